@@ -1,18 +1,18 @@
 import json
-import multiprocessing
 import time
 import traceback
 from contextlib import asynccontextmanager
 
 import aiohttp
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from loguru import logger
 from psutil import NoSuchProcess
 
 from config import setting
+from core.cancel_token import CancelToken
 from core.engine_execute_pool import ExecutePool
 from error.convert_error import ConvertError
 from error.data_process_error import DataProcessError
@@ -29,7 +29,7 @@ from error.no_such_user_error import NoSuchUserError
 from error.query_error import QueryError
 from error.store_error import StoreError
 from error.valid_token_error import ValidTokenError
-from helper.response_result_helper import make_json, response_error_result
+from helper.response_result_helper import json_response, response_error_result
 from helper.warning_helper import UNUSED
 from routers import (
     configuration,
@@ -53,8 +53,13 @@ from routers import (
 @asynccontextmanager
 async def lifespan(application: FastAPI):
     UNUSED(application)
-    ExecutePool.set_pool(multiprocessing.Pool(processes=4))
-    ExecutePool.set_manager_dict(multiprocessing.Manager().dict())
+    # 取消标记需在创建进程池前分配, 由执行进程继承
+    CancelToken.create(setting.CANCEL_TOKEN_SLOTS)
+    ExecutePool.create()
+    # 排队、执行中的调用各占用一个 asyncify 工作线程, 按执行进程数与最大排队数扩大 anyio 默认线程数上限,
+    # 避免执行排队占满工作线程后其他 asyncify 调用无法执行
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens += setting.EXECUTE_POOL_PROCESSES + setting.EXECUTE_POOL_QUEUE_LIMIT
     logger.add(
         "log/dora_{time:YYYY-MM-DD}.log",
         format="<green>{time}</green> <level>{message}</level>",
@@ -126,7 +131,7 @@ async def logger_exception(msg):
 async def general_error_handler(request: Request, exc: GeneralError):
     UNUSED(request, exc)
     await logger_exception(exc.error_message)
-    return JSONResponse(make_json(response_error_result(message=exc.error_message)))
+    return json_response(response_error_result(message=exc.error_message))
 
 
 @app.exception_handler(ConnectionRefusedError)
@@ -134,7 +139,7 @@ async def connection_refused_handler(request: Request, exc: ConnectionRefusedErr
     UNUSED(request, exc)
     msg = "websocket 连接被拒绝，请检查 websocket 服务"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(DataProcessError)
@@ -142,7 +147,7 @@ async def process_error_handler(request: Request, exc: DataProcessError):
     UNUSED(request)
     msg = f"{exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=f"数据处理发生错误, {exc.error_message}")))
+    return json_response(response_error_result(message=f"数据处理发生错误, {exc.error_message}"))
 
 
 @app.exception_handler(ExecuteError)
@@ -150,7 +155,7 @@ async def execute_error_handler(request: Request, exc: ExecuteError):
     UNUSED(request)
     msg = f"function name: {exc.func_name}, 执行失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=f"{exc.error_message}")))
+    return json_response(response_error_result(message=f"{exc.error_message}"))
 
 
 @app.exception_handler(QueryError)
@@ -158,7 +163,7 @@ async def query_error_handler(request: Request, exc: QueryError):
     UNUSED(request)
     msg = f"function name: {exc.func_name}, user: {exc.user_id} 查询失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=f"查询失败, {exc.error_message}")))
+    return json_response(response_error_result(message=f"查询失败, {exc.error_message}"))
 
 
 @app.exception_handler(StoreError)
@@ -166,7 +171,7 @@ async def store_error_handler(request: Request, exc: StoreError):
     UNUSED(request)
     msg = f"function name: {exc.func_name}, user: {exc.user_id} 存储失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=f"存储失败, {exc.error_message}")))
+    return json_response(response_error_result(message=f"存储失败, {exc.error_message}"))
 
 
 @app.exception_handler(EmptyParameterValueError)
@@ -174,7 +179,7 @@ async def empty_parameter_value_error_handler(request: Request, exc: EmptyParame
     UNUSED(request)
     msg = exc.error_message
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(NoSuchUserError)
@@ -182,7 +187,7 @@ async def no_such_user_error_handler(request: Request, exc: NoSuchUserError):
     UNUSED(request)
     msg = exc.error_message
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(NoSuchProcess)
@@ -190,7 +195,7 @@ async def no_such_process_error_handler(request: Request, exc: NoSuchProcess):
     UNUSED(request)
     msg = f"未找到 pid={exc.pid} 关联的进程"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(KeyError)
@@ -198,7 +203,7 @@ async def no_key_error_handler(request: Request, exc: KeyError):
     UNUSED(request)
     msg = f"{exc.args[0]} 参数未传递, 请检查"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(ElementConfigurationQueryError)
@@ -206,7 +211,7 @@ async def element_config_query_error_handler(request: Request, exc: ElementConfi
     UNUSED(request)
     msg = f"算子配置查询失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(InitError)
@@ -214,7 +219,7 @@ async def element_init_error_handler(request: Request, exc: InitError):
     UNUSED(request)
     msg = f"算子初始化失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(ElementConfigurationConfigError)
@@ -222,7 +227,7 @@ async def element_config_error_handler(request: Request, exc: ElementConfigurati
     UNUSED(request)
     msg = f"算子配置失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(DeleteError)
@@ -230,7 +235,7 @@ async def element_delete_error_handler(request: Request, exc: DeleteError):
     UNUSED(request)
     msg = f"算子删除失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(ConvertError)
@@ -238,7 +243,7 @@ async def convert_error_handler(request: Request, exc: ConvertError):
     UNUSED(request)
     msg = f"转换失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(InsightError)
@@ -246,7 +251,7 @@ async def insight_error_handler(request: Request, exc: InsightError):
     UNUSED(request)
     msg = f"洞察数据获取失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(ValidTokenError)
@@ -254,7 +259,7 @@ async def valid_api_token_error_handler(request: Request, exc: ValidTokenError):
     UNUSED(request)
     msg = f"接口权限校验失败, {exc.error_message}"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(LicenseError)
@@ -262,13 +267,13 @@ async def valid_license_error_handler(request: Request, exc: LicenseError):
     UNUSED(request)
     msg = exc.error_message
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     UNUSED(request)
-    origin_err = JSONResponse(make_json(response_error_result(message=exc.errors())))
+    origin_err = json_response(response_error_result(message=exc.errors()))
     await logger_exception(origin_err)
     if not exc.args or not exc.args[0]:
         return origin_err
@@ -286,10 +291,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                 # 用户校验
                 msg = "未传递用户标识, 鉴权失败"
                 await logger_exception(msg)
-                return JSONResponse(make_json(response_error_result(message=msg)))
+                return json_response(response_error_result(message=msg))
             msg = "必传参数未传递, 请检查"
             await logger_exception(msg)
-            return JSONResponse(make_json(response_error_result(message=msg)))
+            return json_response(response_error_result(message=msg))
         if err_type == "missing" and len(loc) > 1:
             # 用户校验
             missing_parameters.append(loc[1])
@@ -305,7 +310,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     else:
         msg = f"{msg1}{msg2}请检查"
     await logger_exception(msg)
-    return JSONResponse(make_json(response_error_result(message=msg)))
+    return json_response(response_error_result(message=msg))
 
 
 @app.get("/")
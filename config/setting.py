@@ -15,6 +15,8 @@ IMAGE_BUCKET = ""
 NOTEBOOK_BUCKET = ""
 MINIO_URL = ""
 MINIO_SCHEME_AND_URL = f"http://{MINIO_URL}"
+# 对象存储客户端连接池大小, 需不小于执行过程数据后写线程数
+OSS_MAX_POOL_CONNECTIONS = 20
 
 # 阿里云 OSS 配置
 ALI_CNAME = ""
@@ -72,6 +74,161 @@ ORACLE_USER2 = ""
 ORACLE_PASSWORD2 = ""
 ORACLE_SERVICE_NAME2 = "orcl"
 
+# 执行过程数据后写配置
+# CSV 文件并发上传线程数
+PROCESS_DATA_WRITER_THREADS = 4
+# 执行记录批量写入条数
+PROCESS_DATA_BATCH_SIZE = 50
+
+# 执行进程内模型缓存配置
+# 每个执行进程缓存的模型个数, 0 表示不缓存
+MODEL_CACHE_SIZE = 16
+# 执行进程启动时是否预加载已发布流水线引用的模型
+MODEL_CACHE_PREWARM = False
+
+# 每个执行进程缓存的流水线执行计划个数, 0 表示不缓存
+DAG_PLAN_CACHE_SIZE = 64
+
+# 算子配置预取缓存配置
+# 每个执行进程缓存的已发布版本个数, 0 表示不缓存
+ELEMENT_CONFIG_CACHE_SIZE = 64
+# 已发布版本算子配置缓存有效期(秒)
+ELEMENT_CONFIG_CACHE_SECONDS = 300
+
+# 执行进程池配置
+# 执行进程数
+EXECUTE_POOL_PROCESSES = 4
+# 每个执行进程最多执行次数, 达到后由新进程替换以释放累积内存, 0 表示不替换
+EXECUTE_POOL_MAX_TASKS_PER_CHILD = 50
+# 只供发布接口调用的执行进程数, 交互执行不可占用
+EXECUTE_POOL_API_RESERVED = 1
+# 等待执行进程的最大排队数, 超过时拒绝执行; 排队的调用占用 asyncify 工作线程, 启动时按此扩大 anyio 线程数上限
+EXECUTE_POOL_QUEUE_LIMIT = 32
+# 最长排队时间(秒), 0 表示不限
+EXECUTE_POOL_QUEUE_TIMEOUT = 300
+# 排队、执行耗时分位数统计的最近执行次数
+EXECUTE_POOL_METRICS_WINDOW = 1000
+
+# 执行进程预热配置
+# 执行进程启动时预先导入的模块, 未安装的模块跳过
+EXECUTE_PROCESS_PRELOAD_MODULES = [
+    "torch",
+    "sklearn",
+    "scipy.optimize",
+    "statsmodels.api",
+    "lightgbm",
+    "prophet",
+    "jieba",
+    "pingouin",
+    "SALib.analyze.sobol",
+    "SALib.sample.saltelli",
+]
+# 执行进程启动时是否导入全部已注册的算子类
+EXECUTE_PROCESS_PRELOAD_ELEMENTS = True
+# 执行进程启动时是否加载结巴分词词典
+EXECUTE_PROCESS_WARM_JIEBA = True
+
+# 取消标记槽位数, 不小于执行进程池中可能同时存在的进程数
+CANCEL_TOKEN_SLOTS = 64
+
+# 外部数据源连接池配置(每个进程、每个数据源)
+# 最大连接数
+TRANSIENT_POOL_MAX_SIZE = 4
+# 空闲连接保留时间(秒), 超时关闭
+TRANSIENT_POOL_IDLE_SECONDS = 300
+# 空闲超过该时间(秒)的连接借出前执行健康检查
+TRANSIENT_POOL_PING_SECONDS = 30
+# 连接全部借出时的最大等待时间(秒)
+TRANSIENT_POOL_WAIT_SECONDS = 30
+
+# 接口密钥缓存配置(每个进程)
+# 缓存的 app_key 个数, 0 表示不缓存
+API_CREDENTIAL_CACHE_SIZE = 10000
+# 密钥缓存有效期(秒)
+API_CREDENTIAL_CACHE_SECONDS = 300
+# 不存在的 app_key 缓存有效期(秒), 0 表示不缓存
+API_CREDENTIAL_NEGATIVE_CACHE_SECONDS = 30
+# 读取数据库密钥版本号的间隔(秒), 其他进程生成、删除密钥后最长在该时间后生效
+API_CREDENTIAL_VERSION_CHECK_SECONDS = 5
+# 密钥版本号表 ml_secret_version 不可用时重新检查的间隔(秒)
+API_CREDENTIAL_VERSION_RETRY_SECONDS = 60
+
+# 表结构元数据缓存配置(每个进程)
+# 缓存的表个数, 0 表示不缓存
+SCHEMA_METADATA_CACHE_SIZE = 512
+# 表结构缓存有效期(秒), 其他进程修改表结构后最长在该时间后生效
+SCHEMA_METADATA_CACHE_SECONDS = 300
+
+# 数据源导入数据模型配置
+# 每批读取及写入条数
+DATA_MODEL_COPY_BATCH_SIZE = 5000
+# 读取与写入之间缓冲的最大批数
+DATA_MODEL_COPY_QUEUE_SIZE = 4
+
+# 数据库输出算子每批写入条数
+DATABASE_OUTPUT_BATCH_SIZE = 1000
+
+# 数据源输入、数据模型算子读取配置
+# 每批读取条数
+DATABASE_INPUT_FETCH_SIZE = 5000
+# 下游全部为列过滤算子时只读取其使用的列
+DATABASE_INPUT_PROJECTION = True
+# 下游仅有一个数据过滤算子时将可下推的过滤条件转为 where 条件
+DATABASE_INPUT_PREDICATE_PUSHDOWN = True
+
+# 神经网络训练配置
+# 小批量大小, 0 表示整批训练
+TRAIN_BATCH_SIZE = 1024
+# 早停监控使用的验证集比例, 0 表示以训练损失监控
+TRAIN_VALIDATION_FRACTION = 0.1
+# 样本数不少于该值时才划分验证集
+TRAIN_VALIDATION_MIN_ROWS = 1000
+# 监控损失连续多少轮无改善时提前停止, 0 表示不早停
+TRAIN_EARLY_STOPPING_PATIENCE = 50
+# 监控损失相对下降不足该比例时视为无改善
+TRAIN_EARLY_STOPPING_MIN_DELTA = 1e-4
+# 是否使用 torch.compile 编译模型后训练
+TRAIN_TORCH_COMPILE = False
+
+# 模型应用算子每批预测行数, 0 表示整体预测
+MODEL_APPLY_BATCH_SIZE = 100000
+
+# 发布接口结果缓存配置(主进程内, 仅对开启结果缓存的发布生效)
+# 缓存的结果个数, 0 表示不缓存
+PUBLISH_RESULT_CACHE_SIZE = 1024
+# 缓存结果的总字节数上限
+PUBLISH_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# 缓存结果及发布信息有效期(秒)
+PUBLISH_RESULT_CACHE_SECONDS = 600
+
+# 过程数据快照格式配置
+# 新写入快照的文件格式: csv、parquet、arrow, 已有快照按文件扩展名读取
+SNAPSHOT_FORMAT = "parquet"
+# Parquet、Arrow IPC 快照的压缩算法
+SNAPSHOT_COMPRESSION = "zstd"
+# 每个行组(记录批)的行数, 分页读取时只下载所需行组
+SNAPSHOT_ROW_GROUP_ROWS = 65536
+# 范围读取快照文件时每次请求的最小字节数
+SNAPSHOT_READ_BUFFER_BYTES = 1024 * 1024
+
+# 洞察分页查询配置
+# 默认每页行数
+INSIGHT_PAGE_SIZE = 100
+# 每页最大行数
+INSIGHT_MAX_PAGE_SIZE = 10000
+# 写入快照时是否同时计算并存储汇总统计
+INSIGHT_SUMMARY_ON_WRITE = True
+# 数值列直方图分箱数
+INSIGHT_HISTOGRAM_BINS = 20
+# 文本列统计出现次数最多的值的个数
+INSIGHT_TOP_VALUES = 10
+
+# 接口响应序列化配置
+# 数据行数不少于该值时分块流式返回响应, 0 表示不流式返回
+RESPONSE_STREAM_ROWS = 50000
+# 分块序列化时每块行数
+RESPONSE_CHUNK_ROWS = 10000
+
 # WebSocket 地址配置
 WEBSOCKET_URL = ""
 
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config.setting import (
+    API_CREDENTIAL_CACHE_SECONDS,
+    API_CREDENTIAL_CACHE_SIZE,
+    API_CREDENTIAL_NEGATIVE_CACHE_SECONDS,
+    API_CREDENTIAL_VERSION_CHECK_SECONDS,
+)
+
+
+class ApiCredentialCache(object):
+    """
+    接口密钥缓存(各进程独立维护)
+    以 app_key 为键缓存 ml_secret 记录, 不存在的 app_key 以较短有效期缓存为空;
+    本进程生成、删除密钥时立即失效, 其他进程定期读取数据库中的密钥版本号, 版本变化时清空缓存
+    """
+
+    # app_key -> (过期时间, 密钥记录, 不存在时为 None)
+    __entries = OrderedDict()
+    __version = None
+    __version_checked = None
+    # 每次失效递增, 查询期间发生失效时不写入查询结果
+    __generation = 0
+    __hit = 0
+    __negative_hit = 0
+    __miss = 0
+    __lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls):
+        return API_CREDENTIAL_CACHE_SIZE > 0 and API_CREDENTIAL_CACHE_SECONDS > 0
+
+    @classmethod
+    def get(cls, app_key, loader):
+        """
+        获取 app_key 对应的密钥记录, 未缓存或已过期时通过 loader 查询
+        :param app_key: app_key
+        :param loader: 查询密钥记录的方法, 参数为 app_key
+        :return: 密钥记录, 不存在时为 None
+        """
+        if not cls.enabled():
+            return loader(app_key)
+        with cls.__lock:
+            cached = cls.__entries.get(app_key)
+            if cached is not None and time.monotonic() <= cached[0]:
+                cls.__entries.move_to_end(app_key)
+                if cached[1] is None:
+                    cls.__negative_hit += 1
+                else:
+                    cls.__hit += 1
+                return cached[1]
+            cls.__miss += 1
+            generation = cls.__generation
+        secret_dict = loader(app_key)
+        seconds = API_CREDENTIAL_CACHE_SECONDS if secret_dict else API_CREDENTIAL_NEGATIVE_CACHE_SECONDS
+        with cls.__lock:
+            if generation == cls.__generation and seconds > 0:
+                cls.__entries[app_key] = (time.monotonic() + seconds, secret_dict or None)
+                cls.__entries.move_to_end(app_key)
+                while len(cls.__entries) > API_CREDENTIAL_CACHE_SIZE:
+                    cls.__entries.popitem(last=False)
+        return secret_dict
+
+    @classmethod
+    def version_due(cls):
+        """
+        是否需要读取数据库中的密钥版本号, 返回是时同时记录读取时间, 同一周期内只有一个调用方读取
+        :return: 是、否
+        """
+        if not cls.enabled():
+            return False
+        now = time.monotonic()
+        with cls.__lock:
+            if cls.__version_checked is not None and now - cls.__version_checked < API_CREDENTIAL_VERSION_CHECK_SECONDS:
+                return False
+            cls.__version_checked = now
+            return True
+
+    @classmethod
+    def sync_version(cls, version):
+        """
+        同步数据库中的密钥版本号, 与上次读取的版本号不同时清空缓存
+        :param version: 密钥版本号, 读取失败时为 None
+        :return: None
+        """
+        if version is None:
+            return
+        with cls.__lock:
+            if cls.__version is not None and cls.__version != version:
+                cls.__clear()
+            cls.__version = version
+
+    @classmethod
+    def invalidate(cls, app_key=None):
+        """
+        使密钥缓存失效
+        :param app_key: app_key, 为空时清空全部缓存
+        :return: None
+        """
+        with cls.__lock:
+            if app_key is None:
+                cls.__clear()
+            else:
+                cls.__entries.pop(app_key, None)
+                cls.__generation += 1
+
+    @classmethod
+    def __clear(cls):
+        cls.__entries.clear()
+        cls.__generation += 1
+
+    @classmethod
+    def counters(cls):
+        """
+        接口密钥缓存命中统计, 自进程启动起累计
+        :return: 命中次数、不存在的 app_key 命中次数、未命中次数、命中率、缓存条数、密钥版本号
+        """
+        with cls.__lock:
+            total = cls.__hit + cls.__negative_hit + cls.__miss
+            return {
+                "hit_count": cls.__hit,
+                "negative_hit_count": cls.__negative_hit,
+                "miss_count": cls.__miss,
+                "hit_rate": round((cls.__hit + cls.__negative_hit) / total, 4) if total else 0.0,
+                "entries": len(cls.__entries),
+                "version": cls.__version,
+            }
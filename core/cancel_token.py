@@ -0,0 +1,128 @@
+import multiprocessing
+import os
+import zlib
+
+import psutil
+from loguru import logger
+
+from enum_type.process_status_type import ProcessStatusType
+
+
+class CancelToken(object):
+    """
+    执行进程池共享的取消标记
+    主进程在创建进程池前分配共享内存数组, 执行进程初始化时占用一个槽位并记录当前执行的连接标识;
+    取消执行时主进程按 pid 和连接标识将槽位置位, 执行进程在训练循环、节点之间直接读取本进程的槽位,
+    读取不涉及进程间通信, 可在每轮迭代中检查
+    """
+
+    # 槽位 -> 执行进程 pid, 0 表示空闲
+    __pids = None
+    # 槽位 -> 当前执行的连接标识摘要, 0 表示未在执行
+    __keys = None
+    # 槽位 -> 是否已取消
+    __flags = None
+    __lock = None
+    # 当前执行进程占用的槽位
+    __slot = None
+
+    @classmethod
+    def create(cls, size):
+        """
+        分配共享内存, 需在创建进程池前于主进程调用, 执行进程通过继承获得
+        :param size: 槽位数, 不小于进程池中可能存在的执行进程数
+        :return: None
+        """
+        cls.__pids = multiprocessing.RawArray("q", size)
+        cls.__keys = multiprocessing.RawArray("q", size)
+        cls.__flags = multiprocessing.RawArray("b", size)
+        cls.__lock = multiprocessing.Lock()
+
+    @classmethod
+    def attach(cls):
+        """
+        执行进程占用一个槽位, 作为进程池初始化函数的一部分调用
+        退出的执行进程遗留的槽位由新的执行进程复用
+        :return: 是否占用成功
+        """
+        if cls.__pids is None:
+            return False
+        pid = os.getpid()
+        with cls.__lock:
+            for slot, slot_pid in enumerate(cls.__pids):
+                if slot_pid == 0 or slot_pid == pid or not psutil.pid_exists(slot_pid):
+                    cls.__pids[slot] = pid
+                    cls.__keys[slot] = 0
+                    cls.__flags[slot] = 0
+                    cls.__slot = slot
+                    return True
+        logger.warning(f"取消标记槽位已满, 执行进程 {pid} 不支持取消执行")
+        return False
+
+    @classmethod
+    def begin(cls, connect_id):
+        """
+        开始执行, 清除上次执行遗留的取消状态
+        :param connect_id: 连接标识
+        :return: None
+        """
+        if cls.__slot is None:
+            return
+        cls.__flags[cls.__slot] = 0
+        cls.__keys[cls.__slot] = key_of(connect_id)
+
+    @classmethod
+    def end(cls):
+        if cls.__slot is None:
+            return
+        cls.__keys[cls.__slot] = 0
+        cls.__flags[cls.__slot] = 0
+
+    @classmethod
+    def cancel(cls, pid, connect_id):
+        """
+        取消执行进程中对应连接标识的执行, 在主进程调用
+        :param pid: 执行进程 pid
+        :param connect_id: 连接标识
+        :return: 是否找到正在执行的任务
+        """
+        if cls.__pids is None:
+            return False
+        pid = int(pid)
+        key = key_of(connect_id)
+        with cls.__lock:
+            for slot, slot_pid in enumerate(cls.__pids):
+                if slot_pid == pid and cls.__keys[slot] == key:
+                    cls.__flags[slot] = 1
+                    return True
+        return False
+
+    @classmethod
+    def cancelled(cls):
+        """
+        当前执行是否已被取消, 在执行进程中调用
+        :return: 是、否
+        """
+        return cls.__slot is not None and cls.__flags[cls.__slot] != 0
+
+    @classmethod
+    def get(cls, key, default=None):
+        """
+        兼容原共享字典的读取方式
+        :param key: "{pid}_{connect_id}"
+        :param default: 未取消时的返回值
+        :return: 已取消时返回 ProcessStatusType.Kill
+        """
+        pid, _, connect_id = str(key).partition("_")
+        if cls.cancelled() and pid == str(os.getpid()) and cls.__keys[cls.__slot] == key_of(connect_id):
+            return ProcessStatusType.Kill.value
+        return default
+
+
+def key_of(connect_id):
+    """
+    连接标识摘要, 各进程计算结果一致, 且不为 0
+    :param connect_id: 连接标识
+    :return: 摘要
+    """
+    return zlib.crc32(str(connect_id).encode()) + 1
@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from config.dag_config import TABLE_NAME, element_info_dict
+from config.setting import ELEMENT_CONFIG_CACHE_SECONDS, ELEMENT_CONFIG_CACHE_SIZE
+from enum_type.enabled import Enabled
+from helper.sql_helper.init_sql_helper import db_helper1
+
+
+class ElementConfigCache(object):
+    """
+    算子配置预取缓存
+    执行前按算子配置表批量查询该版本全部算子配置, 算子执行时直接读取, 不再逐个查询;
+    已发布版本不可修改, 其配置在执行进程内缓存 ELEMENT_CONFIG_CACHE_SECONDS 秒
+    """
+
+    # 当前执行中的版本标识 -> {算子标识: 配置}
+    __active = {}
+    # 已发布版本标识 -> (预取时间, {算子标识: 配置})
+    __published = OrderedDict()
+    __lock = threading.Lock()
+
+    @classmethod
+    def begin(cls, dag_plan, published=False):
+        """
+        预取该执行计划中全部算子的配置
+        :param dag_plan: 执行计划
+        :param published: 是否为已发布版本
+        :return: None
+        """
+        version_id = dag_plan.version_id
+        config_dict = cls.get_published(version_id) if published else None
+        if config_dict is None:
+            config_dict = prefetch_element_config(dag_plan)
+            if published:
+                cls.put_published(version_id, config_dict)
+        with cls.__lock:
+            cls.__active[version_id] = config_dict
+
+    @classmethod
+    def end(cls, version_id):
+        with cls.__lock:
+            cls.__active.pop(version_id, None)
+
+    @classmethod
+    def lookup(cls, version_id, element_id):
+        """
+        读取预取的算子配置
+        :param version_id: 版本标识
+        :param element_id: 算子标识
+        :return: (是否已预取, 配置), 已预取但未配置或已失效时配置为 None
+        """
+        with cls.__lock:
+            config_dict = cls.__active.get(version_id)
+        if config_dict is None or element_id not in config_dict:
+            return False, None
+        config = config_dict[element_id]
+        return True, dict(config) if config is not None else None
+
+    @classmethod
+    def get_published(cls, version_id):
+        with cls.__lock:
+            cached = cls.__published.get(version_id)
+            if cached is None:
+                return None
+            prefetch_time, config_dict = cached
+            if time.monotonic() - prefetch_time > ELEMENT_CONFIG_CACHE_SECONDS:
+                cls.__published.pop(version_id, None)
+                return None
+            cls.__published.move_to_end(version_id)
+            return config_dict
+
+    @classmethod
+    def put_published(cls, version_id, config_dict):
+        if ELEMENT_CONFIG_CACHE_SIZE <= 0:
+            return
+        with cls.__lock:
+            cls.__published[version_id] = (time.monotonic(), config_dict)
+            cls.__published.move_to_end(version_id)
+            while len(cls.__published) > ELEMENT_CONFIG_CACHE_SIZE:
+                cls.__published.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, version_id=None):
+        with cls.__lock:
+            if version_id is None:
+                cls.__published.clear()
+            else:
+                cls.__published.pop(version_id, None)
+
+
+def prefetch_element_config(dag_plan):
+    """
+    按算子配置表批量查询执行计划中支持预取的算子配置, 每张配置表一次查询
+    :param dag_plan: 执行计划
+    :return: {算子标识: 配置}, 已预取但未配置或已失效的算子值为 None
+    """
+    table_id_dict = defaultdict(list)
+    for element_id, node in dag_plan.nodes.items():
+        element_class = dag_plan.element_classes.get(element_id)
+        if not element_class or not getattr(element_class, "prefetch_config", False):
+            continue
+        table_name = element_info_dict.get(node["type"], {}).get(TABLE_NAME)
+        if table_name:
+            table_id_dict[table_name].append(element_id)
+
+    config_dict = {}
+    for table_name, element_id_list in table_id_dict.items():
+        # noinspection SqlResolve
+        config_sql = (
+            f"select * from {table_name} "
+            f"where version_id='{dag_plan.version_id}' and "
+            f"is_enabled={Enabled.Yes.value}"
+        )
+        config_list = db_helper1.fetchall(config_sql) or []
+        row_dict = {config["id"]: config for config in config_list}
+        for element_id in element_id_list:
+            config_dict[element_id] = row_dict.get(element_id)
+    return config_dict
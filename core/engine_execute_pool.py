@@ -1,19 +1,358 @@
+import bisect
+import importlib
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import psutil
+from loguru import logger
+
+from config.dag_config import CLASS_MODULE, element_info_dict
+from config.setting import (
+    EXECUTE_POOL_API_RESERVED,
+    EXECUTE_POOL_MAX_TASKS_PER_CHILD,
+    EXECUTE_POOL_METRICS_WINDOW,
+    EXECUTE_POOL_PROCESSES,
+    EXECUTE_POOL_QUEUE_LIMIT,
+    EXECUTE_POOL_QUEUE_TIMEOUT,
+    EXECUTE_PROCESS_PRELOAD_ELEMENTS,
+    EXECUTE_PROCESS_PRELOAD_MODULES,
+    EXECUTE_PROCESS_WARM_JIEBA,
+)
+from core.cancel_token import CancelToken
+from enum_type.execute_lane import ExecuteLane
+from error.data_process_error import DataProcessError
+from error.execute_error import ExecuteError
+from helper.dag_helper import element_class_of
+from helper.oss_helper.oss_helper import oss_helper1
+from helper.sql_helper.init_sql_helper import db_helper1, db_helper2
+from helper.warning_helper import UNUSED
+
+
 class ExecutePool(object):
+    """
+    执行进程池及其准入控制
+    每个执行独占一个执行进程, 进程池满时按通道优先级排队: 发布接口调用优先于交互执行,
+    且保留 EXECUTE_POOL_API_RESERVED 个进程只供发布接口调用, 避免接口调用排在长时间训练之后;
+    排队数超过上限或排队超时时拒绝执行
+    """
+
     __pool = None
-    __manager_dict = None
+    __processes = 0
+    __condition = threading.Condition()
+    # 按 (通道优先级, 到达顺序) 排序的排队列表
+    __waiting = []
+    __sequence = itertools.count()
+    # 通道 -> 正在执行数
+    __running = {}
+    # 通道 -> 统计
+    __metrics = {}
+
+    @classmethod
+    def create(cls, processes=EXECUTE_POOL_PROCESSES, maxtasksperchild=EXECUTE_POOL_MAX_TASKS_PER_CHILD):
+        """
+        创建执行进程池, 执行进程执行 maxtasksperchild 次后退出并由新进程替换, 释放 torch/pandas 累积的内存
+        :param processes: 进程数
+        :param maxtasksperchild: 每个进程最多执行次数, 0 表示不替换
+        :return: 进程池
+        """
+        pool = multiprocessing.Pool(
+            processes=processes,
+            initializer=init_execute_process,
+            maxtasksperchild=maxtasksperchild or None,
+        )
+        cls.set_pool(pool, processes)
+        return pool
 
     @classmethod
     def get_pool(cls):
         return cls.__pool
 
     @classmethod
-    def set_pool(cls, pool):
-        cls.__pool = pool
+    def set_pool(cls, pool, processes=EXECUTE_POOL_PROCESSES):
+        with cls.__condition:
+            cls.__pool = pool
+            cls.__processes = processes
+            cls.__running = {lane: 0 for lane in ExecuteLane}
+            cls.__metrics = {lane: LaneMetrics() for lane in ExecuteLane}
+            cls.__condition.notify_all()
 
     @classmethod
-    def get_manager_dict(cls):
-        return cls.__manager_dict
+    def apply(cls, func, args=(), lane=ExecuteLane.Interactive):
+        """
+        在执行进程中执行, 进程池满时排队等待
+        :param func: 执行方法
+        :param args: 参数
+        :param lane: 执行通道
+        :return: 执行结果
+        """
+        pool = cls.__pool
+        if not pool:
+            raise DataProcessError("流水线线程池为空, 请重启应用") from None
+        metrics = cls.__metrics[lane]
+        wait_seconds = cls.__acquire(lane)
+        metrics.queue_wait.add(wait_seconds)
+        start = time.perf_counter()
+        try:
+            return pool.apply(func, args=args)
+        finally:
+            metrics.run_time.add(time.perf_counter() - start)
+            cls.__release(lane)
 
     @classmethod
-    def set_manager_dict(cls, manager_dict):
-        cls.__manager_dict = manager_dict
+    def __acquire(cls, lane):
+        """
+        申请执行进程
+        :param lane: 执行通道
+        :return: 排队时间(秒)
+        """
+        start = time.perf_counter()
+        metrics = cls.__metrics[lane]
+        entry = (lane.value, next(cls.__sequence))
+        with cls.__condition:
+            bisect.insort(cls.__waiting, entry)
+            try:
+                if cls.__next_admissible() != entry and len(cls.__waiting) > EXECUTE_POOL_QUEUE_LIMIT:
+                    metrics.rejected += 1
+                    raise ExecuteError(sys._getframe().f_code.co_name, "执行排队数已达上限, 请稍后重试") from None
+                deadline = start + EXECUTE_POOL_QUEUE_TIMEOUT if EXECUTE_POOL_QUEUE_TIMEOUT > 0 else None
+                while cls.__next_admissible() != entry:
+                    remaining = None if deadline is None else deadline - time.perf_counter()
+                    if remaining is not None and remaining <= 0:
+                        metrics.timeout += 1
+                        raise ExecuteError(sys._getframe().f_code.co_name, "执行排队超时, 请稍后重试") from None
+                    cls.__condition.wait(remaining)
+                cls.__running[lane] += 1
+            finally:
+                cls.__waiting.remove(entry)
+                # 排队列表变化, 唤醒其余排队者重新判断
+                cls.__condition.notify_all()
+        return time.perf_counter() - start
+
+    @classmethod
+    def __release(cls, lane):
+        with cls.__condition:
+            cls.__running[lane] -= 1
+            cls.__condition.notify_all()
+
+    @classmethod
+    def __admissible(cls, lane):
+        """
+        通道是否有空闲执行进程, 交互执行不可占用为发布接口保留的进程
+        :param lane: 执行通道
+        :return: 是、否
+        """
+        if sum(cls.__running.values()) >= cls.__processes:
+            return False
+        if lane == ExecuteLane.Api:
+            return True
+        limit = max(1, cls.__processes - EXECUTE_POOL_API_RESERVED)
+        return cls.__running[lane] < limit
+
+    @classmethod
+    def __next_admissible(cls):
+        """
+        排队列表中按优先级第一个可以执行的排队者
+        :return: 排队者, 无则为 None
+        """
+        for entry in cls.__waiting:
+            if cls.__admissible(ExecuteLane(entry[0])):
+                return entry
+        return None
+
+    @classmethod
+    def metrics(cls):
+        """
+        执行进程池统计: 各通道排队、执行数及排队、执行时间, 各执行进程常驻内存
+        :return: 统计字典
+        """
+        with cls.__condition:
+            waiting = {lane: 0 for lane in ExecuteLane}
+            for priority, _ in cls.__waiting:
+                waiting[ExecuteLane(priority)] += 1
+            lanes = {
+                lane.name: {
+                    "running": cls.__running.get(lane, 0),
+                    "waiting": waiting[lane],
+                    **(cls.__metrics[lane].snapshot() if lane in cls.__metrics else {}),
+                }
+                for lane in ExecuteLane
+            }
+        return {"processes": cls.__processes, "lanes": lanes, "workers": worker_memory()}
+
+
+class DurationStats(object):
+    def __init__(self):
+        """
+        耗时统计, 分位数按最近 EXECUTE_POOL_METRICS_WINDOW 次计算
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=EXECUTE_POOL_METRICS_WINDOW)
+        self.__lock = threading.Lock()
+
+    def add(self, seconds):
+        with self.__lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            self.recent.append(seconds)
+
+    def snapshot(self):
+        """
+        :return: 次数及平均、最大、p50、p99 耗时(毫秒)
+        """
+        with self.__lock:
+            recent = sorted(self.recent)
+            count, total, maximum = self.count, self.total, self.max
+
+        def percentile(p):
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))] * 1000, 3)
+
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+            "max_ms": round(maximum * 1000, 3),
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+        }
+
+
+class LaneMetrics(object):
+    def __init__(self):
+        self.queue_wait = DurationStats()
+        self.run_time = DurationStats()
+        self.rejected = 0
+        self.timeout = 0
+
+    def snapshot(self):
+        return {
+            "rejected": self.rejected,
+            "timeout": self.timeout,
+            "queue_wait": self.queue_wait.snapshot(),
+            "run_time": self.run_time.snapshot(),
+        }
+
+
+def worker_memory():
+    """
+    执行进程的常驻内存
+    :return: [{"pid": pid, "rss_mb": 常驻内存}]
+    """
+    workers = []
+    # noinspection PyBroadException
+    try:
+        children = psutil.Process(os.getpid()).children()
+    except Exception as e:
+        logger.warning(f"获取执行进程失败: {e}")
+        return workers
+    for child in children:
+        try:
+            workers.append({"pid": child.pid, "rss_mb": round(child.memory_info().rss / 1024 / 1024, 3)})
+        except psutil.Error:
+            continue
+    return workers
+
+
+def init_execute_process():
+    """
+    执行进程池的初始化函数: 占用取消标记槽位, 创建本进程的数据库连接池和对象存储客户端,
+    预先导入耗时模块及算子类, 预加载已发布流水线引用的模型, 避免进程启动后的首个执行承担这些耗时
+    :return: None
+    """
+    CancelToken.attach()
+    start = time.perf_counter()
+    prepare_clients()
+    import_cost = preload_modules(EXECUTE_PROCESS_PRELOAD_MODULES)
+    if EXECUTE_PROCESS_PRELOAD_ELEMENTS:
+        import_cost.update(preload_elements())
+    if EXECUTE_PROCESS_WARM_JIEBA:
+        import_cost.update(warm_jieba())
+    # model_cache 经 library_operator 导入算子模块, 算子模块又经 element_port_helper 导入本模块, 在此导入避免循环导入
+    from core.model_cache import prewarm_published_models
+
+    prewarm_published_models()
+    slowest = sorted(import_cost.items(), key=lambda item: item[1], reverse=True)[:10]
+    logger.info(
+        f"执行进程 {os.getpid()} 预热完成, 耗时 {time.perf_counter() - start:.3f}s, "
+        f"导入耗时最多的模块: {', '.join(f'{name} {cost:.3f}s' for name, cost in slowest)}"
+    )
+
+
+def prepare_clients():
+    """
+    创建本进程的数据库连接池和对象存储客户端, 不复用父进程的连接
+    :return: None
+    """
+    # noinspection PyBroadException
+    try:
+        UNUSED(db_helper1.pool, db_helper2.pool)
+    except Exception as e:
+        logger.warning(f"执行进程创建数据库连接池失败: {e}")
+    # noinspection PyBroadException
+    try:
+        oss_helper1.prepare_client()
+    except Exception as e:
+        logger.warning(f"执行进程创建对象存储客户端失败: {e}")
+
+
+def preload_modules(module_names):
+    """
+    导入模块
+    :param module_names: 模块名数组
+    :return: 模块名 -> 导入耗时(秒)
+    """
+    import_cost = {}
+    for module_name in module_names:
+        start = time.perf_counter()
+        # noinspection PyBroadException
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            logger.info(f"执行进程预先导入模块 {module_name} 失败: {e}")
+            continue
+        import_cost[module_name] = time.perf_counter() - start
+    return import_cost
+
+
+def preload_elements():
+    """
+    导入全部已注册的算子类
+    :return: 算子模块名 -> 导入耗时(秒)
+    """
+    import_cost = {}
+    for node_type, element_info in element_info_dict.items():
+        start = time.perf_counter()
+        # noinspection PyBroadException
+        try:
+            element_class_of(node_type)
+        except Exception as e:
+            logger.info(f"执行进程预先导入算子 {node_type} 失败: {e}")
+            continue
+        import_cost[element_info.get(CLASS_MODULE) or node_type] = time.perf_counter() - start
+    return import_cost
+
+
+def warm_jieba():
+    """
+    加载结巴分词词典, 避免首次分词时加载
+    :return: {"jieba.initialize": 耗时(秒)}
+    """
+    start = time.perf_counter()
+    # noinspection PyBroadException
+    try:
+        jieba = importlib.import_module("jieba")
+        jieba.setLogLevel(logging.WARNING)
+        jieba.initialize()
+    except Exception as e:
+        logger.info(f"执行进程加载结巴分词词典失败: {e}")
+        return {}
+    return {"jieba.initialize": time.perf_counter() - start}
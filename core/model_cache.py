@@ -0,0 +1,96 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+
+from config.setting import MODEL_CACHE_PREWARM, MODEL_CACHE_SIZE
+from enum_type.deleted import Deleted
+from enum_type.library_type import LibraryType
+from helper.sql_helper.init_sql_helper import db_helper1
+from library_operator import library_operator
+
+# 预测时会修改模型自身状态的机器学习库, 从缓存取出时返回副本
+MUTABLE_LIBRARY_TYPE_LIST = [LibraryType.Grey.value]
+
+
+class ModelCache(object):
+    """
+    执行进程内的已训练模型缓存, 以 ml_models.id 为键, LRU 淘汰
+    模型文件路径或机器学习库类型变化时视为模型已变更, 重新加载
+    """
+
+    __models = OrderedDict()
+    __lock = threading.Lock()
+
+    @classmethod
+    def load(cls, model_id, key, library_type):
+        """
+        获取模型, 未命中时从对象存储加载
+        :param model_id: 模型标识
+        :param key: 模型文件路径
+        :param library_type: 机器学习库类型
+        :return: 模型
+        """
+        if MODEL_CACHE_SIZE <= 0:
+            return library_operator.load(key, library_type)
+        with cls.__lock:
+            cached = cls.__models.get(model_id)
+            if cached is not None and cached[0] == key and cached[1] == library_type:
+                cls.__models.move_to_end(model_id)
+                model = cached[2]
+                return copy.deepcopy(model) if library_type in MUTABLE_LIBRARY_TYPE_LIST else model
+        model = library_operator.load(key, library_type)
+        cls.put(model_id, key, library_type, model)
+        return copy.deepcopy(model) if library_type in MUTABLE_LIBRARY_TYPE_LIST else model
+
+    @classmethod
+    def put(cls, model_id, key, library_type, model):
+        with cls.__lock:
+            cls.__models[model_id] = (key, library_type, model)
+            cls.__models.move_to_end(model_id)
+            while len(cls.__models) > MODEL_CACHE_SIZE:
+                cls.__models.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, model_id=None):
+        """
+        使缓存失效
+        :param model_id: 模型标识, 为空时清空全部缓存
+        :return: None
+        """
+        with cls.__lock:
+            if model_id is None:
+                cls.__models.clear()
+            else:
+                cls.__models.pop(model_id, None)
+
+
+def prewarm_published_models():
+    """
+    预加载已发布流水线引用的模型, 作为执行进程池的初始化函数
+    :return: None
+    """
+    if not MODEL_CACHE_PREWARM or MODEL_CACHE_SIZE <= 0:
+        return
+    model_sql = (
+        f"select distinct t1.id, t1.oss_path as model_path, t1.library_type "
+        f"from ml_models t1 "
+        f"inner join ml_model_file_element t2 "
+        f"on t1.id=t2.model_id "
+        f"inner join ml_pipelining_publish t3 "
+        f"on t2.version_id=t3.version_id "
+        f"where t3.is_deleted={Deleted.No.value}"
+    )
+    # noinspection PyBroadException
+    try:
+        model_list = db_helper1.fetchall(model_sql) or []
+    except Exception as e:
+        logger.error(f"模型预加载查询失败: {e}")
+        return
+    for model_dict in model_list[:MODEL_CACHE_SIZE]:
+        # noinspection PyBroadException
+        try:
+            ModelCache.load(model_dict["id"], model_dict["model_path"], model_dict["library_type"])
+        except Exception as e:
+            logger.error(f"模型 {model_dict['id']} 预加载失败: {e}")
@@ -0,0 +1,124 @@
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from config.setting import PROCESS_DATA_BATCH_SIZE, PROCESS_DATA_WRITER_THREADS
+from entity.dataset.columnar_dataset import ColumnarDataset
+from enum_type.result_code import ResultCode
+from helper.oss_helper.oss_helper import oss_helper1
+from helper.sql_helper.init_sql_helper import db_helper1
+
+
+class ProcessDataWriter(object):
+    """
+    执行过程数据(洞察快照)后写器
+    begin 之后, 算子产生的快照文件提交至线程池并发上传, 执行记录暂存于队列,
+    end 时等待全部上传完成并批量写入执行记录; 未 begin 时保持同步写入
+    """
+
+    __executor = None
+    __lock = threading.Lock()
+    __active = False
+    __skip = False
+    __futures = []
+    __records = []
+
+    @classmethod
+    def get_executor(cls):
+        if cls.__executor is None:
+            cls.__executor = ThreadPoolExecutor(
+                max_workers=PROCESS_DATA_WRITER_THREADS, thread_name_prefix="process_data_writer"
+            )
+        return cls.__executor
+
+    @classmethod
+    def begin(cls, skip_snapshot=False):
+        """
+        开启一次流水线执行的后写
+        :param skip_snapshot: 是否跳过洞察快照
+        :return: None
+        """
+        with cls.__lock:
+            cls.__active = True
+            cls.__skip = skip_snapshot
+            cls.__futures = []
+            cls.__records = []
+
+    @classmethod
+    def create_csv_file(cls, data, fields=None):
+        """
+        创建 CSV 文件, 后写模式下立即返回文件标识, 上传在后台完成
+        :param data: 文件内容数据
+        :param fields: 文件字段数据
+        :return: 文件标识, 跳过快照时为 None
+        """
+        if not cls.__active:
+            return oss_helper1.create_csv_file(data, fields)
+        if cls.__skip:
+            return None
+        key = oss_helper1.generate_csv_key()
+        future = cls.get_executor().submit(oss_helper1.create_csv_file, cls.__detach(data), cls.__detach(fields), key)
+        with cls.__lock:
+            cls.__futures.append(future)
+        return key
+
+    @staticmethod
+    def __detach(data):
+        """
+        复制待上传的数据, 上传期间下游算子原地修改输出数据不影响快照内容
+        :param data: 文件内容数据或字段数据
+        :return: 副本
+        """
+        if isinstance(data, pd.DataFrame):
+            return data.copy()
+        if isinstance(data, ColumnarDataset):
+            # 列数组只读, 物化后共享列数组即可
+            return copy.deepcopy(data)
+        if isinstance(data, list):
+            return [dict(x) if isinstance(x, dict) else x for x in data]
+        return data
+
+    @classmethod
+    def insert(cls, sql, params=None):
+        """
+        插入执行记录, 后写模式下暂存, 由 end 批量写入
+        :param sql: SQL
+        :param params: 动态参数
+        :return: 插入成功 or 失败
+        """
+        if not cls.__active:
+            return db_helper1.execute(sql, params)
+        if cls.__skip:
+            return ResultCode.Success.value
+        with cls.__lock:
+            cls.__records.append((sql, params))
+        return ResultCode.Success.value
+
+    @classmethod
+    def end(cls):
+        """
+        刷新屏障: 等待全部文件上传完成后批量写入执行记录, 并退出后写模式
+        :return: 写入成功 or 失败
+        """
+        with cls.__lock:
+            futures, records = cls.__futures, cls.__records
+            cls.__active = False
+            cls.__skip = False
+            cls.__futures = []
+            cls.__records = []
+        code = ResultCode.Success.value
+        wait(futures)
+        for future in futures:
+            if future.exception() is not None:
+                code = ResultCode.Error.value
+        # 上传失败时不写入执行记录, 避免洞察读取不存在的文件
+        if code != ResultCode.Success.value:
+            return code
+        for start in range(0, len(records), PROCESS_DATA_BATCH_SIZE):
+            batch = records[start : start + PROCESS_DATA_BATCH_SIZE]
+            params_dict = {index: params for index, (_, params) in enumerate(batch) if params}
+            if db_helper1.execute_arr([sql for sql, _ in batch], params_dict) != ResultCode.Success.value:
+                code = ResultCode.Error.value
+        return code
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from config.setting import (
+    PUBLISH_RESULT_CACHE_MAX_BYTES,
+    PUBLISH_RESULT_CACHE_SECONDS,
+    PUBLISH_RESULT_CACHE_SIZE,
+)
+from enum_type.result_cache_policy import ResultCachePolicy
+
+
+class PublishResultCache(object):
+    """
+    发布接口结果缓存(主进程内)
+    以 (发布标识, 版本标识, 同步输入数据摘要) 为键缓存响应体, 只缓存开启结果缓存的发布中
+    全部算子均确定(无随机、无外部读写)的流水线的成功结果;
+    同时缓存发布对应的版本标识及缓存策略, 重新发布、取消发布或修改缓存策略时失效
+    """
+
+    # 键 -> (过期时间, 响应体, 执行过程标识)
+    __entries = OrderedDict()
+    __bytes = 0
+    # 发布标识 -> (过期时间, 版本标识, 结果缓存策略)
+    __publishes = {}
+    # 发布标识 -> [命中次数, 未命中次数]
+    __counters = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls):
+        return PUBLISH_RESULT_CACHE_SIZE > 0 and PUBLISH_RESULT_CACHE_MAX_BYTES > 0
+
+    @classmethod
+    def get_publish(cls, publish_id):
+        """
+        读取缓存的发布信息, 未开启结果缓存的发布同样缓存, 避免每次调用查询版本标识及缓存策略
+        :param publish_id: 发布标识
+        :return: (版本标识, 结果缓存策略), 未缓存或已过期时为 None
+        """
+        with cls.__lock:
+            cached = cls.__publishes.get(publish_id)
+            if cached is None:
+                return None
+            expire_time, version_id, cache_policy = cached
+            if time.monotonic() > expire_time:
+                cls.__publishes.pop(publish_id, None)
+                return None
+            return version_id, cache_policy
+
+    @classmethod
+    def put_publish(cls, publish_id, version_id, cache_policy):
+        """
+        缓存发布的版本标识及结果缓存策略
+        :param publish_id: 发布标识
+        :param version_id: 版本标识
+        :param cache_policy: 结果缓存策略
+        :return: 该发布是否使用结果缓存
+        """
+        if not cls.enabled():
+            return False
+        with cls.__lock:
+            cls.__publishes[publish_id] = (time.monotonic() + PUBLISH_RESULT_CACHE_SECONDS, version_id, cache_policy)
+        return cache_policy == ResultCachePolicy.Cache
+
+    @classmethod
+    def get(cls, key):
+        """
+        读取缓存的响应体并计数
+        :param key: 缓存键, 由 cache_key 生成
+        :return: (响应体, 执行过程标识), 未命中时为 None
+        """
+        publish_id = key[0]
+        with cls.__lock:
+            counter = cls.__counters.setdefault(publish_id, [0, 0])
+            cached = cls.__entries.get(key)
+            if cached is not None and time.monotonic() > cached[0]:
+                cls.__remove(key)
+                cached = None
+            if cached is None:
+                counter[1] += 1
+                return None
+            counter[0] += 1
+            cls.__entries.move_to_end(key)
+            return cached[1], cached[2]
+
+    @classmethod
+    def put(cls, key, body, process_id):
+        """
+        缓存响应体, 超过个数或字节数上限时淘汰最久未使用的结果
+        :param key: 缓存键
+        :param body: 响应体
+        :param process_id: 产生该结果的执行过程标识
+        :return: None
+        """
+        if not cls.enabled() or len(body) > PUBLISH_RESULT_CACHE_MAX_BYTES:
+            return
+        with cls.__lock:
+            # 写入前发布已失效(重新发布、取消发布)或未开启结果缓存, 不缓存执行结果
+            publish = cls.__publishes.get(key[0])
+            if publish is None or publish[2] != ResultCachePolicy.Cache:
+                return
+            cls.__remove(key)
+            cls.__entries[key] = (time.monotonic() + PUBLISH_RESULT_CACHE_SECONDS, body, process_id)
+            cls.__bytes += len(body)
+            while len(cls.__entries) > PUBLISH_RESULT_CACHE_SIZE or cls.__bytes > PUBLISH_RESULT_CACHE_MAX_BYTES:
+                cls.__remove(next(iter(cls.__entries)))
+
+    @classmethod
+    def __remove(cls, key):
+        cached = cls.__entries.pop(key, None)
+        if cached is not None:
+            cls.__bytes -= len(cached[1])
+
+    @classmethod
+    def invalidate(cls, publish_id=None):
+        """
+        使发布的缓存结果及发布信息失效
+        :param publish_id: 发布标识, 为空时清空全部缓存
+        :return: None
+        """
+        with cls.__lock:
+            if publish_id is None:
+                cls.__entries.clear()
+                cls.__bytes = 0
+                cls.__publishes.clear()
+                return
+            cls.__publishes.pop(publish_id, None)
+            for key in [key for key in cls.__entries if key[0] == publish_id]:
+                cls.__remove(key)
+
+    @classmethod
+    def invalidate_version(cls, version_id):
+        """
+        使版本的缓存结果失效, 版本 DAG 配置变化时调用
+        :param version_id: 版本标识
+        :return: None
+        """
+        with cls.__lock:
+            for publish_id in [key for key, value in cls.__publishes.items() if value[1] == version_id]:
+                cls.__publishes.pop(publish_id, None)
+            for key in [key for key in cls.__entries if key[1] == version_id]:
+                cls.__remove(key)
+
+    @classmethod
+    def counters(cls, publish_id):
+        """
+        发布接口结果缓存命中统计, 自应用启动起累计
+        :param publish_id: 发布标识
+        :return: {"cache_hit_count": 命中次数, "cache_miss_count": 未命中次数}
+        """
+        with cls.__lock:
+            hit, miss = cls.__counters.get(publish_id, (0, 0))
+        return {"cache_hit_count": hit, "cache_miss_count": miss}
+
+
+def cache_key(publish_id, version_id, sync_input_data):
+    """
+    生成缓存键, 同步输入数据按键排序后序列化再取摘要, 与字段顺序无关
+    :param publish_id: 发布标识
+    :param version_id: 版本标识
+    :param sync_input_data: 同步输入数据
+    :return: 缓存键
+    """
+    canonical = json.dumps(
+        sync_input_data,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return publish_id, version_id, hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -1,10 +1,18 @@
 from abc import abstractmethod
 
-from helper.oss_helper.oss_helper import oss_helper1
+from core.element_config_cache import ElementConfigCache
+from core.process_data_writer import ProcessDataWriter
 from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class AbstractElement:
+    # 是否支持直接接收列式数据集 ColumnarDataset, 不支持的算子由执行引擎转换为字典数组后传入
+    columnar_input = False
+    # 配置是否为算子配置表中的单行查询, 支持时由执行引擎在执行前批量预取
+    prefetch_config = False
+    # 相同输入是否总是产生相同输出且不读写外部数据, 发布接口只缓存全部算子均确定的流水线结果
+    deterministic = True
+
     def __init__(self, element_id, version_id, user_id):
         """
         初始化方法
@@ -17,6 +25,15 @@ class AbstractElement:
         self.u_id = user_id
         pass
 
+    @classmethod
+    def is_deterministic(cls, element_config):
+        """
+        根据算子配置判断算子是否确定, 输出依赖随机种子等配置的算子重写该方法
+        :param element_config: 预取的算子配置, 未预取时为 None
+        :return: 是、否
+        """
+        return cls.deterministic
+
     @abstractmethod
     def element_process(
         self,
@@ -32,16 +49,30 @@ class AbstractElement:
         """算子执行函数"""
         """抽象方法，所有算子被执行引擎调用时，均执行该方法"""
 
+    def fetch_element_config(self, sql, **kwargs):
+        """
+        获取算子配置, 优先使用执行引擎传入或批量预取的配置, 未预取时根据 SQL 查询
+        :param sql: 查询算子配置的 SQL
+        :param kwargs: 执行引擎传入的参数, element_config 为引擎传入的配置
+        :return: 配置字典
+        """
+        if kwargs.get("element_config") is not None:
+            return dict(kwargs["element_config"])
+        prefetched, element_config = ElementConfigCache.lookup(self.v_id, self.e_id)
+        if prefetched:
+            return element_config
+        return db_helper1.fetchone(sql, [])
+
     @staticmethod
     def insert_process_pipelining(sql, params=None):
         """
-        根据 SQL 将执行记录插入到记录表中
+        根据 SQL 将执行记录插入到记录表中, 后写模式下由 ProcessDataWriter 批量写入
         :param sql: SQL
         :param params: 动态参数
         :return: 插入成功 or 失败
         """
-        return db_helper1.execute(sql, params)
+        return ProcessDataWriter.insert(sql, params)
 
     @staticmethod
     def create_csv_file(data, fields=None):
-        return oss_helper1.create_csv_file(data, fields)
+        return ProcessDataWriter.create_csv_file(data, fields)
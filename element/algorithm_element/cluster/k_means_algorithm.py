@@ -14,11 +14,13 @@ from helper.element_port_helper import port
 from helper.fields_helper import generate_fields
 from helper.polynomial_processing_helper import data_conversion
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class KMeansElement(AbstractElement):
+    prefetch_config = True
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -65,7 +67,7 @@ class KMeansElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        k_means_dict = db_helper1.fetchone(k_means_sql, [])
+        k_means_dict = self.fetch_element_config(k_means_sql, **kwargs)
         data = port(0, data_arr)
         fields = port(0, fields_arr)
         if not k_means_dict or "k_num" not in k_means_dict:
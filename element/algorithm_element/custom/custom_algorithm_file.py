@@ -14,6 +14,8 @@ from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class CustomAlgorithmFile(AbstractElement):
+    deterministic = False
+
     def element_process(
         self,
         process_id,
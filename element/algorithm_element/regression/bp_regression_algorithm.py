@@ -1,14 +1,13 @@
 import json
-import os
 import sys
 
+import numpy as np
 import torch
 import torch.nn as nn
 
 from element.abstract_element import AbstractElement
 from enum_type.enabled import Enabled
 from enum_type.library_type import LibraryType
-from enum_type.process_status_type import ProcessStatusType
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from error.predict_error import PredictError
@@ -18,12 +17,15 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import get_x_count, get_y_count, train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
+from helper.train_helper import fit
 from helper.warning_helper import UNUSED
 from helper.websocket_helper import generate_running_message, send_message
 
 
 class BpRegressionAlgorithm(AbstractElement):
+    prefetch_config = True
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -80,11 +82,11 @@ class BpRegressionAlgorithm(AbstractElement):
         fields = port(0, fields_arr)
         if not role_setting_arr:
             raise ExecuteError(sys._getframe().f_code.co_name, f"执行{element_name}前, 未进行角色配置") from None
-        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr)
+        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr, dtype=np.float32)
         x_count = get_x_count(role_setting_arr)
         y_count = get_y_count(role_setting_arr)
 
-        bp_regression_dict = db_helper1.fetchone(bp_regression_sql, [])
+        bp_regression_dict = self.fetch_element_config(bp_regression_sql, **kwargs)
         if not bp_regression_dict or "epoch" not in bp_regression_dict or "lr" not in bp_regression_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         """
@@ -111,9 +113,8 @@ class BpRegressionAlgorithm(AbstractElement):
             connect_id = kwargs.get("connect_id")
             websocket = kwargs.get("websocket")
             element_name = kwargs.get("element_name")
-            shared_mem = kwargs.get("shared_mem")
 
-            model = reg.train(connect_id, websocket, element_name, shared_mem)
+            model = reg.train(connect_id, websocket, element_name)
 
             store_sql = process_data_store(
                 process_id,
@@ -176,31 +177,22 @@ class DeepLearningBP:
         self.device = device
         # self.data_loader = DataLoader(self.data, batch_size=550, shuffle=True)
 
-    def train(self, connect_id, websocket, element_name, shared_mem):
+    def train(self, connect_id, websocket, element_name):
         md = BP(self.input_size, self.output_size, self.number_of_node)
         # noinspection PyTypeChecker
         md.to(device=self.device)
-        mse_loss = nn.MSELoss()
         md_optim = torch.optim.Adam(md.parameters(), lr=self.lr)
-        pid = os.getpid()
-        for epoch in range(self.epoch):
-            md_optim.zero_grad()
-            y_pre = md.forward(self.x_train)
-            loss = mse_loss(y_pre, self.y_train)
-            loss.backward()
-            md_optim.step()
-
-            m = shared_mem.get(f"{pid}_{connect_id}")
-            if m and m == ProcessStatusType.Kill.value:
-                return md
 
+        def progress(epoch, loss):
             if epoch % 100 == 0:
                 msg = generate_running_message(
                     connect_id,
                     f"{element_name}节点执行进度: "
                     f"{(epoch/self.epoch) * 100:.3f}%, "
-                    f"Loss: {loss.cpu().detach().item()}",
+                    f"Loss: {loss}",
                 )
                 send_message(websocket, msg)
-                print(f"Epoch:{epoch},Loss:{loss.cpu().detach().item()}")
-        return md
+                print(f"Epoch:{epoch},Loss:{loss}")
+
+        # 小批量训练, 监控损失不再下降时提前停止并恢复为最优参数
+        return fit(md, self.x_train, self.y_train, md_optim, self.epoch, loss_func=nn.MSELoss(), progress=progress)
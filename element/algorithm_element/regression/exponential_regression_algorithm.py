@@ -16,11 +16,12 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import get_x_count, get_y_count, train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ExponentialRegressionAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -87,7 +88,7 @@ class ExponentialRegressionAlgorithm(AbstractElement):
         # 是否存在初始值标志
         initial_flag = True
 
-        exponential_regression_dict = db_helper1.fetchone(exponential_regression_sql, [])
+        exponential_regression_dict = self.fetch_element_config(exponential_regression_sql, **kwargs)
         if (
             not exponential_regression_dict
             or "a" not in exponential_regression_dict
@@ -1,6 +1,7 @@
 import json
 import sys
 
+import numpy as np
 from sklearn.linear_model import ElasticNetCV, LassoCV, RidgeCV
 
 from element.abstract_element import AbstractElement
@@ -16,11 +17,13 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class LinearRegressionAlgorithm(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -77,9 +80,9 @@ class LinearRegressionAlgorithm(AbstractElement):
         fields = port(0, fields_arr)
         if not role_setting_arr:
             raise ExecuteError(sys._getframe().f_code.co_name, f"执行{element_name}前, 未进行角色配置") from None
-        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr)
+        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr, dtype=np.float64)
 
-        linear_regression_dict = db_helper1.fetchone(linear_regression_sql, [])
+        linear_regression_dict = self.fetch_element_config(linear_regression_sql, **kwargs)
         if (
             not linear_regression_dict
             or "penalty" not in linear_regression_dict
@@ -16,11 +16,12 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import get_x_count, get_y_count, train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class LogarithmRegressionAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -85,7 +86,7 @@ class LogarithmRegressionAlgorithm(AbstractElement):
         # 是否存在初始值标志
         initial_flag = True
 
-        logarithm_regression_dict = db_helper1.fetchone(logarithm_regression_sql, [])
+        logarithm_regression_dict = self.fetch_element_config(logarithm_regression_sql, **kwargs)
         if (
             not logarithm_regression_dict
             or "a" not in logarithm_regression_dict
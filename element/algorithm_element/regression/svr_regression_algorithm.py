@@ -1,6 +1,7 @@
 import json
 import sys
 
+import numpy as np
 from sklearn.svm import SVR
 
 from element.abstract_element import AbstractElement
@@ -15,11 +16,13 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class SVRRegressionAlgorithm(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -76,9 +79,9 @@ class SVRRegressionAlgorithm(AbstractElement):
         fields = port(0, fields_arr)
         if not role_setting_arr:
             raise ExecuteError(sys._getframe().f_code.co_name, f"执行{element_name}前, 未进行角色配置") from None
-        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr)
+        x_matrix, y_matrix = train_matrix_build(train, role_setting_arr, dtype=np.float64)
 
-        svr_regression_dict = db_helper1.fetchone(svr_regression_sql, [])
+        svr_regression_dict = self.fetch_element_config(svr_regression_sql, **kwargs)
         if (
             not svr_regression_dict
             or "c" not in svr_regression_dict
@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 import torch
 from scipy.optimize import curve_fit
-from torch import optim
+from torch import nn, optim
 
 from element.abstract_element import AbstractElement
 from enum_type.enabled import Enabled
@@ -21,12 +21,14 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
+from helper.train_helper import fit
 from helper.warning_helper import UNUSED
 from helper.websocket_helper import generate_running_message, send_message
 
 
 class WeibullAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -85,7 +87,7 @@ class WeibullAlgorithm(AbstractElement):
         _, y_matrix = train_matrix_build(train, role_setting_arr)
 
         # 是否存在初始值标志
-        weibull_dict = db_helper1.fetchone(weibull_regression_sql, [])
+        weibull_dict = self.fetch_element_config(weibull_regression_sql, **kwargs)
         if (
             not weibull_dict
             or "calc_method" not in weibull_dict
@@ -387,47 +389,45 @@ class Weibull:
         return m, a
 
     def single_bp_regression(self, x, y, k, m, a, opt, lr, epoch, connect_id, websocket, element_name):
-        m_estimate = torch.tensor(float(m), requires_grad=True)
-        a_estimate = torch.tensor(float(a), requires_grad=True)
+        md = WeibullPdf(k, m, a)
         # 定义优化器
         if opt == "adam":
-            optimizer = optim.Adam([m_estimate, a_estimate], lr=lr)
+            optimizer = optim.Adam(md.parameters(), lr=lr)
         elif opt == "sgd":
-            optimizer = optim.SGD([m_estimate, a_estimate], lr=lr)
+            optimizer = optim.SGD(md.parameters(), lr=lr)
         else:
             raise DataProcessError("优化器参数不在数据字典中，请重新获取") from None
 
-        # 开始训练
-        for epoch in range(epoch):
-            # 计算分布
-            predicted = self.single_bp_weibull_pdf(x, k, m_estimate, a_estimate)
-            # mse
-            loss = ((predicted - y) ** 2).mean()
-
-            # mae
-            # loss = torch.abs(predicted - self.y).mean()
-
-            # 反向传播和优化
-            optimizer.zero_grad()
-            loss.backward()
-            optimizer.step()
-
-            if (epoch + 1) % 100 == 0:
+        def progress(i, loss):
+            if (i + 1) % 100 == 0:
                 msg = generate_running_message(
                     connect_id,
-                    f"{element_name}节点执行进度: Epoch[{epoch + 1} / {self.epoch}], "
-                    f"Loss: {loss.item():.4f}, "
-                    f"m: {m_estimate.item():.4f}, "
-                    f"a: {a_estimate.item():.4f}",
+                    f"{element_name}节点执行进度: Epoch[{i + 1} / {self.epoch}], "
+                    f"Loss: {loss:.4f}, "
+                    f"m: {md.m.item():.4f}, "
+                    f"a: {md.a.item():.4f}",
                 )
                 send_message(websocket, msg)
                 print(
-                    f"Epoch [{epoch + 1}/{self.epoch}], Loss: {loss.item():.4f}, "
-                    f"m: {m_estimate.item():.4f}, a: {a_estimate.item():.4f}"
+                    f"Epoch [{i + 1}/{self.epoch}], Loss: {loss:.4f}, "
+                    f"m: {md.m.item():.4f}, a: {md.a.item():.4f}"
                 )
 
-        m = m_estimate.item()
-        a = a_estimate.item()
+        # 曲线需拟合全部点位, 整批训练且不划分验证集, 训练损失不再下降时提前停止
+        # 取消执行时以当前最优估计值结束训练
+        fit(
+            md,
+            x,
+            y,
+            optimizer,
+            epoch,
+            loss_func=nn.MSELoss(),
+            batch_size=0,
+            validation_fraction=0,
+            progress=progress,
+        )
+        m = md.m.item()
+        a = md.a.item()
         return m, a
 
     def single_linear_regression(self, x, y, k, m, a):
@@ -438,10 +438,6 @@ class Weibull:
         a = params[1]
         return m, a
 
-    @staticmethod
-    def single_bp_weibull_pdf(x, k, m, a):
-        return k * (m * a * torch.pow(x, m - 1) * torch.exp(-a * torch.pow(x, m)))
-
     def single_liner_weibull_pdf(self, x, m, a):
         exponent = -a * (x**m)
         return self.k * (m * a * (x ** (m - 1)) * np.exp(exponent))
@@ -481,3 +477,18 @@ class Weibull:
             m_list.append(m)
             a_list.append(a)
         return m_list, a_list
+
+
+class WeibullPdf(nn.Module):
+    """
+    以形状参数 m、尺度参数 a 为待训练参数的威布尔分布密度函数
+    """
+
+    def __init__(self, k, m, a):
+        super(WeibullPdf, self).__init__()
+        self.k = k
+        self.m = nn.Parameter(torch.tensor(float(m)))
+        self.a = nn.Parameter(torch.tensor(float(a)))
+
+    def forward(self, x):
+        return self.k * (self.m * self.a * torch.pow(x, self.m - 1) * torch.exp(-self.a * torch.pow(x, self.m)))
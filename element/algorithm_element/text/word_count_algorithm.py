@@ -17,12 +17,13 @@ from helper.error_helper import translate_error_message
 from helper.fields_helper import generate_fields
 from helper.generate_helper import generate_uuid
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 from helper.word_helper import stopwords
 
 
 class WordCountAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -72,7 +73,7 @@ class WordCountAlgorithm(AbstractElement):
         fields = port(0, fields_arr)
         role = port(0, role_arr)
 
-        cut_word_dict = db_helper1.fetchone(cut_word_sql, [])
+        cut_word_dict = self.fetch_element_config(cut_word_sql, **kwargs)
         if not cut_word_dict or "column_name" not in cut_word_dict or not cut_word_dict["column_name"]:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置分词字段") from None
 
@@ -15,11 +15,12 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.fields_helper import generate_fields
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class WordTagAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -68,7 +69,7 @@ class WordTagAlgorithm(AbstractElement):
         data = port(0, data_arr)
         fields = port(0, fields_arr)
 
-        word_tag_dict = db_helper1.fetchone(word_tag_sql, [])
+        word_tag_dict = self.fetch_element_config(word_tag_sql, **kwargs)
         if (
             not word_tag_dict
             or "top_k" not in word_tag_dict
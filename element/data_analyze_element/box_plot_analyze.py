@@ -10,10 +10,11 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class BoxPlotAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +60,7 @@ class BoxPlotAnalyze(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        box_sql_dict = db_helper1.fetchone(box_sql, [])
+        box_sql_dict = self.fetch_element_config(box_sql, **kwargs)
         if "dimension_column" not in box_sql_dict or "value_column" not in box_sql_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         dimension_column = box_sql_dict["dimension_column"]
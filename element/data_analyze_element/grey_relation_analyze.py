@@ -16,11 +16,12 @@ from helper.element_port_helper import port
 from helper.matrix_helper import matrix_data_format_conversion
 from helper.polynomial_processing_helper import data_conversion
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class GreyRelationAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -75,7 +76,7 @@ class GreyRelationAnalyze(AbstractElement):
         data = port(0, data_arr)
         fields = port(0, fields_arr)
 
-        grey_relation_analyze_dict = db_helper1.fetchone(grey_relation_analyze_sql, [])
+        grey_relation_analyze_dict = self.fetch_element_config(grey_relation_analyze_sql, **kwargs)
         if (
             not grey_relation_analyze_dict
             or "rho" not in grey_relation_analyze_dict
@@ -11,10 +11,11 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class LinePlotAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -60,7 +61,7 @@ class LinePlotAnalyze(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        x_y_axis_sql_dict = db_helper1.fetchone(x_y_axis_sql, [])
+        x_y_axis_sql_dict = self.fetch_element_config(x_y_axis_sql, **kwargs)
         if "x" not in x_y_axis_sql_dict or "y" not in x_y_axis_sql_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         x = x_y_axis_sql_dict["x"]
@@ -10,10 +10,11 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class PiePlotAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +60,7 @@ class PiePlotAnalyze(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        dimension_mapping_dict = db_helper1.fetchone(dimension_mapping_sql, [])
+        dimension_mapping_dict = self.fetch_element_config(dimension_mapping_sql, **kwargs)
         if "dimension_mapping" not in dimension_mapping_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         dimension_mapping_json = dimension_mapping_dict["dimension_mapping"]
@@ -12,12 +12,13 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.fields_helper import generate_fields
 from helper.result_helper import process_error, process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 from library_operator import library_operator
 
 
 class SobolAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -73,7 +74,7 @@ class SobolAnalyze(AbstractElement):
         role_setting_arr = port(0, role_arr)
 
         # [{"name":xxx,"max":xx,"min":xx}]
-        sobol_analyze_dict = db_helper1.fetchone(sobol_analyze_sql, [])
+        sobol_analyze_dict = self.fetch_element_config(sobol_analyze_sql, **kwargs)
         if not sobol_analyze_dict or "feature_value" not in sobol_analyze_dict:
             return process_error(message=f"{element_name}未配置完毕")
 
@@ -10,10 +10,11 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class TreePlotAnalyze(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +60,7 @@ class TreePlotAnalyze(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        column_sql_dict = db_helper1.fetchone(column_sql, [])
+        column_sql_dict = self.fetch_element_config(column_sql, **kwargs)
         if (
             "id_column" not in column_sql_dict
             or "pid_column" not in column_sql_dict
@@ -11,11 +11,12 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.fields_helper import merge_fields
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ColumnAdd(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -60,7 +61,7 @@ class ColumnAdd(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        column_add_dict = db_helper1.fetchone(column_add_sql, [])
+        column_add_dict = self.fetch_element_config(column_add_sql, **kwargs)
 
         if not column_add_dict or "add_fields" not in column_add_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
@@ -13,11 +13,13 @@ from helper.dictionary_rename_helper import dict_rename, field_rename, scaler_re
 from helper.element_port_helper import port
 from helper.join_helper import distinct_list_of_dict
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class DataJoin(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -67,7 +69,7 @@ class DataJoin(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        join_sql_dict = db_helper1.fetchone(join_sql, [])
+        join_sql_dict = self.fetch_element_config(join_sql, **kwargs)
         if (
             not join_sql_dict
             or "join_type" not in join_sql_dict
@@ -11,11 +11,13 @@ from helper.column_data_process_helper import column_data_process
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ColumnDataProcess(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +61,7 @@ class ColumnDataProcess(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        data_process_dict = db_helper1.fetchone(data_process_sql, [])
+        data_process_dict = self.fetch_element_config(data_process_sql, **kwargs)
 
         if not data_process_dict or "process_fields" not in data_process_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
@@ -13,11 +13,12 @@ from helper.column_type_convert_helper import (
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ColumnTypeConvert(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -61,7 +62,7 @@ class ColumnTypeConvert(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        type_convert_dict = db_helper1.fetchone(type_convert_sql, [])
+        type_convert_dict = self.fetch_element_config(type_convert_sql, **kwargs)
 
         if not type_convert_dict or "convert_fields" not in type_convert_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
@@ -10,11 +10,13 @@ from helper.data_filter_helper import data_filter
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class DataFilter(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -58,7 +60,7 @@ class DataFilter(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        data_filter_dict = db_helper1.fetchone(data_filter_sql, [])
+        data_filter_dict = self.fetch_element_config(data_filter_sql, **kwargs)
 
         if (
             not data_filter_dict
@@ -10,11 +10,12 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class DataReplication(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +60,7 @@ class DataReplication(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        data_replication_dict = db_helper1.fetchone(data_replication_sql, [])
+        data_replication_dict = self.fetch_element_config(data_replication_sql, **kwargs)
 
         if not data_replication_dict or "output_port_num" not in data_replication_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
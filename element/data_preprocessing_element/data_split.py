@@ -16,12 +16,22 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 from service.data_model.data_model_service import get_split_sample_data
 
 
 class DataSplit(AbstractElement):
+    prefetch_config = True
+
+    @classmethod
+    def is_deterministic(cls, element_config):
+        """
+        配置了随机种子时切分结果确定
+        :param element_config: 预取的算子配置
+        :return: 是、否
+        """
+        return bool(element_config) and element_config.get("random_seed") not in (None, "")
+
     def element_process(
         self,
         process_id,
@@ -118,7 +128,7 @@ class DataSplit(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        data_split_dict = db_helper1.fetchone(data_split_sql, [])
+        data_split_dict = self.fetch_element_config(data_split_sql, **kwargs)
         if not data_split_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
 
@@ -15,11 +15,12 @@ from helper.min_max_helper import (
     min_max_filter_column_data,
 )
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class InverseMinMaxScalerElement(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -63,7 +64,7 @@ class InverseMinMaxScalerElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        inverse_min_max_scaler_dict = db_helper1.fetchone(inverse_min_max_scaler_sql, [])
+        inverse_min_max_scaler_dict = self.fetch_element_config(inverse_min_max_scaler_sql, **kwargs)
 
         if not inverse_min_max_scaler_dict or "inverse_min_max_fields" not in inverse_min_max_scaler_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
@@ -15,11 +15,13 @@ from helper.min_max_helper import (
     min_max_scaler,
 )
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class MinMaxScalerElement(AbstractElement):
+    columnar_input = True
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -63,7 +65,7 @@ class MinMaxScalerElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        min_max_scaler_dict = db_helper1.fetchone(min_max_scaler_sql, [])
+        min_max_scaler_dict = self.fetch_element_config(min_max_scaler_sql, **kwargs)
 
         if not min_max_scaler_dict or "min_max_fields" not in min_max_scaler_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
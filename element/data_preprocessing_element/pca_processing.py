@@ -15,11 +15,12 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.fields_helper import generate_fields
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class PCAProcessingElement(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -63,7 +64,7 @@ class PCAProcessingElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        pca_processing_dict = db_helper1.fetchone(pca_sql, [])
+        pca_processing_dict = self.fetch_element_config(pca_sql, **kwargs)
         data = port(0, data_arr)
         role_setting_arr = port(0, role_arr)
         if not role_setting_arr:
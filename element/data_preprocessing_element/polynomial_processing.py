@@ -10,11 +10,12 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.polynomial_processing_helper import PolynomialProcessing, data_conversion
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class PolynomialProcessingElement(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -58,7 +59,7 @@ class PolynomialProcessingElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        polynomial_processing_dict = db_helper1.fetchone(polynomial_sql, [])
+        polynomial_processing_dict = self.fetch_element_config(polynomial_sql, **kwargs)
         data = port(0, data_arr)
         fields = port(0, fields_arr)
 
@@ -11,11 +11,12 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.fields_helper import generate_fields
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class RoleSetting(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -59,7 +60,7 @@ class RoleSetting(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        role_setting_dict = db_helper1.fetchone(role_setting_sql, [])
+        role_setting_dict = self.fetch_element_config(role_setting_sql, **kwargs)
         if not role_setting_dict or "role_setting_fields" not in role_setting_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         role_json = role_setting_dict["role_setting_fields"]
@@ -17,11 +17,12 @@ from helper.element_port_helper import port
 from helper.fields_helper import generate_fields
 from helper.matrix_helper import train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ClassificationEvaluate(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -89,7 +90,7 @@ class ClassificationEvaluate(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        evaluate_dict = db_helper1.fetchone(evaluate_sql, [])
+        evaluate_dict = self.fetch_element_config(evaluate_sql, **kwargs)
 
         if not evaluate_dict or "evaluate_list" not in evaluate_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
@@ -16,11 +16,12 @@ from helper.element_port_helper import port
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import data_format_conversion
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class AnalogyEstimationAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -105,7 +106,7 @@ class AnalogyEstimationAlgorithm(AbstractElement):
         if len(y_role_arr) == 0:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置因变量角色") from None
 
-        analogy_estimation_dict = db_helper1.fetchone(analogy_estimation_sql, [])
+        analogy_estimation_dict = self.fetch_element_config(analogy_estimation_sql, **kwargs)
         if not analogy_estimation_dict or "l" not in analogy_estimation_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         """
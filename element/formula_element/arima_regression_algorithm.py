@@ -17,11 +17,12 @@ from helper.error_helper import translate_error_message
 from helper.fields_helper import generate_fields
 from helper.matrix_helper import get_y_count, train_matrix_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ARIMARegressionAlgorithm(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -83,7 +84,7 @@ class ARIMARegressionAlgorithm(AbstractElement):
         if y_count != 1:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}因变量只能配置一个") from None
 
-        arima_regression_dict = db_helper1.fetchone(arima_regression_sql, [])
+        arima_regression_dict = self.fetch_element_config(arima_regression_sql, **kwargs)
         if (
             not arima_regression_dict
             or "p" not in arima_regression_dict
@@ -9,10 +9,11 @@ from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.error_helper import translate_error_message
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 
 
 class CustomFormula(AbstractElement):
+    prefetch_config = True
+
     def element_process(
         self,
         process_id,
@@ -57,7 +58,7 @@ class CustomFormula(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        custom_formula_dict = db_helper1.fetchone(custom_formula_sql, [])
+        custom_formula_dict = self.fetch_element_config(custom_formula_sql, **kwargs)
         if not custom_formula_dict or "formula_content" not in custom_formula_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         formula_content = custom_formula_dict["formula_content"]
@@ -1,7 +1,9 @@
 import json
 import sys
 
+from config.setting import DATABASE_INPUT_FETCH_SIZE
 from element.abstract_element import AbstractElement
+from entity.dataset.columnar_dataset import ColumnarDataset
 from enum_type.deleted import Deleted
 from enum_type.enabled import Enabled
 from enum_type.result_code import ResultCode
@@ -9,11 +11,14 @@ from error.execute_error import ExecuteError
 from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.result_helper import fetch_error, fetch_success, process_success
+from helper.scan_hint_helper import scan_hint, scan_sql
 from helper.sql_helper.init_sql_helper import db_helper1, db_helper2
 from helper.warning_helper import UNUSED
 
 
 class DataModel(AbstractElement):
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -55,13 +60,15 @@ class DataModel(AbstractElement):
 
         # 获取列数据
         fetch_fields = db_helper2.fetch_fields_format(table_name)
-        # 获取数据集
-        data_sql = f"select * from {table_name}"
-        origin_fetch_data = db_helper2.fetchall(data_sql)
-        field_name_list = [f["name"] for f in fetch_fields]
-        fetch_data = []
-        for d in origin_fetch_data:
-            fetch_data.append({key: d[key] for key in field_name_list if key in d})
+        # 只查询字段信息中的列(不含自定义的时间列), 并根据下游算子只读取需要的列和行
+        column_name_dict = {
+            (f.get("column_name") or "").lower(): f.get("column_name") for f in db_helper2.fetch_fields(table_name)
+        }
+        hint = scan_hint(self.v_id, self.e_id)
+        data_sql, params, fetch_fields = scan_sql(table_name, fetch_fields, column_name_dict, hint, db_helper2.cls)
+        # 分批读取数据集, 逐批转为列式存储
+        batches = db_helper2.fetch_stream(data_sql, DATABASE_INPUT_FETCH_SIZE, params)
+        fetch_data = ColumnarDataset.from_batches(batches, fetch_fields)
         # 保存运行信息到记录表中，用于洞察中回看
         store_sql = process_data_store(
             process_id,
@@ -1,19 +1,24 @@
 import json
 import sys
 
+from config.setting import DATABASE_INPUT_FETCH_SIZE
 from element.abstract_element import AbstractElement
+from entity.dataset.columnar_dataset import ColumnarDataset
 from enum_type.enabled import Enabled
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
 from helper.result_helper import process_success
+from helper.scan_hint_helper import scan_hint, scan_sql
 from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 from service.data_source.data_source_service import get_transient_sql_helper
 
 
 class DatabaseInput(AbstractElement):
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -72,12 +77,19 @@ class DatabaseInput(AbstractElement):
         conn = get_transient_sql_helper(datasource_id)
         # 获取列数据
         fields = conn.fetch_fields_format(data_table_name)
-        # 获取数据集
-        data_sql = f"select * from {data_table_name}"
-        data = conn.fetchall(data_sql)
-
-        if data is None:
+        # 根据下游算子只读取需要的列和行
+        data_sql, params = f"select * from {data_table_name}", []
+        hint = scan_hint(self.v_id, self.e_id)
+        if hint:
+            column_name_dict = {
+                (f.get("column_name") or "").lower(): f.get("column_name") for f in conn.fetch_fields(data_table_name)
+            }
+            data_sql, params, fields = scan_sql(data_table_name, fields, column_name_dict, hint, conn.cls)
+        # 分批读取数据集, 逐批转为列式存储
+        batches = conn.fetch_stream(data_sql, DATABASE_INPUT_FETCH_SIZE, params)
+        if batches is None:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}获取数据失败") from None
+        data = ColumnarDataset.from_batches(self.valid_batches(batches, element_name), fields)
         store_sql = process_data_store(
             process_id,
             self.v_id,
@@ -97,5 +109,18 @@ class DatabaseInput(AbstractElement):
             ) from None
         return process_success(data_arr=[data], fields_arr=[fields])
 
+    @staticmethod
+    def valid_batches(batches, element_name):
+        """
+        校验分批读取的数据, 某批读取失败时抛出异常, 避免失败的读取作为空数据集传给下游算子
+        :param batches: 字典数组的迭代器
+        :param element_name: 算子名称
+        :return: 字典数组的迭代器
+        """
+        for records in batches:
+            if records is None:
+                raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}获取数据失败") from None
+            yield records
+
     def __init__(self, e_id, v_id, u_id):
         super().__init__(e_id, v_id, u_id)
@@ -1,12 +1,15 @@
 import json
 import sys
 
+from config.setting import DATABASE_OUTPUT_BATCH_SIZE
 from element.abstract_element import AbstractElement
 from enum_type.enabled import Enabled
 from enum_type.result_code import ResultCode
+from enum_type.write_mode import WriteMode
 from error.execute_error import ExecuteError
 from error.store_error import StoreError
 from helper.data_store_helper import process_data_store
+from helper.database_output_helper import WriteModeColumns
 from helper.element_port_helper import port
 from helper.result_helper import process_success
 from helper.sql_helper.init_sql_helper import db_helper1
@@ -15,6 +18,9 @@ from service.data_source.data_source_service import get_transient_sql_helper
 
 
 class DatabaseOutput(AbstractElement):
+    prefetch_config = True
+    deterministic = False
+
     """
     数据库输出算子
     """
@@ -56,15 +62,15 @@ class DatabaseOutput(AbstractElement):
         data = port(0, data_arr)
         fields = port(0, fields_arr)
 
-        # 获取算子的配置
+        # 获取算子的配置, 未增加 write_mode、key_columns 列的库按追加写入处理
         database_output_sql = (
-            f"select datasource_id, data_table_name "
+            f"select datasource_id, data_table_name{WriteModeColumns.sql()} "
             f"from ml_database_output_element "
             f"where id='{self.e_id}' and "
             f"version_id='{self.v_id}' and "
             f"is_enabled={Enabled.Yes.value}"
         )
-        database_output_dict = db_helper1.fetchone(database_output_sql, [])
+        database_output_dict = self.fetch_element_config(database_output_sql, **kwargs)
 
         if (
             not database_output_dict
@@ -76,6 +82,12 @@ class DatabaseOutput(AbstractElement):
         target_table_name = database_output_dict["data_table_name"]
         if not datasource_id or not target_table_name:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
+        write_mode = database_output_dict.get("write_mode")
+        if write_mode is None:
+            write_mode = WriteMode.Append.value
+        key_columns = json.loads(database_output_dict.get("key_columns") or "[]")
+        if write_mode == WriteMode.Upsert.value and not key_columns:
+            raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置主键列") from None
 
         # 获取算子列的配置
         database_output_column_sql = (
@@ -144,7 +156,6 @@ class DatabaseOutput(AbstractElement):
             column["target_column_info"] = target_column_info
 
         # 数据进入目标库，并拼装洞察数据
-        store_data = []
         store_fields = []
         # 列
         for column in database_output_column_arr:
@@ -155,19 +166,29 @@ class DatabaseOutput(AbstractElement):
                     "data_type": column.get("source_column_data_type"),  # 源数据类型
                 }
             )
-        # 数据
-        for s_row in data:
-            t_row = {}  # 目标行数据，存洞察数据用
-            target_fields = []
-            for column in database_output_column_arr:
-                source_column_code = column.get("source_column_code")  # 源字段名
-                target_column_code = column.get("target_column_code")  # 目标字段名
-                value = s_row.get(source_column_code)  # 值
-                t_row[target_column_code] = value  # 记录洞察数据值
-                target_fields.append(column.get("target_column_info"))  # 目标列信息
-
-            db_helper_target.insert_by_fields(target_table_name, target_fields, t_row)  # 入库
-            store_data.append(t_row)  # 记录洞察数据
+        # 数据, 按目标列顺序组装绑定的值
+        source_column_arr = [column.get("source_column_code") for column in database_output_column_arr]
+        target_column_arr = [column.get("target_column_code") for column in database_output_column_arr]
+        row_arr = [tuple(s_row.get(x) for x in source_column_arr) for s_row in data]
+        store_data = [dict(zip(target_column_arr, row)) for row in row_arr]  # 记录洞察数据
+
+        # 单连接单事务按批写入目标库
+        if row_arr or write_mode == WriteMode.Overwrite.value:
+            write_result, batch_results = db_helper_target.bulk_write(
+                target_table_name,
+                target_column_arr,
+                row_arr,
+                DATABASE_OUTPUT_BATCH_SIZE,
+                write_mode,
+                key_columns,
+            )
+            if write_result != ResultCode.Success.value:
+                failed_batch = batch_results[-1]
+                raise ExecuteError(
+                    sys._getframe().f_code.co_name,
+                    f"{element_name}写入目标数据表失败, 第 {failed_batch['batch'] + 1} 批"
+                    f"({failed_batch['rows']} 条): {failed_batch['error']}",
+                ) from None
 
         # 保存运行信息到记录表中，用于洞察中回看
         relative_path = self.create_csv_file(store_data, store_fields)
@@ -22,6 +22,9 @@ from library_operator import library_operator
 
 
 class ModelFileOutput(AbstractElement):
+    prefetch_config = True
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -64,7 +67,7 @@ class ModelFileOutput(AbstractElement):
             f"version_id='{self.v_id}' and "
             f"is_enabled={Enabled.Yes.value}"
         )
-        model_file_output_dict = db_helper1.fetchone(model_file_output_sql, [])
+        model_file_output_dict = self.fetch_element_config(model_file_output_sql, **kwargs)
         if not model_file_output_dict or "model_name" not in model_file_output_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         # 保存模型文件
@@ -13,11 +13,13 @@ from helper.data_store_helper import process_data_store
 from helper.element_port_helper import port
 from helper.fields_helper import generate_fields
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class MonteCarloGenerateElement(AbstractElement):
+    prefetch_config = True
+    deterministic = False
+
     def element_process(
         self,
         process_id,
@@ -59,7 +61,7 @@ class MonteCarloGenerateElement(AbstractElement):
             f"version_id='{self.v_id}' and is_enabled={Enabled.Yes.value}"
         )
 
-        monte_carlo_generate_dict = db_helper1.fetchone(monte_carlo_generate_sql, [])
+        monte_carlo_generate_dict = self.fetch_element_config(monte_carlo_generate_sql, **kwargs)
 
         num_simulations = monte_carlo_generate_dict["num_simulations"]
         feature_value = json.loads(monte_carlo_generate_dict["feature_value"])
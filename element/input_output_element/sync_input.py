@@ -2,6 +2,7 @@ import json
 import sys
 
 from element.abstract_element import AbstractElement
+from entity.dataset.columnar_dataset import ColumnarDataset
 from enum_type.deleted import Deleted
 from enum_type.element_config_type import ElementConfigType
 from enum_type.enabled import Enabled
@@ -185,6 +186,7 @@ class SyncInput(AbstractElement):
             ]
         if data is None:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未传递对应数据") from None
+        data = ColumnarDataset.from_records(data, fields)
         store_sql = process_data_store(
             process_id,
             self.v_id,
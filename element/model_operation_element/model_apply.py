@@ -5,21 +5,24 @@ import numpy as np
 
 import library_operator.library_operator
 from element.abstract_element import AbstractElement
+from entity.dataset.columnar_dataset import ColumnarDataset, column_array
 from enum_type.enabled import Enabled
 from enum_type.library_type import LibraryType
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from error.store_error import StoreError
+from helper.columnar_helper import is_columnar
 from helper.data_store_helper import process_data_store
-from helper.dictionary_rename_helper import rename
 from helper.element_port_helper import port
-from helper.matrix_helper import dict_array_build
+from helper.matrix_helper import column_dict_build
 from helper.result_helper import process_success
-from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
 
 
 class ModelApply(AbstractElement):
+    prefetch_config = True
+    columnar_input = True
+
     def element_process(
         self,
         process_id,
@@ -62,7 +65,7 @@ class ModelApply(AbstractElement):
             f"is_enabled={Enabled.Yes.value}"
         )
 
-        model_apply_dict = db_helper1.fetchone(model_apply_sql, [])
+        model_apply_dict = self.fetch_element_config(model_apply_sql, **kwargs)
         if not model_apply_dict or "fields" not in model_apply_dict:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置输出字段") from None
         fields_json = model_apply_dict["fields"]
@@ -80,19 +83,22 @@ class ModelApply(AbstractElement):
         # matrix = prediction_matrix_build(data)
         model = model_dict["model"]
         library_type = model_dict["library_type"]
-        prediction_output_matrix = library_operator.library_operator.predict(model, data, library_type, prev_fields)
-        output_list = prediction_output_matrix.tolist()
-        # 特殊处理当 output_list 为单值时，处理为数组格式
-        if not isinstance(output_list, list):
-            output_list = [output_list]
-        if not output_list:
+        # 分批预测, 预测结果保持为数组
+        prediction_output_matrix = library_operator.library_operator.predict_in_batches(
+            model, data, library_type, prev_fields
+        )
+        output_matrix = np.asarray(prediction_output_matrix)
+        # 特殊处理当输出为单值时，处理为数组格式
+        if output_matrix.ndim == 0:
+            output_matrix = output_matrix.reshape(1)
+        if not output_matrix.size:
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}输出矩阵为空") from None
 
         # TODO: 特殊处理威布尔输出结果
         # if library_type == LibraryType.WeibullParameter.value:
         #     output_list = [[output_data] for output_data in output_list]
 
-        shapes = np.asarray(output_list).shape
+        shapes = output_matrix.shape
         if len(shapes) == 1:  # 一维数组处理
             shape = 1
         elif library_type == LibraryType.WeibullParameter.value:  # 特殊处理威布尔输出结果
@@ -123,24 +129,22 @@ class ModelApply(AbstractElement):
         #     generate_fields.extend(fields)
         #     fields = generate_fields[:]
 
-        # 推理结果数据处理
+        # 推理结果按列组装, 不逐行构造字典
         if library_type != LibraryType.WeibullParameter.value:
             output_list_fields = fields[len(prev_fields) : :]
         else:
             output_list_fields = fields
-        output_data = dict_array_build(output_list, output_list_fields)
-        # 推理结果数据拼接 Data 端口传入的数据
+        output_columns = column_dict_build(output_matrix, output_list_fields)
+        # 推理结果数据拼接 Data 端口传入的数据, 输入列按位置改名为配置的字段名
         if library_type != LibraryType.WeibullParameter.value:
             rename_dict_fields = fields[: len(prev_fields) :]
-            rename_data = rename(data, rename_dict_fields)
-
+            columns = {field["name"]: column for field, column in zip(rename_dict_fields, input_columns(data))}
+            columns.update(output_columns)
             rename_dict_fields.extend(output_list_fields)
-            rename_output_data = []
-            for i, d in enumerate(rename_data):
-                rename_output_data.append(dict(rename_data[i], **output_data[i]))
         else:
-            rename_output_data = output_data
+            columns = output_columns
             rename_dict_fields = fields
+        rename_output_data = ColumnarDataset(columns, rename_dict_fields)
         store_sql = process_data_store(
             process_id,
             self.v_id,
@@ -163,3 +167,14 @@ class ModelApply(AbstractElement):
 
     def __init__(self, e_id, v_id, u_id):
         super().__init__(e_id, v_id, u_id)
+
+
+def input_columns(data):
+    """
+    按列顺序取出输入数据的列数组
+    :param data: 字典数组或列式数据集
+    :return: 列数组的迭代器
+    """
+    if is_columnar(data):
+        return (data.column(name) for name in data.names)
+    return (column_array([d.get(name) for d in data]) for name in data[0].keys())
@@ -1,6 +1,7 @@
 import json
 import sys
 
+from core.model_cache import ModelCache
 from element.abstract_element import AbstractElement
 from enum_type.result_code import ResultCode
 from enum_type.store_type import StoreType
@@ -10,7 +11,6 @@ from helper.data_store_helper import process_data_store
 from helper.result_helper import process_success
 from helper.sql_helper.init_sql_helper import db_helper1
 from helper.warning_helper import UNUSED
-from library_operator import library_operator
 
 
 class ModelFile(AbstractElement):
@@ -66,7 +66,7 @@ class ModelFile(AbstractElement):
             raise ExecuteError(sys._getframe().f_code.co_name, f"{element_name}未配置完毕") from None
         key = model_file_dict["model_path"]
         library_type = model_file_dict["library_type"]
-        model = library_operator.load(key, library_type)
+        model = ModelCache.load(model_id, key, library_type)
 
         store_sql = process_data_store(process_id, self.v_id, self.e_id, self.u_id, StoreType.ModelFile.value)
         store_result = self.insert_process_pipelining(store_sql, [json.dumps({"model_name": model_name}), None])
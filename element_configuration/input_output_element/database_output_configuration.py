@@ -1,9 +1,12 @@
+import json
 import sys
 
 from enum_type.enabled import Enabled
 from enum_type.result_code import ResultCode
+from enum_type.write_mode import WriteMode
 from error.element_configuration_config_error import ElementConfigurationConfigError
 from error.element_configuration_query_error import ElementConfigurationQueryError
+from helper.database_output_helper import WriteModeColumns
 from helper.element_port_helper import get_fields_and_role
 from helper.generate_helper import generate_uuid, uuid_and_now
 from helper.result_helper import execute_success
@@ -25,16 +28,21 @@ def get(prev_node_output_port, prev_node_type, prev_element_id, version_id, elem
     :return: {
                 "datasource_id": "",
                 "data_table_name": "",
+                "write_mode": 0,
+                "key_columns": [],
                 "fields": [{"name": "", "nick_name": "", "data_type": "NUMBER"}],
                 "columns": [｛”source_column_code": "", "target_column_code": ""｝]
              }
     """
     datasource_id = ""
     data_table_name = ""
+    write_mode = WriteMode.Append.value
+    key_columns = []
     columns = []
 
+    write_mode_sql = WriteModeColumns.sql()
     database_output_sql = (
-        f"select datasource_id, data_table_name "
+        f"select datasource_id, data_table_name{write_mode_sql} "
         f"from ml_database_output_element "
         f"where id='{element_id}' "
         f"and version_id='{version_id}' "
@@ -46,6 +54,10 @@ def get(prev_node_output_port, prev_node_type, prev_element_id, version_id, elem
         # data_table_name = database_output_dict["data_table_name"]
         datasource_id = database_output_dict.get("datasource_id")
         data_table_name = database_output_dict.get("data_table_name")
+        if database_output_dict.get("write_mode") is not None:
+            write_mode = database_output_dict.get("write_mode")
+        if database_output_dict.get("key_columns"):
+            key_columns = json.loads(database_output_dict.get("key_columns"))
         # 列配置表
         database_output_column_sql = (
             f"select source_column_code, target_column_code "
@@ -68,6 +80,8 @@ def get(prev_node_output_port, prev_node_type, prev_element_id, version_id, elem
         data={
             "datasource_id": datasource_id,
             "data_table_name": data_table_name,
+            "write_mode": write_mode,
+            "key_columns": key_columns,
             "fields": fields,
             "columns": columns,
         }
@@ -95,7 +109,16 @@ def get_columns(datasource_id, table_name):
     return execute_success(data=fields)
 
 
-def configuration(version_id, element_id, user_id, datasource_id, data_table_name, columns):
+def configuration(
+    version_id,
+    element_id,
+    user_id,
+    datasource_id,
+    data_table_name,
+    columns,
+    write_mode=WriteMode.Append.value,
+    key_columns=None,
+):
     """
     用于保存算子配置数据
     :param version_id: 版本标识
@@ -104,6 +127,8 @@ def configuration(version_id, element_id, user_id, datasource_id, data_table_nam
     :param datasource_id: 数据源ID
     :param data_table_name: 表名
     :param columns: 列配置集合
+    :param write_mode: 写入模式
+    :param key_columns: 更新或插入时的主键列(目标列名数组)
     :return: 配置成功/失败
     """
     # 校验
@@ -111,6 +136,13 @@ def configuration(version_id, element_id, user_id, datasource_id, data_table_nam
         raise ElementConfigurationConfigError(sys._getframe().f_code.co_name, "保存数据库输出算子失败, 请配置列信息")
 
     now = current_time()
+    key_columns_json = json.dumps(key_columns or [])
+    write_mode_supported = WriteModeColumns.exist()
+    if not write_mode_supported and (write_mode != WriteMode.Append.value or key_columns):
+        raise ElementConfigurationConfigError(
+            sys._getframe().f_code.co_name,
+            "保存数据库输出算子失败, 数据库未增加 write_mode、key_columns 列, 仅支持追加写入",
+        )
 
     # 取出库中主表信息是否存在
     count = db_helper1.fetchone(
@@ -119,18 +151,25 @@ def configuration(version_id, element_id, user_id, datasource_id, data_table_nam
 
     # 保存主表的脚本
     if count == 0:
+        write_mode_sql = WriteModeColumns.sql()
+        write_mode_value_sql = f",{write_mode},'{key_columns_json}'" if write_mode_supported else ""
         save_database_output_sql = (
             f"insert into ml_database_output_element "
             f"(id, create_user, create_time, "
-            f"version_id, datasource_id, data_table_name, is_enabled) "
+            f"version_id, datasource_id, data_table_name{write_mode_sql}, is_enabled) "
             f"values('{element_id}','{user_id}',to_date('{now}', 'yyyy-mm-dd hh24:mi:ss'),"
-            f"'{version_id}', '{datasource_id}','{data_table_name}',{Enabled.Yes.value})"
+            f"'{version_id}', '{datasource_id}','{data_table_name}'{write_mode_value_sql},"
+            f"{Enabled.Yes.value})"
         )
     else:
+        write_mode_set_sql = (
+            f", write_mode={write_mode}, key_columns='{key_columns_json}'" if write_mode_supported else ""
+        )
         save_database_output_sql = (
             f"update ml_database_output_element "
             f" set datasource_id='{datasource_id}'"
             f", data_table_name='{data_table_name}'"
+            f"{write_mode_set_sql}"
             f", is_enabled='{Enabled.Yes.value}' "
             f" where id='{element_id}' and version_id='{version_id}'"
         )
@@ -251,13 +290,14 @@ def generate_copy_sql(new_version_id, old_version_id):
     :return: SQL
     """
     now = current_time()
+    write_mode_sql = WriteModeColumns.sql()
     # 拷贝算子数据
     copy_sql = (
         f"insert into ml_database_output_element "
         f"(id, create_user, create_time, version_id, "
-        f"datasource_id, data_table_name, is_enabled) "
+        f"datasource_id, data_table_name{write_mode_sql}, is_enabled) "
         f"select id, create_user, to_date('{now}', 'yyyy-mm-dd hh24:mi:ss'), '{new_version_id}', "
-        f"datasource_id, data_table_name, is_enabled "
+        f"datasource_id, data_table_name{write_mode_sql}, is_enabled "
         f"from ml_database_output_element "
         f"where version_id='{old_version_id}'"
     )
@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnarDataset:
+    def __init__(self, columns: dict[str, np.ndarray] | None = None, fields: list[dict] | None = None):
+        """
+        列式数据集实体, 用于算子间传递数据, 每列为一个只读的 numpy 数组
+        :param columns: 列名 -> numpy 数组, 各列长度一致
+        :param fields: 字段信息 [{"name": "", "nick_name": "", "data_type": "NUMBER"}]
+        """
+        self.__columns = {}
+        self._length = 0
+        self._records = None
+        # 由字典数组构建时保留原字典数组及列名, 列数组在首次按列访问时生成
+        self.__source = None
+        self.__source_names = None
+        self.fields = fields
+        if columns:
+            lengths = set()
+            for name, values in columns.items():
+                array = values if isinstance(values, np.ndarray) else np.asarray(values)
+                # 只读, 保证多个下游算子共享同一份内存时互不影响
+                array.flags.writeable = False
+                self.__columns[name] = array
+                lengths.add(len(array))
+            if len(lengths) > 1:
+                raise ValueError("列式数据集各列长度不一致")
+            self._length = lengths.pop()
+
+    @classmethod
+    def from_records(cls, records: list[dict] | None, fields: list[dict] | None = None, names: list[str] | None = None):
+        """
+        由字典数组构建列式数据集, 数值列转为数值数组, 其余列保留 Python 对象
+        列数组在首次按列访问时生成, 只经过不支持列式数据的算子时不发生转换;
+        各行字典的 key 均与列名一致时, 原字典数组直接作为 to_records 的结果
+        :param records: 字典数组
+        :param fields: 字段信息
+        :param names: 列名顺序, 默认取首行的 key
+        :return: 列式数据集
+        """
+        if isinstance(records, ColumnarDataset):
+            return records
+        records = records or []
+        if names is None:
+            names = list(records[0].keys()) if records else [f.get("name") for f in fields or []]
+        dataset = cls(None, fields)
+        dataset._length = len(records)
+        dataset.__columns = None
+        dataset.__source = records
+        dataset.__source_names = list(names)
+        if records:
+            keys = records[0].keys()
+            if list(keys) == dataset.__source_names and all(r.keys() == keys for r in records):
+                dataset._records = records
+        return dataset
+
+    @property
+    def _columns(self) -> dict[str, np.ndarray]:
+        if self.__columns is None:
+            columns = {name: column_array([r.get(name) for r in self.__source]) for name in self.__source_names}
+            for array in columns.values():
+                array.flags.writeable = False
+            self.__columns = columns
+            self.__source = None
+        return self.__columns
+
+    @classmethod
+    def from_batches(cls, batches, fields: list[dict] | None = None, names: list[str] | None = None):
+        """
+        由分批读取的字典数组构建列式数据集, 每批读取后立即转为列数组, 不同时持有全部字典
+        :param batches: 字典数组的迭代器, 如 fetch_stream 的返回值
+        :param fields: 字段信息
+        :param names: 列名顺序, 默认取首行的 key
+        :return: 列式数据集, 与 from_records 读取全部数据的结果一致
+        """
+        chunks = []
+        for records in batches:
+            if not records:
+                continue
+            if names is None:
+                names = list(records[0].keys())
+            chunks.append([chunk_column_array([r.get(name) for r in records]) for name in names])
+        if names is None:
+            names = [f.get("name") for f in fields or []]
+        columns = {name: concat_column_arrays([chunk[i] for chunk in chunks]) for i, name in enumerate(names)}
+        return cls(columns, fields)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, fields: list[dict] | None = None):
+        """
+        由 DataFrame 构建列式数据集
+        :param df: DataFrame
+        :param fields: 字段信息
+        :return: 列式数据集
+        """
+        return cls({column: df[column].to_numpy() for column in df.columns}, fields)
+
+    @property
+    def names(self) -> list[str]:
+        if self.__columns is None:
+            return list(self.__source_names)
+        return list(self.__columns.keys())
+
+    def column(self, name) -> np.ndarray:
+        """
+        获取某列数据, 不发生拷贝
+        :param name: 列名
+        :return: 只读 numpy 数组
+        """
+        return self._columns[name]
+
+    def has_column(self, name) -> bool:
+        if self.__columns is None:
+            return name in self.__source_names
+        return name in self.__columns
+
+    def select(self, names: list[str]):
+        """
+        列投影, 共享原数组
+        :param names: 保留的列名
+        :return: 新的列式数据集
+        """
+        return ColumnarDataset({name: self._columns[name] for name in names if name in self._columns}, self.fields)
+
+    def with_columns(self, columns: dict[str, np.ndarray], fields: list[dict] | None = None):
+        """
+        新增或替换列, 未变更的列共享原数组
+        :param columns: 列名 -> 数组
+        :param fields: 新的字段信息, 默认沿用原字段信息
+        :return: 新的列式数据集
+        """
+        merged = dict(self._columns)
+        merged.update(columns)
+        return ColumnarDataset(merged, fields if fields is not None else self.fields)
+
+    def take(self, indexer):
+        """
+        按布尔掩码或行号数组取行
+        :param indexer: 布尔掩码或行号数组
+        :return: 新的列式数据集
+        """
+        return ColumnarDataset({name: values[indexer] for name, values in self._columns.items()}, self.fields)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        转为 DataFrame, 数值列不发生拷贝
+        :return: DataFrame
+        """
+        return pd.DataFrame(self._columns, copy=False)
+
+    def to_records(self) -> list[dict]:
+        """
+        字典数组兼容视图, 供尚未支持列式数据的算子使用, 结果会被缓存并共享, 调用方不得原地修改;
+        算子通过 port() 深拷贝后使用
+        :return: 字典数组
+        """
+        if self._records is None:
+            if self.__columns is None:
+                names = self.__source_names
+                self._records = [{name: r.get(name) for name in names} for r in self.__source]
+            else:
+                names = self.names
+                values = [self.__columns[name].tolist() for name in names]
+                self._records = [dict(zip(names, row)) for row in zip(*values)]
+        return self._records
+
+    def __len__(self):
+        return self._length
+
+    def __bool__(self):
+        return self._length > 0
+
+    def __deepcopy__(self, memo):
+        # 列数组只读, 深拷贝时直接共享数组
+        return ColumnarDataset(self._columns, self.fields)
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarDataset):
+            return self.to_records() == other.to_records()
+        if isinstance(other, list):
+            return self.to_records() == other
+        return NotImplemented
+
+    __hash__ = None
+
+
+def column_array(values: list) -> np.ndarray:
+    """
+    将一列 Python 值转为 numpy 数组, 全部为数值时转为数值数组, 否则保留为 object 数组
+    :param values: 一列数据
+    :return: numpy 数组
+    """
+    if values and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        array = np.asarray(values)
+        if array.dtype.kind in "if":
+            return array
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def chunk_column_array(values: list) -> tuple[np.ndarray, bool]:
+    """
+    将一批数据中的一列转为数组, 供 concat_column_arrays 拼接
+    :param values: 一批数据中的一列
+    :return: (numpy 数组, 是否全部为数值), 整数与浮点数混合时保留原值, 以便按整列规则拼接
+    """
+    array = column_array(values)
+    if array.dtype.kind == "f" and not all(isinstance(v, float) for v in values):
+        mixed = np.empty(len(values), dtype=object)
+        mixed[:] = values
+        return mixed, True
+    return array, array.dtype.kind in "if"
+
+
+def concat_column_arrays(chunks: list[tuple[np.ndarray, bool]]) -> np.ndarray:
+    """
+    拼接同一列的分批数组, 结果与对整列调用 column_array 一致
+    :param chunks: chunk_column_array 的返回值数组
+    :return: numpy 数组
+    """
+    if not chunks:
+        return column_array([])
+    if all(numeric for _, numeric in chunks):
+        return np.concatenate([np.asarray(a.tolist()) if a.dtype == object else a for a, _ in chunks])
+    result = np.empty(sum(len(a) for a, _ in chunks), dtype=object)
+    offset = 0
+    for a, _ in chunks:
+        # 数值数组转为 Python 对象后写入
+        result[offset : offset + len(a)] = a.tolist() if a.dtype != object else a
+        offset += len(a)
+    return result
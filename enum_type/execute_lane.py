@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ExecuteLane(int, Enum):
+    # 发布接口调用, 优先调度
+    Api = 0
+    # 手动执行等交互执行
+    Interactive = 1
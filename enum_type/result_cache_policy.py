@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ResultCachePolicy(int, Enum):
+    # 不缓存接口结果
+    Skip = 0
+    # 缓存接口结果
+    Cache = 1
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class SnapshotFormatType(str, Enum):
+    # 逗号分隔文本, 历史快照格式
+    Csv = "csv"
+    # Parquet 列式文件, 按行组读取
+    Parquet = "parquet"
+    # Arrow IPC 文件, 按记录批读取
+    Arrow = "arrow"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class SnapshotPolicy(int, Enum):
+    # 保存洞察快照
+    Store = 0
+    # 跳过洞察快照
+    Skip = 1
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class WriteMode(int, Enum):
+    # 追加写入
+    Append = 0
+    # 按主键列更新或插入
+    Upsert = 1
+    # 清空目标表后写入
+    Overwrite = 2
@@ -1,6 +1,8 @@
+from enum_type.result_code import ResultCode
 from enum_type.secret_type import SecretType
 from helper.generate_helper import uuid_and_now
 from helper.sql_helper.init_sql_helper import db_helper1
+from helper.token_helper import increase_secret_version
 
 
 def register_app(user_id, app_name, app_key, app_secret):
@@ -19,4 +21,7 @@ def register_app(user_id, app_name, app_key, app_secret):
         f"'{user_id}', to_date('{now}', 'yyyy-mm-dd hh24:mi:ss'), "
         f"'{app_name}', '{secret_id}' , null)"
     )
-    return db_helper1.execute_arr([insert_secret_sql, app_register_sql])
+    result = db_helper1.execute_arr([insert_secret_sql, app_register_sql])
+    if result == ResultCode.Success.value:
+        increase_secret_version()
+    return result
@@ -1,8 +1,9 @@
 import numpy as np
-import pandas as pd
 
+from entity.dataset.columnar_dataset import ColumnarDataset
 from enum_type.data_process_type import DataProcessType
 from error.data_process_error import DataProcessError
+from helper.columnar_helper import is_columnar, to_dataframe
 from helper.error_helper import translate_error_message
 
 
@@ -25,7 +26,7 @@ process_function_dict = {
 
 
 def column_data_process(data, process_fields):
-    df = pd.DataFrame.from_dict(data)
+    df = to_dataframe(data)
     for column in df.columns:
         process_type_dict = process_type(process_fields, column)
         if process_type_dict and process_type_dict["process_type"] in process_function_dict:
@@ -34,6 +35,8 @@ def column_data_process(data, process_fields):
                 df = func(df, column)
             except ValueError as e:
                 raise DataProcessError(translate_error_message(str(e))) from None
+    if is_columnar(data):
+        return ColumnarDataset.from_dataframe(df, data.fields)
     return df.to_dict("records")
 
 
@@ -12,6 +12,7 @@ from pandas._libs import NaTType
 from enum_type.result_code import ResultCode
 from enum_type.user_data_type import UserDataType
 from error.convert_error import ConvertError
+from helper.columnar_helper import to_dataframe
 from helper.result_helper import execute_success
 
 
@@ -101,7 +102,7 @@ def column_type_convert_from_df_to_df(df, convert_fields, cname):
 
 
 def column_type_convert_from_data_to_df(data, convert_fields, cname):
-    df = pd.DataFrame.from_dict(data)
+    df = to_dataframe(data)
     try:
         for column in df.columns:
             convert_field_dict = convert_field(convert_fields, column)
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from entity.dataset.columnar_dataset import ColumnarDataset
+
+
+def is_columnar(data):
+    """
+    判断数据是否为列式数据集
+    :param data: 数据
+    :return: 是、否
+    """
+    return isinstance(data, ColumnarDataset)
+
+
+def to_records(data):
+    """
+    统一转为字典数组, 用于未支持列式数据的算子
+    :param data: 字典数组或列式数据集
+    :return: 字典数组
+    """
+    if isinstance(data, ColumnarDataset):
+        return data.to_records()
+    return data
+
+
+def to_dataframe(data):
+    """
+    统一转为 DataFrame
+    :param data: 字典数组或列式数据集
+    :return: DataFrame
+    """
+    if isinstance(data, ColumnarDataset):
+        return data.to_dataframe()
+    return pd.DataFrame.from_dict(data)
+
+
+def column_names(data):
+    """
+    获取数据的列名
+    :param data: 字典数组或列式数据集
+    :return: 列名数组
+    """
+    if isinstance(data, ColumnarDataset):
+        return data.names
+    if not data:
+        return []
+    return list(data[0].keys())
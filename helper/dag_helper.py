@@ -1,7 +1,13 @@
+import copy
+import hashlib
 import json
+import threading
+from collections import OrderedDict, deque
 
-from config.dag_config import SYNC_INPUT
+from config.dag_config import CLASS_MODULE, CLASS_NAME, SYNC_INPUT, element_info_dict
+from config.setting import DAG_PLAN_CACHE_SIZE
 from enum_type.result_code import ResultCode
+from helper.columnar_helper import to_records
 from helper.oss_helper.oss_helper import oss_helper1
 from helper.sql_helper.init_sql_helper import db_helper1
 
@@ -22,6 +28,86 @@ class ContainerBuild:
         pass
 
 
+class DagPlan:
+    def __init__(self, version_id, dag_config_key, dag_arr):
+        """
+        编译后的流水线执行计划, 同一版本的 DAG 配置只解析一次
+        :param version_id: 版本标识
+        :param dag_config_key: DAG 配置文件标识, 每次保存配置都会生成新的文件标识
+        :param dag_arr: DAG 配置
+        """
+        self.version_id = version_id
+        self.dag_config_key = dag_config_key
+        self.dag_arr = dag_arr
+        self.content_hash = hashlib.md5(json.dumps(dag_arr, sort_keys=True).encode()).hexdigest()
+        # 执行顺序 id 数组
+        self.order = topological_sort(dag_arr)
+        # 节点 id -> 节点配置
+        self.nodes = {node["id"]: node for node in dag_arr}
+        # 节点 id -> (依赖的数据字典, 依赖的模型字典)
+        self.port_maps = {node["id"]: node_port_maps(node) for node in dag_arr}
+        # 节点 id -> 依赖的算子 id 数组
+        self.dependency_ids = {node["id"]: dependency_container_build(node).container for node in dag_arr}
+        # 节点 id -> 算子类
+        self.element_classes = {node["id"]: element_class_of(node["type"]) for node in dag_arr}
+        # 节点 id -> 上游节点 id 集合, 节点 id -> 下游节点 id 数组
+        self.upstream = {node["id"]: {x["id"] for x in node["dependency"]} for node in dag_arr}
+        self.downstream = {node["id"]: [] for node in dag_arr}
+        for node_id, upstream_ids in self.upstream.items():
+            for upstream_id in upstream_ids:
+                if upstream_id in self.downstream:
+                    self.downstream[upstream_id].append(node_id)
+
+    def dependency_nodes(self, node_id):
+        """
+        获取节点的依赖数据字典和模型字典, 与 dependency_nodes 返回一致
+        :param node_id: 节点id
+        :return: 数据字典和模型字典元组
+        """
+        return self.port_maps.get(node_id, ())
+
+
+class DagPlanCache(object):
+    """
+    进程内的执行计划缓存, 以版本标识为键, DAG 配置文件标识变化时重新编译
+    """
+
+    __plans = OrderedDict()
+    __lock = threading.Lock()
+
+    @classmethod
+    def get(cls, version_id, dag_config_key):
+        with cls.__lock:
+            plan = cls.__plans.get(version_id)
+            if plan is None or plan.dag_config_key != dag_config_key:
+                return None
+            cls.__plans.move_to_end(version_id)
+            return plan
+
+    @classmethod
+    def put(cls, plan: DagPlan):
+        if DAG_PLAN_CACHE_SIZE <= 0:
+            return
+        with cls.__lock:
+            cls.__plans[plan.version_id] = plan
+            cls.__plans.move_to_end(plan.version_id)
+            while len(cls.__plans) > DAG_PLAN_CACHE_SIZE:
+                cls.__plans.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, version_id=None):
+        """
+        使执行计划失效
+        :param version_id: 版本标识, 为空时清空全部缓存
+        :return: None
+        """
+        with cls.__lock:
+            if version_id is None:
+                cls.__plans.clear()
+            else:
+                cls.__plans.pop(version_id, None)
+
+
 def topological_sort(dag_config):
     """
     根据配置生成 DAG
@@ -61,13 +147,13 @@ def topological_sort(dag_config):
     for u in g:
         for v in g[u]:
             in_degrees[v] += 1
-    # 使用列表作为队列并将入度为0的添加到队列中
-    q = [u for u in g if in_degrees[u] == 0]
+    # 使用双端队列并将入度为0的添加到队列中
+    q = deque(u for u in g if in_degrees[u] == 0)
     res = []
     # 当队列中有元素时执行
     while q:
         # 从队首取出元素
-        u = q.pop(0)
+        u = q.popleft()
         # 将取出的元素存入结果中
         res.append(u)
         # 移除与取出元素相关的指向, 即将所有与取出元素相关的元素的入度减少1
@@ -104,22 +190,47 @@ def dependency_nodes(node_id, dag_config):
     :param dag_config: 配置
     :return: 数据字典和模型字典元组
     """
+    if isinstance(dag_config, DagPlan):
+        return dag_config.dependency_nodes(node_id)
     for o in dag_config:
         if node_id == o["id"]:
-            dag_data_dict = {
-                x["dist_port"]: {"source_id": x["id"], "source_port": x["source_port"]}
-                for x in o["dependency"]
-                if x["type"] == "data"
-            }
-            dag_model_dict = {
-                x["dist_port"]: {"source_id": x["id"], "source_port": x["source_port"]}
-                for x in o["dependency"]
-                if x["type"] == "model"
-            }
-            return dag_data_dict, dag_model_dict
+            return node_port_maps(o)
     return ()
 
 
+def node_port_maps(node):
+    """
+    解析节点的依赖数据字典和模型字典
+    :param node: 节点配置
+    :return: 数据字典和模型字典元组
+    """
+    dag_data_dict = {
+        x["dist_port"]: {"source_id": x["id"], "source_port": x["source_port"]}
+        for x in node["dependency"]
+        if x["type"] == "data"
+    }
+    dag_model_dict = {
+        x["dist_port"]: {"source_id": x["id"], "source_port": x["source_port"]}
+        for x in node["dependency"]
+        if x["type"] == "model"
+    }
+    return dag_data_dict, dag_model_dict
+
+
+def element_class_of(node_type):
+    """
+    根据算子类型反射获取算子类
+    :param node_type: 算子类型
+    :return: 算子类, 未注册的类型返回 None
+    """
+    element_info = element_info_dict.get(node_type)
+    if not element_info or not element_info.get(CLASS_MODULE) or not element_info.get(CLASS_NAME):
+        return None
+    # noinspection PyTypeChecker
+    module = __import__(element_info[CLASS_MODULE], fromlist=True)
+    return getattr(module, element_info[CLASS_NAME], None)
+
+
 def container_init(index_arr, n):
     """
     初始化 None 容器
@@ -162,13 +273,14 @@ def dependency_container_build(node):
     return ContainerBuild(ResultCode.Success.value, dependency_id_arr)
 
 
-def data_container_build(dag_data_dict, dag_dict, node_type, sync_input_data):
+def data_container_build(dag_data_dict, dag_dict, node_type, sync_input_data, columnar=None):
     """
     组装数据数组、字段数组、角色数组
     :param dag_data_dict: 根据配置文件解析的依赖的数据字典
     :param dag_dict: 内存中保存的算子执行结果
     :param node_type: 节点类型, 用于特殊处理同步输入节点
     :param sync_input_data: 同步输入节点输入的数据
+    :param columnar: 当前算子是否支持直接接收列式数据集, 不支持时转为字典数组; 为空时根据节点类型对应的算子类判断
     :return: 组装好的数据数组、字段数组、角色数组
     """
     if node_type == SYNC_INPUT:
@@ -183,6 +295,8 @@ def data_container_build(dag_data_dict, dag_dict, node_type, sync_input_data):
             tuple([] for _ in range(DATA_FIELDS_ROLE_SCALER_ARR_NUMBER)),
         )
 
+    if columnar is None:
+        columnar = element_support_columnar(element_class_of(node_type))
     index_arr = list(dag_data_dict.keys())
     # 存储的是算子端口号, 默认起始位置为 0
     index_arr.sort()
@@ -202,7 +316,7 @@ def data_container_build(dag_data_dict, dag_dict, node_type, sync_input_data):
             return ContainerBuild(ResultCode.Error.value, ())
         # 从源算子的某一端口输出的数据
         source_port_data = element_data[source_element_port]
-        data_arr[index] = source_port_data
+        data_arr[index] = source_port_data if columnar else to_records(source_port_data)
 
         # 组装 field_arr
         if element_field and len(element_field) > source_element_port:
@@ -292,6 +406,19 @@ def get_dag(version_id):
     :param version_id: 版本标识
     :return: DAG 数据
     """
+    dag_plan = get_dag_plan(version_id)
+    if dag_plan is None:
+        return None
+    # 返回副本, 避免调用方修改缓存中的配置
+    return copy.deepcopy(dag_plan.dag_arr)
+
+
+def get_dag_plan(version_id):
+    """
+    获取该版本编译后的执行计划, 仅在 DAG 配置文件标识变化时重新下载并编译
+    :param version_id: 版本标识
+    :return: 执行计划
+    """
     pipelining_config_sql = f"select dag_config from ml_pipelining_version " f"where id='{version_id}'"
     pipelining_config_dict = db_helper1.fetchone(pipelining_config_sql, [])
     if not pipelining_config_dict or "dag_config" not in pipelining_config_dict:
@@ -299,10 +426,26 @@ def get_dag(version_id):
     dag_config = pipelining_config_dict["dag_config"]
     if not dag_config:
         return None
+    dag_plan = DagPlanCache.get(version_id, dag_config)
+    if dag_plan is not None:
+        return dag_plan
     dag_config_str = oss_helper1.get_json_file_data(dag_config)
     # json_str -> arr
     dag_config_arr = json.loads(dag_config_str)
-    return dag_config_arr
+    if not dag_config_arr:
+        return None
+    dag_plan = DagPlan(version_id, dag_config, dag_config_arr)
+    DagPlanCache.put(dag_plan)
+    return dag_plan
+
+
+def element_support_columnar(element_class):
+    """
+    算子类是否支持直接接收列式数据集
+    :param element_class: 算子类
+    :return: 是、否
+    """
+    return bool(getattr(element_class, "columnar_input", False))
 
 
 def valid_dag_exist_sync_input_element(dag_arr):
@@ -1,9 +1,13 @@
+import operator
 from datetime import datetime
 
+import numpy as np
+
 from enum_type.compare_type import CompareType
 from enum_type.filter_type import FilterType
 from enum_type.user_data_type import UserDataType
 from error.data_process_error import DataProcessError
+from helper.columnar_helper import is_columnar
 
 
 def date_convert(value):
@@ -35,43 +39,118 @@ def convert_value(value, data_type):
     return value
 
 
-def condition(x, filter_type, filter_compare_fields):
+class CompiledCondition:
+    def __init__(self, condition_field):
+        """
+        编译后的单个过滤条件, 比较值只解析一次
+        :param condition_field: {"name": "", "value": 0, "data_type": "NUMBER", "compare_type": "less_than"}
+        """
+        self.name = condition_field["name"]
+        self.compare_type = condition_field["compare_type"]
+        self.value = None
+        self.error = None
+        if self.compare_type not in (CompareType.IsNull, CompareType.IsNotNull):
+            try:
+                self.value = convert_value(condition_field["value"], condition_field["data_type"])
+            except DataProcessError as e:
+                # 与逐行比较一致, 仅在存在非空值需要比较时抛出
+                self.error = e
+
+    def mask(self, column, null_mask):
+        """
+        向量化计算过滤结果
+        :param column: 列数据
+        :param null_mask: 空值掩码
+        :return: 布尔掩码, 不支持的比较类型返回非空值掩码
+        """
+        if self.compare_type == CompareType.IsNull:
+            return null_mask.copy()
+        if self.compare_type == CompareType.IsNotNull:
+            return ~null_mask
+        not_null = ~null_mask
+        if self.error is not None and not_null.any():
+            raise self.error
+        compare_func = COMPARE_FUNC_DICT.get(self.compare_type)
+        if compare_func is None:
+            # 不支持的比较类型: 空值行判定为不满足, 非空值行不产生判定结果
+            return ~null_mask
+        result = np.zeros(len(column), dtype=bool)
+        if not not_null.any():
+            return result
+        values = column[not_null]
+        if values.dtype != object and not isinstance(self.value, (int, float)):
+            # 数值列与非数值比较时按 Python 语义逐个比较
+            values = values.astype(object)
+        with np.errstate(invalid="ignore"):
+            compared = compare_func(values, self.value)
+        result[not_null] = np.asarray(compared, dtype=bool)
+        return result
+
+
+class CompiledFilter:
+    def __init__(self, filter_type, filter_compare_fields):
+        """
+        编译后的过滤器, 按列计算布尔掩码
+        :param filter_type: 过滤类型
+        :param filter_compare_fields: 需要过滤的字段字典数组
+        """
+        self.filter_type = filter_type
+        self.conditions = [CompiledCondition(y) for y in filter_compare_fields]
+
+    def mask(self, data):
+        """
+        计算数据的过滤掩码
+        :param data: 字典数组或列式数据集
+        :return: 布尔掩码
+        """
+        n = len(data)
+        columns = {}
+        masks = []
+        for c in self.conditions:
+            if c.name not in columns:
+                columns[c.name] = filter_column(data, c.name)
+            condition_mask = c.mask(*columns[c.name])
+            if self.filter_type != FilterType.All and c.compare_type not in COMPARE_TYPES:
+                # 任一满足时, 不支持的比较类型不影响结果
+                continue
+            masks.append(condition_mask)
+        if self.filter_type == FilterType.All:
+            return np.logical_and.reduce(masks) if masks else np.ones(n, dtype=bool)
+        return np.logical_or.reduce(masks) if masks else np.zeros(n, dtype=bool)
+
+
+COMPARE_FUNC_DICT = {
+    CompareType.GreatThan: operator.gt,
+    CompareType.GreatThanOrEqual: operator.ge,
+    CompareType.Equal: operator.eq,
+    CompareType.LessThan: operator.lt,
+    CompareType.LessThanOrEqual: operator.le,
+    CompareType.NotEqual: operator.ne,
+}
+
+COMPARE_TYPES = {*COMPARE_FUNC_DICT, CompareType.IsNull, CompareType.IsNotNull}
+
+
+def filter_column(data, name):
     """
-    过滤条件封装
-    :param x: 字典元素
-    :param filter_type: 过滤条件
-    :param filter_compare_fields: 需要过滤的字段字典数组
-    :return: true/false
+    取出过滤字段所在列, 字段不存在时尝试小写字段名
+    :param data: 字典数组或列式数据集
+    :param name: 字段名
+    :return: 列数据, 空值(None)掩码
     """
-    condition_results = []
-    for y in filter_compare_fields:
-        name = y["name"]
-        date_type = y["data_type"]
-        v = x.get(name, x.get(name.lower(), None))
-        compare_type = y["compare_type"]
-        if compare_type == CompareType.IsNull:
-            condition_results.append(v is None)
-        elif compare_type == CompareType.IsNotNull:
-            condition_results.append(v is not None)
-        elif v is None:
-            condition_results.append(False)
-        else:
-            value = y["value"]
-            value = convert_value(value, date_type)
-            if compare_type == CompareType.GreatThan:
-                condition_results.append(v > value)
-            elif compare_type == CompareType.GreatThanOrEqual:
-                condition_results.append(v >= value)
-            elif compare_type == CompareType.Equal:
-                condition_results.append(v == value)
-            elif compare_type == CompareType.LessThan:
-                condition_results.append(v < value)
-            elif compare_type == CompareType.LessThanOrEqual:
-                condition_results.append(v <= value)
-            elif compare_type == CompareType.NotEqual:
-                condition_results.append(v != value)
-
-    return all(condition_results) if filter_type == FilterType.All else any(condition_results)
+    if is_columnar(data):
+        column_name = name if data.has_column(name) else name.lower()
+        if not data.has_column(column_name):
+            return np.full(len(data), None, dtype=object), np.ones(len(data), dtype=bool)
+        column = data.column(column_name)
+        if column.dtype != object:
+            return column, np.zeros(len(column), dtype=bool)
+    else:
+        lower_name = name.lower()
+        column = np.empty(len(data), dtype=object)
+        column[:] = [x.get(name, x.get(lower_name, None)) for x in data]
+    null_mask = np.fromiter((v is None for v in column), dtype=bool, count=len(column))
+    return column, null_mask
 
 
 def data_filter(filter_type, data, filter_compare_fields):
@@ -80,8 +159,13 @@ def data_filter(filter_type, data, filter_compare_fields):
     :param filter_type: 过滤类型
     :param data: 数据
     :param filter_compare_fields: 过滤字段字典数组
-    :return: 过滤后的数据数组
+    :return: 过滤后的数据数组, 列式数据集过滤后仍为列式数据集
     """
     if not filter_compare_fields:
         return data
-    return [x for x in data if condition(x, filter_type, filter_compare_fields)]
+    if not data:
+        return data if is_columnar(data) else []
+    mask = CompiledFilter(filter_type, filter_compare_fields).mask(data)
+    if is_columnar(data):
+        return data.take(mask)
+    return [x for x, keep in zip(data, mask.tolist()) if keep]
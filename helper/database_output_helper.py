@@ -0,0 +1,62 @@
+import threading
+
+from loguru import logger
+
+from helper.error_helper import is_undefined_column_error
+from helper.sql_helper.init_sql_helper import db_helper1
+
+# 写入模式相关列, 由数据库脚本为 ml_database_output_element 增加
+WRITE_MODE_COLUMNS_SQL = ", write_mode, key_columns"
+
+
+class WriteModeColumns(object):
+    """
+    ml_database_output_element 是否已增加 write_mode、key_columns 列, 进程内只检查一次;
+    未执行数据库脚本的库按追加写入处理
+    """
+
+    __exist = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def exist(cls):
+        """
+        写入模式相关列是否存在, 查询失败且不是列不存在时抛出异常, 下次调用重新检查
+        :return: 是、否
+        """
+        if cls.__exist is None:
+            with cls.__lock:
+                if cls.__exist is None:
+                    cls.__exist = cls.__probe()
+                    if not cls.__exist:
+                        logger.warning("ml_database_output_element 未增加 write_mode、key_columns 列, 仅支持追加写入")
+        return cls.__exist
+
+    @staticmethod
+    def __probe():
+        try:
+            db_helper1.fetchone(
+                f"select datasource_id{WRITE_MODE_COLUMNS_SQL} from ml_database_output_element where 1=0"
+            )
+            return True
+        except Exception as e:
+            if is_undefined_column_error(e):
+                return False
+            raise
+
+    @classmethod
+    def sql(cls):
+        """
+        查询、保存写入模式相关列的 SQL 片段, 列不存在时为空
+        :return: SQL 片段
+        """
+        return WRITE_MODE_COLUMNS_SQL if cls.exist() else ""
+
+    @classmethod
+    def invalidate(cls):
+        """
+        清除检查结果, 下次调用重新检查
+        :return: None
+        """
+        with cls.__lock:
+            cls.__exist = None
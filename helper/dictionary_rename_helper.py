@@ -1,3 +1,6 @@
+from entity.dataset.columnar_dataset import ColumnarDataset
+
+
 def dict_key_rename(arr, prefix, exclude_key):
     """
     字典 key 改名
@@ -46,6 +49,9 @@ def dict_rename(arr, element_id):
     """
     if not element_id or not arr:
         return None
+    if isinstance(arr, ColumnarDataset):
+        # 列式数据集仅修改列名, 共享原数组
+        return ColumnarDataset({k + f".{element_id}": arr.column(k) for k in arr.names})
     n_a = []
     for d in arr:
         n_d = dict()
@@ -90,3 +90,31 @@ def translate_error_message(origin_except_message):
             return f"样本数据个数为{count_list[1]}, 无法将数据分割为{count_list[0]}份, 请检查数据"
         return "样本数据数目少于要分割的份数, 请检查数据"
     return origin_except_message
+
+
+# 各数据库列不存在的错误信息: Oracle、达梦、MySQL、PostgreSQL、SQL Server
+UNDEFINED_COLUMN_PATTERNS = re.compile(
+    r"ORA-00904|无效的列名|Unknown column|column .* does not exist|Invalid column name", re.IGNORECASE
+)
+# 各数据库表不存在的错误信息: Oracle、达梦、MySQL、PostgreSQL、SQL Server
+UNDEFINED_TABLE_PATTERNS = re.compile(
+    r"ORA-00942|无效的表或视图名|Table .* doesn't exist|relation .* does not exist|Invalid object name", re.IGNORECASE
+)
+
+
+def is_undefined_column_error(e):
+    """
+    是否为查询的列不存在的数据库错误
+    :param e: 数据库异常
+    :return: 是、否
+    """
+    return bool(UNDEFINED_COLUMN_PATTERNS.search(str(e)))
+
+
+def is_undefined_table_error(e):
+    """
+    是否为查询的表不存在的数据库错误
+    :param e: 数据库异常
+    :return: 是、否
+    """
+    return bool(UNDEFINED_TABLE_PATTERNS.search(str(e)))
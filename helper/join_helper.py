@@ -1,37 +1,29 @@
 from itertools import groupby
 from operator import itemgetter
 
+import numpy as np
+import pandas as pd
+
+from entity.dataset.columnar_dataset import ColumnarDataset, column_array
+from helper.columnar_helper import is_columnar, to_records
+
+# 连接 key 不存在时的占位
+_MISSING = object()
+
 
 def inner_join(data_0, data_1, field_0, field_1, fields):
     """
     字典数组内连接
     :param data_0: 端口0的字典数组
     :param data_1: 端口1的字典数组
-    :param field_0: 端口0的字典数组连接 key
-    :param field_1: 端口1的字典数组连接 key
+    :param field_0: 端口0的字典数组连接 key, 多字段连接时为数组
+    :param field_1: 端口1的字典数组连接 key, 多字段连接时为数组
     :param fields: 过滤字段数组
     :return:
     """
-    arr = []
     if not data_1 or not data_0 or not fields:
-        return arr
-
-    field_0_name = field_0["name"]
-    field_1_name = field_1["name"]
-
-    for d0 in data_0:
-        for d1 in data_1:
-            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
-                x = {}
-                for field_name in fields:
-                    if field_name in d0:
-                        x[field_name] = d0[field_name]
-                    elif field_name in d1:
-                        x[field_name] = d1[field_name]
-                if x:
-                    arr.append(x)
-
-    return arr
+        return []
+    return hash_join(data_0, data_1, field_0, field_1, fields, keep_left=False, keep_right=False)
 
 
 def left_join(data_0, data_1, field_0, field_1, fields):
@@ -39,41 +31,14 @@ def left_join(data_0, data_1, field_0, field_1, fields):
     字典数组左连接
     :param data_0: 端口0的字典数组
     :param data_1: 端口1的字典数组
-    :param field_0: 端口0的字典数组连接 key
-    :param field_1: 端口1的字典数组连接 key
+    :param field_0: 端口0的字典数组连接 key, 多字段连接时为数组
+    :param field_1: 端口1的字典数组连接 key, 多字段连接时为数组
     :param fields: 过滤字段数组
     :return:
     """
-    arr = []
     if not data_0 or not fields:
-        return arr
-
-    field_0_name = field_0["name"]
-    field_1_name = field_1["name"]
-
-    for d0 in data_0:
-        joined = False
-        for d1 in data_1:
-            x = {}
-            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
-                joined = True
-                for field_name in fields:
-                    if field_name in d0:
-                        x[field_name] = d0[field_name]
-                    elif field_name in d1:
-                        x[field_name] = d1[field_name]
-                if x:
-                    arr.append(x)
-        if not joined and field_0_name in d0:
-            x = {}
-            for field_name in fields:
-                if field_name in d0:
-                    x[field_name] = d0[field_name]
-                else:
-                    x[field_name] = None
-            if x:
-                arr.append(x)
-    return arr
+        return []
+    return hash_join(data_0, data_1, field_0, field_1, fields, keep_left=True, keep_right=False)
 
 
 def full_join(data_0, data_1, field_0, field_1, fields):
@@ -81,36 +46,300 @@ def full_join(data_0, data_1, field_0, field_1, fields):
     字典数组全连接
     :param data_0: 端口0的字典数组
     :param data_1: 端口1的字典数组
-    :param field_0: 端口0的字典数组连接 key
-    :param field_1: 端口1的字典数组连接 key
+    :param field_0: 端口0的字典数组连接 key, 多字段连接时为数组
+    :param field_1: 端口1的字典数组连接 key, 多字段连接时为数组
     :param fields: 过滤字段数组
     :return:
     """
-    arr = []
     if not fields:
-        return arr
+        return []
+    if not data_0:
+        # 左侧为空时, 右侧数据全部保留
+        data_0 = data_0 if is_columnar(data_0) and is_columnar(data_1) else []
+    return hash_join(data_0, data_1, field_0, field_1, fields, keep_left=True, keep_right=True)
 
-    arr = left_join(data_0, data_1, field_0, field_1, fields)
 
-    field_0_name = field_0["name"]
-    field_1_name = field_1["name"]
+def hash_join(data_0, data_1, field_0, field_1, fields, keep_left, keep_right):
+    """
+    哈希连接, 结果顺序与嵌套循环一致: 按端口0顺序, 同一行的匹配按端口1顺序, 全连接时未匹配的端口1数据追加在最后
+    连接 key 语义与嵌套循环一致: 不存在 key 的行不参与匹配, None 与 None 相等, NaN 与任何值不相等
+    :param data_0: 端口0的字典数组或列式数据集
+    :param data_1: 端口1的字典数组或列式数据集
+    :param field_0: 端口0的连接 key
+    :param field_1: 端口1的连接 key
+    :param fields: 过滤字段数组
+    :param keep_left: 是否保留端口0未匹配的数据
+    :param keep_right: 是否保留端口1未匹配的数据
+    :return: 连接后的数据, 两个输入均为列式数据集时返回列式数据集
+    """
+    names_0 = join_field_names(field_0)
+    names_1 = join_field_names(field_1)
+    data_1 = data_1 if data_1 is not None else []
+    columnar = is_columnar(data_0) and is_columnar(data_1)
+    if not columnar:
+        data_0 = to_records(data_0)
+        data_1 = to_records(data_1)
+    keys_0 = [join_key_column(data_0, name) for name in names_0]
+    keys_1 = [join_key_column(data_1, name) for name in names_1]
+    try:
+        codes_0, codes_1 = join_key_codes(keys_0, keys_1)
+    except TypeError:
+        # 连接 key 不可哈希时退回嵌套循环
+        return nested_loop_join(data_0, data_1, names_0, names_1, fields, keep_left, keep_right)
+    if is_sorted_numeric_key(keys_0, keys_1):
+        left_index, right_index = merge_join_index(keys_0[0], keys_1[0])
+    else:
+        left_index, right_index = join_index(codes_0, codes_1)
 
-    for d1 in data_1:
-        joined = False
-        for d0 in data_0:
-            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
-                joined = True
-                break
-        if not joined:
-            x = {}
+    if keep_left:
+        # 端口0未匹配且存在连接 key 的行, 以 -1 表示右侧为空, 插入到对应位置保持顺序
+        matched = np.zeros(len(data_0), dtype=bool)
+        matched[left_index] = True
+        present = ~key_missing_mask(keys_0)
+        unmatched = np.flatnonzero(~matched & present)
+        left_index = np.concatenate([left_index, unmatched])
+        right_index = np.concatenate([right_index, np.full(len(unmatched), -1, dtype=np.int64)])
+        order = np.argsort(left_index, kind="stable")
+        left_index = left_index[order]
+        right_index = right_index[order]
+    if keep_right:
+        matched = np.zeros(len(data_1), dtype=bool)
+        matched[right_index[right_index >= 0]] = True
+        unmatched = np.flatnonzero(~matched)
+        left_index = np.concatenate([left_index, np.full(len(unmatched), -1, dtype=np.int64)])
+        right_index = np.concatenate([right_index, unmatched])
+
+    if columnar:
+        return columnar_join_result(data_0, data_1, left_index, right_index, fields)
+    return records_join_result(data_0, data_1, left_index, right_index, fields)
+
+
+def join_field_names(field):
+    if isinstance(field, (list, tuple)):
+        return [f["name"] for f in field]
+    return [field["name"]]
+
+
+def join_key_column(data, name):
+    """
+    取出一列连接 key, 不存在 key 的行以 _MISSING 占位
+    :param data: 字典数组或列式数据集
+    :param name: 字段名
+    :return: object 数组
+    """
+    if is_columnar(data):
+        if data.has_column(name):
+            return data.column(name).astype(object)
+        return np.full(len(data), _MISSING, dtype=object)
+    column = np.empty(len(data), dtype=object)
+    column[:] = [d.get(name, _MISSING) for d in data]
+    return column
+
+
+def key_missing_mask(keys):
+    mask = np.zeros(len(keys[0]) if keys else 0, dtype=bool)
+    for key in keys:
+        mask |= np.fromiter((v is _MISSING for v in key), dtype=bool, count=len(key))
+    return mask
+
+
+def join_key_codes(keys_0, keys_1):
+    """
+    将两侧连接 key 编码为整数, 相等的 key 编码相同, 不参与匹配的 key 编码为 -1
+    :param keys_0: 端口0的连接 key 数组
+    :param keys_1: 端口1的连接 key 数组
+    :return: 两侧编码数组
+    """
+    n_0 = len(keys_0[0])
+    codes = None
+    for key_0, key_1 in zip(keys_0, keys_1):
+        values = np.concatenate([key_0, key_1])
+        column_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        column_codes = column_codes.astype(np.int64)
+        # None 与 None 相等, NaN 不与任何值相等, 与嵌套循环的 == 语义一致
+        na_index = np.flatnonzero(column_codes == -1)
+        none_code = len(uniques)
+        for i in na_index:
+            if values[i] is None:
+                column_codes[i] = none_code
+        missing = np.fromiter((v is _MISSING for v in values), dtype=bool, count=len(values))
+        column_codes[missing] = -1
+        if codes is None:
+            codes = column_codes
+        else:
+            invalid = (codes == -1) | (column_codes == -1)
+            combined = codes * (none_code + 1) + column_codes
+            codes, _ = pd.factorize(combined)
+            codes = codes.astype(np.int64)
+            codes[invalid] = -1
+    return codes[:n_0], codes[n_0:]
+
+
+def join_index(codes_0, codes_1):
+    """
+    根据两侧编码生成匹配的行号对, 按端口0顺序, 同一行的匹配按端口1顺序
+    :param codes_0: 端口0编码
+    :param codes_1: 端口1编码
+    :return: 端口0行号数组, 端口1行号数组
+    """
+    size = int(max(codes_0.max(initial=-1), codes_1.max(initial=-1))) + 1
+    valid_1 = codes_1 >= 0
+    counts = np.bincount(codes_1[valid_1], minlength=size)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    # 端口1按编码稳定排序, 同编码内保持原顺序
+    order_1 = np.flatnonzero(valid_1)[np.argsort(codes_1[valid_1], kind="stable")]
+    valid_0 = codes_0 >= 0
+    repeat = np.zeros(len(codes_0), dtype=np.int64)
+    repeat[valid_0] = counts[codes_0[valid_0]]
+    total = int(repeat.sum())
+    left_index = np.repeat(np.arange(len(codes_0), dtype=np.int64), repeat)
+    offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+    begin = np.zeros(len(codes_0), dtype=np.int64)
+    begin[valid_0] = starts[codes_0[valid_0]]
+    right_index = order_1[np.repeat(begin, repeat) + offsets]
+    return left_index, right_index
+
+
+def is_sorted_numeric_key(keys_0, keys_1):
+    """
+    判断是否为单字段、无空值且已升序排列的数值 key, 满足时使用归并连接
+    :param keys_0: 端口0的连接 key 数组
+    :param keys_1: 端口1的连接 key 数组
+    :return: 是、否
+    """
+    if len(keys_0) != 1:
+        return False
+    for key in (keys_0[0], keys_1[0]):
+        if len(key) == 0 or any(v is _MISSING or v is None for v in key):
+            return False
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in key):
+            return False
+        array = np.asarray(key.tolist(), dtype=float)
+        if np.isnan(array).any() or (len(array) > 1 and (np.diff(array) < 0).any()):
+            return False
+    return True
+
+
+def merge_join_index(key_0, key_1):
+    """
+    归并连接, 要求两侧 key 均已升序排列
+    :param key_0: 端口0的连接 key
+    :param key_1: 端口1的连接 key
+    :return: 端口0行号数组, 端口1行号数组
+    """
+    array_0 = np.asarray(key_0.tolist(), dtype=float)
+    array_1 = np.asarray(key_1.tolist(), dtype=float)
+    begin = np.searchsorted(array_1, array_0, side="left")
+    end = np.searchsorted(array_1, array_0, side="right")
+    repeat = (end - begin).astype(np.int64)
+    total = int(repeat.sum())
+    left_index = np.repeat(np.arange(len(array_0), dtype=np.int64), repeat)
+    offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+    right_index = np.repeat(begin.astype(np.int64), repeat) + offsets
+    return left_index, right_index
+
+
+def records_join_result(data_0, data_1, left_index, right_index, fields):
+    arr = []
+    for i, j in zip(left_index.tolist(), right_index.tolist()):
+        x = {}
+        if i >= 0 and j >= 0:
+            d0 = data_0[i]
+            d1 = data_1[j]
             for field_name in fields:
-                if field_name in d1:
+                if field_name in d0:
+                    x[field_name] = d0[field_name]
+                elif field_name in d1:
                     x[field_name] = d1[field_name]
-                else:
-                    x[field_name] = None
-            if x:
-                arr.append(x)
+        else:
+            d = data_0[i] if i >= 0 else data_1[j]
+            for field_name in fields:
+                x[field_name] = d[field_name] if field_name in d else None
+        if x:
+            arr.append(x)
+    return arr
 
+
+def columnar_join_result(data_0, data_1, left_index, right_index, fields):
+    """
+    按行号对取出连接结果, 取值规则与 records_join_result 一致:
+    端口0存在的行(匹配行、端口0未匹配行)优先取端口0的列, 端口1未匹配的行只取端口1的列, 两侧均不存在的列填充 None
+    :param data_0: 端口0的列式数据集
+    :param data_1: 端口1的列式数据集
+    :param left_index: 端口0行号数组, -1 表示端口0为空
+    :param right_index: 端口1行号数组, -1 表示端口1为空
+    :param fields: 过滤字段数组
+    :return: 列式数据集
+    """
+    right_only = left_index < 0
+    columns = {}
+    for field_name in fields:
+        in_0 = data_0.has_column(field_name)
+        in_1 = data_1.has_column(field_name)
+        if in_0 and in_1 and right_only.any():
+            values = take_column(data_0, field_name, left_index).astype(object)
+            values[right_only] = take_column(data_1, field_name, right_index[right_only]).astype(object)
+            # 两侧拼接的列按整列规则重新确定类型
+            values = column_array(values.tolist())
+        elif in_0:
+            values = take_column(data_0, field_name, left_index)
+        elif in_1:
+            values = take_column(data_1, field_name, right_index)
+        else:
+            values = np.full(len(left_index), None, dtype=object)
+        columns[field_name] = values
+    return ColumnarDataset(columns) if columns else []
+
+
+def take_column(data, name, index):
+    """
+    按行号取出一列, 行号为 -1 的位置填充 None
+    :param data: 列式数据集
+    :param name: 列名
+    :param index: 行号数组
+    :return: numpy 数组, 存在 -1 行号时为 object 数组
+    """
+    values = data.column(name)
+    missing = index < 0
+    if not missing.any():
+        return values[index]
+    taken = np.full(len(index), None, dtype=object)
+    present = ~missing
+    if present.any():
+        taken[present] = values.astype(object)[index[present]]
+    return taken
+
+
+def nested_loop_join(data_0, data_1, names_0, names_1, fields, keep_left, keep_right):
+    """
+    嵌套循环连接, 用于不可哈希的连接 key
+    """
+    data_0 = to_records(data_0)
+    data_1 = to_records(data_1)
+
+    def matches(d0, d1):
+        return all(n0 in d0 and n1 in d1 and d0[n0] == d1[n1] for n0, n1 in zip(names_0, names_1))
+
+    arr = []
+    for d0 in data_0:
+        joined = False
+        for d1 in data_1:
+            if matches(d0, d1):
+                joined = True
+                x = {}
+                for field_name in fields:
+                    if field_name in d0:
+                        x[field_name] = d0[field_name]
+                    elif field_name in d1:
+                        x[field_name] = d1[field_name]
+                if x:
+                    arr.append(x)
+        if keep_left and not joined and all(n0 in d0 for n0 in names_0):
+            arr.append({field_name: d0[field_name] if field_name in d0 else None for field_name in fields})
+    if keep_right:
+        for d1 in data_1:
+            if not any(matches(d0, d1) for d0 in data_0):
+                arr.append({field_name: d1[field_name] if field_name in d1 else None for field_name in fields})
     return arr
 
 
@@ -1,8 +1,12 @@
+from operator import itemgetter
+
 import numpy
 import pandas as pd
 
 from enum_type.role_type import RoleType
 from enum_type.user_data_type import UserDataType
+from error.data_process_error import DataProcessError
+from helper.columnar_helper import column_names, is_columnar
 from helper.fields_helper import generate_fields
 
 
@@ -45,66 +49,99 @@ def dict_array_build(matrix, fields):
     :param fields: 字段信息
     :return: 字典数组
     """
-    arr = []
     if matrix is None or fields is None:
-        return arr
+        return []
 
     names = [field.get("name") for field in fields if field.get("name") is not None]
     if not names:
-        return arr
-
-    for vector in matrix:
-        if isinstance(vector, list):
-            prop = dict(zip(names, vector))
-        else:
-            prop = dict(zip(names, [vector]))
-        arr.append(prop)
-
-    return arr
+        return []
+    return [dict(zip(names, vector if isinstance(vector, list) else [vector])) for vector in matrix]
 
 
-def prediction_matrix_build(data):
+def column_dict_build(matrix, fields):
     """
-    将预测数据(字典数组)转为 numpy Matrix
-    :param data:
-    :return:
+    将 Matrix 按列拆分为列数组, 与 dict_array_build 的列对应关系一致, 不逐行构造字典
+    :param matrix: numpy 数组, 一维时视为单列
+    :param fields: 字段信息
+    :return: 列名 -> 列数组
     """
-    x_matrix = prediction_data_role_handle(data)
-    return numpy.array(x_matrix)
+    if matrix is None or fields is None:
+        return {}
+    names = [field.get("name") for field in fields if field.get("name") is not None]
+    matrix = numpy.asarray(matrix)
+    if matrix.ndim == 0:
+        matrix = matrix.reshape(1)
+    if matrix.ndim == 1:
+        return {names[0]: matrix} if names else {}
+    return {name: matrix[:, i] for i, name in enumerate(names[: matrix.shape[1]])}
 
 
-def prediction_data_role_handle(data):
+def prediction_matrix_build(data, dtype=None):
     """
-    将预测数据(字典数组)转为二维数组
-    :param data: 字典数组
-    :return: 二维数组
+    将预测数据(字典数组或列式数据集)的全部列转为 numpy Matrix, 列顺序为首行字典的键顺序
+    :param data: 字典数组或列式数据集
+    :param dtype: 目标类型, 默认按数据推断
+    :return: Matrix
     """
-    x_matrix = []
-    if not data:
-        return x_matrix
-    keys = data[0].keys()
-    for d in data:
-        x_arr = []
-        for x_key in keys:
-            x = d[x_key]
-            x_arr.append(x)
-        x_matrix.append(x_arr)
-
-    return x_matrix
+    return record_matrix(data, column_names(data), dtype)
 
 
-def train_matrix_build(data, role_settings):
+def train_matrix_build(data, role_settings, dtype=None):
     """
-    根据角色信息将字典数组转为 Matrix
-    :param data:
-    :param role_settings:
-    :return:
+    根据角色信息将字典数组或列式数据集转为 Matrix
+    :param data: 字典数组或列式数据集
+    :param role_settings: 角色信息
+    :param dtype: 目标类型, 默认按数据推断
+    :return: 自变量 Matrix、因变量 Matrix
     """
     x_role_arr = [x.get("name") for x in role_settings if x.get("role_type") == RoleType.X.value]
     y_role_arr = [x.get("name") for x in role_settings if x.get("role_type") == RoleType.Y.value]
+    return record_matrix(data, x_role_arr, dtype), record_matrix(data, y_role_arr, dtype)
 
-    x_matrix, y_matrix = train_data_role_handle(data, x_role_arr, y_role_arr)
-    return numpy.array(x_matrix), numpy.array(y_matrix)
+
+def record_matrix(data, names, dtype=None):
+    """
+    取出指定列组成二维 Matrix
+    列式数据集直接拼接列数组; 字典数组以一次 itemgetter 遍历取值, 由 numpy 一次性构造,
+    类型推断与逐行构造二维数组后 numpy.array 的结果一致
+    :param data: 字典数组或列式数据集
+    :param names: 列名数组
+    :param dtype: 目标类型, 如 numpy.float64, 指定时 None 转为 NaN, 非数值数据报错
+    :return: Matrix, 形状为 (行数, 列数)
+    """
+    if not data:
+        return numpy.empty((0, len(names)), dtype=dtype)
+    if not names:
+        return numpy.empty((len(data), 0), dtype=dtype)
+    try:
+        if is_columnar(data):
+            return numpy.column_stack([numpy.asarray(data.column(name), dtype=dtype) for name in names])
+        rows = list(map(itemgetter(*names), data))
+        matrix = numpy.array(rows, dtype=dtype)
+    except (TypeError, ValueError):
+        if dtype is None:
+            raise
+        raise DataProcessError(f"{invalid_column(data, names, dtype)} 列存在无法转换为数值的数据") from None
+    return matrix.reshape(len(rows), len(names))
+
+
+def invalid_column(data, names, dtype):
+    """
+    查找无法转换为目标类型的列
+    :param data: 字典数组或列式数据集
+    :param names: 列名数组
+    :param dtype: 目标类型
+    :return: 列名
+    """
+    for name in names:
+        try:
+            if is_columnar(data):
+                numpy.asarray(data.column(name), dtype=dtype)
+            else:
+                numpy.array([d[name] for d in data], dtype=dtype)
+        except (TypeError, ValueError):
+            return name
+    return ",".join(names)
 
 
 def get_x_count(role_settings):
@@ -113,29 +150,3 @@ def get_x_count(role_settings):
 
 def get_y_count(role_settings):
     return len([x.get("name") for x in role_settings if x.get("role_type") == RoleType.Y.value])
-
-
-def train_data_role_handle(data, x_role_arr, y_role_arr):
-    """
-    根据自变量因变量数组, 处理数据
-    :param data: 初始数据
-    :param x_role_arr: 自变量数组
-    :param y_role_arr: 因变量数组
-    :return: 处理后的自变量二维数组、因变量二维数组元组
-    """
-    x_matrix = []
-    y_matrix = []
-
-    for d in data:
-        x_arr = []
-        y_arr = []
-        for x_role in x_role_arr:
-            x = d[x_role]
-            x_arr.append(x)
-        for y_role in y_role_arr:
-            y = d[y_role]
-            y_arr.append(y)
-        x_matrix.append(x_arr)
-        y_matrix.append(y_arr)
-
-    return x_matrix, y_matrix
@@ -1,7 +1,9 @@
 import pandas as pd
 
+from entity.dataset.columnar_dataset import ColumnarDataset
 from error.data_process_error import DataProcessError
 from helper.column_data_process_helper import process_type
+from helper.columnar_helper import is_columnar, to_dataframe
 
 
 def scaler_filter(scaler, filter_fields):
@@ -30,6 +32,8 @@ def min_max_filter_column_data(data, min_max_fields):
     if min_max_fields is None or data is None:
         return []
     min_max_fields_name_arr = [x["name"] for x in min_max_fields]
+    if is_columnar(data):
+        return data.select([name for name in data.names if name in min_max_fields_name_arr])
     n_arr = []
     for d in data:
         n_dict = {}
@@ -43,7 +47,7 @@ def min_max_filter_column_data(data, min_max_fields):
 
 def min_max_scaler(data, min_max_fields):
     scaler = {}
-    df = pd.DataFrame.from_dict(data)
+    df = to_dataframe(data)
     normalized_df = df.copy(deep=True)
     for column in df.columns:
         manual_val = process_type(min_max_fields, column)
@@ -59,6 +63,8 @@ def min_max_scaler(data, min_max_fields):
         if min_val == max_val:
             continue
         normalized_df[column] = round((df[column] - min_val) / (max_val - min_val), 10)
+    if is_columnar(data):
+        return ColumnarDataset.from_dataframe(normalized_df, data.fields), scaler
     return normalized_df.to_dict("records"), scaler
 
 
@@ -84,6 +90,9 @@ def concat_min_max_data(min_max_data, data):
         return data
     if len(min_max_data) != len(data):
         return None
+    if is_columnar(data) and is_columnar(min_max_data):
+        # 只替换归一化的列, 其余列共享原数组
+        return data.with_columns({name: min_max_data.column(name) for name in min_max_data.names})
     for i in range(len(data)):
         if isinstance(data[i], dict) and isinstance(min_max_data[i], dict):
             data[i].update(min_max_data[i])
@@ -1,27 +1,32 @@
 import io
+import os
 import shutil
 import tempfile
+import threading
 
 import joblib
-import numpy as np
 import oss2
 import pandas as pd
-from oss2.exceptions import NoSuchKey
+from oss2.exceptions import NoSuchKey, NotFound
 from pandas.errors import EmptyDataError
 
 from config import setting
 from enum_type.result_code import ResultCode
 from error.data_process_error import DataProcessError
-from helper.column_type_convert_helper import (
-    column_type_convert_from_data_to_df,
-    column_type_convert_from_df_to_df,
-)
-from helper.folder_helper import csv_folder, excel_folder, json_folder, model_folder
+from helper.column_type_convert_helper import column_type_convert_from_data_to_df
+from helper.folder_helper import excel_folder, json_folder, model_folder
 from helper.generate_helper import generate_uuid
 from helper.oss_helper.oss_helper import OSSHelper
+from helper.oss_helper.snapshot_format import snapshot_format_of, snapshot_frame
 
 
 class AliHelper(OSSHelper):
+    # 进程内复用的存储桶客户端, 共享同一连接池, 以进程号区分
+    __buckets = {}
+    __session = None
+    __session_pid = None
+    __lock = threading.Lock()
+
     def upload_model_to_s3(self, content: bytes, file_name: str):
         extend_name = ""
         name_and_extend_list = file_name.split(".")
@@ -189,48 +194,58 @@ class AliHelper(OSSHelper):
 
         raise DataProcessError("excel 数据存储失败") from None
 
-    def create_csv_file(self, data, fields=None):
-        relative_folder = csv_folder()
-        csv_name = generate_uuid()
-        key = relative_folder + str(csv_name) + ".csv"
-        if fields:
-            convert_result = column_type_convert_from_data_to_df(data, fields, "data_type")
-            if convert_result.code != ResultCode.Success.value:
-                raise DataProcessError("数据转换失败") from None
-            df = convert_result.data
-        else:
-            df = pd.DataFrame(data)
+    def create_csv_file(self, data, fields=None, key=None):
+        if not key:
+            key = self.generate_csv_key()
+        df = snapshot_frame(data, fields)
         s3 = self.get_bucket_client(setting.ALI_CSV_BUCKET)
-
-        with io.StringIO() as csv_buffer:
-            # noinspection PyTypeChecker
-            df.to_csv(csv_buffer, index=False, na_rep="")
-            response = s3.put_object(key, csv_buffer.getvalue())
-            status = self.valid_s3_response(response)
-            if status == 200:
-                return key
+        body = snapshot_format_of(key).dumps(df, fields)
+        response = s3.put_object(key, body)
+        status = self.valid_s3_response(response)
+        if status == 200:
+            self.create_csv_summary(key, df, fields)
+            return key
 
         raise DataProcessError("csv 数据存储失败") from None
 
     def read_csv_file(self, key, fields):
         """
-        对象存储根据 data 创建 CSV 文件
+        读取快照文件, 按文件扩展名确定格式, 兼容已有的 CSV 文件
         :param key: key
         :param fields: 文件字段数据
         :return: 文件内容
         """
-        d = []
+        return self.read_snapshot_records(key, fields)
+
+    def read_csv_frame(self, key, **kwargs):
         try:
-            df = pd.read_csv(self.generate_s3_presigned_url_for_excel(key, setting.ALI_CSV_BUCKET))
-            if fields:
-                convert_result = column_type_convert_from_df_to_df(df, fields, "data_type")
-                if convert_result.code == ResultCode.Success.value:
-                    df = convert_result.data
-            df = df.replace(np.nan, None).replace(np.inf, "inf").replace(-np.inf, "-inf").replace({pd.NaT: None})
-            d = df.to_dict("records")
+            return pd.read_csv(self.generate_s3_presigned_url_for_excel(key, setting.ALI_CSV_BUCKET), **kwargs)
         except (EmptyDataError, FileNotFoundError):
-            pass
-        return d
+            return None
+
+    def snapshot_size(self, key):
+        s3 = self.get_bucket_client(setting.ALI_CSV_BUCKET)
+        try:
+            return s3.head_object(key).content_length
+        except NotFound:
+            return None
+
+    def read_snapshot_range(self, key, start, end):
+        s3 = self.get_bucket_client(setting.ALI_CSV_BUCKET)
+        return s3.get_object(key, byte_range=(start, end - 1)).read()
+
+    def put_csv_summary(self, key, content: bytes):
+        s3 = self.get_bucket_client(setting.ALI_CSV_BUCKET)
+        response = s3.put_object(self.csv_summary_key(key), content)
+        if self.valid_s3_response(response) != 200:
+            raise DataProcessError("汇总统计存储失败") from None
+
+    def get_csv_summary(self, key):
+        s3 = self.get_bucket_client(setting.ALI_CSV_BUCKET)
+        try:
+            return s3.get_object(self.csv_summary_key(key)).read()
+        except NoSuchKey:
+            return None
 
     def create_notebook(self, key, content: str):
         """
@@ -261,12 +276,27 @@ class AliHelper(OSSHelper):
         except Exception:
             raise DataProcessError("notebook 文件加载失败") from None
 
-    @staticmethod
-    def get_bucket_client(bucket_name):
-        auth = oss2.Auth(setting.ALI_ACCESS_KEY, setting.ALI_SECRET_KEY)
-        cname = setting.ALI_CNAME
-        bucket = oss2.Bucket(auth, cname, bucket_name, is_cname=True)
-        return bucket
+    def prepare_client(self):
+        self.get_bucket_client(setting.ALI_MODEL_BUCKET)
+
+    @classmethod
+    def get_bucket_client(cls, bucket_name):
+        pid = os.getpid()
+        bucket = cls.__buckets.get(bucket_name) if cls.__session_pid == pid else None
+        if bucket is not None:
+            return bucket
+        with cls.__lock:
+            if cls.__session is None or cls.__session_pid != pid:
+                cls.__session = oss2.Session(pool_size=setting.OSS_MAX_POOL_CONNECTIONS)
+                cls.__session_pid = pid
+                cls.__buckets = {}
+            bucket = cls.__buckets.get(bucket_name)
+            if bucket is None:
+                auth = oss2.Auth(setting.ALI_ACCESS_KEY, setting.ALI_SECRET_KEY)
+                cname = setting.ALI_CNAME
+                bucket = oss2.Bucket(auth, cname, bucket_name, is_cname=True, session=cls.__session)
+                cls.__buckets[bucket_name] = bucket
+            return bucket
 
     @staticmethod
     def valid_s3_response(response):
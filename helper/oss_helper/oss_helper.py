@@ -1,9 +1,17 @@
 import abc
 import importlib
+import json
+from contextlib import contextmanager
 
-from config.setting import Oss
+from loguru import logger
+
+from config.setting import INSIGHT_SUMMARY_ON_WRITE, Oss
 from enum_type.oss_type import OSSType
 from error.no_such_oss_type_error import NoSuchOssTypeError
+from helper.folder_helper import csv_folder
+from helper.generate_helper import generate_uuid
+from helper.oss_helper.snapshot_format import frame_to_records, open_range_file, snapshot_format, snapshot_format_of
+from helper.snapshot_summary_helper import summarize_dataframe
 
 
 class OSSHelper(abc.ABC):
@@ -103,25 +111,193 @@ class OSSHelper(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def create_csv_file(self, data: list[dict], fields=None):
+    def create_csv_file(self, data: list[dict], fields=None, key=None):
         """
-        对象存储根据 data 创建 CSV 文件
+        对象存储根据 data 创建快照文件, 文件格式由文件标识的扩展名确定
         :param data: 文件内容数据
         :param fields: 文件字段数据
+        :param key: 指定的文件标识, 为空时自动生成
         :return: 文件标识
         """
         pass
 
+    @staticmethod
+    def generate_csv_key():
+        """
+        生成快照文件标识, 用于先返回标识后异步上传, 扩展名为 SNAPSHOT_FORMAT 对应的文件格式
+        :return: 文件标识
+        """
+        return csv_folder() + str(generate_uuid()) + snapshot_format().extension
+
     @abc.abstractmethod
     def read_csv_file(self, key, fields: str):
         """
-        对象存储根据 data 创建 CSV 文件
+        读取快照文件, 按文件扩展名确定格式, 兼容已有的 CSV 文件
+        :param key: key
+        :param fields: 文件字段数据
+        :return: 文件内容
+        """
+        pass
+
+    @abc.abstractmethod
+    def read_csv_frame(self, key, **kwargs):
+        """
+        读取 CSV 文件为 DataFrame
+        :param key: key
+        :param kwargs: pd.read_csv 参数
+        :return: DataFrame, 文件不存在或为空时为 None
+        """
+        pass
+
+    @abc.abstractmethod
+    def snapshot_size(self, key):
+        """
+        快照文件大小
+        :param key: key
+        :return: 字节数, 文件不存在时为 None
+        """
+        pass
+
+    @abc.abstractmethod
+    def read_snapshot_range(self, key, start, end):
+        """
+        范围读取快照文件
+        :param key: key
+        :param start: 起始字节
+        :param end: 结束字节(不含)
+        :return: 文件内容
+        """
+        pass
+
+    @contextmanager
+    def open_snapshot(self, key):
+        """
+        以范围读取方式打开快照文件, 读取 Parquet、Arrow IPC 文件时只下载文件尾及所需行组
+        :param key: key
+        :return: 文件对象, 文件不存在时为 None
+        """
+        size = self.snapshot_size(key)
+        if size is None:
+            yield None
+            return
+        with open_range_file(size, lambda start, end: self.read_snapshot_range(key, start, end)) as f:
+            yield f
+
+    def read_snapshot_frame(self, key, columns=None, offset=0, limit=None):
+        """
+        按文件扩展名确定格式读取快照文件
+        :param key: key
+        :param columns: 查询列, 为空时读取全部列
+        :param offset: 起始行
+        :param limit: 行数, 为空时读取到末尾
+        :return: DataFrame, 文件不存在或为空时为 None
+        """
+        return snapshot_format_of(key).read_frame(self, key, columns, offset, limit)
+
+    def read_snapshot_records(self, key, fields, columns=None, offset=0, limit=None):
+        """
+        读取快照文件并转为字典数组, CSV 文件按字段数据转换类型, 列式文件已保存类型, 不再转换
+        :param key: key
+        :param fields: 文件字段数据
+        :param columns: 查询列, 为空时读取全部列
+        :param offset: 起始行
+        :param limit: 行数, 为空时读取到末尾
+        :return: 文件内容
+        """
+        df = self.read_snapshot_frame(key, columns, offset, limit)
+        if df is None:
+            return []
+        return frame_to_records(df, None if snapshot_format_of(key).typed else fields)
+
+    def read_csv_page(self, key, fields, columns=None, offset=0, limit=None, sort_by=None, ascending=True):
+        """
+        分页读取快照文件, 只读取查询列; 未指定排序列时只读取 [offset, offset + limit) 行
         :param key: key
         :param fields: 文件字段数据
+        :param columns: 查询列, 为空时读取全部列
+        :param offset: 起始行
+        :param limit: 行数, 为空时读取到末尾
+        :param sort_by: 排序列
+        :param ascending: 是否升序
         :return: 文件内容
         """
+        if not sort_by:
+            return self.read_snapshot_records(key, fields, columns, offset, limit)
+        usecols = list(dict.fromkeys(columns + [sort_by])) if columns else None
+        df = self.read_snapshot_frame(key, usecols)
+        if df is None:
+            return []
+        df = df.sort_values(sort_by, ascending=ascending, kind="stable", na_position="last")
+        df = df.iloc[offset : None if limit is None else offset + limit]
+        if columns:
+            df = df[columns]
+        return frame_to_records(df, None if snapshot_format_of(key).typed else fields)
+
+    @staticmethod
+    def csv_summary_key(key):
+        """
+        CSV 文件汇总统计的文件标识, 与 CSV 文件存储在同一存储桶
+        :param key: CSV 文件标识
+        :return: 汇总统计文件标识
+        """
+        return f"{key}.summary.json"
+
+    @abc.abstractmethod
+    def put_csv_summary(self, key, content: bytes):
+        """
+        存储 CSV 文件的汇总统计
+        :param key: CSV 文件标识
+        :param content: 汇总统计 JSON
+        :return: None
+        """
         pass
 
+    @abc.abstractmethod
+    def get_csv_summary(self, key):
+        """
+        读取 CSV 文件的汇总统计
+        :param key: CSV 文件标识
+        :return: 汇总统计 JSON, 不存在时为 None
+        """
+        pass
+
+    def create_csv_summary(self, key, df, fields=None):
+        """
+        计算并存储 CSV 文件的汇总统计, 失败时只记录日志, 不影响快照写入
+        :param key: CSV 文件标识
+        :param df: 文件内容
+        :param fields: 文件字段数据
+        :return: None
+        """
+        if not INSIGHT_SUMMARY_ON_WRITE:
+            return
+        # noinspection PyBroadException
+        try:
+            self.put_csv_summary(key, dump_summary(summarize_dataframe(df, fields)))
+        except Exception as e:
+            logger.warning(f"快照 {key} 汇总统计存储失败: {e}")
+
+    def read_csv_summary(self, key, fields=None):
+        """
+        读取 CSV 文件的汇总统计, 历史快照未存储时读取全部数据计算一次并补存
+        :param key: CSV 文件标识
+        :param fields: 文件字段数据
+        :return: {"row_count": 行数, "columns": {列名: 统计}}
+        """
+        content = self.get_csv_summary(key)
+        if content:
+            return json.loads(content)
+        df = self.read_snapshot_frame(key)
+        if df is None:
+            return {"row_count": 0, "columns": {}}
+        summary = summarize_dataframe(df, fields)
+        # noinspection PyBroadException
+        try:
+            self.put_csv_summary(key, dump_summary(summary))
+        except Exception as e:
+            logger.warning(f"快照 {key} 汇总统计补存失败: {e}")
+        return summary
+
     def create_notebook(self, key, content: str):
         """
         创建 notebook 文件, 如果存在则覆盖
@@ -140,6 +316,13 @@ class OSSHelper(abc.ABC):
         """
         pass
 
+    def prepare_client(self):
+        """
+        创建当前进程的对象存储客户端, 执行进程启动时调用, 避免首次请求时创建
+        :return: None
+        """
+        pass
+
 
 def create_oss_helper() -> OSSHelper:
     if Oss in OSSType._value2member_map_:
@@ -150,4 +333,8 @@ def create_oss_helper() -> OSSHelper:
     raise NoSuchOssTypeError(error_message="不支持的对象存储类型") from None
 
 
+def dump_summary(summary):
+    return json.dumps(summary, ensure_ascii=False, default=str).encode("utf-8")
+
+
 oss_helper1 = create_oss_helper()
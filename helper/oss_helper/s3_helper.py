@@ -1,25 +1,33 @@
 import io
+import os
 import tempfile
+import threading
 
 import boto3
 import botocore.exceptions
 import joblib
-import numpy as np
 import pandas as pd
+from botocore.config import Config
+from pandas.errors import EmptyDataError
 
 from config import setting
 from enum_type.result_code import ResultCode
 from error.data_process_error import DataProcessError
-from helper.column_type_convert_helper import (
-    column_type_convert_from_data_to_df,
-    column_type_convert_from_df_to_df,
-)
-from helper.folder_helper import csv_folder, excel_folder, json_folder, model_folder
+from helper.column_type_convert_helper import column_type_convert_from_data_to_df
+from helper.folder_helper import excel_folder, json_folder, model_folder
 from helper.generate_helper import generate_uuid
 from helper.oss_helper.oss_helper import OSSHelper
+from helper.oss_helper.snapshot_format import snapshot_format_of, snapshot_frame
 
 
 class S3Helper(OSSHelper):
+    # 进程内复用的客户端, boto3 客户端线程安全, 但不可跨进程共享, 以进程号区分
+    __client = None
+    __client_pid = None
+    __lock = threading.Lock()
+    # 已确认存在的存储桶
+    __existing_buckets = set()
+
     def upload_model_to_s3(self, content: bytes, file_name: str):
         extend_name = ""
         name_and_extend_list = file_name.split(".")
@@ -169,57 +177,75 @@ class S3Helper(OSSHelper):
 
         raise DataProcessError("excel 数据存储失败") from None
 
-    def create_csv_file(self, data, fields=None):
-        relative_folder = csv_folder()
-        csv_name = generate_uuid()
-        key = relative_folder + str(csv_name) + ".csv"
-        if fields:
-            convert_result = column_type_convert_from_data_to_df(data, fields, "data_type")
-            if convert_result.code != ResultCode.Success.value:
-                raise DataProcessError("数据转换失败") from None
-            df = convert_result.data
-        else:
-            df = pd.DataFrame(data)
+    def create_csv_file(self, data, fields=None, key=None):
+        if not key:
+            key = self.generate_csv_key()
+        df = snapshot_frame(data, fields)
         self.make_bucket_if_not_exist(setting.CSV_BUCKET)
         s3 = self.get_s3_client()
-
-        with io.StringIO() as csv_buffer:
-            # noinspection PyTypeChecker
-            df.to_csv(csv_buffer, index=False, na_rep="")
-            response = s3.put_object(Bucket=setting.CSV_BUCKET, Key=key, Body=csv_buffer.getvalue())
-            status = self.valid_s3_response(response)
-            if status == 200:
-                return key
+        body = snapshot_format_of(key).dumps(df, fields)
+        response = s3.put_object(Bucket=setting.CSV_BUCKET, Key=key, Body=body)
+        status = self.valid_s3_response(response)
+        if status == 200:
+            self.create_csv_summary(key, df, fields)
+            return key
 
         raise DataProcessError("csv 数据存储失败") from None
 
     def read_csv_file(self, key, fields):
         """
-        对象存储根据 data 创建 CSV 文件
+        读取快照文件, 按文件扩展名确定格式, 兼容已有的 CSV 文件
         :param key: key
         :param fields: 文件字段数据
         :return: 文件内容
         """
-        d = []
         # noinspection PyBroadException
         try:
-            df = pd.read_csv(
+            return self.read_snapshot_records(key, fields)
+        except Exception:
+            return []
+
+    def read_csv_frame(self, key, **kwargs):
+        try:
+            return pd.read_csv(
                 f"s3://{setting.CSV_BUCKET}/{key}",
                 storage_options={
                     "key": setting.MINIO_ACCESS_KEY,
                     "secret": setting.MINIO_SECRET_KEY,
                     "client_kwargs": {"endpoint_url": setting.MINIO_SCHEME_AND_URL},
                 },
+                **kwargs,
             )
-            if fields:
-                convert_result = column_type_convert_from_df_to_df(df, fields, "data_type")
-                if convert_result.code == ResultCode.Success.value:
-                    df = convert_result.data
-            df = df.replace(np.nan, None).replace(np.inf, "inf").replace(-np.inf, "-inf").replace({pd.NaT: None})
-            d = df.to_dict("records")
-        except Exception:
-            pass
-        return d
+        except (EmptyDataError, FileNotFoundError):
+            return None
+
+    def snapshot_size(self, key):
+        s3 = self.get_s3_client()
+        try:
+            return s3.head_object(Bucket=setting.CSV_BUCKET, Key=key)["ContentLength"]
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    def read_snapshot_range(self, key, start, end):
+        s3 = self.get_s3_client()
+        response = s3.get_object(Bucket=setting.CSV_BUCKET, Key=key, Range=f"bytes={start}-{end - 1}")
+        return response["Body"].read()
+
+    def put_csv_summary(self, key, content: bytes):
+        s3 = self.get_s3_client()
+        response = s3.put_object(Bucket=setting.CSV_BUCKET, Key=self.csv_summary_key(key), Body=content)
+        if self.valid_s3_response(response) != 200:
+            raise DataProcessError("汇总统计存储失败") from None
+
+    def get_csv_summary(self, key):
+        s3 = self.get_s3_client()
+        try:
+            response = s3.get_object(Bucket=setting.CSV_BUCKET, Key=self.csv_summary_key(key))
+        except s3.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
 
     def create_notebook(self, key, content: str):
         """
@@ -251,23 +277,41 @@ class S3Helper(OSSHelper):
         except Exception:
             raise DataProcessError("notebook 文件加载失败") from None
 
-    @staticmethod
-    def get_s3_client():
-        s3 = boto3.client(
-            "s3",
-            endpoint_url=setting.MINIO_SCHEME_AND_URL,
-            aws_access_key_id=setting.MINIO_ACCESS_KEY,
-            aws_secret_access_key=setting.MINIO_SECRET_KEY,
-            verify=setting.MINIO_SCHEME_AND_URL.startswith("https"),
-        )
-        return s3
+    def prepare_client(self):
+        self.get_s3_client()
+
+    @classmethod
+    def get_s3_client(cls):
+        pid = os.getpid()
+        if cls.__client is not None and cls.__client_pid == pid:
+            return cls.__client
+        with cls.__lock:
+            if cls.__client is None or cls.__client_pid != pid:
+                cls.__client = boto3.client(
+                    "s3",
+                    endpoint_url=setting.MINIO_SCHEME_AND_URL,
+                    aws_access_key_id=setting.MINIO_ACCESS_KEY,
+                    aws_secret_access_key=setting.MINIO_SECRET_KEY,
+                    verify=setting.MINIO_SCHEME_AND_URL.startswith("https"),
+                    config=Config(
+                        max_pool_connections=setting.OSS_MAX_POOL_CONNECTIONS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    ),
+                )
+                cls.__client_pid = pid
+                # 新进程重新确认存储桶
+                cls.__existing_buckets = set()
+            return cls.__client
 
     def make_bucket_if_not_exist(self, bucket) -> None:
         s3 = self.get_s3_client()
+        if bucket in self.__existing_buckets:
+            return
         try:
             s3.head_bucket(Bucket=bucket)
         except botocore.exceptions.ClientError:
             s3.create_bucket(Bucket=bucket, ACL="public-read")
+        self.__existing_buckets.add(bucket)
 
     @staticmethod
     def valid_s3_response(response):
@@ -0,0 +1,311 @@
+import abc
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config.setting import (
+    SNAPSHOT_COMPRESSION,
+    SNAPSHOT_FORMAT,
+    SNAPSHOT_READ_BUFFER_BYTES,
+    SNAPSHOT_ROW_GROUP_ROWS,
+)
+from enum_type.result_code import ResultCode
+from enum_type.snapshot_format_type import SnapshotFormatType
+from enum_type.user_data_type import UserDataType
+from error.data_process_error import DataProcessError
+from helper.column_type_convert_helper import (
+    column_type_convert_from_data_to_df,
+    column_type_convert_from_df_to_df,
+    convert_field,
+)
+
+# 嵌入快照文件元数据的字段数据
+FIELDS_METADATA_KEY = b"flyboat.fields"
+# 嵌入 Arrow IPC 文件元数据的每个记录批行数, 用于按行号定位记录批
+BATCH_ROWS_METADATA_KEY = b"flyboat.batch_rows"
+# 空值转为文本后的字符串, CSV 文件读取时按空值处理, 列式文件写入前还原为空值
+NULL_TEXTS = ("None", "NaT", "<NA>", "nan")
+
+
+class SnapshotFormat(abc.ABC):
+    """
+    过程数据快照文件格式
+    """
+
+    format_type = None
+    # 是否保存列类型, 保存时读取后无需按字段数据再次转换
+    typed = True
+
+    @property
+    def extension(self):
+        return f".{self.format_type.value}"
+
+    @abc.abstractmethod
+    def dumps(self, df, fields=None):
+        """
+        序列化快照数据
+        :param df: 快照数据
+        :param fields: 快照字段数据
+        :return: 文件内容
+        """
+        pass
+
+    @abc.abstractmethod
+    def read_frame(self, helper, key, columns=None, offset=0, limit=None):
+        """
+        读取快照数据, 只读取查询列及 [offset, offset + limit) 行所在的行组
+        :param helper: 对象存储对象
+        :param key: 文件标识
+        :param columns: 查询列, 为空时读取全部列
+        :param offset: 起始行
+        :param limit: 行数, 为空时读取到末尾
+        :return: DataFrame, 文件不存在或为空时为 None
+        """
+        pass
+
+
+class CsvSnapshotFormat(SnapshotFormat):
+    format_type = SnapshotFormatType.Csv
+    typed = False
+
+    def dumps(self, df, fields=None):
+        with io.StringIO() as csv_buffer:
+            # noinspection PyTypeChecker
+            df.to_csv(csv_buffer, index=False, na_rep="")
+            return csv_buffer.getvalue()
+
+    def read_frame(self, helper, key, columns=None, offset=0, limit=None):
+        kwargs = {"usecols": columns, "nrows": limit}
+        if offset:
+            # 以函数跳过起始行, 避免 offset 较大时构造行号集合
+            kwargs["skiprows"] = lambda i: 0 < i <= offset
+        return helper.read_csv_frame(key, **kwargs)
+
+
+class ParquetSnapshotFormat(SnapshotFormat):
+    format_type = SnapshotFormatType.Parquet
+
+    def dumps(self, df, fields=None):
+        sink = io.BytesIO()
+        pq.write_table(
+            to_arrow_table(df, fields),
+            sink,
+            compression=SNAPSHOT_COMPRESSION,
+            row_group_size=max(SNAPSHOT_ROW_GROUP_ROWS, 1),
+        )
+        return sink.getvalue()
+
+    def read_frame(self, helper, key, columns=None, offset=0, limit=None):
+        with helper.open_snapshot(key) as f:
+            if f is None:
+                return None
+            # 合并相邻列块的读取, 减少范围读取请求数
+            parquet_file = pq.ParquetFile(f, pre_buffer=True)
+            metadata = parquet_file.metadata
+            row_counts = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+            groups, skip = overlapping_groups(row_counts, offset, limit)
+            if groups:
+                table = parquet_file.read_row_groups(groups, columns=columns)
+            else:
+                table = parquet_file.schema_arrow.empty_table()
+                table = table.select(columns) if columns else table
+        return slice_table(table, skip, limit).to_pandas()
+
+
+class ArrowSnapshotFormat(SnapshotFormat):
+    format_type = SnapshotFormatType.Arrow
+
+    def dumps(self, df, fields=None):
+        batch_rows = max(SNAPSHOT_ROW_GROUP_ROWS, 1)
+        table = to_arrow_table(df, fields)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), BATCH_ROWS_METADATA_KEY: str(batch_rows).encode()}
+        )
+        sink = io.BytesIO()
+        options = pa.ipc.IpcWriteOptions(compression=SNAPSHOT_COMPRESSION)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=batch_rows)
+        return sink.getvalue()
+
+    def read_frame(self, helper, key, columns=None, offset=0, limit=None):
+        with helper.open_snapshot(key) as f:
+            if f is None:
+                return None
+            reader = pa.ipc.open_file(f)
+            batch_rows = int((reader.schema.metadata or {}).get(BATCH_ROWS_METADATA_KEY, 0))
+            indices = range(reader.num_record_batches)
+            skip = offset
+            if batch_rows > 0:
+                # 写入时按固定行数切分记录批, 直接定位所需记录批
+                first = offset // batch_rows
+                last = reader.num_record_batches if limit is None else -(-(offset + limit) // batch_rows)
+                indices = range(first, min(last, reader.num_record_batches))
+                skip = offset - first * batch_rows
+            batches = [reader.get_batch(i) for i in indices]
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+        table = table.select(columns) if columns else table
+        return slice_table(table, skip, limit).to_pandas()
+
+
+snapshot_formats = {
+    f.format_type.value: f for f in (CsvSnapshotFormat(), ParquetSnapshotFormat(), ArrowSnapshotFormat())
+}
+
+
+def snapshot_format():
+    """
+    新写入快照使用的文件格式
+    :return: 快照文件格式
+    """
+    return snapshot_formats.get(SNAPSHOT_FORMAT, snapshot_formats[SnapshotFormatType.Csv.value])
+
+
+def snapshot_format_of(key):
+    """
+    根据文件扩展名确定快照文件格式, 无法识别时按 CSV 读取, 兼容已有快照
+    :param key: 文件标识
+    :return: 快照文件格式
+    """
+    extension = key.rsplit(".", 1)[-1].lower() if key and "." in key else ""
+    return snapshot_formats.get(extension, snapshot_formats[SnapshotFormatType.Csv.value])
+
+
+def snapshot_frame(data, fields=None):
+    """
+    按字段类型将快照数据转为 DataFrame, 文本列中由空值转换得到的字符串还原为空值, 与 CSV 文件读取结果一致
+    :param data: 快照数据
+    :param fields: 快照字段数据
+    :return: DataFrame
+    """
+    if not fields:
+        return pd.DataFrame(data)
+    convert_result = column_type_convert_from_data_to_df(data, fields, "data_type")
+    if convert_result.code != ResultCode.Success.value:
+        raise DataProcessError("数据转换失败") from None
+    df = convert_result.data
+    for column in df.columns:
+        field = convert_field(fields, str(column))
+        if field and field.get("data_type") == UserDataType.Varchar2.value:
+            df[column] = df[column].mask(df[column].isin(NULL_TEXTS), None)
+    return df
+
+
+def frame_to_records(df, fields=None):
+    """
+    按字段类型转换快照数据并转为字典数组, 空值转为 None, 无穷值转为字符串
+    :param df: 快照数据
+    :param fields: 文件字段数据
+    :return: 字典数组
+    """
+    if fields:
+        convert_result = column_type_convert_from_df_to_df(df, fields, "data_type")
+        if convert_result.code == ResultCode.Success.value:
+            df = convert_result.data
+    df = df.replace(np.nan, None).replace(np.inf, "inf").replace(-np.inf, "-inf").replace({pd.NaT: None})
+    return df.to_dict("records")
+
+
+def to_arrow_table(df, fields=None):
+    """
+    DataFrame 转为 Arrow 表, 字段数据嵌入表元数据; 类型混杂无法转换的列按文本存储
+    :param df: 快照数据
+    :param fields: 快照字段数据
+    :return: Arrow 表
+    """
+    arrays = []
+    for column in df.columns:
+        series = df[column]
+        try:
+            arrays.append(pa.array(series, from_pandas=True))
+        except (pa.ArrowException, TypeError, ValueError):
+            values = series.astype(object).where(series.notna(), None)
+            arrays.append(pa.array([None if v is None else str(v) for v in values], type=pa.string()))
+    table = pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+    if fields:
+        metadata = {FIELDS_METADATA_KEY: json.dumps(fields, ensure_ascii=False, default=str).encode("utf-8")}
+        table = table.replace_schema_metadata(metadata)
+    return table
+
+
+def overlapping_groups(row_counts, offset, limit):
+    """
+    计算与 [offset, offset + limit) 行重叠的行组
+    :param row_counts: 各行组行数
+    :param offset: 起始行
+    :param limit: 行数, 为空时到末尾
+    :return: 行组序号数组, 第一个行组中需跳过的行数
+    """
+    groups = []
+    skip = 0
+    start = 0
+    end = None if limit is None else offset + limit
+    for index, row_count in enumerate(row_counts):
+        stop = start + row_count
+        if stop > offset and (end is None or start < end):
+            if not groups:
+                skip = offset - start
+            groups.append(index)
+        start = stop
+    return groups, skip
+
+
+def slice_table(table, skip, limit):
+    if skip <= 0 and limit is None:
+        return table
+    return table.slice(max(skip, 0), limit)
+
+
+class RangeFile(io.RawIOBase):
+    def __init__(self, size, read_range):
+        """
+        以范围读取实现的只读文件对象, 读取 Parquet、Arrow IPC 文件时只下载文件尾及所需行组
+        :param size: 文件大小
+        :param read_range: 范围读取方法, 参数为 (起始字节, 结束字节(不含))
+        """
+        super().__init__()
+        self.size = size
+        self.position = 0
+        self.read_range = read_range
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = self.size + offset
+        self.position = max(self.position, 0)
+        return self.position
+
+    def readinto(self, buffer):
+        if self.position >= self.size:
+            return 0
+        end = min(self.position + len(buffer), self.size)
+        data = self.read_range(self.position, end)
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+def open_range_file(size, read_range):
+    """
+    创建带缓冲的范围读取文件对象
+    :param size: 文件大小
+    :param read_range: 范围读取方法
+    :return: 文件对象
+    """
+    buffer_size = max(SNAPSHOT_READ_BUFFER_BYTES, io.DEFAULT_BUFFER_SIZE)
+    return io.BufferedReader(RangeFile(size, read_range), buffer_size=buffer_size)
@@ -1,4 +1,4 @@
-from helper.dag_helper import get_dag, topological_sort
+from helper.dag_helper import get_dag, get_dag_plan
 from helper.sql_helper.init_sql_helper import db_helper1
 
 
@@ -15,17 +15,14 @@ def get_algorithm_name_list(element_id_list):
 
 
 def get_element_ids(version_id, node_type):
-    dag_arr = get_dag(version_id)
-    if not dag_arr:
+    dag_plan = get_dag_plan(version_id)
+    if not dag_plan:
         return None
-    dag_id_arr = topological_sort(dag_arr)
     element_ids = []
-    for element_id in dag_id_arr:
-        nodes = [x for x in dag_arr if x["id"] == element_id]
-        if not nodes:
+    for element_id in dag_plan.order:
+        node = dag_plan.nodes.get(element_id)
+        if not node:
             return None
-        # 获取要执行的算子节点, 根据执行顺序, 从全局 DAG 字典中该节点需要执行的算子处理函数
-        node = nodes[0]
         current_node_type = node["type"]
         if node_type == current_node_type:
             element_ids.append(element_id)
@@ -33,17 +30,14 @@ def get_element_ids(version_id, node_type):
 
 
 def get_element_id(version_id, node_type):
-    dag_arr = get_dag(version_id)
-    if not dag_arr:
+    dag_plan = get_dag_plan(version_id)
+    if not dag_plan:
         return None
-    dag_id_arr = topological_sort(dag_arr)
 
-    for element_id in dag_id_arr:
-        nodes = [x for x in dag_arr if x["id"] == element_id]
-        if not nodes:
+    for element_id in dag_plan.order:
+        node = dag_plan.nodes.get(element_id)
+        if not node:
             return None
-        # 获取要执行的算子节点, 根据执行顺序, 从全局 DAG 字典中该节点需要执行的算子处理函数
-        node = nodes[0]
         current_node_type = node["type"]
         if node_type == current_node_type:
             return element_id
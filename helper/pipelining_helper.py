@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import json
 import sys
 
@@ -14,7 +15,11 @@ from config.dag_config import (
     TABLE_NAME,
     element_info_dict,
 )
+from core.cancel_token import CancelToken
+from core.element_config_cache import ElementConfigCache
 from core.engine_execute_pool import ExecutePool
+from core.process_data_writer import ProcessDataWriter
+from core.publish_result_cache import PublishResultCache
 from core.pipelining_engine import (
     machine_learning_execute_engine,
     machine_learning_execute_engine_with_websocket,
@@ -22,20 +27,22 @@ from core.pipelining_engine import (
 from enum_type.deleted import Deleted
 from enum_type.element_config_type import ElementConfigType
 from enum_type.enabled import Enabled
+from enum_type.execute_lane import ExecuteLane
 from enum_type.input_type import ValueType
 from enum_type.pipelining_operation_type import PipeliningOperationType
 from enum_type.pipelining_process_status import PipeliningProcessStatus
 from enum_type.result_code import ResultCode
-from error.data_process_error import DataProcessError
+from enum_type.snapshot_policy import SnapshotPolicy
 from error.execute_error import ExecuteError
-from helper.dag_helper import get_dag
+from error.store_error import StoreError
+from helper.dag_helper import DagPlanCache, get_dag_plan
 from helper.generate_helper import generate_uuid, uuid_and_now
 from helper.model_version_helper import version_handle
 from helper.oss_helper.oss_helper import oss_helper1
 from helper.result_helper import ExecuteResult, execute_error, execute_success
 from helper.sql_helper.init_sql_helper import db_helper1
 from helper.time_helper import current_time
-from publish.pipelining_publish import insert_publish, update_process
+from publish.pipelining_publish import get_snapshot_policy, insert_publish, update_process
 
 
 def multiprocess_pipelining_exec(
@@ -49,12 +56,9 @@ def multiprocess_pipelining_exec(
     to_element_id=None,
     serial_number=None,
 ):
-    # 进程池执行流水线
-    pool = ExecutePool.get_pool()
-    if not pool:
-        raise DataProcessError("流水线线程池为空, 请重启应用") from None
-    manager_dict = ExecutePool.get_manager_dict()
-    return pool.apply(
+    # 进程池执行流水线, 发布接口调用优先于交互执行
+    lane = ExecuteLane.Api if publish_id else ExecuteLane.Interactive
+    return ExecutePool.apply(
         pipelining_exec,
         args=(
             sync_input_data,
@@ -64,10 +68,10 @@ def multiprocess_pipelining_exec(
             connect_id,
             process_id,
             need_websocket,
-            manager_dict,
             to_element_id,
             serial_number,
         ),
+        lane=lane,
     )
 
 
@@ -79,13 +83,11 @@ def pipelining_exec(
     connect_id=None,
     process_id=None,
     need_websocket=False,
-    shared_mem=None,
     to_element_id=None,
     serial_number=None,
 ):
     """
     实际调度引擎执行方法
-    :param shared_mem: 共享内存
     :param sync_input_data: 同步输入数据
     :param version_id: 版本标识
     :param user_id: 用户标识
@@ -95,44 +97,65 @@ def pipelining_exec(
     :param need_websocket: 是否需要连接 websocket
     :param to_element_id: 开始执行到哪个算子
     :param serial_number: 授权序列号
-    :return: response_result
+    :return: response_result, 成功时 cacheable 表示结果是否可被发布接口结果缓存复用
     """
     if not process_id:
         process_id = generate_uuid()
-    dag_arr = get_dag(version_id)
+    dag_plan = get_dag_plan(version_id)
 
-    if not dag_arr:
+    if not dag_plan:
         raise ExecuteError(sys._getframe().f_code.co_name, "流水线配置解析失败") from None
+    dag_arr = copy.deepcopy(dag_plan.dag_arr)
+    # 执行前批量预取算子配置, 已发布版本的配置在执行进程内缓存
+    ElementConfigCache.begin(dag_plan, published=bool(publish_id))
+    # 发布接口结果缓存只复用全部算子均确定的流水线结果
+    cacheable = bool(publish_id) and dag_plan_deterministic(dag_plan)
+    # 取消执行时由主进程置位, 算子及训练循环通过 CancelToken 检查
+    CancelToken.begin(connect_id)
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    if not need_websocket:
-        execute_result: ExecuteResult = loop.run_until_complete(
-            machine_learning_execute_engine(
-                sync_input_data,
-                version_id,
-                user_id,
-                process_id,
-                dag_arr,
-                connect_id,
-                to_element_id=to_element_id,
-                serial_number=serial_number,
+    try:
+        if not need_websocket:
+            # 非交互执行时执行过程数据后写, 交互执行需逐算子洞察, 保持同步写入
+            # 只有发布接口调用需查询快照策略
+            skip_snapshot = bool(publish_id) and get_snapshot_policy(publish_id) == SnapshotPolicy.Skip
+            ProcessDataWriter.begin(skip_snapshot=skip_snapshot)
+            try:
+                execute_result: ExecuteResult = loop.run_until_complete(
+                    machine_learning_execute_engine(
+                        sync_input_data,
+                        version_id,
+                        user_id,
+                        process_id,
+                        dag_arr,
+                        connect_id,
+                        to_element_id=to_element_id,
+                        serial_number=serial_number,
+                    )
+                )
+            finally:
+                flush_result = ProcessDataWriter.end()
+            if flush_result != ResultCode.Success.value:
+                loop.close()
+                raise StoreError(sys._getframe().f_code.co_name, user_id, "执行过程数据存储失败") from None
+        else:
+            execute_result: ExecuteResult = loop.run_until_complete(
+                machine_learning_execute_engine_with_websocket(
+                    sync_input_data,
+                    version_id,
+                    user_id,
+                    process_id,
+                    dag_arr,
+                    connect_id,
+                    CancelToken,
+                    to_element_id=to_element_id,
+                    serial_number=serial_number,
+                )
             )
-        )
-    else:
-        execute_result: ExecuteResult = loop.run_until_complete(
-            machine_learning_execute_engine_with_websocket(
-                sync_input_data,
-                version_id,
-                user_id,
-                process_id,
-                dag_arr,
-                connect_id,
-                shared_mem,
-                to_element_id=to_element_id,
-                serial_number=serial_number,
-            )
-        )
+    finally:
+        CancelToken.end()
+        ElementConfigCache.end(version_id)
     loop.close()
     update_process(process_id, version_id)
     if publish_id:
@@ -145,10 +168,27 @@ def pipelining_exec(
     if execute_result.code == ResultCode.Error.value:
         return execute_error(execute_result.message)
 
-    return execute_success(
+    result = execute_success(
         data=execute_result.data.get("data") if execute_result.data is not None else None,
         message=execute_result.message,
     )
+    result.cacheable = cacheable
+    return result
+
+
+def dag_plan_deterministic(dag_plan):
+    """
+    执行计划中的算子是否均确定, 需在算子配置预取之后调用
+    :param dag_plan: 执行计划
+    :return: 是、否
+    """
+    for element_id, element_class in dag_plan.element_classes.items():
+        if element_class is None:
+            return False
+        _, element_config = ElementConfigCache.lookup(dag_plan.version_id, element_id)
+        if not element_class.is_deterministic(element_config):
+            return False
+    return True
 
 
 def publish_pipelining(version_id, tag_id_list, user_id, description):
@@ -221,6 +261,8 @@ def publish_pipelining(version_id, tag_id_list, user_id, description):
     )
 
     insert_result = db_helper1.execute_arr([merge_sql, delete_tag_sql, insert_tag_sql, operation_sql])
+    # 重新发布后不再复用发布前缓存的接口结果
+    PublishResultCache.invalidate(publish_id)
     if insert_result != ResultCode.Success.value:
         return execute_error("发布失败")
     return execute_success(data={"publish_id": publish_id})
@@ -244,7 +286,7 @@ def cancel_publish_pipelining(publish_id, user_id):
         f"'{user_id}', to_date('{now}', 'yyyy-mm-dd hh24:mi:ss'), "
         f"'{publish_id}', '{PipeliningOperationType.CancelPublish.value}', null)"
     )
-
+    PublishResultCache.invalidate(publish_id)
     return db_helper1.execute_arr([update_sql, operation_sql])
 
 
@@ -449,7 +491,11 @@ def config_pipelining_dag(version_id, dag):
     # noinspection SqlWithoutWhere
     update_sql = f"update ml_pipelining_version " f"set dag_config=:1 where id='{version_id}'"
     relative_path = oss_helper1.create_json_file(dag)
-    return db_helper1.execute_arr([update_sql], {0: [relative_path]})
+    result = db_helper1.execute_arr([update_sql], {0: [relative_path]})
+    # 执行进程中的缓存依据配置文件标识失效, 此处清理当前进程的缓存
+    DagPlanCache.invalidate(version_id)
+    PublishResultCache.invalidate_version(version_id)
+    return result
 
 
 def disable_element_list(version_id, type_element_id_dict):
@@ -1,4 +1,5 @@
 from config.setting import PUBLISH_HOST
+from core.publish_result_cache import PublishResultCache
 from enum_type.deleted import Deleted
 from enum_type.pipelining_operation_type import PipeliningOperationType
 from helper.generate_helper import generate_uuid
@@ -110,6 +111,19 @@ def change_publish_name_and_description(publish_id, publish_name, description):
     return db_helper1.execute(update_sql)
 
 
+def change_snapshot_policy_by_publish_id(publish_id, snapshot_policy):
+    update_sql = (
+        f"update ml_pipelining_publish " f"set snapshot_policy={int(snapshot_policy)} " f"where id='{publish_id}'"
+    )
+    return db_helper1.execute(update_sql)
+
+
+def change_cache_policy_by_publish_id(publish_id, cache_policy):
+    update_sql = f"update ml_pipelining_publish " f"set cache_policy={int(cache_policy)} " f"where id='{publish_id}'"
+    PublishResultCache.invalidate(publish_id)
+    return db_helper1.execute(update_sql)
+
+
 def associate_client_with_publish_id_list(user_id, client_id, experiment_id, publish_id_list):
     delete_sql = f"delete from ml_publish_client where system_code='{client_id}'"
     now = current_time()
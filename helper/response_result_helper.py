@@ -1,9 +1,20 @@
+import json
 import math
 from datetime import date, datetime
+from itertools import repeat
 
+import numpy as np
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from config.setting import RESPONSE_CHUNK_ROWS, RESPONSE_STREAM_ROWS
+from entity.dataset.columnar_dataset import ColumnarDataset
 from enum_type.response_code import ResponseCode
 from helper.result_helper import ExecuteResult
 
+ORJSON_OPTION = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+CONTAINER_TYPES = (dict, list, tuple, ColumnarDataset)
+
 
 def make_json(json_object):
     __dict = json_object.__dict__
@@ -15,6 +26,8 @@ def make_obj_can_json_serializable(obj):
         return {k: make_obj_can_json_serializable(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [make_obj_can_json_serializable(item) for item in obj]
+    elif isinstance(obj, ColumnarDataset):
+        return make_obj_can_json_serializable(obj.to_records())
     elif isinstance(obj, (datetime, date)):
         return obj.isoformat()
     elif isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
@@ -44,3 +57,213 @@ def response_error_result(code=ResponseCode.Error.value, message="", data=None):
     :return: response
     """
     return response_result(code, message, data)
+
+
+class JsonResponse(JSONResponse):
+    """
+    以 encode_json 序列化的 JSON 响应, 与 make_json 后由 JSONResponse 序列化的结果一致
+    """
+
+    def render(self, content) -> bytes:
+        return encode_json(content)
+
+
+def json_response(result, stream_rows=None):
+    """
+    由执行结果生成 JSON 响应, 数据行数不少于 stream_rows 时分块流式返回
+    :param result: 执行结果, 如 response_result 的返回值
+    :param stream_rows: 流式返回的最少数据行数, 默认为 RESPONSE_STREAM_ROWS, 0 表示不流式返回
+    :return: 响应
+    """
+    content = result.__dict__
+    stream_rows = RESPONSE_STREAM_ROWS if stream_rows is None else stream_rows
+    if 0 < stream_rows <= row_count(content):
+        return StreamingResponse(iter_json(content), media_type="application/json")
+    return JsonResponse(content)
+
+
+def encode_json(obj):
+    """
+    序列化为 JSON
+    :param obj: 对象
+    :return: UTF-8 编码的 JSON
+    """
+    return b"".join(iter_json(obj))
+
+
+def iter_json(obj, chunk_rows=None):
+    """
+    分块序列化为 JSON, 字典逐键序列化, 数组及列式数据集每 chunk_rows 行序列化为一块;
+    块内以 orjson 一次序列化, 列式数据集按列序列化后拼接为行, 不转换为字典数组
+    :param obj: 对象
+    :param chunk_rows: 每块行数, 默认为 RESPONSE_CHUNK_ROWS
+    :return: UTF-8 编码的 JSON 块的迭代器
+    """
+    chunk_rows = max(1, chunk_rows or RESPONSE_CHUNK_ROWS)
+    if isinstance(obj, ColumnarDataset):
+        yield from iter_columnar_json(obj, chunk_rows)
+    elif type(obj) is dict:
+        yield b"{"
+        for i, (key, value) in enumerate(obj.items()):
+            yield (b"," if i else b"") + dumps_key(key) + b":"
+            yield from iter_json(value, chunk_rows)
+        yield b"}"
+    elif type(obj) is list and any(isinstance(item, ColumnarDataset) for item in obj):
+        yield b"["
+        for i, item in enumerate(obj):
+            if i:
+                yield b","
+            yield from iter_json(item, chunk_rows)
+        yield b"]"
+    elif type(obj) is list and len(obj) > chunk_rows:
+        yield b"["
+        for start in range(0, len(obj), chunk_rows):
+            yield (b"," if start else b"") + dumps(obj[start : start + chunk_rows])[1:-1]
+        yield b"]"
+    else:
+        yield dumps(obj)
+
+
+def iter_columnar_json(dataset, chunk_rows):
+    """
+    分块序列化列式数据集, 结果与 to_records 后序列化一致
+    :param dataset: 列式数据集
+    :param chunk_rows: 每块行数
+    :return: UTF-8 编码的 JSON 块的迭代器
+    """
+    names = dataset.names
+    length = len(dataset)
+    if not names or not length:
+        yield b"[]"
+        return
+    # 每行依次为 {"列1":值1,"列2":值2}, 列名部分为常量
+    prefixes = [(b"{" if i == 0 else b",") + dumps_key(name) + b":" for i, name in enumerate(names)]
+    yield b"["
+    for start in range(0, length, chunk_rows):
+        end = min(start + chunk_rows, length)
+        parts = []
+        for prefix, name in zip(prefixes, names):
+            parts.append(repeat(prefix))
+            parts.append(column_tokens(dataset.column(name)[start:end]))
+        parts.append(repeat(b"}"))
+        yield (b"," if start else b"") + b",".join(map(b"".join, zip(*parts)))
+    yield b"]"
+
+
+def column_tokens(values):
+    """
+    将一列值分别序列化, 数值列整列一次序列化后切分
+    :param values: numpy 数组
+    :return: 每个值的 JSON 数组
+    """
+    kind = values.dtype.kind
+    try:
+        if kind in "iub":
+            return orjson.dumps(np.ascontiguousarray(values), option=ORJSON_OPTION)[1:-1].split(b",")
+        if kind == "f":
+            # 与 tolist 一致按双精度输出, NaN、Inf 与 make_obj_can_json_serializable 一致输出为字符串
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            tokens = orjson.dumps(values, option=ORJSON_OPTION)[1:-1].split(b",")
+            for i in np.flatnonzero(~np.isfinite(values)).tolist():
+                tokens[i] = dumps(str(values[i]))
+            return tokens
+    except TypeError:
+        # orjson 不支持的数组(非本机字节序等)逐个序列化
+        pass
+    return [dumps(value) for value in values.tolist()]
+
+
+def dumps(obj):
+    """
+    以 orjson 序列化, 结果与 make_obj_can_json_serializable 后以 json 序列化一致:
+    orjson 将 NaN、Inf 输出为 null, 输出含 null 且对象中含 NaN、Inf 时转换后重新序列化;
+    orjson 不支持的对象(超出 64 位的整数等)使用 json 序列化
+    :param obj: 对象
+    :return: UTF-8 编码的 JSON
+    """
+    try:
+        content = orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTION)
+    except TypeError:
+        return json.dumps(
+            make_obj_can_json_serializable(obj),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    if b"null" in content and contains_non_finite(obj):
+        return orjson.dumps(make_obj_can_json_serializable(obj), default=orjson_default, option=ORJSON_OPTION)
+    return content
+
+
+def dumps_key(key):
+    """
+    序列化字典键, 非字符串键与 json 一致转为字符串
+    :param key: 键
+    :return: UTF-8 编码的 JSON 字符串
+    """
+    if isinstance(key, str):
+        return orjson.dumps(key)
+    return json.dumps({key: None}, ensure_ascii=False, separators=(",", ":"))[1:-6].encode("utf-8")
+
+
+def orjson_default(obj):
+    """
+    orjson 不能直接序列化的对象的转换
+    :param obj: 对象
+    :return: 可序列化的对象
+    """
+    if isinstance(obj, ColumnarDataset):
+        return obj.to_records()
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8")
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError
+
+
+def contains_non_finite(obj):
+    """
+    对象中是否含有 NaN、Inf 浮点数
+    :param obj: 对象
+    :return: 是、否
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, ColumnarDataset):
+        return any(column_contains_non_finite(obj.column(name)) for name in obj.names)
+    if isinstance(obj, dict):
+        return values_contain_non_finite(list(obj.values()))
+    if isinstance(obj, (list, tuple)):
+        if obj and all(type(item) is dict for item in obj):
+            # 字典数组展开为值数组一次判断
+            return values_contain_non_finite([value for item in obj for value in item.values()])
+        return values_contain_non_finite(obj)
+    return False
+
+
+def values_contain_non_finite(values):
+    floats = [value for value in values if isinstance(value, float)]
+    if floats and not np.isfinite(np.array(floats, dtype=np.float64)).all():
+        return True
+    return any(contains_non_finite(value) for value in values if isinstance(value, CONTAINER_TYPES))
+
+
+def column_contains_non_finite(values):
+    if values.dtype.kind == "f":
+        return not np.isfinite(values).all()
+    if values.dtype.kind == "O":
+        return contains_non_finite(values.tolist())
+    return False
+
+
+def row_count(obj):
+    """
+    统计字典中数组及列式数据集的行数, 用于判断是否流式返回
+    :param obj: 对象
+    :return: 行数
+    """
+    if isinstance(obj, (list, ColumnarDataset)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(map(row_count, obj.values()))
+    return 0
@@ -0,0 +1,175 @@
+import json
+
+from config.dag_config import COLUMN_FILTER, DATA_FILTER
+from config.setting import DATABASE_INPUT_PREDICATE_PUSHDOWN, DATABASE_INPUT_PROJECTION
+from core.element_config_cache import ElementConfigCache
+from enum_type.compare_type import CompareType
+from enum_type.enabled import Enabled
+from enum_type.filter_type import FilterType
+from enum_type.user_data_type import UserDataType
+from error.data_process_error import DataProcessError
+from helper.dag_helper import get_dag_plan
+from helper.data_filter_helper import convert_value
+from helper.sql_helper.init_sql_helper import db_helper1
+
+# 可下推的比较类型 -> SQL 运算符
+SQL_OPERATOR_DICT = {
+    CompareType.GreatThan: ">",
+    CompareType.GreatThanOrEqual: ">=",
+    CompareType.Equal: "=",
+    CompareType.LessThan: "<",
+    CompareType.LessThanOrEqual: "<=",
+    CompareType.NotEqual: "<>",
+}
+
+# 比较语义与 Python 一致、可下推的字段类型
+PUSHDOWN_DATA_TYPES = (UserDataType.Number.value, UserDataType.Date.value)
+
+
+class ScanHint:
+    def __init__(self, columns=None, filter_type=None, conditions=None):
+        """
+        输入算子的读取提示, 由下游算子的配置推导
+        :param columns: 下游使用的列名数组, 为空时读取全部列
+        :param filter_type: 下游数据过滤算子的过滤类型
+        :param conditions: 下游数据过滤算子的过滤条件
+        """
+        self.columns = columns
+        self.filter_type = filter_type
+        self.conditions = conditions or []
+
+    def __bool__(self):
+        return self.columns is not None or bool(self.conditions)
+
+
+def scan_hint(version_id, element_id) -> ScanHint:
+    """
+    根据执行计划中的下游算子推导输入算子的读取提示
+    下游全部为列过滤算子时只读取其使用的列; 下游仅有一个数据过滤算子时下推过滤条件,
+    数据过滤算子仍会对读取结果再次过滤, 下推只减少读取的行数, 不改变其结果
+    :param version_id: 版本标识
+    :param element_id: 输入算子标识
+    :return: 读取提示
+    """
+    if not DATABASE_INPUT_PROJECTION and not DATABASE_INPUT_PREDICATE_PUSHDOWN:
+        return ScanHint()
+    dag_plan = get_dag_plan(version_id)
+    if dag_plan is None:
+        return ScanHint()
+    downstream_ids = dag_plan.downstream.get(element_id) or []
+    if not downstream_ids:
+        return ScanHint()
+    types = [dag_plan.nodes[x]["type"] for x in downstream_ids]
+
+    if DATABASE_INPUT_PROJECTION and all(x == COLUMN_FILTER for x in types):
+        columns = []
+        for downstream_id in downstream_ids:
+            config = element_config(version_id, downstream_id, "filter_fields", "ml_column_filter_element")
+            if not config or not config.get("filter_fields"):
+                return ScanHint()
+            for field in json.loads(config["filter_fields"]):
+                if field.get("name") and field["name"] not in columns:
+                    columns.append(field["name"])
+        return ScanHint(columns=columns)
+
+    if DATABASE_INPUT_PREDICATE_PUSHDOWN and types == [DATA_FILTER]:
+        config = element_config(
+            version_id, downstream_ids[0], "filter_type, filter_compare_fields", "ml_data_filter_element"
+        )
+        if not config or not config.get("filter_type") or not config.get("filter_compare_fields"):
+            return ScanHint()
+        return ScanHint(filter_type=config["filter_type"], conditions=json.loads(config["filter_compare_fields"]))
+    return ScanHint()
+
+
+def element_config(version_id, element_id, columns, table_name):
+    """
+    读取下游算子的配置, 优先使用批量预取的配置
+    :param version_id: 版本标识
+    :param element_id: 算子标识
+    :param columns: 查询的列
+    :param table_name: 算子配置表
+    :return: 配置字典
+    """
+    prefetched, config = ElementConfigCache.lookup(version_id, element_id)
+    if prefetched:
+        return config
+    # noinspection SqlResolve
+    config_sql = (
+        f"select {columns} "
+        f"from {table_name} "
+        f"where id='{element_id}' and "
+        f"version_id='{version_id}' and "
+        f"is_enabled={Enabled.Yes.value}"
+    )
+    return db_helper1.fetchone(config_sql, [])
+
+
+def scan_sql(table_name, fields, column_name_dict, hint: ScanHint, dialect):
+    """
+    根据读取提示生成查询语句
+    :param table_name: 表名
+    :param fields: 格式化的字段信息 [{"name": "", "nick_name": "", "data_type": "NUMBER"}]
+    :param column_name_dict: 小写字段名 -> 数据库中的字段名
+    :param hint: 读取提示
+    :param dialect: 临时数据库对象类或业务数据库对象类, 提供 quote_identifier、placeholder
+    :return: (sql, 绑定变量数组, 读取的字段信息)
+    """
+    fields = [f for f in fields if f["name"] in column_name_dict]
+    if hint.columns is not None:
+        selected_fields = [f for f in fields if f["name"] in hint.columns]
+        # 列过滤算子的字段均不在表中时仍读取全部列, 保证行数不变
+        fields = selected_fields or fields
+    column_sql = ", ".join([dialect.quote_identifier(column_name_dict[f["name"]]) for f in fields]) or "*"
+    sql = f"select {column_sql} from {table_name}"
+
+    params = []
+    predicate_arr = []
+    data_type_dict = {f["name"]: f["data_type"] for f in fields}
+    for condition in hint.conditions:
+        predicate = condition_sql(condition, data_type_dict, column_name_dict, dialect, params)
+        if predicate is None and hint.filter_type != FilterType.All:
+            # 任一满足时, 存在不可下推的条件则整体不下推
+            params, predicate_arr = [], []
+            break
+        if predicate is not None:
+            predicate_arr.append(predicate)
+    if predicate_arr:
+        separator = " and " if hint.filter_type == FilterType.All else " or "
+        sql += " where " + separator.join([f"({x})" for x in predicate_arr])
+    return sql, params, fields
+
+
+def condition_sql(condition, data_type_dict, column_name_dict, dialect, params):
+    """
+    将数据过滤条件转为 SQL 条件, 不可下推时返回 None
+    :param condition: {"name": "", "value": 0, "data_type": "NUMBER", "compare_type": "less_than"}
+    :param data_type_dict: 小写字段名 -> 字段类型
+    :param column_name_dict: 小写字段名 -> 数据库中的字段名
+    :param dialect: 提供 quote_identifier、placeholder 的数据库对象类
+    :param params: 绑定变量数组, 可下推时追加比较值
+    :return: SQL 条件
+    """
+    name = condition.get("name")
+    # 与数据过滤算子一致, 优先匹配原字段名, 其次匹配小写字段名
+    if name and name not in data_type_dict:
+        name = name.lower()
+    if name not in data_type_dict:
+        return None
+    column_sql = dialect.quote_identifier(column_name_dict[name])
+    compare_type = condition.get("compare_type")
+    if compare_type == CompareType.IsNull:
+        return f"{column_sql} is null"
+    if compare_type == CompareType.IsNotNull:
+        return f"{column_sql} is not null"
+    operator = SQL_OPERATOR_DICT.get(compare_type)
+    data_type = condition.get("data_type")
+    if operator is None or data_type not in PUSHDOWN_DATA_TYPES or data_type_dict[name] != data_type:
+        return None
+    try:
+        value = convert_value(condition.get("value"), data_type)
+    except DataProcessError:
+        # 比较值无法转换时由数据过滤算子报错
+        return None
+    params.append(value)
+    return f"{column_sql} {operator} {dialect.placeholder(len(params) - 1)}"
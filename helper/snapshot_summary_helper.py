@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from config.setting import INSIGHT_HISTOGRAM_BINS, INSIGHT_TOP_VALUES
+from enum_type.user_data_type import UserDataType
+
+
+def summarize_dataframe(df, fields=None):
+    """
+    计算快照数据的汇总统计, 快照写入时计算一次并与快照一同存储, 洞察时直接读取
+    :param df: 快照数据
+    :param fields: 快照字段数据, 用于确定各列的统计方式
+    :return: {"row_count": 行数, "columns": {列名: 统计}}
+    """
+    data_type_dict = {(f.get("name") or "").lower(): f.get("data_type") for f in fields or [] if isinstance(f, dict)}
+    columns = {}
+    for column in df.columns:
+        data_type = data_type_dict.get(str(column).lower())
+        columns[str(column)] = summarize_series(df[column], data_type)
+    return {"row_count": int(len(df)), "columns": columns}
+
+
+def summarize_series(series, data_type=None):
+    """
+    计算单列的汇总统计
+    数值列: 个数、空值数、最小值、最大值、均值、等宽直方图;
+    日期列: 个数、空值数、最小值、最大值;
+    其他列: 个数、空值数、不同值个数、出现次数最多的值
+    :param series: 列数据
+    :param data_type: 字段类型
+    :return: 统计字典
+    """
+    nulls = int(series.isna().sum())
+    summary = {"count": int(len(series)) - nulls, "nulls": nulls}
+    if data_type == UserDataType.Number.value or (
+        data_type is None and pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    ):
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        summary["kind"] = "number"
+        if not len(values):
+            summary.update({"min": None, "max": None, "mean": None, "histogram": None})
+            return summary
+        counts, edges = np.histogram(values, bins=max(INSIGHT_HISTOGRAM_BINS, 1))
+        summary.update(
+            {
+                "min": finite_or_none(values.min()),
+                "max": finite_or_none(values.max()),
+                "mean": finite_or_none(values.mean()),
+                "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+            }
+        )
+        return summary
+    if data_type == UserDataType.Date.value or pd.api.types.is_datetime64_any_dtype(series):
+        values = pd.to_datetime(series, errors="coerce").dropna()
+        summary["kind"] = "date"
+        summary["min"] = values.min().isoformat() if len(values) else None
+        summary["max"] = values.max().isoformat() if len(values) else None
+        return summary
+    value_counts = series.dropna().astype(str).value_counts()
+    top = value_counts.head(INSIGHT_TOP_VALUES)
+    summary.update(
+        {
+            "kind": "string",
+            "distinct": int(len(value_counts)),
+            "top_values": {"values": top.index.tolist(), "counts": [int(x) for x in top.tolist()]},
+        }
+    )
+    return summary
+
+
+def finite_or_none(value):
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def project_summary(summary, columns=None):
+    """
+    只保留查询列的汇总统计
+    :param summary: 汇总统计
+    :param columns: 查询列, 为空时保留全部列
+    :return: 汇总统计
+    """
+    if not summary or not columns:
+        return summary
+    column_summary = summary.get("columns") or {}
+    return {**summary, "columns": {c: column_summary[c] for c in columns if c in column_summary}}
@@ -1,4 +1,8 @@
 import abc
+import os
+import threading
+
+from loguru import logger
 
 from config.dynamic_table_setting import TS_COLUMN_NAME
 from entity.database.database_field import DatabaseField, DatabaseFieldFormat
@@ -6,18 +10,48 @@ from entity.database.database_field_standard import DatabaseFieldStandard
 from entity.database.database_table import DatabaseTable
 from entity.page.page import Page
 from enum_type.database_field_data_type import DatabaseFieldStandardDataType
+from enum_type.result_code import ResultCode
+from enum_type.write_mode import WriteMode
+from helper.sql_helper.schema_metadata_cache import SchemaMetadataCache
+from helper.warning_helper import UNUSED
 
 
 class AbstractSqlHelper(abc.ABC):
+    # (数据库对象类, 连接池类型) -> 连接池, 各进程在首次使用时创建
+    __pools = {}
+    # 继承自父进程的连接池, 子进程不使用, 仅保留引用以免回收时关闭父进程的连接
+    __inherited_pools = []
+    __pid = None
+    __lock = threading.Lock()
+
     def __init__(self, conn_pool):
         self.conn = None
         self.cursor = None
         self.pool = conn_pool
 
+    @classmethod
+    def get_pool(cls, pool_type):
+        """
+        获取当前进程的连接池对象, 首次使用时创建, 执行进程 fork 后重新创建, 不与父进程共享连接
+        :param pool_type: 连接池类型
+        :return: 连接池对象
+        """
+        key = (cls, pool_type)
+        with AbstractSqlHelper.__lock:
+            if AbstractSqlHelper.__pid != os.getpid():
+                AbstractSqlHelper.__inherited_pools.extend(AbstractSqlHelper.__pools.values())
+                AbstractSqlHelper.__pools = {}
+                AbstractSqlHelper.__pid = os.getpid()
+            pool = AbstractSqlHelper.__pools.get(key)
+            if pool is None:
+                pool = cls.create_pool(pool_type)
+                AbstractSqlHelper.__pools[key] = pool
+            return pool
+
     @staticmethod
-    def get_pool(pool_type):
+    def create_pool(pool_type):
         """
-        获取连接池对象
+        创建连接池对象
         :param pool_type: 连接池类型
         :return: 连接池对象
         """
@@ -71,15 +105,91 @@ class AbstractSqlHelper(abc.ABC):
         """
         pass
 
+    def fetch_stream(self, sql, size, params=None):
+        """
+        流式获取记录数组, 查询只执行一次, 通过独立游标按批读取
+        :param sql: sql
+        :param size: 每批条数
+        :param params:
+        :return: 字典数组生成器, 每次返回一批
+        """
+        if params is None:
+            params = []
+        cursor = self.create_stream_cursor(size)
+        try:
+            cursor.execute(sql, params)
+            convert_row = self.row_converter(cursor)
+            while True:
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                yield [convert_row(row) for row in rows]
+        finally:
+            cursor.close()
+
+    @abc.abstractmethod
+    def create_stream_cursor(self, size):
+        """
+        创建流式读取使用的游标
+        :param size: 每批条数
+        :return: 游标
+        """
+        pass
+
     @abc.abstractmethod
+    def row_converter(self, cursor):
+        """
+        根据游标的列描述生成行转换函数
+        :param cursor: 已执行查询的游标
+        :return: 将一行转换为小写字段名字典的函数
+        """
+        pass
+
+    @staticmethod
+    def quote_identifier(name):
+        return f'"{name}"'
+
+    @staticmethod
+    def placeholder(index):
+        """
+        位置绑定变量占位符
+        :param index: 序号, 从 0 开始
+        :return: 占位符
+        """
+        return f":{index + 1}"
+
+    def metadata_owner(self):
+        """
+        元数据缓存中的所属库, 以连接池区分业务库、动态库
+        :return: 所属库
+        """
+        return type(self), self.pool
+
     def fetch_fields(self, table_name) -> list[DatabaseField]:
         """
-        获取表名为 table_name 的元数据信息
+        获取表名为 table_name 的元数据信息, 结果按 SCHEMA_METADATA_CACHE_SECONDS 缓存
+        :param table_name: 表名
+        :return: 源数据列表
+        """
+        return SchemaMetadataCache.get_fields(self.metadata_owner(), table_name, self.query_fields)
+
+    @abc.abstractmethod
+    def query_fields(self, table_name) -> list[DatabaseField]:
+        """
+        查询表名为 table_name 的元数据信息
         :param table_name: 表名
         :return: 源数据列表
         """
         pass
 
+    def invalidate_fields(self, table_name):
+        """
+        使表名为 table_name 的元数据缓存失效, 表结构变化后调用
+        :param table_name: 表名
+        :return: None
+        """
+        SchemaMetadataCache.invalidate(self.metadata_owner(), table_name)
+
     def fetch_fields_format(self, table_name):
         """
         获取表名为 table_name 的格式化元数据信息
@@ -204,6 +314,13 @@ class AbstractSqlHelper(abc.ABC):
         """
         pass
 
+    def reserved_words(self):
+        """
+        保留字集合, 进程内只查询一次
+        :return: 数据库保留字集合
+        """
+        return SchemaMetadataCache.get_reserved_words(self.metadata_owner(), self.reserved_words_list)
+
     @abc.abstractmethod
     def execute(self, sql, params=None):
         """
@@ -292,6 +409,9 @@ class AbstractSqlHelper(abc.ABC):
 
 
 class AbstractTransientSqlHelper(abc.ABC):
+    # 连接健康检查语句
+    ping_sql = "select 1"
+
     def __init__(self, connection_string, user, password):
         self.conn = None
         self.cursor = None
@@ -307,6 +427,18 @@ class AbstractTransientSqlHelper(abc.ABC):
     def close(self):
         pass
 
+    def ping(self):
+        """
+        检查连接是否可用, 不可用时抛出异常
+        :return: None
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(self.ping_sql)
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
     @abc.abstractmethod
     def fetchone(self, sql, params=None):
         """
@@ -339,6 +471,50 @@ class AbstractTransientSqlHelper(abc.ABC):
         """
         pass
 
+    def fetch_stream(self, sql, size, params=None):
+        """
+        流式获取记录数组, 查询只执行一次, 通过服务端游标按批读取
+        :param sql: sql
+        :param size: 每批条数
+        :param params:
+        :return: 字典数组生成器, 每次返回一批
+        """
+        if params is None:
+            params = []
+        cursor = self.create_stream_cursor(size)
+        try:
+            cursor.execute(sql, params)
+            convert_row = None
+            while True:
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                if convert_row is None:
+                    # 部分驱动的服务端游标在首次读取后才返回列描述
+                    convert_row = self.row_converter(cursor)
+                yield [convert_row(row) for row in rows]
+        finally:
+            if cursor is not self.cursor:
+                cursor.close()
+
+    def create_stream_cursor(self, size):
+        """
+        创建流式读取使用的游标, 默认使用当前游标
+        :param size: 每批条数
+        :return: 游标
+        """
+        UNUSED(size)
+        return self.cursor
+
+    @abc.abstractmethod
+    def row_converter(self, cursor):
+        """
+        根据游标的列描述生成行转换函数
+        :param cursor: 已执行查询的游标
+        :return: 将一行转换为小写字段名字典的函数
+        """
+        pass
+
     @abc.abstractmethod
     def execute(self, sql, params=None):
         """
@@ -388,15 +564,38 @@ class AbstractTransientSqlHelper(abc.ABC):
         lower_tables = [self._create_database_table_format(table) for table in data]
         return lower_tables
 
-    @abc.abstractmethod
+    def metadata_owner(self):
+        """
+        元数据缓存中的所属库, 以连接信息区分外部数据源
+        :return: 所属库
+        """
+        return type(self), self.connection_string, self.user
+
     def fetch_fields(self, table_name) -> list[DatabaseField]:
         """
-        获取表名为 table_name 的元数据信息
+        获取表名为 table_name 的元数据信息, 结果按 SCHEMA_METADATA_CACHE_SECONDS 缓存
+        :param table_name: 表名
+        :return: 源数据列表
+        """
+        return SchemaMetadataCache.get_fields(self.metadata_owner(), table_name, self.query_fields)
+
+    @abc.abstractmethod
+    def query_fields(self, table_name) -> list[DatabaseField]:
+        """
+        查询表名为 table_name 的元数据信息
         :param table_name: 表名
         :return: 源数据列表
         """
         pass
 
+    def invalidate_fields(self, table_name):
+        """
+        使表名为 table_name 的元数据缓存失效, 表结构变化后调用
+        :param table_name: 表名
+        :return: None
+        """
+        SchemaMetadataCache.invalidate(self.metadata_owner(), table_name)
+
     def fetch_fields_format(self, table_name):
         """
         获取表名为 table_name 的格式化元数据信息
@@ -516,3 +715,93 @@ class AbstractTransientSqlHelper(abc.ABC):
         value_sql = ",".join([f':{x.get("column_name")}' for x in field_arr])
         sql = f'insert into "{table_name}" ({field_sql}) values({value_sql})'
         return self.execute_arr([sql], {0: value_dict})
+
+    def bulk_write(
+        self,
+        table_name,
+        column_arr: list,
+        row_arr: list,
+        batch_size,
+        write_mode=WriteMode.Append,
+        key_arr=None,
+    ):
+        """
+        批量写入数据, 语句只准备一次, 按批绑定数组执行, 全部批次在同一事务中提交
+        :param table_name: 表名
+        :param column_arr: 列名数组
+        :param row_arr: 行数据数组, 每行为与列名顺序一致的值数组
+        :param batch_size: 每批条数
+        :param write_mode: 写入模式
+        :param key_arr: 主键列名数组, 更新或插入时使用
+        :return: 成功/失败 ResultCode, 每批结果数组 [{"batch": 批次, "rows": 条数, "error": 错误信息}]
+        """
+        if write_mode == WriteMode.Upsert:
+            sql = self.upsert_sql(table_name, column_arr, key_arr or [])
+        else:
+            sql = self.insert_sql(table_name, column_arr)
+        cursor = self.cursor
+        batch_results = []
+        batch = 0
+        batch_rows = []
+        # noinspection PyBroadException
+        try:
+            if write_mode == WriteMode.Overwrite:
+                # 使用 delete 而非 truncate, 写入失败时可随事务回滚
+                cursor.execute(f"delete from {self.quote_identifier(table_name)}")
+            for batch, i in enumerate(range(0, len(row_arr), batch_size)):
+                batch_rows = row_arr[i : i + batch_size]
+                self.execute_batch(cursor, sql, batch_rows)
+                rows = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else len(batch_rows)
+                batch_results.append({"batch": batch, "rows": rows, "error": None})
+            self.conn.commit()
+        except Exception as err:
+            logger.error(f"SQL BULK WRITE ERROR: batch {batch} {err}")
+            batch_results.append({"batch": batch, "rows": len(batch_rows), "error": f"{err}"})
+            self.conn.rollback()
+            return ResultCode.Error.value, batch_results
+        return ResultCode.Success.value, batch_results
+
+    @staticmethod
+    def execute_batch(cursor, sql, rows):
+        cursor.executemany(sql, rows)
+
+    @staticmethod
+    def quote_identifier(name):
+        return f'"{name}"'
+
+    @staticmethod
+    def placeholder(index):
+        """
+        位置绑定变量占位符
+        :param index: 列序号, 从 0 开始
+        :return: 占位符
+        """
+        return f":{index + 1}"
+
+    def insert_sql(self, table_name, column_arr):
+        field_sql = ", ".join([self.quote_identifier(x) for x in column_arr])
+        value_sql = ", ".join([self.placeholder(i) for i in range(len(column_arr))])
+        return f"insert into {self.quote_identifier(table_name)} ({field_sql}) values({value_sql})"
+
+    def upsert_sql(self, table_name, column_arr, key_arr):
+        """
+        生成按主键列更新或插入的 merge 语句
+        :param table_name: 表名
+        :param column_arr: 列名数组
+        :param key_arr: 主键列名数组
+        :return: SQL
+        """
+        q = self.quote_identifier
+        source_sql = ", ".join([f"{self.placeholder(i)} as {q(x)}" for i, x in enumerate(column_arr)])
+        on_sql = " and ".join([f"t.{q(x)} = s.{q(x)}" for x in key_arr])
+        update_sql = ", ".join([f"t.{q(x)} = s.{q(x)}" for x in column_arr if x not in key_arr])
+        field_sql = ", ".join([q(x) for x in column_arr])
+        value_sql = ", ".join([f"s.{q(x)}" for x in column_arr])
+        sql = f"merge into {q(table_name)} t using ({self.select_values_sql(source_sql)}) s on ({on_sql}) "
+        if update_sql:
+            sql += f"when matched then update set {update_sql} "
+        return sql + f"when not matched then insert ({field_sql}) values ({value_sql})"
+
+    @staticmethod
+    def select_values_sql(source_sql):
+        return f"select {source_sql} from dual"
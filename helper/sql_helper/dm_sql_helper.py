@@ -40,41 +40,39 @@ test_db_config = {
 
 current_env_db_config = test_db_config if env == "test" else product_db_config
 
-dm_pool = PooledDB(
-    creator=dmPython,
-    maxconnections=0,
-    mincached=2,
-    ping=1,
-    autoCommit=False,
-    blocking=True,
-    cursorclass=dmPython.DictCursor,
-    **current_env_db_config,
-)
-
-dm_pool2 = PooledDB(
-    creator=dmPython,
-    maxconnections=0,
-    mincached=2,
-    ping=1,
-    host=setting.DM_HOST2,
-    port=setting.DM_PORT2,
-    user=setting.DM_USER2,
-    password=setting.DM_PASSWORD2,
-    autoCommit=False,
-    blocking=True,
-    cursorclass=dmPython.DictCursor,
-)
-
 
 class DmSqlHelper(AbstractSqlHelper):
     @staticmethod
-    def get_pool(pool_type):
+    def create_pool(pool_type):
         """
-        返回数据库连接池对象
+        创建数据库连接池对象
         :param pool_type: 连接池类型
         :return: 业务库、动态库
         """
-        return dm_pool if pool_type == DataBasePoolType.Business else dm_pool2
+        if pool_type == DataBasePoolType.Business:
+            return PooledDB(
+                creator=dmPython,
+                maxconnections=0,
+                mincached=2,
+                ping=1,
+                autoCommit=False,
+                blocking=True,
+                cursorclass=dmPython.DictCursor,
+                **current_env_db_config,
+            )
+        return PooledDB(
+            creator=dmPython,
+            maxconnections=0,
+            mincached=2,
+            ping=1,
+            host=setting.DM_HOST2,
+            port=setting.DM_PORT2,
+            user=setting.DM_USER2,
+            password=setting.DM_PASSWORD2,
+            autoCommit=False,
+            blocking=True,
+            cursorclass=dmPython.DictCursor,
+        )
 
     def open(self):
         self.conn = self.pool.connection()
@@ -149,18 +147,25 @@ class DmSqlHelper(AbstractSqlHelper):
         # logger.info(sql)
         cursor = self.cursor
         cursor.execute(sql, params)
-        desc_tuple = cursor.description
-        cursor_desc_dict = {d[0]: d for d in desc_tuple}
+        convert_row = self.row_converter(cursor)
         result = cursor.fetchall()
+        return [convert_row(d) for d in result]
 
-        result = [
-            {
+    def create_stream_cursor(self, size):
+        cursor = self.conn.cursor()
+        cursor.arraysize = size
+        return cursor
+
+    def row_converter(self, cursor):
+        cursor_desc_dict = {d[0]: d for d in cursor.description}
+
+        def convert_row(d):
+            return {
                 k.lower(): v if not isinstance(v, Decimal) else float(v) if cursor_desc_dict[k][5] != 0 else int(v)
                 for k, v in d.items()
             }
-            for d in result
-        ]
-        return result
+
+        return convert_row
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
@@ -202,7 +207,7 @@ class DmSqlHelper(AbstractSqlHelper):
         page = Page(data, count)
         return page
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = (
             "select t1.table_name --表名称\n"
             "      ,t1.comments as table_comment  --表描述\n"
@@ -305,7 +310,10 @@ class DmSqlHelper(AbstractSqlHelper):
             sql_list.append(create_primary_key_sql)
         if create_column_comment_sql:
             sql_list.extend(create_column_comment_sql)
-        return self.execute_arr(sql_list)
+        result = self.execute_arr(sql_list)
+        # DDL 部分执行成功时表结构也可能已变化, 无论结果均使缓存失效
+        self.invalidate_fields(table_name)
+        return result
 
     def insert_field_to_dynamic_table(self, table_name: str, field: DatabaseFieldStandard):
         """
@@ -316,7 +324,9 @@ class DmSqlHelper(AbstractSqlHelper):
         """
         f = self.created_field_string_from_field_standard(field)
         sql = f"alter table {table_name} add({f})"
-        return self.execute(sql)
+        result = self.execute(sql)
+        self.invalidate_fields(table_name)
+        return result
 
     def batch_insert_to_dynamic_table(
         self,
@@ -354,7 +364,7 @@ class DmSqlHelper(AbstractSqlHelper):
         return self.execute_many(sql, params)
 
     def created_field_string_from_field_standard(self, field_standard: DatabaseFieldStandard):
-        reserved_words = self.reserved_words_list()
+        reserved_words = self.reserved_words()
         convert_string_dict = {
             DatabaseFieldStandardDataType.Varchar2: ("VARCHAR2", ["4000"]),
             DatabaseFieldStandardDataType.Date: ("DATE", None),
@@ -522,6 +532,8 @@ class DmSqlHelper(AbstractSqlHelper):
 
 
 class TransientDmSqlHelper(AbstractTransientSqlHelper):
+    ping_sql = "select 1 from dual"
+
     @staticmethod
     def split_connection_string(connection_string):
         # 使用正则表达式匹配主机地址和端口
@@ -574,18 +586,25 @@ class TransientDmSqlHelper(AbstractTransientSqlHelper):
         # logger.info(sql)
         cursor = self.cursor
         cursor.execute(sql, params)
-        desc_tuple = cursor.description
-        cursor_desc_dict = {d[0]: d for d in desc_tuple}
+        convert_row = self.row_converter(cursor)
         result = cursor.fetchall()
+        return [convert_row(d) for d in result]
 
-        result = [
-            {
+    def create_stream_cursor(self, size):
+        cursor = self.conn.cursor()
+        cursor.arraysize = size
+        return cursor
+
+    def row_converter(self, cursor):
+        cursor_desc_dict = {d[0]: d for d in cursor.description}
+
+        def convert_row(d):
+            return {
                 k.lower(): v if not isinstance(v, Decimal) else float(v) if cursor_desc_dict[k][5] != 0 else int(v)
                 for k, v in d.items()
             }
-            for d in result
-        ]
-        return result
+
+        return convert_row
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
@@ -712,7 +731,7 @@ class TransientDmSqlHelper(AbstractTransientSqlHelper):
         lower_tables = [self._create_database_table(field) for field in data]
         return Page(lower_tables, page.count)
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = (
             "select t1.table_name --表名称\n"
             "      ,t1.comments as table_comment  --表描述\n"
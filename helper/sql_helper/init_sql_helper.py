@@ -6,15 +6,22 @@ from entity.database.database_field_standard import DatabaseFieldStandard
 from entity.page.page import Page
 from enum_type.database_type import DataBaseType
 from enum_type.db_pool_type import DataBasePoolType
+from enum_type.write_mode import WriteMode
 from error.no_such_db_type_error import NoSuchDbTypeError
 from helper.response_result_helper import make_json
 from helper.sql_helper.abstract_sql_helper import AbstractSqlHelper
+from helper.sql_helper.transient_pool import TransientPoolRegistry
 
 
 class SqlHelper(object):
     def __init__(self, cls: Type[AbstractSqlHelper], pool_type: DataBasePoolType):
         self.cls = cls
-        self.pool = cls.get_pool(pool_type)
+        self.pool_type = pool_type
+
+    @property
+    def pool(self):
+        # 连接池在使用它的进程内创建
+        return self.cls.get_pool(self.pool_type)
 
     def fetchone(self, sql, params=None):
         with self.cls(self.pool) as helper:
@@ -28,6 +35,10 @@ class SqlHelper(object):
         with self.cls(self.pool) as helper:
             return helper.fetchpage(sql, current, size, params)
 
+    def fetch_stream(self, sql, size, params=None):
+        with self.cls(self.pool) as helper:
+            yield from helper.fetch_stream(sql, size, params)
+
     def fetch_fields(self, table_name):
         with self.cls(self.pool) as helper:
             data = helper.fetch_fields(table_name)
@@ -104,11 +115,25 @@ class SqlHelper(object):
 
 
 class TransientSqlHelper(object):
-    def __init__(self, connection_string, user, password):
+    def __init__(self, connection_string, user, password, datasource_id=None):
         self.connection_string = connection_string
         self.user = user
         self.password = password
         self.cls = DataBaseType.get_transient_class_by_connection_str(connection_string)
+        # 已保存的数据源复用连接池中的连接
+        self.datasource_id = datasource_id
+
+    def connection(self):
+        """
+        获取连接, 已保存的数据源从连接池借出, 否则新建连接
+        :return: 上下文管理器, 进入时返回已打开连接的临时数据库对象
+        """
+        if self.datasource_id and self.cls:
+            pool = TransientPoolRegistry.get(
+                self.datasource_id, self.cls, self.connection_string, self.user, self.password
+            )
+            return pool.connection()
+        return self.cls(self.connection_string, self.user, self.password)
 
     def test(self):
         # noinspection PyBroadException
@@ -119,59 +144,67 @@ class TransientSqlHelper(object):
             return False
 
     def fetchone(self, sql, params=None):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.fetchone(sql, params)
 
     def fetchall(self, sql, params=None):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.fetchall(sql, params)
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.fetchpage(sql, current, size, params)
 
+    def fetch_stream(self, sql, size, params=None):
+        with self.connection() as helper:
+            yield from helper.fetch_stream(sql, size, params)
+
     def execute(self, sql, params=None):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.execute(sql, params)
 
     def execute_arr(self, sql_arr, params_dict=None):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.execute_arr(sql_arr, params_dict)
 
     def fetch_tables(self):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             data = helper.fetch_tables()
             return [make_json(table) for table in data]
 
     def fetch_tables_by_page(self, table_name, current, size):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             page = helper.fetch_tables_by_page(table_name, current, size)
             page.data = [make_json(table) for table in page.data]
             return page
 
     def fetch_tables_format(self, table_name):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             data = helper.fetch_tables_format(table_name)
             return [make_json(field) for field in data]
 
     def fetch_fields(self, table_name):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             data = helper.fetch_fields(table_name)
             return [make_json(field) for field in data]
 
     def fetch_fields_format(self, table_name):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             data = helper.fetch_fields_format(table_name)
             return [make_json(field) for field in data]
 
     def fetch_fields_standard(self, table_name) -> list[DatabaseFieldStandard]:
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.fetch_fields_standard(table_name)
 
     def insert_by_fields(self, table_name, field_arr: list, value_dict: dict):
-        with self.cls(self.connection_string, self.user, self.password) as helper:
+        with self.connection() as helper:
             return helper.insert_by_fields(table_name, field_arr, value_dict)
 
+    def bulk_write(self, table_name, column_arr, row_arr, batch_size, write_mode=WriteMode.Append, key_arr=None):
+        with self.connection() as helper:
+            return helper.bulk_write(table_name, column_arr, row_arr, batch_size, write_mode, key_arr)
+
 
 def create_db_helper():
     if DataBase in DataBaseType._value2member_map_:
@@ -13,6 +13,7 @@ from enum_type.result_code import ResultCode
 from enum_type.user_data_type import UserDataType
 from error.general_error import GeneralError
 from helper.sql_helper.abstract_sql_helper import AbstractTransientSqlHelper
+from helper.warning_helper import UNUSED
 
 
 class TransientMysqlSqlHelper(AbstractTransientSqlHelper):
@@ -73,13 +74,20 @@ class TransientMysqlSqlHelper(AbstractTransientSqlHelper):
         # logger.info(sql)
         cursor = self.cursor
         cursor.execute(sql, params)
-        desc_tuple = cursor.description
-        cursor_desc_dict = {d[0]: d for d in desc_tuple}
+        convert_row = self.row_converter(cursor)
         # noinspection PyTypeChecker
         result: list[dict] = cursor.fetchall()
+        return [convert_row(d) for d in result]
+
+    def create_stream_cursor(self, size):
+        # 无缓冲游标, 不会在执行时将全部结果读入内存
+        return self.conn.cursor(pymysql.cursors.SSDictCursor)
 
-        result = [
-            {
+    def row_converter(self, cursor):
+        cursor_desc_dict = {d[0]: d for d in cursor.description}
+
+        def convert_row(d):
+            return {
                 k.lower(): None
                 if v is None
                 else int.from_bytes(v, byteorder="big")
@@ -91,9 +99,8 @@ class TransientMysqlSqlHelper(AbstractTransientSqlHelper):
                 else int(v)
                 for k, v in d.items()
             }
-            for d in result
-        ]
-        return result
+
+        return convert_row
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
@@ -218,7 +225,7 @@ class TransientMysqlSqlHelper(AbstractTransientSqlHelper):
         lower_tables = [self._create_database_table(field) for field in data]
         return Page(lower_tables, page.count)
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = f"""
         select  
             t1.table_name as table_name,           -- 表名称
@@ -361,6 +368,22 @@ class TransientMysqlSqlHelper(AbstractTransientSqlHelper):
         sql = f"insert into {table_name} ({field_sql}) values({value_sql})"
         return self.execute_arr([sql], {0: value_dict})
 
+    @staticmethod
+    def quote_identifier(name):
+        return f"`{name}`"
+
+    @staticmethod
+    def placeholder(index):
+        UNUSED(index)
+        return "%s"
+
+    def upsert_sql(self, table_name, column_arr, key_arr):
+        # 依赖目标表的主键或唯一索引判断冲突, 主键列配置仅用于排除更新列
+        q = self.quote_identifier
+        update_arr = [x for x in column_arr if x not in key_arr] or column_arr[:1]
+        update_sql = ", ".join([f"{q(x)} = values({q(x)})" for x in update_arr])
+        return f"{self.insert_sql(table_name, column_arr)} on duplicate key update {update_sql}"
+
     def open(self):
         self.conn = pymysql.connect(
             user=self.user,
@@ -21,40 +21,39 @@ from helper.sql_helper.abstract_sql_helper import (
 )
 
 oracledb.defaults.fetch_lobs = False
-oracle_pool = oracledb.create_pool(
-    user=setting.ORACLE_USER,
-    password=setting.ORACLE_PASSWORD,
-    host=setting.ORACLE_HOST,
-    port=setting.ORACLE_PORT,
-    service_name=setting.ORACLE_SERVICE_NAME,
-    min=2,
-    max=5,
-    increment=1,
-    disable_oob=True,
-)
-
-oracle_pool2 = oracledb.create_pool(
-    user=setting.ORACLE_USER2,
-    password=setting.ORACLE_PASSWORD2,
-    host=setting.ORACLE_HOST2,
-    port=setting.ORACLE_PORT2,
-    service_name=setting.ORACLE_SERVICE_NAME2,
-    min=2,
-    max=5,
-    increment=1,
-    disable_oob=True,
-)
 
 
 class OracleSqlHelper(AbstractSqlHelper):
     @staticmethod
-    def get_pool(pool_type):
+    def create_pool(pool_type):
         """
-        返回数据库连接池对象
+        创建数据库连接池对象
         :param pool_type: 连接池类型
         :return: 业务库、动态库
         """
-        return oracle_pool if pool_type == DataBasePoolType.Business else oracle_pool2
+        if pool_type == DataBasePoolType.Business:
+            return oracledb.create_pool(
+                user=setting.ORACLE_USER,
+                password=setting.ORACLE_PASSWORD,
+                host=setting.ORACLE_HOST,
+                port=setting.ORACLE_PORT,
+                service_name=setting.ORACLE_SERVICE_NAME,
+                min=2,
+                max=5,
+                increment=1,
+                disable_oob=True,
+            )
+        return oracledb.create_pool(
+            user=setting.ORACLE_USER2,
+            password=setting.ORACLE_PASSWORD2,
+            host=setting.ORACLE_HOST2,
+            port=setting.ORACLE_PORT2,
+            service_name=setting.ORACLE_SERVICE_NAME2,
+            min=2,
+            max=5,
+            increment=1,
+            disable_oob=True,
+        )
 
     def open(self):
         self.conn = self.pool.acquire()
@@ -132,6 +131,20 @@ class OracleSqlHelper(AbstractSqlHelper):
         result = cursor.fetchall()
         return result
 
+    def create_stream_cursor(self, size):
+        cursor = self.conn.cursor()
+        cursor.arraysize = size
+        cursor.prefetchrows = size
+        return cursor
+
+    def row_converter(self, cursor):
+        columns = [col[0].lower() for col in cursor.description]
+
+        def convert_row(row):
+            return dict(zip(columns, row))
+
+        return convert_row
+
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
         获取记录数组(分页)
@@ -169,7 +182,7 @@ class OracleSqlHelper(AbstractSqlHelper):
         page = Page(data, count)
         return page
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = (
             "select t1.table_name --表名称\n"
             "      ,t1.comments as table_comment  --表描述\n"
@@ -272,7 +285,10 @@ class OracleSqlHelper(AbstractSqlHelper):
             sql_list.append(create_primary_key_sql)
         if create_column_comment_sql:
             sql_list.extend(create_column_comment_sql)
-        return self.execute_arr(sql_list)
+        result = self.execute_arr(sql_list)
+        # DDL 部分执行成功时表结构也可能已变化, 无论结果均使缓存失效
+        self.invalidate_fields(table_name)
+        return result
 
     def insert_field_to_dynamic_table(self, table_name: str, field: DatabaseFieldStandard):
         """
@@ -283,7 +299,9 @@ class OracleSqlHelper(AbstractSqlHelper):
         """
         f = self.created_field_string_from_field_standard(field)
         sql = f"alter table {table_name} add {f}"
-        return self.execute(sql)
+        result = self.execute(sql)
+        self.invalidate_fields(table_name)
+        return result
 
     def batch_insert_to_dynamic_table(
         self,
@@ -321,7 +339,7 @@ class OracleSqlHelper(AbstractSqlHelper):
         return self.execute_many(sql, params)
 
     def created_field_string_from_field_standard(self, field_standard: DatabaseFieldStandard):
-        reserved_words = self.reserved_words_list()
+        reserved_words = self.reserved_words()
         convert_string_dict = {
             DatabaseFieldStandardDataType.Varchar2: ("VARCHAR2", ["4000"]),
             DatabaseFieldStandardDataType.DateTime: ("DATE", None),
@@ -462,6 +480,8 @@ class OracleSqlHelper(AbstractSqlHelper):
 
 
 class TransientOracleSqlHelper(AbstractTransientSqlHelper):
+    ping_sql = "select 1 from dual"
+
     @staticmethod
     def split_connection_string(connection_string):
         # 正则表达式匹配主机、端口、服务名称或SID
@@ -524,6 +544,20 @@ class TransientOracleSqlHelper(AbstractTransientSqlHelper):
         result = cursor.fetchall()
         return result
 
+    def create_stream_cursor(self, size):
+        cursor = self.conn.cursor()
+        cursor.arraysize = size
+        cursor.prefetchrows = size
+        return cursor
+
+    def row_converter(self, cursor):
+        columns = [col[0].lower() for col in cursor.description]
+
+        def convert_row(row):
+            return dict(zip(columns, row))
+
+        return convert_row
+
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
         获取记录数组(分页)
@@ -640,7 +674,7 @@ class TransientOracleSqlHelper(AbstractTransientSqlHelper):
         lower_tables = [self._create_database_table(field) for field in data]
         return Page(lower_tables, page.count)
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = (
             "select t1.table_name --表名称\n"
             "      ,t1.comments as table_comment  --表描述\n"
@@ -1,10 +1,11 @@
 import re
+import uuid
 from decimal import Decimal
 
 import psycopg2
 import psycopg2.extensions
 from loguru import logger
-from psycopg2.extras import DictCursor
+from psycopg2.extras import DictCursor, execute_batch
 
 from entity.database.database_field import DatabaseField
 from entity.database.database_table import DatabaseTable
@@ -14,6 +15,7 @@ from enum_type.result_code import ResultCode
 from enum_type.user_data_type import UserDataType
 from error.general_error import GeneralError
 from helper.sql_helper.abstract_sql_helper import AbstractTransientSqlHelper
+from helper.warning_helper import UNUSED
 
 
 class TransientPostgresqlSqlHelper(AbstractTransientSqlHelper):
@@ -74,13 +76,22 @@ class TransientPostgresqlSqlHelper(AbstractTransientSqlHelper):
         # logger.info(sql)
         cursor = self.cursor
         cursor.execute(sql, params)
-        desc_tuple = cursor.description
-        cursor_desc_dict = {d[0]: d for d in desc_tuple}
+        convert_row = self.row_converter(cursor)
         # noinspection PyTypeChecker
         result: list[dict] = cursor.fetchall()
+        return [convert_row(d) for d in result]
+
+    def create_stream_cursor(self, size):
+        # 命名游标为服务端游标, 按 itersize 分批从服务端读取
+        cursor = self.conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=DictCursor)
+        cursor.itersize = size
+        return cursor
 
-        result = [
-            {
+    def row_converter(self, cursor):
+        cursor_desc_dict = {d[0]: d for d in cursor.description}
+
+        def convert_row(d):
+            return {
                 k.lower(): None
                 if v is None
                 else v
@@ -98,9 +109,8 @@ class TransientPostgresqlSqlHelper(AbstractTransientSqlHelper):
                 else int(v)
                 for k, v in d.items()
             }
-            for d in result
-        ]
-        return result
+
+        return convert_row
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
@@ -244,7 +254,7 @@ class TransientPostgresqlSqlHelper(AbstractTransientSqlHelper):
         lower_tables = [self._create_database_table(field) for field in data]
         return Page(lower_tables, page.count)
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = f"""
         select
             t1.table_name as table_name,           -- 表名称
@@ -382,6 +392,23 @@ class TransientPostgresqlSqlHelper(AbstractTransientSqlHelper):
         sql = f"insert into {table_name} ({field_sql}) values({value_sql})"
         return self.execute_arr([sql], {0: value_dict})
 
+    @staticmethod
+    def execute_batch(cursor, sql, rows):
+        # executemany 为逐条执行, execute_batch 将多条语句合并为一次往返
+        execute_batch(cursor, sql, rows, page_size=len(rows))
+
+    @staticmethod
+    def placeholder(index):
+        UNUSED(index)
+        return "%s"
+
+    def upsert_sql(self, table_name, column_arr, key_arr):
+        q = self.quote_identifier
+        conflict_sql = ", ".join([q(x) for x in key_arr])
+        update_sql = ", ".join([f"{q(x)} = excluded.{q(x)}" for x in column_arr if x not in key_arr])
+        action_sql = f"do update set {update_sql}" if update_sql else "do nothing"
+        return f"{self.insert_sql(table_name, column_arr)} on conflict ({conflict_sql}) {action_sql}"
+
     def open(self):
         self.conn = psycopg2.connect(
             user=self.user,
@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from config.setting import SCHEMA_METADATA_CACHE_SECONDS, SCHEMA_METADATA_CACHE_SIZE
+
+
+class SchemaMetadataCache(object):
+    """
+    表结构元数据缓存(各进程独立维护)
+    以 (所属库, 表名) 为键缓存 fetch_fields 查询的字段列表, 所属库为业务库连接池或外部数据源连接信息;
+    动态建表、动态增加字段后在本进程内立即失效, 其他进程在有效期后重新查询;
+    数据库保留字在进程内只查询一次
+    """
+
+    # (所属库, 表名) -> (过期时间, 字段列表)
+    __fields = OrderedDict()
+    # 所属库 -> 保留字集合
+    __reserved_words = {}
+    __pid = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls):
+        return SCHEMA_METADATA_CACHE_SIZE > 0 and SCHEMA_METADATA_CACHE_SECONDS > 0
+
+    @classmethod
+    def __reset_if_forked(cls):
+        # 子进程的所属库(连接池)与父进程不同, 不沿用父进程的缓存
+        if cls.__pid != os.getpid():
+            cls.__fields = OrderedDict()
+            cls.__reserved_words = {}
+            cls.__pid = os.getpid()
+
+    @classmethod
+    def get_fields(cls, owner, table_name, loader):
+        """
+        获取表的字段列表, 未缓存或已过期时通过 loader 查询
+        :param owner: 所属库
+        :param table_name: 表名
+        :param loader: 查询字段列表的方法, 参数为表名
+        :return: 字段列表(副本)
+        """
+        if not cls.enabled():
+            return loader(table_name)
+        key = (owner, table_name)
+        with cls.__lock:
+            cls.__reset_if_forked()
+            cached = cls.__fields.get(key)
+            if cached is not None and time.monotonic() <= cached[0]:
+                cls.__fields.move_to_end(key)
+                return list(cached[1])
+        fields = loader(table_name)
+        # 表不存在时不缓存, 避免建表后仍返回空
+        if fields:
+            with cls.__lock:
+                cls.__reset_if_forked()
+                cls.__fields[key] = (time.monotonic() + SCHEMA_METADATA_CACHE_SECONDS, list(fields))
+                cls.__fields.move_to_end(key)
+                while len(cls.__fields) > SCHEMA_METADATA_CACHE_SIZE:
+                    cls.__fields.popitem(last=False)
+        return fields
+
+    @classmethod
+    def invalidate(cls, owner=None, table_name=None):
+        """
+        使表的字段列表缓存失效, 表名不区分大小写
+        :param owner: 所属库, 为空时清空全部缓存
+        :param table_name: 表名, 为空时使所属库的全部表失效
+        :return: None
+        """
+        with cls.__lock:
+            if owner is None:
+                cls.__fields.clear()
+                return
+            upper_table_name = table_name.upper() if table_name else None
+            for key in [
+                key
+                for key in cls.__fields
+                if key[0] == owner and (upper_table_name is None or key[1].upper() == upper_table_name)
+            ]:
+                cls.__fields.pop(key, None)
+
+    @classmethod
+    def get_reserved_words(cls, owner, loader):
+        """
+        获取数据库保留字集合, 进程内只查询一次
+        :param owner: 所属库
+        :param loader: 查询保留字列表的方法
+        :return: 保留字集合
+        """
+        with cls.__lock:
+            cls.__reset_if_forked()
+            reserved_words = cls.__reserved_words.get(owner)
+        if reserved_words is None:
+            reserved_words = frozenset(loader())
+            with cls.__lock:
+                cls.__reset_if_forked()
+                cls.__reserved_words[owner] = reserved_words
+        return reserved_words
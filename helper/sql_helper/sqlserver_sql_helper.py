@@ -13,6 +13,7 @@ from enum_type.result_code import ResultCode
 from enum_type.user_data_type import UserDataType
 from error.general_error import GeneralError
 from helper.sql_helper.abstract_sql_helper import AbstractTransientSqlHelper
+from helper.warning_helper import UNUSED
 
 
 class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
@@ -51,6 +52,8 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
         self.port = port
         self.instance_name = instance_name
         self.database = database
+        # 当前查询的列类型, 由 fetch_column_types 查询
+        self.column_types = None
 
     def fetchone(self, sql, params=None):
         """
@@ -85,9 +88,36 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
         if params is None:
             params = []
         # logger.info(sql)
+        self.column_types = self.fetch_column_types(sql, params)
+        if self.column_types is None:
+            return []
+
+        cursor = self.cursor
+        cursor.execute(sql, params)
+        convert_row = self.row_converter(cursor)
+        # noinspection PyTypeChecker
+        result: list[dict] = cursor.fetchall()
+        return [convert_row(d) for d in result]
+
+    def fetch_stream(self, sql, size, params=None):
+        self.column_types = self.fetch_column_types(sql, params)
+        if self.column_types is None:
+            return
+        yield from super().fetch_stream(sql, size, params)
+
+    def fetch_column_types(self, sql, params=None):
+        """
+        通过执行计划解析查询的表名称, 并查询该表的列类型
+        :param sql: sql
+        :param params: 绑定变量
+        :return: {列名: 类型}, 未解析出表名称时返回 None
+        """
         cursor = self.cursor
         cursor.execute("set showplan_xml on")
-        cursor.execute(sql)
+        if params:
+            cursor.execute(sql, tuple(params))
+        else:
+            cursor.execute(sql)
         # noinspection PyTypeChecker
         plan: dict = cursor.fetchone()
         exec_plan = list(plan.values())[0]
@@ -104,14 +134,7 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
         for obj in root.findall(".//ns0:Object", namespaces):
             table_name = obj.attrib.get("Table").strip("[]")
         if not table_name:
-            return []
-
-        cursor.execute(sql, params)
-
-        desc_tuple = cursor.description
-        cursor_desc_dict = {d[0]: d for d in desc_tuple}
-        # noinspection PyTypeChecker
-        result: list[dict] = cursor.fetchall()
+            return None
 
         meta_sql = f"""
                         select 
@@ -128,10 +151,14 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
                     """
         cursor.execute(meta_sql)
         # noinspection PyTypeChecker
-        column_types: dict = {item["column_name"]: item["data_type"] for item in cursor.fetchall()}
+        return {item["column_name"]: item["data_type"] for item in cursor.fetchall()}
 
-        result = [
-            {
+    def row_converter(self, cursor):
+        cursor_desc_dict = {d[0]: d for d in cursor.description}
+        column_types = self.column_types or {}
+
+        def convert_row(d):
+            return {
                 k.lower(): None
                 if v is None
                 else v.hex()
@@ -151,9 +178,8 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
                 else int(v)
                 for k, v in d.items()
             }
-            for d in result
-        ]
-        return result
+
+        return convert_row
 
     def fetchpage(self, sql, current, size, params=None) -> Page:
         """
@@ -341,7 +367,7 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
         lower_tables = [self._create_database_table(field) for field in data]
         return Page(lower_tables, page.count)
 
-    def fetch_fields(self, table_name: str) -> list[DatabaseField]:
+    def query_fields(self, table_name: str) -> list[DatabaseField]:
         sql = f"""
         select  
             t1.table_name as table_name,           -- 表名称
@@ -515,6 +541,19 @@ class TransientSqlserverSqlHelper(AbstractTransientSqlHelper):
             },
         )
 
+    @staticmethod
+    def placeholder(index):
+        UNUSED(index)
+        return "%s"
+
+    @staticmethod
+    def select_values_sql(source_sql):
+        return f"select {source_sql}"
+
+    def upsert_sql(self, table_name, column_arr, key_arr):
+        # merge 语句须以分号结束
+        return f"{super().upsert_sql(table_name, column_arr, key_arr)};"
+
     def open(self):
         self.conn = pymssql.connect(
             user=self.user,
@@ -0,0 +1,200 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from loguru import logger
+
+from config.setting import (
+    TRANSIENT_POOL_IDLE_SECONDS,
+    TRANSIENT_POOL_MAX_SIZE,
+    TRANSIENT_POOL_PING_SECONDS,
+    TRANSIENT_POOL_WAIT_SECONDS,
+)
+from error.general_error import GeneralError
+
+
+class TransientConnectionPool(object):
+    def __init__(self, cls, connection_string, user, password, max_size=None):
+        """
+        外部数据源连接池, 池中保存已打开连接的临时数据库对象
+        :param cls: 临时数据库对象类
+        :param connection_string: 连接字符串
+        :param user: 用户名
+        :param password: 密码
+        :param max_size: 最大连接数
+        """
+        self.cls = cls
+        self.connection_string = connection_string
+        self.user = user
+        self.password = password
+        self.max_size = TRANSIENT_POOL_MAX_SIZE if max_size is None else max_size
+        # 空闲连接, (归还时间, 临时数据库对象)
+        self.idle = deque()
+        self.lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(max(self.max_size, 1))
+        self.last_used = time.monotonic()
+        self.closed = False
+
+    @contextmanager
+    def connection(self):
+        """
+        借出一个连接, 使用完毕后归还; 使用过程中抛出异常时连接状态未知, 直接关闭
+        :return: 已打开连接的临时数据库对象
+        """
+        helper = self.acquire()
+        try:
+            yield helper
+        except BaseException:
+            self.discard(helper)
+            raise
+        else:
+            self.release(helper)
+
+    def acquire(self):
+        if not self.semaphore.acquire(timeout=TRANSIENT_POOL_WAIT_SECONDS):
+            raise GeneralError("获取数据源连接超时") from None
+        try:
+            self.last_used = time.monotonic()
+            self.evict_idle()
+            while True:
+                with self.lock:
+                    if not self.idle:
+                        break
+                    released_time, helper = self.idle.pop()
+                # 空闲时间较长的连接可能已被服务端或防火墙断开, 借出前检查
+                if time.monotonic() - released_time > TRANSIENT_POOL_PING_SECONDS and not ping_quietly(helper):
+                    close_quietly(helper)
+                    continue
+                return helper
+            helper = self.cls(self.connection_string, self.user, self.password)
+            helper.open()
+            return helper
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    def release(self, helper):
+        # noinspection PyBroadException
+        try:
+            # 结束连接上未提交的读事务, 避免长时间占用服务端资源
+            helper.conn.rollback()
+        except Exception:
+            self.discard(helper)
+            return
+        with self.lock:
+            if not self.closed:
+                self.idle.append((time.monotonic(), helper))
+                helper = None
+        if helper is not None:
+            close_quietly(helper)
+        self.semaphore.release()
+
+    def discard(self, helper):
+        close_quietly(helper)
+        self.semaphore.release()
+
+    def evict_idle(self):
+        """
+        关闭空闲超时的连接
+        :return: 剩余空闲连接数
+        """
+        now = time.monotonic()
+        with self.lock:
+            expired = [x for x in self.idle if now - x[0] > TRANSIENT_POOL_IDLE_SECONDS]
+            self.idle = deque(x for x in self.idle if now - x[0] <= TRANSIENT_POOL_IDLE_SECONDS)
+            remaining = len(self.idle)
+        for _, helper in expired:
+            close_quietly(helper)
+        return remaining
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            idle = list(self.idle)
+            self.idle.clear()
+        for _, helper in idle:
+            close_quietly(helper)
+
+
+class TransientPoolRegistry(object):
+    """
+    外部数据源连接池注册表, 以数据源标识为键, 各进程独立维护
+    数据源连接信息变化时(ml_datasource 被修改)重建连接池, 长时间未使用的连接池整体关闭
+    """
+
+    # 数据源标识 -> (连接信息, 连接池)
+    __pools = {}
+    __pid = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def get(cls, datasource_id, helper_cls, connection_string, user, password):
+        """
+        获取数据源的连接池
+        :param datasource_id: 数据源标识
+        :param helper_cls: 临时数据库对象类
+        :param connection_string: 连接字符串
+        :param user: 用户名
+        :param password: 密码
+        :return: 连接池
+        """
+        signature = (connection_string, user, password)
+        stale = []
+        with cls.__lock:
+            if cls.__pid != os.getpid():
+                # 子进程不复用父进程的连接
+                cls.__pools = {}
+                cls.__pid = os.getpid()
+            cached = cls.__pools.get(datasource_id)
+            if cached is not None and cached[0] != signature:
+                stale.append(cached[1])
+                cached = None
+            if cached is None:
+                pool = TransientConnectionPool(helper_cls, connection_string, user, password)
+                cls.__pools[datasource_id] = (signature, pool)
+            else:
+                pool = cached[1]
+            now = time.monotonic()
+            for key, (_, other) in list(cls.__pools.items()):
+                if other is not pool and now - other.last_used > TRANSIENT_POOL_IDLE_SECONDS:
+                    stale.append(other)
+                    cls.__pools.pop(key)
+        for stale_pool in stale:
+            stale_pool.close()
+        return pool
+
+    @classmethod
+    def invalidate(cls, datasource_id=None):
+        """
+        关闭并移除连接池, 借出中的连接归还时关闭
+        :param datasource_id: 数据源标识, 为空时移除全部连接池
+        :return: None
+        """
+        with cls.__lock:
+            if datasource_id is None:
+                pools = [pool for _, pool in cls.__pools.values()]
+                cls.__pools.clear()
+            else:
+                cached = cls.__pools.pop(datasource_id, None)
+                pools = [cached[1]] if cached else []
+        for pool in pools:
+            pool.close()
+
+
+def ping_quietly(helper):
+    # noinspection PyBroadException
+    try:
+        helper.ping()
+        return True
+    except Exception:
+        return False
+
+
+def close_quietly(helper):
+    # noinspection PyBroadException
+    try:
+        helper.close()
+    except Exception as err:
+        logger.warning(f"TRANSIENT CONNECTION CLOSE ERROR: {err}")
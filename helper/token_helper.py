@@ -1,13 +1,112 @@
 import base64
+import hmac
+import threading
+import time
 
+from loguru import logger
+
+from config.setting import API_CREDENTIAL_VERSION_RETRY_SECONDS
+from core.api_credential_cache import ApiCredentialCache
+from enum_type.result_code import ResultCode
 from enum_type.secret_type import SecretType
+from helper.error_helper import is_undefined_table_error
 from helper.generate_helper import generate_uuid, uuid_and_now
 from helper.sql_helper.init_sql_helper import db_helper1
 
 
-def get_secret_by_app_key(app_key, publish_id):
+def query_secret_by_app_key(app_key):
     secret_sql = f"select id, app_secret, publish_id, secret_type " f"from ml_secret where app_key='{app_key}'"
-    secret_dict = db_helper1.fetchone(secret_sql)
+    return db_helper1.fetchone(secret_sql)
+
+
+class SecretVersionTable(object):
+    """
+    密钥版本号表 ml_secret_version(单行), 由数据库脚本创建并插入记录;
+    表或记录不存在、查询失败时本次不读写版本号, 间隔 API_CREDENTIAL_VERSION_RETRY_SECONDS 后重新检查,
+    期间其他进程的密钥缓存在有效期后失效
+    """
+
+    __ready = False
+    __retry_time = 0
+    __lock = threading.Lock()
+
+    @classmethod
+    def ready(cls):
+        """
+        密钥版本号表及记录是否可用, 可用后不再检查
+        :return: 是、否
+        """
+        if cls.__ready:
+            return True
+        if time.monotonic() < cls.__retry_time:
+            return False
+        with cls.__lock:
+            if not cls.__ready and time.monotonic() >= cls.__retry_time:
+                cls.__ready = cls.__check()
+                if not cls.__ready:
+                    cls.__retry_time = time.monotonic() + API_CREDENTIAL_VERSION_RETRY_SECONDS
+        return cls.__ready
+
+    @staticmethod
+    def __check():
+        # noinspection PyBroadException
+        try:
+            count_dict = db_helper1.fetchone("select count(1) as row_count from ml_secret_version")
+        except Exception as e:
+            if is_undefined_table_error(e):
+                logger.warning("密钥版本号表 ml_secret_version 不存在, 请执行数据库脚本")
+            else:
+                logger.warning(f"检查密钥版本号表失败: {e}")
+            return False
+        if not count_dict or not count_dict.get("row_count"):
+            logger.warning("密钥版本号表 ml_secret_version 无记录, 请执行数据库脚本")
+            return False
+        return True
+
+    @classmethod
+    def invalidate(cls):
+        """
+        清除检查结果, 下次调用重新检查
+        :return: None
+        """
+        with cls.__lock:
+            cls.__ready = False
+            cls.__retry_time = 0
+
+
+def get_secret_version():
+    """
+    读取数据库中的密钥版本号, 密钥生成、删除时递增, 用于使其他进程的密钥缓存失效
+    :return: 密钥版本号, 读取失败时为 None
+    """
+    if not SecretVersionTable.ready():
+        return None
+    # noinspection PyBroadException
+    try:
+        version_dict = db_helper1.fetchone("select secret_version from ml_secret_version")
+    except Exception as e:
+        logger.warning(f"读取密钥版本号失败: {e}")
+        return None
+    return version_dict.get("secret_version") if version_dict else None
+
+
+def increase_secret_version():
+    """
+    递增数据库中的密钥版本号并使本进程的密钥缓存失效
+    :return: None
+    """
+    ApiCredentialCache.invalidate()
+    if not SecretVersionTable.ready():
+        return
+    result = db_helper1.execute("update ml_secret_version set secret_version = secret_version + 1")
+    if result != ResultCode.Success.value:
+        logger.warning("递增密钥版本号失败, 其他进程的密钥缓存在有效期后失效")
+
+
+def get_secret_by_app_key(app_key, publish_id):
+    if ApiCredentialCache.version_due():
+        ApiCredentialCache.sync_version(get_secret_version())
+    secret_dict = ApiCredentialCache.get(app_key, query_secret_by_app_key)
     if secret_dict and secret_dict.get("secret_type") is not None:
         secret_type = secret_dict["secret_type"]
         if secret_type == SecretType.Pipelining.value:
@@ -26,7 +125,8 @@ def valid_token(token, app_key, client_timestamp, publish_id):
     app_secret = get_secret_by_app_key(app_key, publish_id)
     if not app_secret:
         return False
-    return token == encrypt(app_secret, client_timestamp)
+    # 固定时间比较, 避免通过响应时间逐字节猜测 token
+    return hmac.compare_digest(str(token).encode("utf-8"), encrypt(app_secret, client_timestamp).encode("utf-8"))
 
 
 # AES 'pad' byte array to multiple of BLOCK_SIZE bytes
@@ -62,7 +162,10 @@ def generate_key(publish_id, user_id, secret_name, description):
         f"'{app_key}', '{app_secret}', {SecretType.Pipelining.value}, "
         f"'{publish_id}', '{description}')"
     )
-    return db_helper1.execute(insert_secret_sql)
+    result = db_helper1.execute(insert_secret_sql)
+    if result == ResultCode.Success.value:
+        increase_secret_version()
+    return result
 
 
 def get_secret_by_publish_id(publish_id):
@@ -72,4 +175,7 @@ def get_secret_by_publish_id(publish_id):
 
 def delete_secret_by_id(private_id):
     delete_secret_sql = f"delete from ml_secret " f"where id='{private_id}'"
-    return db_helper1.execute(delete_secret_sql)
+    result = db_helper1.execute(delete_secret_sql)
+    if result == ResultCode.Success.value:
+        increase_secret_version()
+    return result
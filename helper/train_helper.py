@@ -0,0 +1,186 @@
+import copy
+import os
+
+import torch
+import torch.nn as nn
+from loguru import logger
+from torch.utils.data import DataLoader, TensorDataset
+
+from config.setting import (
+    EXECUTE_POOL_PROCESSES,
+    TRAIN_BATCH_SIZE,
+    TRAIN_EARLY_STOPPING_MIN_DELTA,
+    TRAIN_EARLY_STOPPING_PATIENCE,
+    TRAIN_TORCH_COMPILE,
+    TRAIN_VALIDATION_FRACTION,
+    TRAIN_VALIDATION_MIN_ROWS,
+)
+from core.cancel_token import CancelToken
+
+_train_threads_set = False
+
+
+class EarlyStopping(object):
+    def __init__(self, patience=None, min_delta=None):
+        """
+        早停判断, 监控损失连续 patience 轮相对下降不足 min_delta 时停止
+        :param patience: 容忍轮数, 小于等于 0 时不早停
+        :param min_delta: 最小相对下降
+        """
+        self.patience = TRAIN_EARLY_STOPPING_PATIENCE if patience is None else patience
+        self.min_delta = TRAIN_EARLY_STOPPING_MIN_DELTA if min_delta is None else min_delta
+        self.best_loss = None
+        self.wait = 0
+
+    @property
+    def enabled(self):
+        return self.patience > 0
+
+    def step(self, loss):
+        """
+        记录一轮的监控损失
+        :param loss: 监控损失
+        :return: 是否为目前最优
+        """
+        if self.best_loss is None or loss < self.best_loss - abs(self.best_loss) * self.min_delta:
+            self.best_loss = loss
+            self.wait = 0
+            return True
+        self.wait += 1
+        return False
+
+    @property
+    def should_stop(self):
+        return self.enabled and self.wait >= self.patience
+
+
+def set_train_threads():
+    """
+    按执行进程数划分 CPU 核数, 设置 torch 计算线程数, 每个进程只设置一次
+    :return: None
+    """
+    global _train_threads_set
+    if _train_threads_set:
+        return
+    _train_threads_set = True
+    threads = max(1, (os.cpu_count() or 1) // max(1, EXECUTE_POOL_PROCESSES))
+    torch.set_num_threads(threads)
+
+
+def compile_model(model):
+    """
+    按配置编译模型, 编译失败时使用原模型; 编译后的模型与原模型共享参数
+    :param model: 模型
+    :return: 用于训练的模型
+    """
+    if not TRAIN_TORCH_COMPILE or not hasattr(torch, "compile"):
+        return model
+    # noinspection PyBroadException
+    try:
+        return torch.compile(model)
+    except Exception as e:
+        logger.warning(f"模型编译失败, 使用原模型训练: {e}")
+        return model
+
+
+def split_validation(x, y, validation_fraction=None):
+    """
+    划分验证集, 样本数少于 TRAIN_VALIDATION_MIN_ROWS 时不划分
+    :param x: 特征张量
+    :param y: 目标张量
+    :param validation_fraction: 验证集比例
+    :return: (训练特征, 训练目标, 验证特征, 验证目标), 不划分时验证集为 None
+    """
+    fraction = TRAIN_VALIDATION_FRACTION if validation_fraction is None else validation_fraction
+    n = len(x)
+    valid_count = int(n * fraction)
+    if fraction <= 0 or n < TRAIN_VALIDATION_MIN_ROWS or valid_count <= 0:
+        return x, y, None, None
+    index = torch.randperm(n, device=x.device)
+    valid_index, train_index = index[:valid_count], index[valid_count:]
+    return x[train_index], y[train_index], x[valid_index], y[valid_index]
+
+
+def fit(
+    model,
+    x_train,
+    y_train,
+    optimizer,
+    epoch,
+    loss_func=None,
+    batch_size=None,
+    validation_fraction=None,
+    patience=None,
+    progress=None,
+):
+    """
+    训练模型: 小批量训练, 以验证集损失(样本较少时以训练损失)早停, 结束时恢复为最优模型参数;
+    取消执行时以最优模型参数结束训练
+    :param model: 模型
+    :param x_train: 特征张量
+    :param y_train: 目标张量
+    :param optimizer: 优化器
+    :param epoch: 最大迭代次数
+    :param loss_func: 损失函数, 默认为均方误差
+    :param batch_size: 小批量大小, 小于等于 0 或不小于样本数时整批训练
+    :param validation_fraction: 验证集比例, 0 表示不划分验证集
+    :param patience: 早停容忍轮数, 0 表示不早停
+    :param progress: 进度回调, 入参为 (当前轮次, 本轮训练损失), 每轮调用
+    :return: 训练后的模型
+    """
+    set_train_threads()
+    loss_func = loss_func or nn.MSELoss()
+    batch_size = TRAIN_BATCH_SIZE if batch_size is None else batch_size
+    x_fit, y_fit, x_valid, y_valid = split_validation(x_train, y_train, validation_fraction)
+    if 0 < batch_size < len(x_fit):
+        batches = DataLoader(TensorDataset(x_fit, y_fit), batch_size=batch_size, shuffle=True)
+    else:
+        batches = [(x_fit, y_fit)]
+    train_model = compile_model(model)
+    early_stopping = EarlyStopping(patience)
+    best_state = None
+
+    for i in range(epoch):
+        epoch_loss = 0.0
+        for x, y in batches:
+            optimizer.zero_grad()
+            loss = loss_func(train_model(x), y)
+            loss.backward()
+            optimizer.step()
+            epoch_loss += loss.detach().item() * len(x)
+        epoch_loss /= max(len(x_fit), 1)
+
+        if CancelToken.cancelled():
+            break
+        if progress is not None:
+            progress(i, epoch_loss)
+        if not early_stopping.enabled:
+            continue
+
+        monitor_loss = epoch_loss if x_valid is None else validation_loss(train_model, loss_func, x_valid, y_valid)
+        if early_stopping.step(monitor_loss):
+            best_state = copy.deepcopy(model.state_dict())
+        elif early_stopping.should_stop:
+            logger.info(f"早停于第 {i + 1} 轮, 最优监控损失: {early_stopping.best_loss}")
+            break
+
+    if best_state is not None:
+        model.load_state_dict(best_state)
+    return model
+
+
+def validation_loss(model, loss_func, x_valid, y_valid):
+    """
+    计算验证集损失, 计算时关闭 dropout 等训练行为
+    :param model: 模型
+    :param loss_func: 损失函数
+    :param x_valid: 验证特征张量
+    :param y_valid: 验证目标张量
+    :return: 验证集损失
+    """
+    model.eval()
+    try:
+        with torch.no_grad():
+            return loss_func(model(x_valid), y_valid).item()
+    finally:
+        model.train()
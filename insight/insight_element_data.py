@@ -1,7 +1,9 @@
 import json
 
+from config.setting import INSIGHT_MAX_PAGE_SIZE, INSIGHT_PAGE_SIZE
 from helper.oss_helper.oss_helper import oss_helper1
-from helper.result_helper import execute_success
+from helper.result_helper import execute_error, execute_success
+from helper.snapshot_summary_helper import project_summary
 from helper.sql_helper.init_sql_helper import db_helper1
 
 
@@ -80,6 +82,83 @@ def insight_structured_data(process_id, version_id, element_id):
     return execute_success(data=process_dict)
 
 
+def insight_query_structured_data(
+    process_id,
+    version_id,
+    element_id,
+    tab=None,
+    columns=None,
+    offset=0,
+    limit=INSIGHT_PAGE_SIZE,
+    sort_by=None,
+    ascending=True,
+):
+    """
+    分页查询结构化洞察数据, 只读取查询列, 总行数及各列汇总统计读取快照写入时存储的结果
+    :param process_id: 过程标识
+    :param version_id: 版本标识
+    :param element_id: 算子标识
+    :param tab: 多页签数据(如数据切分)的页签, 为空时取第一个页签
+    :param columns: 查询列, 为空时查询全部列
+    :param offset: 起始行
+    :param limit: 行数
+    :param sort_by: 排序列
+    :param ascending: 是否升序
+    :return: {"fields": 字段, "data": 行数据, "total": 总行数, "summary": 汇总统计, "tab": 页签, "tabs": 页签数组}
+    """
+    sql = (
+        f"select data, fields, store_type from ml_process "
+        f"where process_id='{process_id}' and "
+        f"version_id='{version_id}' and "
+        f"element_id='{element_id}'"
+    )
+    process_dict = db_helper1.fetchone(sql)
+    if not process_dict or not process_dict.get("data") or not process_dict.get("fields"):
+        return execute_success()
+    fields = json.loads(process_dict["fields"])
+    path = process_dict["data"]
+    tabs = []
+    if isinstance(fields, dict):
+        # 多页签数据, data 为页签 -> 文件标识
+        path_dict = {k: v for k, v in json.loads(path).items() if v}
+        tabs = list(path_dict.keys())
+        if not tabs:
+            return execute_success()
+        tab = tab or tabs[0]
+        if tab not in path_dict:
+            return execute_error(f"页签 {tab} 不存在")
+        path = path_dict[tab]
+        fields = fields.get(tab) or []
+    elif not isinstance(fields, list) or path.lstrip().startswith(("{", "[")):
+        return execute_error("该算子的洞察数据不支持分页查询")
+
+    offset = max(int(offset or 0), 0)
+    limit = min(max(int(limit or INSIGHT_PAGE_SIZE), 1), INSIGHT_MAX_PAGE_SIZE)
+    summary = oss_helper1.read_csv_summary(path, fields)
+    names = list((summary.get("columns") or {}).keys())
+    unknown = [c for c in (columns or []) + ([sort_by] if sort_by else []) if c not in names]
+    if unknown:
+        return execute_error(f"列 {', '.join(unknown)} 不存在")
+    data = []
+    if offset < summary.get("row_count", 0):
+        data = oss_helper1.read_csv_page(path, fields, columns or None, offset, limit, sort_by, ascending)
+    if columns:
+        lower_columns = {c.lower() for c in columns}
+        fields = [f for f in fields if (f.get("name") or "").lower() in lower_columns]
+    return execute_success(
+        data={
+            "fields": fields,
+            "data": data,
+            "total": summary.get("row_count", 0),
+            "offset": offset,
+            "limit": limit,
+            "summary": project_summary(summary, columns),
+            "tab": tab,
+            "tabs": tabs,
+        }
+    )
+
+
 def recent_process_id(version_id):
     sql = f"select process_id from ml_pipelining_version " f"where id='{version_id}'"
     process_dict = db_helper1.fetchone(sql)
@@ -3,6 +3,7 @@ import torch
 from numpy import ndarray
 from prophet.serialize import model_from_json, model_to_json
 
+from config.setting import MODEL_APPLY_BATCH_SIZE
 from element.algorithm_element.regression.exponential_regression_algorithm import (
     ExponentModel,
 )
@@ -13,10 +14,19 @@ from element.algorithm_element.regression.weibull_algorithm import WeibullRun
 from enum_type.library_type import LibraryType
 from error.data_process_error import DataProcessError
 from error.predict_error import PredictError
+from helper.columnar_helper import is_columnar
 from helper.error_helper import translate_error_message
 from helper.matrix_helper import dict_array_build, prediction_matrix_build
 from helper.oss_helper.oss_helper import oss_helper1
 
+# 逐行独立预测, 可以分批执行的机器学习库类型
+BATCH_LIBRARY_TYPES = {
+    LibraryType.Sklearn.value,
+    LibraryType.ExponentialParameter.value,
+    LibraryType.LogarithmParameter.value,
+    LibraryType.Pytorch.value,
+}
+
 
 def save(model, key, library_type):
     if library_type == LibraryType.Sklearn.value:
@@ -58,7 +68,7 @@ def load(key, library_type):
 
 def predict(model, data, library_type, fields=None):
     if library_type == LibraryType.Sklearn.value:
-        if isinstance(data[0], dict):
+        if not isinstance(data, ndarray):
             matrix = prediction_matrix_build(data)
         else:
             matrix = data
@@ -139,12 +149,61 @@ def predict(model, data, library_type, fields=None):
         return y_pre.values
     elif library_type == LibraryType.Pytorch.value:
         if not isinstance(data, ndarray):
-            matrix = prediction_matrix_build(data)
+            matrix = prediction_matrix_build(data, numpy.float32)
         else:
             matrix = data
-        with torch.no_grad():
-            y_pre = model.forward(torch.tensor(matrix, dtype=torch.float32).to(device="cpu"))
-
-        return y_pre.squeeze().numpy()
+        return pytorch_predict(model, matrix).squeeze()
     else:
         raise PredictError("不支持的机器学习库") from None
+
+
+def pytorch_predict(model, matrix):
+    """
+    Pytorch 模型预测, 不记录计算图
+    :param model: 模型
+    :param matrix: 二维特征数组
+    :return: 模型原始输出数组
+    """
+    with torch.inference_mode():
+        y_pre = model.forward(torch.as_tensor(matrix, dtype=torch.float32, device="cpu"))
+    return y_pre.numpy()
+
+
+def predict_in_batches(model, data, library_type, fields=None, batch_size=MODEL_APPLY_BATCH_SIZE):
+    """
+    分批预测, 每批只构造该批的特征矩阵, 结果拼接为与整体预测相同的数组;
+    灰色、威布尔等需要整体数据的模型及数据量不超过一批时整体预测
+    :param model: 模型
+    :param data: 字典数组、列式数据集或二维数组
+    :param library_type: 机器学习库类型
+    :param fields: 字段信息
+    :param batch_size: 每批行数, 小于等于 0 表示不分批
+    :return: 预测结果数组
+    """
+    size = len(data)
+    if library_type not in BATCH_LIBRARY_TYPES or batch_size <= 0 or size <= batch_size:
+        return predict(model, data, library_type, fields)
+    results = []
+    for start in range(0, size, batch_size):
+        batch = slice_data(data, start, start + batch_size)
+        if library_type == LibraryType.Pytorch.value:
+            # 各批保留原始输出形状, 拼接后再压缩维度, 避免单行批次被压缩为标量
+            matrix = batch if isinstance(batch, ndarray) else prediction_matrix_build(batch, numpy.float32)
+            results.append(pytorch_predict(model, matrix))
+        else:
+            results.append(numpy.asarray(predict(model, batch, library_type, fields)))
+    output = numpy.concatenate(results)
+    return output.squeeze() if library_type == LibraryType.Pytorch.value else output
+
+
+def slice_data(data, start, end):
+    """
+    取出 [start, end) 行, 列式数据集共享原数组
+    :param data: 字典数组、列式数据集或二维数组
+    :param start: 起始行
+    :param end: 结束行
+    :return: 同类型的数据
+    """
+    if is_columnar(data):
+        return data.take(slice(start, end))
+    return data[start:end]
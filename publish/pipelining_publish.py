@@ -1,4 +1,6 @@
 from enum_type.pipelining_operation_type import PipeliningOperationType
+from enum_type.result_cache_policy import ResultCachePolicy
+from enum_type.snapshot_policy import SnapshotPolicy
 from helper.generate_helper import uuid_and_now
 from helper.sql_helper.init_sql_helper import db_helper1
 
@@ -22,6 +24,44 @@ def get_version(publish_id):
         return None
 
 
+def get_snapshot_policy(publish_id):
+    """
+    根据发布标识获取洞察快照策略
+    :param publish_id: 发布标识
+    :return: 快照策略, 查询失败时默认保存
+    """
+    # noinspection PyBroadException
+    try:
+        if not publish_id:
+            return SnapshotPolicy.Store
+        policy_sql = f"select snapshot_policy " f"from ml_pipelining_publish " f"where id='{publish_id}'"
+        policy_dict = db_helper1.fetchone(policy_sql)
+        if not policy_dict or policy_dict.get("snapshot_policy") is None:
+            return SnapshotPolicy.Store
+        return SnapshotPolicy(int(policy_dict["snapshot_policy"]))
+    except Exception:
+        return SnapshotPolicy.Store
+
+
+def get_cache_policy(publish_id):
+    """
+    根据发布标识获取接口结果缓存策略
+    :param publish_id: 发布标识
+    :return: 结果缓存策略, 查询失败时默认不缓存
+    """
+    # noinspection PyBroadException
+    try:
+        if not publish_id:
+            return ResultCachePolicy.Skip
+        policy_sql = f"select cache_policy " f"from ml_pipelining_publish " f"where id='{publish_id}'"
+        policy_dict = db_helper1.fetchone(policy_sql)
+        if not policy_dict or policy_dict.get("cache_policy") is None:
+            return ResultCachePolicy.Skip
+        return ResultCachePolicy(int(policy_dict["cache_policy"]))
+    except Exception:
+        return ResultCachePolicy.Skip
+
+
 # #
 
 
@@ -1,7 +1,6 @@
 import sys
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from element_configuration.algorithm_element.cluster import (
     k_means_algorithm_configuration,
@@ -82,6 +81,7 @@ from enum_type.input_type import ValueType
 from enum_type.penalty import Penalty
 from enum_type.result_code import ResultCode
 from enum_type.split_type import SplitType
+from enum_type.write_mode import WriteMode
 from error.empty_parameter_value_error import EmptyParameterValueError
 from error.store_error import StoreError
 from helper.http_parameter_helper import (
@@ -90,6 +90,7 @@ from helper.http_parameter_helper import (
     get_version_id_and_element_id_from_body,
 )
 from helper.response_result_helper import (
+    json_response,
     make_json,
     response_error_result,
     response_result,
@@ -161,7 +162,7 @@ async def sync_input(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/sync_output")
@@ -185,7 +186,7 @@ async def sync_output(request: Request):
     store_result = sync_output_configuration.configuration(version_id, element_id, user_id, key, nick_name, fields)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @valid_exist_user_id
@@ -207,7 +208,7 @@ async def model_sync_output(request: Request):
     store_result = model_sync_output_configuration.configuration(version_id, element_id, user_id, key, nick_name)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_model")
@@ -230,7 +231,7 @@ async def data_model(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/model_file_output")
@@ -250,7 +251,7 @@ async def model_file_output(request: Request):
     store_result = model_file_output_configuration.configuration(version_id, element_id, user_id, model_name)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_filter")
@@ -299,7 +300,7 @@ async def data_filter(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_split")
@@ -368,7 +369,7 @@ async def data_split(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/role_setting")
@@ -407,7 +408,7 @@ async def role_setting(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/column_data_process")
@@ -446,7 +447,7 @@ async def column_data_process(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/column_type_convert")
@@ -485,7 +486,7 @@ async def column_type_convert(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/min_max_scaler")
@@ -524,7 +525,7 @@ async def min_max_scaler(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/inverse_min_max_scaler")
@@ -562,7 +563,7 @@ async def inverse_min_max_scaler(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/polynomial_processing")
@@ -596,7 +597,7 @@ async def polynomial_processing(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/pca_processing")
@@ -616,7 +617,7 @@ async def pca_processing(request: Request):
     store_result = pca_processing_configuration.configuration(version_id, element_id, user_id, n_components)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_replication")
@@ -654,7 +655,7 @@ async def data_replication(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/linear_regression_algorithm")
@@ -676,7 +677,7 @@ async def linear_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/ridge_regression_algorithm")
@@ -695,7 +696,7 @@ async def ridge_regression_algorithm(request: Request):
     store_result = ridge_regression_algorithm_configuration.configuration(version_id, element_id, user_id, alpha)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/pls_regression_algorithm")
@@ -720,7 +721,7 @@ async def pls_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/monte_carlo_generate")
@@ -743,7 +744,7 @@ async def monte_carlo_generate(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/grey_relation_analyze")
@@ -762,7 +763,7 @@ async def grey_relation_analyze(request: Request):
     store_result = grey_relation_analyze_configuration.configuration(version_id, element_id, user_id, rho, weight)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/sobol_analyze")
@@ -780,7 +781,7 @@ async def sobol_analyze(request: Request):
     store_result = sobol_analyze_configuration.configuration(version_id, element_id, user_id, feature_value)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/svr_regression_algorithm")
@@ -805,7 +806,7 @@ async def svr_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/random_forest_regression_algorithm")
@@ -851,7 +852,7 @@ async def random_forest_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/decision_trees_regression_algorithm")
@@ -888,7 +889,7 @@ async def decision_trees_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/lgb_regression_algorithm")
@@ -929,7 +930,7 @@ async def lgb_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/arima_regression_algorithm")
@@ -949,7 +950,7 @@ async def arima_regression_algorithm(request: Request):
     store_result = arima_regression_algorithm_configuration.configuration(version_id, element_id, user_id, p, d, q)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/bp_regression_algorithm")
@@ -973,7 +974,7 @@ async def bp_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/lstm_regression_algorithm")
@@ -1000,7 +1001,7 @@ async def lstm_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/k_means_algorithm")
@@ -1029,7 +1030,7 @@ async def k_means_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/cut_word_algorithm")
@@ -1058,7 +1059,7 @@ async def cut_word_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/word_count_algorithm")
@@ -1087,7 +1088,7 @@ async def word_count_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/word_tag_algorithm")
@@ -1118,7 +1119,7 @@ async def word_tag_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/histogram_plot_analyze")
@@ -1151,7 +1152,7 @@ async def histogram_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/line_plot_analyze")
@@ -1184,7 +1185,7 @@ async def line_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/scatter_plot_analyze")
@@ -1217,7 +1218,7 @@ async def scatter_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/pie_plot_analyze")
@@ -1255,7 +1256,7 @@ async def pie_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/spider_plot_analyze")
@@ -1293,7 +1294,7 @@ async def spider_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/bubble_plot_analyze")
@@ -1326,7 +1327,7 @@ async def bubble_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/tree_plot_analyze")
@@ -1381,7 +1382,7 @@ async def tree_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/box_plot_analyze")
@@ -1428,7 +1429,7 @@ async def box_plot_analyze(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/column_filter")
@@ -1466,7 +1467,7 @@ async def column_filter(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/column_add")
@@ -1497,7 +1498,7 @@ async def column_add(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_join")
@@ -1548,7 +1549,7 @@ async def data_join(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/model_apply")
@@ -1568,7 +1569,7 @@ async def model_apply(request: Request):
     store_result = model_apply_configuration.configuration(version_id, element_id, user_id, fields)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/custom_algorithm")
@@ -1591,7 +1592,7 @@ async def custom_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/regression_evaluate")
@@ -1613,7 +1614,7 @@ async def regression_evaluate(request: Request):
     store_result = regression_evaluate_configuration.configuration(version_id, element_id, user_id, evaluate_list)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/classification_evaluate")
@@ -1635,7 +1636,7 @@ async def classification_evaluate(request: Request):
     store_result = classification_evaluate_configuration.configuration(version_id, element_id, user_id, evaluate_list)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/analogy_estimation_algorithm")
@@ -1668,7 +1669,7 @@ async def analogy_estimation_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/weibull_algorithm")
@@ -1707,7 +1708,7 @@ async def weibull_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/logarithm_regression_algorithm")
@@ -1728,7 +1729,7 @@ async def logarithm_regression_algorithm(request: Request):
     store_result = logarithm_regression_algorithm_configuration.configuration(version_id, element_id, user_id, a, b)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/exponential_regression_algorithm")
@@ -1752,7 +1753,7 @@ async def exponential_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/custom_formula")
@@ -1783,7 +1784,7 @@ async def custom_formula(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/database_input")
@@ -1806,7 +1807,7 @@ async def database_input(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据源输入算子保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/database_output")
@@ -1823,11 +1824,18 @@ async def database_output(request: Request):
     datasource_id = body["datasource_id"]
     data_table_name = body["data_table_name"]
     columns = body["columns"]
+    # 写入模式及更新或插入时的主键列(目标列名数组), 未传入时追加写入
+    write_mode = body.get("write_mode", WriteMode.Append.value)
+    key_columns = body.get("key_columns") or []
     if not datasource_id or not data_table_name or not columns:
         raise EmptyParameterValueError(["datasource_id", "data_table_name", "columns"]) from None
+    if write_mode not in WriteMode._value2member_map_:
+        return make_json(response_error_result())
+    if write_mode == WriteMode.Upsert.value and not key_columns:
+        raise EmptyParameterValueError(["key_columns"]) from None
     store_result = database_output_configuration.configuration(
-        version_id, element_id, user_id, datasource_id, data_table_name, columns
+        version_id, element_id, user_id, datasource_id, data_table_name, columns, write_mode, key_columns
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据源输出算子保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
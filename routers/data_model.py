@@ -2,7 +2,6 @@ import sys
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from config import setting
 from enum_type.result_code import ResultCode
@@ -10,7 +9,7 @@ from error.empty_parameter_value_error import EmptyParameterValueError
 from error.execute_error import ExecuteError
 from helper.generate_helper import generate_uuid
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, make_json, response_result
 from helper.sql_helper.init_sql_helper import db_helper2
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
@@ -55,7 +54,7 @@ def data_model_samples(blade_auth: Annotated[str | None, Header()], data_model:
     if not table_id:
         raise EmptyParameterValueError(["table_id"]) from None
     page = get_sample_data_from_dt_table_by_id(table_id, data_model.search_key, data_model.current, data_model.size)
-    return JSONResponse(make_json(response_result(data=make_json(page))))
+    return json_response(response_result(data=make_json(page)))
 
 
 @router.post("/data_model_fields")
@@ -70,7 +69,7 @@ def data_model_fields(blade_auth: Annotated[str | None, Header()], data_model: G
     if not table_id:
         raise EmptyParameterValueError(["table_id"]) from None
     fields = get_sample_data_fields_from_dt_table_by_id(table_id)
-    return JSONResponse(make_json(response_result(data=fields)))
+    return json_response(response_result(data=fields))
 
 
 @router.post("/save_relation_data_model")
@@ -108,7 +107,7 @@ async def save_relation_data_model(blade_auth: Annotated[str | None, Header()],
     )
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "动态创建数据表失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/save_file_data_model")
@@ -123,7 +122,7 @@ async def save_file_data_model(blade_auth: Annotated[str | None, Header()], data
     result = insert_file_data_model(user_id, table_id, data_model_name, file_type, data_model_description)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "动态创建数据表失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/save_manual_data_model")
@@ -136,7 +135,7 @@ async def save_manual_data_model(blade_auth: Annotated[str | None, Header()], da
     result = insert_manual_data_model(user_id, table_id, data_model_name, data_model_description)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "动态创建数据表失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/save_formula_data_model")
@@ -159,7 +158,7 @@ async def save_formula_data_model(blade_auth: Annotated[str | None, Header()], d
     )
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "动态创建数据表失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/update_data_model")
@@ -181,7 +180,7 @@ async def update_data_model(blade_auth: Annotated[str | None, Header()], update_
 
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "更新数据失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_data_model")
@@ -199,7 +198,7 @@ async def delete_data_model(blade_auth: Annotated[str | None, Header()], update_
 
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除数据失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/batch_append_data_model")
@@ -218,7 +217,7 @@ async def batch_append_data_model(blade_auth: Annotated[str | None, Header()], a
 
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "追加数据失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/add_data_tag_field")
@@ -230,4 +229,4 @@ def add_data_tag_field(blade_auth: Annotated[str | None, Header()], data_tag: Da
     result = insert_field_to_dynamic_table_for_data_tag(table_id, field)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "添加数据标签列失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
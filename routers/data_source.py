@@ -1,13 +1,12 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from enum_type.result_code import ResultCode
 from error.empty_parameter_value_error import EmptyParameterValueError
 from error.general_error import GeneralError
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, make_json, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from parameter_entity.data_source.data_source import DataSource
@@ -30,7 +29,7 @@ async def get_data_tables(blade_auth: Annotated[str | None, Header()], data_tabl
     UNUSED(blade_auth)
     page = get_tables_by_page(data_table)
     data = make_json(page)
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
 
 
 @router.post("/check_link")
@@ -45,7 +44,7 @@ async def check_link(blade_auth: Annotated[str | None, Header()], data_source: T
     if not db_url:
         raise EmptyParameterValueError(["db_url"]) from None
     is_link = test_check_link(data_source)
-    return JSONResponse(make_json(response_result(data={"is_link": is_link})))
+    return json_response(response_result(data={"is_link": is_link}))
 
 
 @router.post("/save_or_update")
@@ -70,4 +69,4 @@ async def save_or_update(blade_auth: Annotated[str | None, Header()], data_sourc
         result = save_data_source(data_source, user_id)
     if result != ResultCode.Success.value:
         raise GeneralError("数据源配置保存失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from element.data_analyze_element.critic_analyze import Critic
 from element.data_analyze_element.critic_topsis_analyze import CriticTopsis
@@ -12,6 +11,7 @@ from enum_type.user_data_type import UserDataType
 from helper.http_parameter_helper import get_request_body
 from helper.polynomial_processing_helper import data_conversion
 from helper.response_result_helper import (
+    json_response,
     make_json,
     response_error_result,
     response_result,
@@ -72,7 +72,7 @@ async def pca_analyze(request: Request):
     md = PCAAnalysis(data=df)
     liner_table = md.liner_coefficient_table()
     result = convert_deduction_result(body, liner_table[0])
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
 
 
 @router.post("/factor_analyze")
@@ -91,7 +91,7 @@ async def factor_analyze(request: Request):
     md = FactorAnalysis(data=df)
     liner_table = md.liner_coefficient_table()
     result = convert_deduction_result(body, liner_table[0])
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
 
 
 @router.post("/critic_analyze")
@@ -110,7 +110,7 @@ async def critic_analyze(request: Request):
     md = Critic(data=df)
     critic_weight_matrix = md.critic_matrix()
     result = convert_deduction_result(body, critic_weight_matrix[0])
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
 
 
 @router.post("/critic_topsis_analyze")
@@ -136,7 +136,7 @@ async def critic_topsis_analyze(request: Request):
     #     "topsis_ideal_solutions": topsis_ideal_solutions[0]
     # }
     result = {"result": best_result[0][0]["相对接近度C"]}
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
 
 
 @router.post("/grey_relation_analyze")
@@ -156,4 +156,4 @@ async def grey_relation_analyze(request: Request):
     md = GreyRelationAnalysis(data=df, rho=0.5, weight=weight)
     _, score_matrix = md.calc_rank()
     result = {"result": score_matrix[0][0]["score"]}
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
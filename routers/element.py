@@ -1,7 +1,6 @@
 import sys
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 import service.data_model.data_model_service
 from element_configuration.algorithm_element.cluster import (
@@ -90,7 +89,7 @@ from helper.http_parameter_helper import (
     get_user_id_from_request,
     get_version_id_and_element_id_from_body,
 )
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from helper.sample_data_generate_helper import (
     create_test_data,
     delete_test_data,
@@ -111,7 +110,7 @@ async def sync_input(request: Request):
     query_result = sync_input_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/preview_sync_input_test_data")
@@ -127,7 +126,7 @@ async def preview_sync_input_test_data(request: Request):
     query_result = get_test_data(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取预览数据信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/upload_sync_input_test_data")
@@ -147,7 +146,7 @@ async def upload_sync_input_test_data(request: Request):
     store_result = create_test_data(user_id, version_id, element_id, json_data)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据存储失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_sync_input_test_data")
@@ -163,7 +162,7 @@ async def delete_sync_input_test_data(request: Request):
     delete_result = delete_test_data(version_id, element_id)
     if delete_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "无法删除测试数据") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/sync_output")
@@ -180,7 +179,7 @@ async def sync_output(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/model_sync_output")
@@ -192,7 +191,7 @@ async def model_sync_output(request: Request):
     query_result = model_sync_output_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_model")
@@ -205,7 +204,7 @@ async def data_model(request: Request):
     query_result = data_model_configuration.get(version_id, element_id, user_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_models")
@@ -222,7 +221,7 @@ async def data_models(request: Request):
     query_result = service.data_model.data_model_service.get_all_data_models(user_id, data_model_table_name)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_model_fields")
@@ -237,7 +236,7 @@ async def data_model_fields(request: Request):
     if not table_name:
         raise EmptyParameterValueError(["table_name"]) from None
     data = service.data_model.data_model_service.get_sample_data_fields_from_dt_table_by_name(table_name)
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
 
 
 @router.post("/data_model_samples")
@@ -250,10 +249,10 @@ async def data_model_samples(request: Request):
     body = await get_request_body(request)
     table_name = body.get("table_name")
     if not table_name:
-        return JSONResponse(make_json(response_result(data=[])))
+        return json_response(response_result(data=[]))
     page = service.data_model.data_model_service.get_sample_data_from_dt_table_by_name(table_name)
     data = page.data
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
 
 
 @router.post("/model_file_output")
@@ -265,7 +264,7 @@ async def model_file_output(request: Request):
     query_result = model_file_output_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_filter")
@@ -282,7 +281,7 @@ async def data_filter(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_split")
@@ -294,7 +293,7 @@ async def data_split(request: Request):
     query_result = data_split_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/role_setting")
@@ -311,7 +310,7 @@ async def role_setting(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/column_data_process")
@@ -328,7 +327,7 @@ async def column_data_process(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/column_type_convert")
@@ -345,7 +344,7 @@ async def column_type_convert(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/min_max_scaler")
@@ -362,7 +361,7 @@ async def min_max_scaler(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/inverse_min_max_scaler")
@@ -379,7 +378,7 @@ async def inverse_min_max_scaler(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/polynomial_processing")
@@ -391,7 +390,7 @@ async def polynomial_processing(request: Request):
     query_result = polynomial_processing_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/monte_carlo_generate")
@@ -408,7 +407,7 @@ async def monte_carlo_generate(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_replication")
@@ -425,7 +424,7 @@ async def data_replication(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/model_file")
@@ -437,7 +436,7 @@ async def model_file(request: Request):
     query_result = model_file_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/linear_regression_algorithm")
@@ -449,7 +448,7 @@ async def linear_regression_algorithm(request: Request):
     query_result = linear_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/ridge_regression_algorithm")
@@ -461,7 +460,7 @@ async def ridge_regression_algorithm(request: Request):
     query_result = ridge_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/pls_regression_algorithm")
@@ -473,7 +472,7 @@ async def pls_regression_algorithm(request: Request):
     query_result = pls_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/svr_regression_algorithm")
@@ -485,7 +484,7 @@ async def svr_regression_algorithm(request: Request):
     query_result = svr_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/random_forest_regression_algorithm")
@@ -497,7 +496,7 @@ async def random_forest_regression_algorithm(request: Request):
     query_result = random_forest_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/lgb_regression_algorithm")
@@ -509,7 +508,7 @@ async def lgb_regression_algorithm(request: Request):
     query_result = lgb_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/decision_trees_regression_algorithm")
@@ -521,7 +520,7 @@ async def decision_trees_regression_algorithm(request: Request):
     query_result = decision_trees_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/arima_regression_algorithm")
@@ -533,7 +532,7 @@ async def arima_regression_algorithm(request: Request):
     query_result = arima_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/lstm_regression_algorithm")
@@ -545,7 +544,7 @@ async def lstm_regression_algorithm(request: Request):
     query_result = lstm_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/bp_regression_algorithm")
@@ -557,7 +556,7 @@ async def bp_regression_algorithm(request: Request):
     query_result = bp_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/k_means_algorithm")
@@ -569,7 +568,7 @@ async def k_means_algorithm(request: Request):
     query_result = k_means_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/cut_word_algorithm")
@@ -587,7 +586,7 @@ async def cut_word_algorithm(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/word_count_algorithm")
@@ -605,7 +604,7 @@ async def word_count_algorithm(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/word_tag_algorithm")
@@ -623,7 +622,7 @@ async def word_tag_algorithm(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/pca_processing")
@@ -635,7 +634,7 @@ async def pca_processing(request: Request):
     query_result = pca_processing_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/histogram_plot_analyze")
@@ -652,7 +651,7 @@ async def histogram_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/line_plot_analyze")
@@ -669,7 +668,7 @@ async def line_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/scatter_plot_analyze")
@@ -686,7 +685,7 @@ async def scatter_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/pie_plot_analyze")
@@ -703,7 +702,7 @@ async def pie_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/spider_plot_analyze")
@@ -720,7 +719,7 @@ async def spider_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/bubble_plot_analyze")
@@ -737,7 +736,7 @@ async def bubble_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/tree_plot_analyze")
@@ -754,7 +753,7 @@ async def tree_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/box_plot_analyze")
@@ -771,7 +770,7 @@ async def box_plot_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/grey_relation_analyze")
@@ -788,7 +787,7 @@ async def grey_relation_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/sobol_analyze")
@@ -804,7 +803,7 @@ async def sobol_analyze(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/column_filter")
@@ -821,7 +820,7 @@ async def column_filter(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/column_add")
@@ -838,7 +837,7 @@ async def column_add(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/arithmetic_function_list")
@@ -853,7 +852,7 @@ async def arithmetic_function_list(request: Request):
     query_result = column_add_configuration.get_all_arithmetic_function_list()
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "获取算术运算函数列表失败") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/data_join")
@@ -874,7 +873,7 @@ async def data_join(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/model_apply")
@@ -886,7 +885,7 @@ async def model_apply(request: Request):
     query_result = model_apply_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/custom_algorithm")
@@ -898,7 +897,7 @@ async def custom_algorithm(request: Request):
     query_result = custom_algorithm_file_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/algorithm_params")
@@ -910,7 +909,7 @@ async def algorithm_params(request: Request):
     query_result = custom_algorithm_file_configuration.get_params(algorithm_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/regression_evaluate")
@@ -923,7 +922,7 @@ async def regression_evaluate(request: Request):
     query_result = regression_evaluate_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/classification_evaluate")
@@ -936,7 +935,7 @@ async def classification_evaluate(request: Request):
     query_result = classification_evaluate_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/analogy_estimation_algorithm")
@@ -953,7 +952,7 @@ async def analogy_estimation_algorithm(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/exponential_regression_algorithm")
@@ -965,7 +964,7 @@ async def exponential_regression_algorithm(request: Request):
     query_result = exponential_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/logarithm_regression_algorithm")
@@ -977,7 +976,7 @@ async def logarithm_regression_algorithm(request: Request):
     query_result = logarithm_regression_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/weibull_algorithm")
@@ -989,7 +988,7 @@ async def weibull_algorithm(request: Request):
     query_result = weibull_algorithm_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/custom_formula")
@@ -1001,7 +1000,7 @@ async def custom_formula(request: Request):
     query_result = custom_formula_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/database_input")
@@ -1015,7 +1014,7 @@ async def database_input(request: Request):
     query_result = database_input_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/database_output")
@@ -1034,7 +1033,7 @@ async def database_output(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/database_tables")
@@ -1048,7 +1047,7 @@ async def database_tables(request: Request):
     query_result = database_input_configuration.get_tables(datasource_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/database_columns")
@@ -1063,4 +1062,4 @@ async def database_columns(request: Request):
     query_result = database_output_configuration.get_columns(datasource_id, table_name)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
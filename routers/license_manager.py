@@ -2,12 +2,11 @@ import sys
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from license_service.serial_number import SerialNumber
@@ -27,7 +26,7 @@ async def get_pc_identifier(blade_auth: Annotated[str | None, Header()]):
     """
     UNUSED(blade_auth)
     pc_identifier = SerialNumber.get_hashed_machine_id()
-    return JSONResponse(make_json(response_result(data=pc_identifier)))
+    return json_response(response_result(data=pc_identifier))
 
 
 @router.post("/upload_license_data")
@@ -46,7 +45,7 @@ async def upload_license_data(blade_auth: Annotated[str | None, Header()], licen
     result = SerialNumber.upload_serial_number(serial_number)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "保存序列号失败") from None
-    return JSONResponse(make_json(response_result(data=serial_number)))
+    return json_response(response_result(data=serial_number))
 
 
 @router.post("/get_license_data")
@@ -58,7 +57,7 @@ async def get_license_data(blade_auth: Annotated[str | None, Header()]):
     """
     UNUSED(blade_auth)
     serial_number = SerialNumber.get_serial_number()
-    return JSONResponse(make_json(response_result(data=serial_number)))
+    return json_response(response_result(data=serial_number))
 
 
 @router.post("/generate_license_data")
@@ -73,7 +72,7 @@ async def generate_license_data(blade_auth: Annotated[str | None, Header()], id_
     exp = id_and_exp.exp
     sig = SerialNumber.sig_data(key, exp)
     serial_number = SerialNumber.license_data(key, exp, sig)
-    return JSONResponse(make_json(response_result(data=serial_number)))
+    return json_response(response_result(data=serial_number))
 
 
 @router.post("/valid_license_data")
@@ -86,4 +85,4 @@ async def valid_license_data(blade_auth: Annotated[str | None, Header()], licens
     UNUSED(blade_auth)
     serial_number = license_data.serial_number
     SerialNumber.valid_privkey_sign_data(serial_number)
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
@@ -1,11 +1,10 @@
 import sys
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from service.login.login_service import create_demo_sample_data_and_pipelining
 
 # 登录 Controller
@@ -21,4 +20,4 @@ async def create_demo(user_id: str):
     result = create_demo_sample_data_and_pipelining(user_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "创建样例数据失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
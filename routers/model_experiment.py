@@ -2,12 +2,11 @@ import sys
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, make_json, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from parameter_entity.model_experiment.execute_model_experiment import ExecuteModelExperiment
@@ -44,7 +43,7 @@ async def create_experiment(blade_auth: Annotated[str | None, Header()], model_e
     result = create_new_model_experiment(user_id, model_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "保存实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/edit_experiment")
@@ -58,7 +57,7 @@ async def edit_experiment(blade_auth: Annotated[str | None, Header()], model_exp
     result = edit_exist_model_experiment(model_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_experiment")
@@ -72,7 +71,7 @@ async def delete_experiment(blade_auth: Annotated[str | None, Header()], model_e
     result = delete_exist_model_experiment(model_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/experiment_list")
@@ -83,7 +82,7 @@ async def experiment_list(blade_auth: Annotated[str | None, Header()], model_exp
     :return: response_result
     """
     user_id = get_user_id_from_blade_auth(blade_auth)
-    return JSONResponse(make_json(response_result(data=make_json(get_experiment_list(user_id, model_experiment)))))
+    return json_response(response_result(data=make_json(get_experiment_list(user_id, model_experiment))))
 
 
 @router.post("/publish_tree")
@@ -94,7 +93,7 @@ async def publish_tree(blade_auth: Annotated[str | None, Header()]):
     :return: response_result
     """
     user_id = get_user_id_from_blade_auth(blade_auth)
-    return JSONResponse(make_json(response_result(data=get_publish_tree(user_id))))
+    return json_response(response_result(data=get_publish_tree(user_id)))
 
 
 @router.post("/get_experiment_detail")
@@ -105,9 +104,7 @@ async def get_experiment_detail(
 ):
     UNUSED(blade_auth)
     experiment_id = model_experiment_parameters.experiment_id
-    return JSONResponse(
-        make_json(response_result(data=get_model_experiment_parameters_and_execute_result(experiment_id)))
-    )
+    return json_response(response_result(data=get_model_experiment_parameters_and_execute_result(experiment_id)))
 
 
 @router.post("/edit_model_parameters")
@@ -120,7 +117,7 @@ async def edit_model_and_model_parameters(
     result = edit_model_experiment_parameters(user_id, model_experiment_parameters)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑模型参数失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/run_experiment")
@@ -134,11 +131,11 @@ async def run_experiment(blade_auth: Annotated[str | None, Header()], execute_mo
 @valid_exist_user_id_from_blade_auth
 async def experiment_history(blade_auth: Annotated[str | None, Header()], history: ModelExperimentHistory):
     UNUSED(blade_auth)
-    return JSONResponse(make_json(response_result(data=execute_history(history))))
+    return json_response(response_result(data=execute_history(history)))
 
 
 @router.post("/experiment_history_detail")
 @valid_exist_user_id_from_blade_auth
 async def experiment_history_detail(blade_auth: Annotated[str | None, Header()], history: ModelExperimentHistory):
     UNUSED(blade_auth)
-    return JSONResponse(make_json(response_result(data=execute_history_detail(history))))
+    return json_response(response_result(data=execute_history_detail(history)))
@@ -2,12 +2,11 @@ import sys
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from enum_type.result_code import ResultCode
 from error.execute_error import ExecuteError
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, make_json, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from parameter_entity.notebook.notebook_experiment import NotebookExperiment
@@ -37,7 +36,7 @@ async def create_experiment(blade_auth: Annotated[str | None, Header()], noteboo
     result = create_new_notebook_experiment(user_id, notebook_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "保存实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/edit_experiment")
@@ -51,7 +50,7 @@ async def edit_experiment(blade_auth: Annotated[str | None, Header()], notebook_
     result = edit_exist_notebook_experiment(notebook_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_experiment")
@@ -65,7 +64,7 @@ async def delete_experiment(blade_auth: Annotated[str | None, Header()], noteboo
     result = delete_exist_notebook_experiment(notebook_experiment)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除实验失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/experiment_list")
@@ -76,9 +75,7 @@ async def experiment_list(blade_auth: Annotated[str | None, Header()], notebook_
     :return: response_result
     """
     user_id = get_user_id_from_blade_auth(blade_auth)
-    return JSONResponse(
-        make_json(response_result(data=make_json(get_notebook_experiment_list(user_id, notebook_experiment))))
-    )
+    return json_response(response_result(data=make_json(get_notebook_experiment_list(user_id, notebook_experiment))))
 
 
 @router.post("/load_notebook")
@@ -94,7 +91,7 @@ async def load_notebook(
         notebook_name = create_empty_notebook(notebook_id)
     else:
         load_notebook_to_local(notebook_name)
-    return JSONResponse(make_json(response_result(data=notebook_name)))
+    return json_response(response_result(data=notebook_name))
 
 
 @router.post("/save_notebook")
@@ -103,4 +100,4 @@ async def save_notebook(
 ):
     notebook_name = notebook_detail.notebook_name
     put_notebook_to_s3(notebook_name)
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
@@ -3,7 +3,6 @@ import sys
 import numpy as np
 from asyncer import asyncify
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 from sklearn.metrics import cohen_kappa_score
 
 from element_configuration.algorithm_element.custom import (
@@ -53,7 +52,7 @@ from helper.pipelining_helper import (
     publish_pipelining,
 )
 from helper.response_result_helper import (
-    make_json,
+    json_response,
     response_error_result,
     response_result,
 )
@@ -75,9 +74,7 @@ async def get_element_id_by_version_id_and_node_type(request: Request):
     version_id, _ = get_version_id_and_element_id_from_body(body)
     node_type = body["node_type"]
     element_id = get_element_id(version_id, node_type)
-    return JSONResponse(
-        make_json(response_result(data={"element_id": element_id}) if element_id else response_error_result())
-    )
+    return json_response(response_result(data={"element_id": element_id}) if element_id else response_error_result())
 
 
 @router.post("/role_setting")
@@ -98,7 +95,7 @@ async def role_setting(request: Request):
     )
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_role_setting")
@@ -130,7 +127,7 @@ async def config_role_setting(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_split")
@@ -146,7 +143,7 @@ async def data_split(request: Request):
     query_result = data_split_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_data_split")
@@ -182,7 +179,7 @@ async def config_data_split(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/custom_algorithm")
@@ -198,7 +195,7 @@ async def custom_algorithm(request: Request):
     query_result = custom_algorithm_file_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_custom_algorithm")
@@ -220,7 +217,7 @@ async def config_custom_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/data_model")
@@ -236,7 +233,7 @@ async def data_model(request: Request):
     query_result = data_model_configuration.get(version_id, element_id, user_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_data_model")
@@ -258,7 +255,7 @@ async def config_data_model(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/sync_input")
@@ -270,7 +267,7 @@ async def sync_input(request: Request):
     query_result = sync_input_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_sync_input")
@@ -316,7 +313,7 @@ async def config_sync_input(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/model_apply")
@@ -328,7 +325,7 @@ async def model_apply(request: Request):
     query_result = model_apply_configuration.get(version_id, element_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/config_model_apply")
@@ -347,7 +344,7 @@ async def config_model_apply(request: Request):
     store_result = model_apply_configuration.configuration(version_id, element_id, user_id, fields)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_column_data_process")
@@ -378,7 +375,7 @@ async def config_column_data_process(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_min_max")
@@ -409,7 +406,7 @@ async def config_min_max(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_regression_evaluate")
@@ -431,7 +428,7 @@ async def config_regression_evaluate(request: Request):
     store_result = regression_evaluate_configuration.configuration(version_id, element_id, user_id, evaluate_list)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_analogy_estimation_algorithm")
@@ -461,7 +458,7 @@ async def config_analogy_estimation_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/api_schedule/{publish_id}")
@@ -497,7 +494,7 @@ async def api_schedule(request: Request):
     )
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data, message=execute_result.message)))
+    return json_response(response_result(data=execute_result.data, message=execute_result.message))
 
 
 @router.post("/manual_execute")
@@ -530,7 +527,7 @@ async def manual_execute(request: Request):
     )
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data, message=execute_result.message)))
+    return json_response(response_result(data=execute_result.data, message=execute_result.message))
 
 
 @router.post("/publish")
@@ -547,7 +544,7 @@ async def publish(request: Request):
     publish_result = publish_pipelining(version_id, tag_id_list, user_id, description)
     if publish_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "发布失败") from None
-    return JSONResponse(make_json(response_result(data=publish_result.data)))
+    return json_response(response_result(data=publish_result.data))
 
 
 @router.post("/copy_version")
@@ -564,7 +561,7 @@ async def copy_version(request: Request):
     copy_result = await asyncify(copy_pipelining_version)(pipelining_id, version_id)
     if copy_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "复制版本失败") from None
-    return JSONResponse(make_json(response_result(data=copy_result.data)))
+    return json_response(response_result(data=copy_result.data))
 
 
 @router.post("/algorithm_params")
@@ -576,7 +573,7 @@ async def algorithm_params(request: Request):
     query_result = custom_algorithm_file_configuration.get_params(algorithm_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取配置信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/input_params")
@@ -589,7 +586,7 @@ async def input_params(request: Request):
     query_result = get_input_params(version_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取参数信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/output_params")
@@ -602,7 +599,7 @@ async def output_params(request: Request):
     query_result = get_output_params(version_id)
     if query_result.code != ResultCode.Success.value:
         raise QueryError(sys._getframe().f_code.co_name, user_id, "无法获取参数信息") from None
-    return JSONResponse(make_json(response_result(data=query_result.data)))
+    return json_response(response_result(data=query_result.data))
 
 
 @router.post("/consistency_analysis")
@@ -626,7 +623,7 @@ async def consistency_analysis(request: Request):
     flatten_y1_matrix = y1_matrix.flatten()
     flatten_y2_matrix = y2_matrix.flatten()
     score = cohen_kappa_score(flatten_y1_matrix, flatten_y2_matrix)
-    return JSONResponse(make_json(response_result(data={"score": round(score, 2)})))
+    return json_response(response_result(data={"score": round(score, 2)}))
 
 
 @router.post("/config_svr_regression_algorithm")
@@ -650,7 +647,7 @@ async def config_svr_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_pls_regression_algorithm")
@@ -673,7 +670,7 @@ async def config_pls_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_ridge_regression_algorithm")
@@ -690,7 +687,7 @@ async def config_ridge_regression_algorithm(request: Request):
     store_result = ridge_regression_algorithm_configuration.configuration(version_id, element_id, user_id, alpha)
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/config_linear_regression_algorithm")
@@ -711,4 +708,4 @@ async def config_linear_regression_algorithm(request: Request):
     )
     if store_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "数据库保存配置失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
@@ -4,17 +4,25 @@ from typing import Annotated
 
 from asyncer import asyncify
 from fastapi import APIRouter, Header, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from starlette.background import BackgroundTask
 from websockets.sync.client import connect
 
 from config import setting
-from core.pipelining_engine import cancel_execute_engine
+from core.api_credential_cache import ApiCredentialCache
+from core.cancel_token import CancelToken
+from core.engine_execute_pool import ExecutePool
+from core.publish_result_cache import PublishResultCache, cache_key
 from enum_type.element_config_type import ElementConfigType
+from enum_type.pipelining_process_status import PipeliningProcessStatus
+from enum_type.result_cache_policy import ResultCachePolicy
 from enum_type.result_code import ResultCode
+from enum_type.snapshot_policy import SnapshotPolicy
 from error.empty_parameter_value_error import EmptyParameterValueError
 from error.execute_error import ExecuteError
 from error.store_error import StoreError
 from helper.app_helper import register_app
+from helper.generate_helper import generate_uuid
 from helper.http_parameter_helper import (
     get_request_body,
     get_user_id_from_blade_auth,
@@ -60,7 +68,9 @@ from helper.pipelining_helper import (
 from helper.pipelining_publish_helper import (
     all_publish_list,
     associate_client_with_publish_id_list,
+    change_cache_policy_by_publish_id,
     change_publish_name_and_description,
+    change_snapshot_policy_by_publish_id,
     delete_client_publish_list,
     get_all_client,
     get_audit,
@@ -69,7 +79,7 @@ from helper.pipelining_publish_helper import (
     get_status_count,
     publish_list_by_tag,
 )
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import encode_json, json_response, make_json, response_result
 from helper.sample_data_generate_helper import generate_input_data
 from helper.token_helper import (
     delete_secret_by_id,
@@ -82,13 +92,13 @@ from helper.wrapper_helper import (
     valid_exist_user_id,
     valid_exist_user_id_from_blade_auth,
 )
-from insight.insight_element_data import recent_process_id
+from insight.insight_element_data import insight_query_structured_data, recent_process_id
 from license_service.serial_number import SerialNumber
 from parameter_entity.data_model.general_data_model import GeneralDataModel
 from parameter_entity.logic_flow.dag import Dag
 from parameter_entity.logic_flow.logic_flow import LogicFlow
 from parameter_entity.pipelining_element.pipelining_element import PipeliningElement
-from publish.pipelining_publish import get_version
+from publish.pipelining_publish import get_cache_policy, get_version, insert_publish
 from service.data_model.data_model_service import (
     create_excel_file_by_table,
     get_sample_data_fields_from_datasource,
@@ -116,8 +126,30 @@ async def cancel_execute(request: Request):
     if not pid:
         raise KeyError("pid") from None
     connect_id = body["connect_id"]
-    cancel_execute_engine(pid, connect_id)
-    return JSONResponse(make_json(response_result()))
+    CancelToken.cancel(pid, connect_id)
+    return json_response(response_result())
+
+
+@router.post("/execute_pool_metrics")
+@valid_exist_user_id
+async def execute_pool_metrics(request: Request):
+    """
+    执行进程池统计: 各通道排队、执行数, 排队、执行耗时, 执行进程常驻内存
+    :return: response_result
+    """
+    UNUSED(request)
+    return json_response(response_result(data=ExecutePool.metrics()))
+
+
+@router.post("/api_credential_cache_metrics")
+@valid_exist_user_id
+async def api_credential_cache_metrics(request: Request):
+    """
+    本进程接口密钥缓存统计: 命中、未命中次数及命中率
+    :return: response_result
+    """
+    UNUSED(request)
+    return json_response(response_result(data=ApiCredentialCache.counters()))
 
 
 @router.post("/manual_execute")
@@ -166,7 +198,7 @@ async def manual_execute(request: Request):
     )
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data, message=execute_result.message)))
+    return json_response(response_result(data=execute_result.data, message=execute_result.message))
 
 
 @router.post("/api_schedule/{publish_id}")
@@ -182,9 +214,38 @@ async def api_schedule(request: Request):
     publish_id = request.path_params.get("publish_id")
     if not publish_id:
         raise ExecuteError(sys._getframe().f_code.co_name, "引擎执行失败，未配置 publish_id 参数") from None
-    version_id = get_version(publish_id)
-    if not version_id:
-        raise ExecuteError(sys._getframe().f_code.co_name, "引擎执行失败，未找到对应的 version_id 参数") from None
+    # 为了适应参数化软件需求，可以获取模型评估的指标，因此外部传递该过程标识
+    process_id = body.get("process_id")
+    # 发布的版本标识及缓存策略在有效期内缓存, 未开启结果缓存的发布同样不再重复查询
+    publish = PublishResultCache.get_publish(publish_id)
+    if publish:
+        version_id, cache_policy = publish
+    else:
+        version_id = get_version(publish_id)
+        if not version_id:
+            raise ExecuteError(sys._getframe().f_code.co_name, "引擎执行失败，未找到对应的 version_id 参数") from None
+        cache_policy = get_cache_policy(publish_id) if PublishResultCache.enabled() else ResultCachePolicy.Skip
+        PublishResultCache.put_publish(publish_id, version_id, cache_policy)
+    # 外部传递过程标识时需按该标识保存执行过程, 不使用结果缓存
+    use_cache = not process_id and PublishResultCache.enabled() and cache_policy == ResultCachePolicy.Cache
+    key = cache_key(publish_id, version_id, sync_input_data) if use_cache else None
+    if key:
+        cached = PublishResultCache.get(key)
+        if cached is not None:
+            cached_body, cached_process_id = cached
+            # 命中缓存同样记录调用, 关联产生该结果的执行过程
+            return Response(
+                content=cached_body,
+                media_type="application/json",
+                background=BackgroundTask(
+                    insert_publish,
+                    publish_id,
+                    user_id,
+                    cached_process_id,
+                    PipeliningProcessStatus.Success.value,
+                ),
+            )
+        process_id = generate_uuid()
 
     sync_input_element_list = get_sync_element_list(version_id)
     if sync_input_element_list and len(set([x["json_key"] for x in sync_input_element_list])) != len(
@@ -195,8 +256,6 @@ async def api_schedule(request: Request):
             "引擎执行失败，该流水线中同步输入算子存在同名的 key 配置",
         ) from None
 
-    # 为了适应参数化软件需求，可以获取模型评估的指标，因此外部传递该过程标识
-    process_id = body.get("process_id")
     sync_input_data = generate_input_data(version_id, sync_input_data)
     serial_number = SerialNumber.get_serial_number()
     execute_result = await asyncify(multiprocess_pipelining_exec)(
@@ -212,7 +271,12 @@ async def api_schedule(request: Request):
     )
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data, message=execute_result.message)))
+    result = response_result(data=execute_result.data, message=execute_result.message)
+    if key and getattr(execute_result, "cacheable", False):
+        content = encode_json(result.__dict__)
+        PublishResultCache.put(key, content, process_id)
+        return Response(content=content, media_type="application/json")
+    return json_response(result)
 
 
 @router.post("/recent_process")
@@ -228,7 +292,7 @@ async def recent_process(request: Request):
     execute_result = recent_process_id(version_id)
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data)))
+    return json_response(response_result(data=execute_result.data))
 
 
 @router.post("/insight")
@@ -246,7 +310,33 @@ async def insight(request: Request):
     execute_result = await asyncify(insight_element)(version_id, element_id, node_type, process_id)
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data)))
+    return json_response(response_result(data=execute_result.data))
+
+
+@router.post("/insight_query")
+@valid_exist_user_id
+async def insight_query(request: Request):
+    """
+    结构化洞察数据分页查询接口, 支持列选择、排序, 并返回总行数及各列汇总统计
+    :return: response_result
+    """
+    body = await get_request_body(request)
+    version_id, element_id = get_version_id_and_element_id_from_body(body)
+    process_id = body["process_id"]
+    execute_result = await asyncify(insight_query_structured_data)(
+        process_id,
+        version_id,
+        element_id,
+        tab=body.get("tab"),
+        columns=body.get("columns"),
+        offset=body.get("offset", 0),
+        limit=body.get("limit", setting.INSIGHT_PAGE_SIZE),
+        sort_by=body.get("sort_by"),
+        ascending=body.get("sort_order", "asc") != "desc",
+    )
+    if execute_result.code != ResultCode.Success.value:
+        raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
+    return json_response(response_result(data=execute_result.data))
 
 
 @router.post("/publish")
@@ -264,7 +354,7 @@ async def publish(request: Request):
     publish_result = publish_pipelining(version_id, tag_id_list, user_id, description)
     if publish_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "发布失败") from None
-    return JSONResponse(make_json(response_result(data=publish_result.data)))
+    return json_response(response_result(data=publish_result.data))
 
 
 @router.post("/cancel_publish")
@@ -280,7 +370,7 @@ async def cancel_publish(request: Request):
     cancel_result = cancel_publish_pipelining(publish_id, user_id)
     if cancel_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "取消发布失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/pipelining_list")
@@ -299,7 +389,7 @@ async def pipelining_list(request: Request):
     else:
         pipelining_arr = await asyncify(get_all_pipelining_list)(user_id, experiment_id)
 
-    return JSONResponse(make_json(response_result(data=pipelining_arr)))
+    return json_response(response_result(data=pipelining_arr))
 
 
 @router.post("/change")
@@ -318,7 +408,7 @@ async def change(request: Request):
     edit_result = edit_pipelining(pipelining_id, pipelining_name, description)
     if edit_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete")
@@ -336,7 +426,7 @@ async def delete(request: Request):
     delete_result = delete_pipelining_by_id(user_id, pipelining_id)
     if delete_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/move")
@@ -354,7 +444,7 @@ async def move(request: Request):
     move_result = move_pipelining(experiment_id, pipelining_id)
     if move_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "移动失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/add")
@@ -374,7 +464,7 @@ async def add(request: Request):
     add_result = add_pipelining(experiment_id, pipelining_name, description, user_id)
     if add_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "新增失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/version_list")
@@ -389,7 +479,7 @@ async def version_list(request: Request):
     if not pipelining_id:
         raise EmptyParameterValueError(["pipelining_id"]) from None
     pipelining_version_list = await asyncify(get_pipelining_version_list)(pipelining_id)
-    return JSONResponse(make_json(response_result(data=pipelining_version_list)))
+    return json_response(response_result(data=pipelining_version_list))
 
 
 @router.post("/logic_flow_by_version_id")
@@ -408,7 +498,7 @@ async def logic_flow_by_version_id(request: Request):
         raise ExecuteError(sys._getframe().f_code.co_name, "获取画布信息失败") from None
     relative_path = logic_flow_dict.get("logic_flow")
     logic_flow_data = await asyncify(oss_helper1.get_json_file_data)(relative_path)
-    return JSONResponse(make_json(response_result(data=logic_flow_data)))
+    return json_response(response_result(data=logic_flow_data))
 
 
 @router.post("/logic_flow")
@@ -424,7 +514,7 @@ async def get_logic_flow(request: Request):
         raise EmptyParameterValueError(["relative_path"]) from None
     relative_path = body.get("relative_path", "")
     logic_flow_data = await asyncify(oss_helper1.get_json_file_data)(relative_path)
-    return JSONResponse(make_json(response_result(data=logic_flow_data)))
+    return json_response(response_result(data=logic_flow_data))
 
 
 @router.post("/logic_flow_config")
@@ -442,7 +532,7 @@ def logic_flow_config(blade_auth: Annotated[str | None, Header()], logic_flow: L
     config_result = config_pipelining_logic_flow(version_id, logic_flow_str)
     if config_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "更新流水线失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/dag_config")
@@ -460,7 +550,7 @@ def dag_config(blade_auth: Annotated[str | None, Header()], dag: Dag):
     config_result = config_pipelining_dag(version_id, dag_str)
     if config_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "更新流水线失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/disable_elements")
@@ -482,7 +572,7 @@ async def disable_elements(request: Request):
     disable_result = disable_element_list(version_id, type_element_id_dict)
     if disable_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "算子失效更新失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/copy_version")
@@ -502,7 +592,7 @@ async def copy_version(request: Request):
     copy_result = await asyncify(copy_pipelining_version)(pipelining_id, version_id, user_id=user_id)
     if copy_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "复制版本失败") from None
-    return JSONResponse(make_json(response_result(data=copy_result.data)))
+    return json_response(response_result(data=copy_result.data))
 
 
 @router.post("/delete_version")
@@ -520,7 +610,7 @@ async def delete_version(request: Request):
     delete_result = delete_pipelining_version(pipelining_id, version_id)
     if delete_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除版本失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/sync_input_list")
@@ -532,7 +622,7 @@ async def sync_input_list(request: Request):
     # noinspection PyBroadException
     body = await get_request_body(request)
     version_id, _ = get_version_id_and_element_id_from_body(body)
-    return JSONResponse(make_json(response_result(data=get_sync_element_list(version_id))))
+    return json_response(response_result(data=get_sync_element_list(version_id)))
 
 
 @router.post("/sync_output_list")
@@ -544,9 +634,7 @@ async def sync_output_list(request: Request):
     # noinspection PyBroadException
     body = await get_request_body(request)
     version_id, _ = get_version_id_and_element_id_from_body(body)
-    return JSONResponse(
-        make_json(response_result(data=get_sync_element_list(version_id, ElementConfigType.Output.value)))
-    )
+    return json_response(response_result(data=get_sync_element_list(version_id, ElementConfigType.Output.value)))
 
 
 @router.post("/sync_model_list")
@@ -558,9 +646,7 @@ async def sync_model_list(request: Request):
     # noinspection PyBroadException
     body = await get_request_body(request)
     version_id, _ = get_version_id_and_element_id_from_body(body)
-    return JSONResponse(
-        make_json(response_result(data=get_sync_element_list(version_id, ElementConfigType.ModelOutput.value)))
-    )
+    return json_response(response_result(data=get_sync_element_list(version_id, ElementConfigType.ModelOutput.value)))
 
 
 @router.post("/config_sync_element_order")
@@ -578,7 +664,7 @@ async def config_sync_element_order(request: Request):
     config_result = config_order(element_list, version_id)
     if config_result != ResultCode.Success.value:
         raise StoreError(sys._getframe().f_code.co_name, user_id, "顺序调整失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/publish_list")
@@ -592,7 +678,7 @@ async def publish_list(request: Request):
     user_id = get_user_id_from_request(request)
     version_id, _ = get_version_id_and_element_id_from_body(body)
     tag_id = body.get("tag_id")
-    return JSONResponse(make_json(response_result(data=publish_list_by_tag(tag_id, user_id))))
+    return json_response(response_result(data=publish_list_by_tag(tag_id, user_id)))
 
 
 @router.post("/call_count")
@@ -606,21 +692,22 @@ async def call_count(request: Request):
     publish_id = body["publish_id"]
     start_time = body["start_time"]
     end_time = body["end_time"]
-    return JSONResponse(make_json(response_result(data=get_call_count(start_time, end_time, publish_id))))
+    return json_response(response_result(data=get_call_count(start_time, end_time, publish_id)))
 
 
 @router.post("/status_count")
 @valid_exist_user_id
 async def status_count(request: Request):
     """
-    获取接口统计信息(成功、失败次数)
+    获取接口统计信息(成功、失败次数, 及自应用启动起的结果缓存命中、未命中次数)
     :return: 获取接口统计信息
     """
     body = await get_request_body(request)
     publish_id = body["publish_id"]
     start_time = body["start_time"]
     end_time = body["end_time"]
-    return JSONResponse(make_json(response_result(data=get_status_count(start_time, end_time, publish_id))))
+    count_dict = get_status_count(start_time, end_time, publish_id) or {}
+    return json_response(response_result(data={**count_dict, **PublishResultCache.counters(publish_id)}))
 
 
 @router.post("/audit")
@@ -632,7 +719,7 @@ async def audit(request: Request):
     """
     body = await get_request_body(request)
     publish_id = body["publish_id"]
-    return JSONResponse(make_json(response_result(data=get_audit(publish_id))))
+    return json_response(response_result(data=get_audit(publish_id)))
 
 
 @router.post("/generate_private_key")
@@ -650,7 +737,7 @@ async def generate_private_key(request: Request):
     generate_result = generate_key(publish_id, user_id, secret_name, description)
     if generate_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "密钥生成失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/private_key_list")
@@ -662,7 +749,7 @@ async def private_key_list(request: Request):
     """
     body = await get_request_body(request)
     publish_id = body["publish_id"]
-    return JSONResponse(make_json(response_result(data=get_secret_by_publish_id(publish_id))))
+    return json_response(response_result(data=get_secret_by_publish_id(publish_id)))
 
 
 @router.post("/delete_private_key")
@@ -677,7 +764,7 @@ async def delete_private_key(request: Request):
     delete_result = delete_secret_by_id(private_id)
     if delete_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "密钥删除失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/change_publish_information")
@@ -694,7 +781,43 @@ async def change_publish_information(request: Request):
     change_result = change_publish_name_and_description(publish_id, publish_name, description)
     if change_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "发布信息修改失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
+
+
+@router.post("/change_publish_snapshot_policy")
+@valid_exist_user_id
+async def change_publish_snapshot_policy(request: Request):
+    """
+    更新发布的洞察快照策略, 0: 保存, 1: 跳过
+    :return: 更新成功/失败
+    """
+    body = await get_request_body(request)
+    publish_id = body["publish_id"]
+    snapshot_policy = body["snapshot_policy"]
+    if snapshot_policy not in SnapshotPolicy._value2member_map_:
+        raise ExecuteError(sys._getframe().f_code.co_name, "快照策略不存在") from None
+    change_result = change_snapshot_policy_by_publish_id(publish_id, snapshot_policy)
+    if change_result != ResultCode.Success.value:
+        raise ExecuteError(sys._getframe().f_code.co_name, "快照策略修改失败") from None
+    return json_response(response_result())
+
+
+@router.post("/change_publish_cache_policy")
+@valid_exist_user_id
+async def change_publish_cache_policy(request: Request):
+    """
+    更新发布的接口结果缓存策略, 0: 不缓存, 1: 缓存
+    :return: 更新成功/失败
+    """
+    body = await get_request_body(request)
+    publish_id = body["publish_id"]
+    cache_policy = body["cache_policy"]
+    if cache_policy not in ResultCachePolicy._value2member_map_:
+        raise ExecuteError(sys._getframe().f_code.co_name, "结果缓存策略不存在") from None
+    change_result = change_cache_policy_by_publish_id(publish_id, cache_policy)
+    if change_result != ResultCode.Success.value:
+        raise ExecuteError(sys._getframe().f_code.co_name, "结果缓存策略修改失败") from None
+    return json_response(response_result())
 
 
 @router.post("/version_name_change")
@@ -713,7 +836,7 @@ async def version_name_change(request: Request):
     edit_result = edit_version_name(pipelining_id, version_id, version_name)
     if edit_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/all_publish_list")
@@ -724,7 +847,7 @@ async def get_all_publish_list(request: Request):
     """
     body = await get_request_body(request)
     experiment_id = body.get("experiment_id")
-    return JSONResponse(make_json(response_result(data=all_publish_list(experiment_id))))
+    return json_response(response_result(data=all_publish_list(experiment_id)))
 
 
 @router.post("/client_list")
@@ -735,7 +858,7 @@ async def get_client_list(request: Request):
     :return: 客户端列表
     """
     UNUSED(request)
-    return JSONResponse(make_json(response_result(data=get_all_client())))
+    return json_response(response_result(data=get_all_client()))
 
 
 @router.post("/client_id_associate_publish_id_list")
@@ -755,7 +878,7 @@ async def client_id_associate_publish_id_list(request: Request):
     associate_result = associate_client_with_publish_id_list(user_id, client_id, experiment_id, publish_id_list)
     if associate_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "关联失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/client_publish_pipelining_list")
@@ -782,7 +905,7 @@ async def client_publish_pipelining_list(request: Request):
         }
         for k, v in result_dict.items()
     ]
-    return JSONResponse(make_json(response_result(data=result_list)))
+    return json_response(response_result(data=result_list))
 
 
 @router.post("/delete_client_associate_publish_id_list")
@@ -799,7 +922,7 @@ async def delete_client_associate_publish_id_list(request: Request):
     delete_result = delete_client_publish_list(client_id)
     if delete_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/app_register")
@@ -819,7 +942,7 @@ async def app_register(request: Request):
     register_result = register_app(user_id, app_name, app_key, app_secret)
     if register_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "注册应用失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/experiment_space_list")
@@ -831,7 +954,7 @@ async def experiment_space_list(request: Request):
     """
     user_id = get_user_id_from_request(request)
     space_list = get_experiment_space_list(user_id)
-    return JSONResponse(make_json(response_result(data=space_list)))
+    return json_response(response_result(data=space_list))
 
 
 @router.post("/add_experiment_space")
@@ -849,7 +972,7 @@ async def add_experiment_space(request: Request):
     result = save_experiment_space(user_id, space_name, space_description, placeholder)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "新增空间失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/edit_experiment_space")
@@ -867,7 +990,7 @@ async def edit_experiment_space(request: Request):
     result = save_experiment_space_with_id(user_id, space_id, space_name, space_description)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "编辑空间失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_experiment_space")
@@ -883,7 +1006,7 @@ async def delete_experiment_space(request: Request):
     result = delete_experiment_space_with_id(user_id, space_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除空间失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/create_pipelining_element")
@@ -907,7 +1030,7 @@ async def create_pipelining_element(request: Request):
     result = create_new_pipelining_element(user_id, name, description, new_version_id, origin_pipelining_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "创建管道算子失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/delete_pipelining_element")
@@ -922,7 +1045,7 @@ async def delete_pipelining_element(blade_auth: Annotated[str | None, Header()],
     result = delete_pipelining_element_by_id(pipelining_element_id, user_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除管道算子失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/register_pipelining_element")
@@ -938,7 +1061,7 @@ async def register_pipelining_element(request: Request):
     result = register_pipelining_element_by_id(user_id, pipelining_element_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "注册管道算子失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/unregister_pipelining_element")
@@ -954,7 +1077,7 @@ async def unregister_pipelining_element(request: Request):
     result = unregister_pipelining_element_by_id(user_id, pipelining_element_id)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "取消注册管道算子失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/registered_pipelining_element_list")
@@ -970,7 +1093,7 @@ async def registered_pipelining_element_list(request: Request):
     current = body.get("current", 1)
     size = body.get("size", 10)
     result = get_registered_pipelining_element_list(current, size, user_id, name)
-    return JSONResponse(make_json(response_result(data=make_json(result))))
+    return json_response(response_result(data=make_json(result)))
 
 
 @router.post("/pipelining_element_list")
@@ -986,7 +1109,7 @@ async def pipelining_element_list(request: Request):
     current = body.get("current", 1)
     size = body.get("size", 10)
     result = get_pipelining_element_list(current, size, user_id, name)
-    return JSONResponse(make_json(response_result(data=make_json(result))))
+    return json_response(response_result(data=make_json(result)))
 
 
 @router.post("/get_element_tree")
@@ -1002,7 +1125,7 @@ async def element_tree(request: Request):
     execute_result = get_element_tree()
     if execute_result.code != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, execute_result.message) from None
-    return JSONResponse(make_json(response_result(data=execute_result.data)))
+    return json_response(response_result(data=execute_result.data))
 
 
 @router.post("/pipelining_and_version_tree")
@@ -1022,7 +1145,7 @@ async def pipelining_and_version_tree(request: Request):
         current, size, user_id, experiment_id, pipelining_name
     )
 
-    return JSONResponse(make_json(response_result(data=make_json(pipelining_arr))))
+    return json_response(response_result(data=make_json(pipelining_arr)))
 
 
 @router.post("/delete_version_multi")
@@ -1040,7 +1163,7 @@ async def delete_version_multi(request: Request):
     delete_result = delete_pipelining_version_multi(version_ids)
     if delete_result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, "删除版本失败") from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
 
 
 @router.post("/generate_data_model_presigned_url")
@@ -1057,7 +1180,7 @@ async def generate_data_model_presigned_url(request: Request):
     url = oss_helper1.generate_s3_presigned_url_for_excel(key)
     if not url:
         raise ExecuteError(sys._getframe().f_code.co_name, "生成临时下载链接失败") from None
-    return JSONResponse(make_json(response_result(data=url)))
+    return json_response(response_result(data=url))
 
 
 @router.post("/generate_model_presigned_url")
@@ -1072,7 +1195,7 @@ async def generate_model_presigned_url(request: Request):
     url = oss_helper1.generate_s3_presigned_url_for_model(key)
     if not url:
         raise ExecuteError(sys._getframe().f_code.co_name, "生成临时下载链接失败") from None
-    return JSONResponse(make_json(response_result(data=url)))
+    return json_response(response_result(data=url))
 
 
 @router.post("/upload_model_file")
@@ -1090,7 +1213,7 @@ async def upload_model_file(request: Request):
         key = oss_helper1.upload_model_to_s3(content, file_name)
         if not key:
             raise ExecuteError(sys._getframe().f_code.co_name, "保存模型文件失败") from None
-        return JSONResponse(make_json(response_result(data=key)))
+        return json_response(response_result(data=key))
 
 
 @router.post("/data_model_fields")
@@ -1105,7 +1228,7 @@ async def data_model_fields(data_model: GeneralDataModel):
     if not datasource_id or not table_name:
         raise EmptyParameterValueError(["datasource_id, table_name"]) from None
     result = get_sample_data_fields_from_datasource(datasource_id, table_name)
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
 
 
 @router.post("/data_model_samples")
@@ -1120,4 +1243,4 @@ async def data_model_samples(data_model: GeneralDataModel):
     if not datasource_id or not table_name:
         raise EmptyParameterValueError(["datasource_id, table_name"]) from None
     result = get_sample_data_from_datasource(datasource_id, table_name)
-    return JSONResponse(make_json(response_result(data=result)))
+    return json_response(response_result(data=result))
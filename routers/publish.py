@@ -1,10 +1,9 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from error.empty_parameter_value_error import EmptyParameterValueError
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from parameter_entity.publish.publish import Publish
@@ -27,7 +26,7 @@ async def sync_input_parameter(blade_auth: Annotated[str | None, Header()], publ
     if not version_id:
         raise EmptyParameterValueError(["version_id"]) from None
     data = get_sync_input_parameter_by_version(version_id)
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
 
 
 @router.post("/sync_input_parameter_by_publish_id")
@@ -43,7 +42,7 @@ async def sync_input_parameter_by_publish_id(blade_auth: Annotated[str | None, H
         raise EmptyParameterValueError(["publish_id"]) from None
     version_id = get_version(publish_id)
     data = get_sync_input_parameter_by_version(version_id)
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
 
 
 @router.post("/sync_output_parameter_by_publish_id")
@@ -59,4 +58,4 @@ async def sync_output_parameter_by_publish_id(blade_auth: Annotated[str | None,
         raise EmptyParameterValueError(["publish_id"]) from None
     version_id = get_version(publish_id)
     data = get_sync_output_parameter_by_version(version_id)
-    return JSONResponse(make_json(response_result(data=data)))
+    return json_response(response_result(data=data))
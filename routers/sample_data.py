@@ -2,7 +2,6 @@ import sys
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
 from core.pipelining_engine import machine_learning_execute_engine
 from enum_type.response_code import ResponseCode
@@ -11,7 +10,7 @@ from error.execute_error import ExecuteError
 from error.general_error import GeneralError
 from helper.dag_helper import get_dag
 from helper.http_parameter_helper import get_user_id_from_blade_auth
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from helper.sample_data_generate_helper import generate_input_data
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from license_service.serial_number import SerialNumber
@@ -38,7 +37,7 @@ async def split_2_or_3(blade_auth: Annotated[str | None, Header()], sample_data_
     # 如果存在配好的数据, 则直接显示配置好的
     split_sample_data = get_split_sample_data(version_id, element_id)
     if split_sample_data and split_sample_data["data"]:
-        return JSONResponse(make_json(response_result(data=split_sample_data)))
+        return json_response(response_result(data=split_sample_data))
 
     # 不存在则执行至该算子, 获取各个集合的数据展示
     sync_input_data = generate_input_data(version_id)
@@ -80,7 +79,7 @@ async def split_2_or_3(blade_auth: Annotated[str | None, Header()], sample_data_
         fields["test"] = sample_data_fields[1]
         fields["valid"] = sample_data_fields[2]
 
-    return JSONResponse(make_json(response_result(data={"data": data, "fields": fields})))
+    return json_response(response_result(data={"data": data, "fields": fields}))
 
 
 @router.post("/config_split_2_or_3")
@@ -95,4 +94,4 @@ def config_split_2_or_3(blade_auth: Annotated[str | None, Header()], sample_data
     result = rewrite_split_sample_data(user_id, sample_data_model)
     if result != ResultCode.Success.value:
         raise ExecuteError(sys._getframe().f_code.co_name, result.message) from None
-    return JSONResponse(make_json(response_result()))
+    return json_response(response_result())
@@ -1,9 +1,8 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
 
-from helper.response_result_helper import make_json, response_result
+from helper.response_result_helper import json_response, response_result
 from helper.warning_helper import UNUSED
 from helper.wrapper_helper import valid_exist_user_id_from_blade_auth
 from license_service.serial_number import SerialNumber
@@ -21,4 +20,4 @@ async def get_user_info(blade_auth: Annotated[str | None, Header()]):
     """
     UNUSED(blade_auth)
     exp = SerialNumber.get_exp_time_by_serial_number()
-    return JSONResponse(make_json(response_result(data={"exp": exp})))
+    return json_response(response_result(data={"exp": exp}))
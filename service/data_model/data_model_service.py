@@ -1,6 +1,9 @@
 import json
-import math
+import queue
 import sys
+import threading
+
+from loguru import logger
 
 from config import setting
 from config.dynamic_table_setting import TS_COLUMN_NAME
@@ -257,46 +260,110 @@ def insert_field_to_dynamic_table_for_data_tag(table_id, field: dict):
     return db_helper2.insert_field_to_dynamic_table(table_name, standard_field)
 
 
+# 流式读取结束标记
+STREAM_END = object()
+
+
 def batch_insert_to_dynamic_table_by_datasource_id(
     dynamic_table_name,
     datasource_id,
     table_name,
     standard_fields: list[DatabaseFieldStandard],
-    count=5000,
+    count=None,
+    progress_callback=None,
 ):
     """
     批量插入动态表
+    源表只查询一次, 由读取线程通过服务端游标按批读取并放入有界队列, 当前线程同时批量写入动态表
     :param dynamic_table_name: 动态表名
     :param datasource_id: 源数据源标识
     :param table_name: 源数据表名
     :param standard_fields: 标准字段列表
-    :param count: 每批插入数量
+    :param count: 每批插入数量, 为空时使用 DATA_MODEL_COPY_BATCH_SIZE
+    :param progress_callback: 进度回调, 入参为已插入条数、总条数
     :return: 插入结果
     """
+    if not count:
+        count = setting.DATA_MODEL_COPY_BATCH_SIZE
     conn = get_transient_sql_helper(datasource_id)
     sql = f"select count(*) as c from {table_name}"
     c_dict = conn.fetchone(sql)
     total = 0
     if c_dict and "c" in c_dict:
         total = c_dict.get("c", 0)
-    page_size = math.ceil(total / count)
     custom_ts_name = TS_COLUMN_NAME
-    for page in range(page_size):
-        current = page + 1
-        page_data = conn.fetchpage(f"select * from {table_name}", current, count)
-        batch_data = page_data.data
-        now = current_time_m()
-        for d in batch_data:
-            d[custom_ts_name] = now
-        column_names = [f.column_name.upper() for f in standard_fields]
-        if custom_ts_name not in column_names:
-            standard_fields.append(DatabaseFieldStandard(custom_ts_name, DatabaseFieldStandardDataType.DateTime))
-        result = db_helper2.batch_insert_to_dynamic_table(dynamic_table_name, batch_data, standard_fields)
-        if result != ResultCode.Success.value:
-            return ResultCode.Error.value
+    column_names = [f.column_name.upper() for f in standard_fields]
+    if custom_ts_name not in column_names:
+        standard_fields.append(DatabaseFieldStandard(custom_ts_name, DatabaseFieldStandardDataType.DateTime))
+
+    batch_queue = queue.Queue(maxsize=setting.DATA_MODEL_COPY_QUEUE_SIZE)
+    stop_event = threading.Event()
+    reader = threading.Thread(
+        target=read_batches_to_queue,
+        args=(conn.fetch_stream(f"select * from {table_name}", count), batch_queue, stop_event),
+        name=f"copy_{dynamic_table_name}",
+        daemon=True,
+    )
+    reader.start()
+    inserted = 0
+    logged_percent = 0
+    try:
+        while True:
+            batch_data = batch_queue.get()
+            if batch_data is STREAM_END:
+                break
+            if isinstance(batch_data, Exception):
+                logger.error(f"{table_name} 数据读取失败: {batch_data}")
+                return ResultCode.Error.value
+            now = current_time_m()
+            for d in batch_data:
+                d[custom_ts_name] = now
+            result = db_helper2.batch_insert_to_dynamic_table(dynamic_table_name, batch_data, standard_fields)
+            if result != ResultCode.Success.value:
+                return ResultCode.Error.value
+            inserted += len(batch_data)
+            if progress_callback:
+                progress_callback(inserted, total)
+            percent = inserted * 100 // total if total else 100
+            if percent >= logged_percent + 10:
+                logged_percent = percent - percent % 10
+                logger.info(f"{table_name} -> {dynamic_table_name}: {inserted}/{total}")
+    finally:
+        # 写入失败时通知读取线程停止并关闭源数据库连接
+        stop_event.set()
+        reader.join()
     return ResultCode.Success.value
 
 
+def read_batches_to_queue(batch_iter, batch_queue, stop_event):
+    """
+    将分批读取的数据放入有界队列, 队列满时阻塞读取, 读取结束放入 STREAM_END, 读取异常时放入异常
+    :param batch_iter: 批数据生成器
+    :param batch_queue: 有界队列
+    :param stop_event: 停止事件, 写入方结束时设置
+    :return: None
+    """
+    try:
+        for batch_data in batch_iter:
+            if not put_until_stopped(batch_queue, batch_data, stop_event):
+                return
+        put_until_stopped(batch_queue, STREAM_END, stop_event)
+    except Exception as e:
+        put_until_stopped(batch_queue, e, stop_event)
+    finally:
+        batch_iter.close()
+
+
+def put_until_stopped(batch_queue, item, stop_event, timeout=0.5):
+    while not stop_event.is_set():
+        try:
+            batch_queue.put(item, timeout=timeout)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
 def batch_insert_to_dynamic_table_by_data(
     dynamic_table_name, data, standard_fields: list[DatabaseFieldStandard], count=5000
 ):
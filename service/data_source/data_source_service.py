@@ -4,6 +4,7 @@ from enum_type.deleted import Deleted
 from error.execute_error import ExecuteError
 from helper.generate_helper import uuid_and_now
 from helper.sql_helper.init_sql_helper import TransientSqlHelper, db_helper1
+from helper.sql_helper.transient_pool import TransientPoolRegistry
 from parameter_entity.data_source.data_source import DataSource
 from parameter_entity.data_source.data_table import DataTable
 from parameter_entity.data_source.test_data_source_link import TestDataSourceLink
@@ -31,7 +32,7 @@ def get_transient_sql_helper(datasource_id) -> TransientSqlHelper:
     db_password = datasource_dict["db_password"]
     if not db_url or not db_user or not db_password:
         raise ExecuteError(sys._getframe().f_code.co_name, "数据源配置不完整") from None
-    return TransientSqlHelper(db_url, db_user, db_password)
+    return TransientSqlHelper(db_url, db_user, db_password, datasource_id)
 
 
 def get_tables_by_page(data_table: DataTable):
@@ -98,4 +99,7 @@ def update_data_source(data_source: DataSource, user_id: str):
         f"where id='{datasource_id}' "
         f"and create_user='{user_id}'"
     )
-    return db_helper1.execute(sql)
+    result = db_helper1.execute(sql)
+    # 其他进程在下次获取连接时比对连接信息, 发生变化时重建连接池
+    TransientPoolRegistry.invalidate(datasource_id)
+    return result
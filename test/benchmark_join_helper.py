@@ -0,0 +1,181 @@
+"""
+数据连接性能对比: 嵌套循环(原实现) vs 哈希连接(字典数组 / 列式数据集)
+运行: python -m test.benchmark_join_helper
+嵌套循环为 O(n·m), 超过 NESTED_LOOP_LIMIT 行时按实测耗时平方外推
+"""
+
+import random
+import time
+
+from entity.dataset.columnar_dataset import ColumnarDataset
+from helper import join_helper
+
+NESTED_LOOP_LIMIT = 5000
+ROW_COUNTS = [1000, 100000, 1000000]
+
+
+def nested_loop_inner_join(data_0, data_1, field_0, field_1, fields):
+    """
+    字典数组内连接(原实现)
+    :param data_0: 端口0的字典数组
+    :param data_1: 端口1的字典数组
+    :param field_0: 端口0的字典数组连接 key
+    :param field_1: 端口1的字典数组连接 key
+    :param fields: 过滤字段数组
+    :return:
+    """
+    arr = []
+    if not data_1 or not data_0 or not fields:
+        return arr
+
+    field_0_name = field_0["name"]
+    field_1_name = field_1["name"]
+
+    for d0 in data_0:
+        for d1 in data_1:
+            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
+                x = {}
+                for field_name in fields:
+                    if field_name in d0:
+                        x[field_name] = d0[field_name]
+                    elif field_name in d1:
+                        x[field_name] = d1[field_name]
+                if x:
+                    arr.append(x)
+
+    return arr
+
+
+def nested_loop_left_join(data_0, data_1, field_0, field_1, fields):
+    """
+    字典数组左连接(原实现)
+    :param data_0: 端口0的字典数组
+    :param data_1: 端口1的字典数组
+    :param field_0: 端口0的字典数组连接 key
+    :param field_1: 端口1的字典数组连接 key
+    :param fields: 过滤字段数组
+    :return:
+    """
+    arr = []
+    if not data_0 or not fields:
+        return arr
+
+    field_0_name = field_0["name"]
+    field_1_name = field_1["name"]
+
+    for d0 in data_0:
+        joined = False
+        for d1 in data_1:
+            x = {}
+            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
+                joined = True
+                for field_name in fields:
+                    if field_name in d0:
+                        x[field_name] = d0[field_name]
+                    elif field_name in d1:
+                        x[field_name] = d1[field_name]
+                if x:
+                    arr.append(x)
+        if not joined and field_0_name in d0:
+            x = {}
+            for field_name in fields:
+                if field_name in d0:
+                    x[field_name] = d0[field_name]
+                else:
+                    x[field_name] = None
+            if x:
+                arr.append(x)
+    return arr
+
+
+def nested_loop_full_join(data_0, data_1, field_0, field_1, fields):
+    """
+    字典数组全连接(原实现)
+    :param data_0: 端口0的字典数组
+    :param data_1: 端口1的字典数组
+    :param field_0: 端口0的字典数组连接 key
+    :param field_1: 端口1的字典数组连接 key
+    :param fields: 过滤字段数组
+    :return:
+    """
+    arr = []
+    if not fields:
+        return arr
+
+    arr = nested_loop_left_join(data_0, data_1, field_0, field_1, fields)
+
+    field_0_name = field_0["name"]
+    field_1_name = field_1["name"]
+
+    for d1 in data_1:
+        joined = False
+        for d0 in data_0:
+            if field_0_name in d0 and field_1_name in d1 and d0[field_0_name] == d1[field_1_name]:
+                joined = True
+                break
+        if not joined:
+            x = {}
+            for field_name in fields:
+                if field_name in d1:
+                    x[field_name] = d1[field_name]
+                else:
+                    x[field_name] = None
+            if x:
+                arr.append(x)
+
+    return arr
+
+
+# 连接类型 -> (原实现, 哈希连接)
+JOINS = {
+    "inner": (nested_loop_inner_join, join_helper.inner_join),
+    "left": (nested_loop_left_join, join_helper.left_join),
+    "full": (nested_loop_full_join, join_helper.full_join),
+}
+
+
+def build_data(n, key_name, value_name, key_range):
+    return [{key_name: random.randrange(key_range), value_name: random.random()} for _ in range(n)]
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    random.seed(0)
+    field_0 = {"name": "k0"}
+    field_1 = {"name": "k1"}
+    fields = ["k0", "x", "y"]
+    nested_loop_1k = {}
+    print(
+        f"{'join':>6} {'rows':>10} {'nested loop(s)':>16} {'hash records(s)':>16} "
+        f"{'hash columnar(s)':>17} {'output rows':>12}"
+    )
+    for n in ROW_COUNTS:
+        data_0 = build_data(n, "k0", "x", n)
+        data_1 = build_data(n, "k1", "y", n)
+        columnar_0 = ColumnarDataset.from_records(data_0)
+        columnar_1 = ColumnarDataset.from_records(data_1)
+        for join_type, (nested_loop_join, join) in JOINS.items():
+            if n <= NESTED_LOOP_LIMIT:
+                nested_loop_time, expected = timeit(nested_loop_join, data_0, data_1, field_0, field_1, fields)
+                nested_loop_1k[join_type] = nested_loop_time * (1000 / n) ** 2
+                nested_loop_text = f"{nested_loop_time:.3f}"
+            else:
+                expected = None
+                nested_loop_text = f"~{nested_loop_1k[join_type] * (n / 1000) ** 2:.0f} (est.)"
+            hash_time, result = timeit(join, data_0, data_1, field_0, field_1, fields)
+            columnar_time, columnar_result = timeit(join, columnar_0, columnar_1, field_0, field_1, fields)
+            # 实测嵌套循环时校验行数一致
+            assert expected is None or len(expected) == len(result) == len(columnar_result)
+            print(
+                f"{join_type:>6} {n:>10} {nested_loop_text:>16} {hash_time:>16.3f} "
+                f"{columnar_time:>17.3f} {len(result):>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
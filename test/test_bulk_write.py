@@ -0,0 +1,188 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from enum_type.result_code import ResultCode
+from enum_type.write_mode import WriteMode
+from helper.database_output_helper import WriteModeColumns
+from helper.sql_helper.dm_sql_helper import TransientDmSqlHelper
+from helper.sql_helper.mysql_sql_helper import TransientMysqlSqlHelper
+from helper.sql_helper.oracle_sql_helper import TransientOracleSqlHelper
+from helper.sql_helper.postgresql_sql_helper import TransientPostgresqlSqlHelper
+from helper.sql_helper.sqlserver_sql_helper import TransientSqlserverSqlHelper
+
+COLUMNS = ["id", "name", "value"]
+KEYS = ["id"]
+ROWS = [[1, "a", 1.5], [2, "b", 2.5], [3, "c", 3.5]]
+
+
+def helper_of(cls):
+    # 不解析连接串、不建立连接, mock 连接与游标
+    helper = cls.__new__(cls)
+    helper.conn = MagicMock()
+    helper.cursor = MagicMock()
+    helper.cursor.rowcount = -1
+    return helper
+
+
+MERGE_SQL = (
+    'merge into "t" t using (select :1 as "id", :2 as "name", :3 as "value" from dual) s '
+    'on (t."id" = s."id") '
+    'when matched then update set t."name" = s."name", t."value" = s."value" '
+    'when not matched then insert ("id", "name", "value") values (s."id", s."name", s."value")'
+)
+
+
+@pytest.mark.parametrize(
+    "cls, insert_sql, upsert_sql",
+    [
+        (
+            TransientOracleSqlHelper,
+            'insert into "t" ("id", "name", "value") values(:1, :2, :3)',
+            MERGE_SQL,
+        ),
+        (
+            TransientDmSqlHelper,
+            'insert into "t" ("id", "name", "value") values(:1, :2, :3)',
+            MERGE_SQL,
+        ),
+        (
+            TransientMysqlSqlHelper,
+            "insert into `t` (`id`, `name`, `value`) values(%s, %s, %s)",
+            "insert into `t` (`id`, `name`, `value`) values(%s, %s, %s) "
+            "on duplicate key update `name` = values(`name`), `value` = values(`value`)",
+        ),
+        (
+            TransientPostgresqlSqlHelper,
+            'insert into "t" ("id", "name", "value") values(%s, %s, %s)',
+            'insert into "t" ("id", "name", "value") values(%s, %s, %s) '
+            'on conflict ("id") do update set "name" = excluded."name", "value" = excluded."value"',
+        ),
+        (
+            TransientSqlserverSqlHelper,
+            'insert into "t" ("id", "name", "value") values(%s, %s, %s)',
+            'merge into "t" t using (select %s as "id", %s as "name", %s as "value") s '
+            'on (t."id" = s."id") '
+            'when matched then update set t."name" = s."name", t."value" = s."value" '
+            'when not matched then insert ("id", "name", "value") values (s."id", s."name", s."value");',
+        ),
+    ],
+)
+def test_insert_and_upsert_sql(cls, insert_sql, upsert_sql):
+    helper = helper_of(cls)
+    assert helper.insert_sql("t", COLUMNS) == insert_sql
+    assert helper.upsert_sql("t", COLUMNS, KEYS) == upsert_sql
+
+
+def test_upsert_sql_only_key_columns():
+    # 全部列均为主键列时不生成更新子句
+    assert TransientOracleSqlHelper.__new__(TransientOracleSqlHelper).upsert_sql("t", ["id"], ["id"]) == (
+        'merge into "t" t using (select :1 as "id" from dual) s on (t."id" = s."id") '
+        'when not matched then insert ("id") values (s."id")'
+    )
+    postgresql = TransientPostgresqlSqlHelper.__new__(TransientPostgresqlSqlHelper)
+    assert postgresql.upsert_sql("t", ["id"], ["id"]).endswith('on conflict ("id") do nothing')
+    mysql = TransientMysqlSqlHelper.__new__(TransientMysqlSqlHelper)
+    assert mysql.upsert_sql("t", ["id"], ["id"]).endswith("on duplicate key update `id` = values(`id`)")
+
+
+def test_bulk_write_append_batches_and_commits_once():
+    helper = helper_of(TransientOracleSqlHelper)
+    code, batch_results = helper.bulk_write("t", COLUMNS, ROWS, 2)
+    assert code == ResultCode.Success.value
+    sql = helper.insert_sql("t", COLUMNS)
+    assert [c.args for c in helper.cursor.executemany.call_args_list] == [(sql, ROWS[:2]), (sql, ROWS[2:])]
+    helper.cursor.execute.assert_not_called()
+    helper.conn.commit.assert_called_once()
+    helper.conn.rollback.assert_not_called()
+    # rowcount 无效时按批次条数计
+    assert batch_results == [{"batch": 0, "rows": 2, "error": None}, {"batch": 1, "rows": 1, "error": None}]
+
+
+def test_bulk_write_overwrite_deletes_first():
+    helper = helper_of(TransientMysqlSqlHelper)
+    code, _ = helper.bulk_write("t", COLUMNS, ROWS, 10, WriteMode.Overwrite)
+    assert code == ResultCode.Success.value
+    helper.cursor.execute.assert_called_once_with("delete from `t`")
+    helper.cursor.executemany.assert_called_once_with(helper.insert_sql("t", COLUMNS), ROWS)
+    helper.conn.commit.assert_called_once()
+
+
+def test_bulk_write_overwrite_without_rows_clears_table():
+    helper = helper_of(TransientOracleSqlHelper)
+    code, batch_results = helper.bulk_write("t", COLUMNS, [], 10, WriteMode.Overwrite)
+    assert code == ResultCode.Success.value
+    assert batch_results == []
+    helper.cursor.execute.assert_called_once_with('delete from "t"')
+    helper.conn.commit.assert_called_once()
+
+
+def test_bulk_write_upsert_uses_upsert_sql():
+    helper = helper_of(TransientSqlserverSqlHelper)
+    helper.cursor.rowcount = 3
+    code, batch_results = helper.bulk_write("t", COLUMNS, ROWS, 10, WriteMode.Upsert, KEYS)
+    assert code == ResultCode.Success.value
+    helper.cursor.executemany.assert_called_once_with(helper.upsert_sql("t", COLUMNS, KEYS), ROWS)
+    assert batch_results == [{"batch": 0, "rows": 3, "error": None}]
+
+
+def test_bulk_write_postgresql_uses_execute_batch():
+    helper = helper_of(TransientPostgresqlSqlHelper)
+    with patch("helper.sql_helper.postgresql_sql_helper.execute_batch") as mock:
+        code, _ = helper.bulk_write("t", COLUMNS, ROWS, 2, WriteMode.Upsert, KEYS)
+    assert code == ResultCode.Success.value
+    sql = helper.upsert_sql("t", COLUMNS, KEYS)
+    assert [c.args for c in mock.call_args_list] == [
+        (helper.cursor, sql, ROWS[:2]),
+        (helper.cursor, sql, ROWS[2:]),
+    ]
+    assert [c.kwargs for c in mock.call_args_list] == [{"page_size": 2}, {"page_size": 1}]
+    helper.cursor.executemany.assert_not_called()
+    helper.conn.commit.assert_called_once()
+
+
+def test_bulk_write_error_rolls_back():
+    helper = helper_of(TransientOracleSqlHelper)
+    helper.cursor.executemany.side_effect = [None, RuntimeError("ORA-00001")]
+    code, batch_results = helper.bulk_write("t", COLUMNS, ROWS, 2, WriteMode.Overwrite)
+    assert code == ResultCode.Error.value
+    assert batch_results == [
+        {"batch": 0, "rows": 2, "error": None},
+        {"batch": 1, "rows": 1, "error": "ORA-00001"},
+    ]
+    helper.conn.commit.assert_not_called()
+    helper.conn.rollback.assert_called_once()
+
+
+@pytest.fixture
+def write_mode_columns():
+    WriteModeColumns.invalidate()
+    yield
+    WriteModeColumns.invalidate()
+
+
+def test_write_mode_columns_probed_once(write_mode_columns):
+    with patch("helper.database_output_helper.db_helper1.fetchone") as fetchone:
+        fetchone.return_value = None
+        assert WriteModeColumns.sql() == ", write_mode, key_columns"
+        assert WriteModeColumns.exist()
+    fetchone.assert_called_once()
+
+
+def test_write_mode_columns_missing(write_mode_columns):
+    # 未增加 write_mode、key_columns 列时按原查询读取配置
+    with patch("helper.database_output_helper.db_helper1.fetchone") as fetchone:
+        fetchone.side_effect = RuntimeError('ORA-00904: "WRITE_MODE": invalid identifier')
+        assert WriteModeColumns.sql() == ""
+        assert not WriteModeColumns.exist()
+    fetchone.assert_called_once()
+
+
+def test_write_mode_columns_other_error_not_cached(write_mode_columns):
+    with patch("helper.database_output_helper.db_helper1.fetchone") as fetchone:
+        fetchone.side_effect = [RuntimeError("DPY-4011: the database or network closed the connection"), None]
+        # 其他查询错误直接抛出, 不缓存检查结果
+        with pytest.raises(RuntimeError):
+            WriteModeColumns.exist()
+        assert WriteModeColumns.exist()
+    assert fetchone.call_count == 2
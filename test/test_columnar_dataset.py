@@ -0,0 +1,132 @@
+import copy
+
+import numpy as np
+import pytest
+
+from entity.dataset.columnar_dataset import ColumnarDataset, column_array
+
+RECORDS = [
+    {"a": 1, "b": 2.5, "c": "x"},
+    {"a": 2, "b": 3.5, "c": None},
+    {"a": 3, "b": 4.5, "c": "z"},
+]
+FIELDS = [
+    {"name": "a", "nick_name": "a", "data_type": "NUMBER"},
+    {"name": "b", "nick_name": "b", "data_type": "NUMBER"},
+    {"name": "c", "nick_name": "c", "data_type": "STRING"},
+]
+
+
+def test_from_records_round_trip():
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    assert len(dataset) == 3
+    assert dataset.names == ["a", "b", "c"]
+    assert dataset.fields == FIELDS
+    # 字典 key 与列名一致时直接返回原字典数组, 不发生转换
+    assert dataset.to_records() is RECORDS
+    assert dataset.column("a").dtype.kind == "i"
+    assert dataset.column("b").dtype.kind == "f"
+    assert dataset.column("c").dtype == object
+    # 由列数组重新生成的字典数组与原字典数组一致
+    assert ColumnarDataset(dict((name, dataset.column(name)) for name in dataset.names)).to_records() == RECORDS
+
+
+def test_from_records_projection_and_missing_keys():
+    records = [{"a": 1, "b": 2, "extra": 0}, {"a": 3, "extra": 0}]
+    dataset = ColumnarDataset.from_records(records, names=["a", "b"])
+    assert dataset.to_records() == [{"a": 1, "b": 2}, {"a": 3, "b": None}]
+    assert dataset.column("b").tolist() == [2, None]
+    assert dataset.to_records() == [{"a": 1, "b": 2}, {"a": 3, "b": None}]
+
+
+def test_from_records_empty():
+    dataset = ColumnarDataset.from_records([], FIELDS)
+    assert not dataset
+    assert dataset.names == ["a", "b", "c"]
+    assert dataset.to_records() == []
+    assert len(dataset.column("a")) == 0
+
+
+def test_mixed_int_float_coercion():
+    assert column_array([1, 2.5, 3]).dtype == np.float64
+    assert column_array([1, 2, 3]).dtype.kind == "i"
+    # 布尔值、None、文本不按数值列处理
+    assert column_array([True, 1]).dtype == object
+    assert column_array([1, None]).dtype == object
+    assert column_array([1, "2"]).dtype == object
+
+    dataset = ColumnarDataset.from_records([{"v": 1}, {"v": 2.5}])
+    assert dataset.column("v").tolist() == [1.0, 2.5]
+    assert dataset.to_records() == [{"v": 1}, {"v": 2.5}]
+
+
+def test_from_batches_matches_from_records():
+    batches = [[{"v": 1}, {"v": 2}], [], [{"v": 2.5}, {"v": 3}]]
+    records = [r for batch in batches for r in batch]
+    streamed = ColumnarDataset.from_batches(iter(batches))
+    assert streamed.column("v").dtype == ColumnarDataset.from_records(records).column("v").dtype
+    assert streamed.column("v").tolist() == [1.0, 2.0, 2.5, 3.0]
+
+    mixed = ColumnarDataset.from_batches(iter([[{"v": 1}], [{"v": "x"}]]))
+    assert mixed.column("v").dtype == object
+    assert mixed.column("v").tolist() == [1, "x"]
+
+
+def test_columns_are_read_only():
+    dataset = ColumnarDataset.from_records(RECORDS)
+    for name in dataset.names:
+        with pytest.raises(ValueError):
+            dataset.column(name)[0] = None
+    source = np.array([1, 2, 3])
+    dataset = ColumnarDataset({"a": source})
+    assert not dataset.column("a").flags.writeable
+
+
+def test_columns_length_mismatch():
+    with pytest.raises(ValueError):
+        ColumnarDataset({"a": np.array([1, 2]), "b": np.array([1])})
+
+
+def test_select():
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    selected = dataset.select(["c", "a", "missing"])
+    assert selected.names == ["c", "a"]
+    # 投影共享原数组
+    assert selected.column("a") is dataset.column("a")
+    assert selected.to_records() == [{"c": "x", "a": 1}, {"c": None, "a": 2}, {"c": "z", "a": 3}]
+
+
+def test_take():
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    assert dataset.take(np.array([True, False, True])).to_records() == [RECORDS[0], RECORDS[2]]
+    assert dataset.take(np.array([2, 0, 2])).to_records() == [RECORDS[2], RECORDS[0], RECORDS[2]]
+    assert dataset.take(np.array([], dtype=np.int64)).to_records() == []
+
+
+def test_with_columns():
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    result = dataset.with_columns({"b": np.array([0.0, 0.0, 0.0]), "d": np.array([1, 1, 1])})
+    assert result.names == ["a", "b", "c", "d"]
+    assert result.column("a") is dataset.column("a")
+    assert result.column("b").tolist() == [0.0, 0.0, 0.0]
+    assert dataset.column("b").tolist() == [2.5, 3.5, 4.5]
+
+
+def test_to_dataframe():
+    df = ColumnarDataset.from_records(RECORDS).to_dataframe()
+    assert list(df.columns) == ["a", "b", "c"]
+    assert df.to_dict(orient="records") == RECORDS
+
+
+def test_deepcopy_shares_columns():
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    copied = copy.deepcopy(dataset)
+    assert copied == dataset
+    assert copied.column("a") is dataset.column("a")
+
+
+def test_equality():
+    dataset = ColumnarDataset.from_records(RECORDS)
+    assert dataset == RECORDS
+    assert dataset == ColumnarDataset.from_records([dict(r) for r in RECORDS])
+    assert dataset != RECORDS[:2]
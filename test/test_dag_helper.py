@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from config.dag_config import DATA_FILTER, INVERSE_MIN_MAX_SCALER
+from entity.dataset.columnar_dataset import ColumnarDataset
+from enum_type.result_code import ResultCode
+from helper.dag_helper import data_container_build
+
+RECORDS = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+FIELDS = [
+    {"name": "a", "nick_name": "a", "data_type": "NUMBER"},
+    {"name": "b", "nick_name": "b", "data_type": "NUMBER"},
+]
+
+
+class ColumnarElement(object):
+    columnar_input = True
+
+
+class RecordsElement(object):
+    pass
+
+
+# 以替身算子类代替反射导入, 算子模块依赖执行引擎, 测试时不导入
+ELEMENT_CLASSES = {DATA_FILTER: ColumnarElement, INVERSE_MIN_MAX_SCALER: RecordsElement}
+
+
+def build(node_type, columnar=None):
+    dataset = ColumnarDataset.from_records(RECORDS, FIELDS)
+    dag_data_dict = {0: {"source_id": "source", "source_port": 0}}
+    dag_dict = {"source": ([dataset], [FIELDS], [None], [], [None])}
+    with patch("helper.dag_helper.element_class_of", side_effect=ELEMENT_CLASSES.get):
+        result = data_container_build(dag_data_dict, dag_dict, node_type, None, columnar)
+    assert result.code == ResultCode.Success.value
+    data_arr, field_arr, _, _ = result.container
+    assert field_arr == [FIELDS]
+    return dataset, data_arr[0]
+
+
+def test_data_container_build_columnar_element():
+    # 支持列式数据的算子直接接收列式数据集
+    dataset, data = build(DATA_FILTER)
+    assert data is dataset
+
+
+def test_data_container_build_records_element():
+    # 不支持列式数据的算子接收字典数组
+    _, data = build(INVERSE_MIN_MAX_SCALER)
+    assert isinstance(data, list)
+    assert data == RECORDS
+
+
+def test_data_container_build_explicit_flag():
+    _, data = build(DATA_FILTER, columnar=False)
+    assert isinstance(data, list)
+
+
+def test_data_container_build_unregistered_element():
+    # 未注册的算子类型接收字典数组
+    _, data = build("unregistered")
+    assert data == RECORDS
@@ -0,0 +1,220 @@
+import math
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from entity.dataset.columnar_dataset import ColumnarDataset
+from enum_type.compare_type import CompareType
+from enum_type.filter_type import FilterType
+from error.data_process_error import DataProcessError
+from helper.data_filter_helper import CompiledCondition, CompiledFilter, convert_value, data_filter
+
+
+def condition(x, filter_type, filter_compare_fields):
+    # 逐行比较的实现, 作为对照
+    condition_results = []
+    for y in filter_compare_fields:
+        name = y["name"]
+        v = x.get(name, x.get(name.lower(), None))
+        compare_type = y["compare_type"]
+        if compare_type == CompareType.IsNull:
+            condition_results.append(v is None)
+        elif compare_type == CompareType.IsNotNull:
+            condition_results.append(v is not None)
+        elif v is None:
+            condition_results.append(False)
+        else:
+            value = convert_value(y["value"], y["data_type"])
+            if compare_type == CompareType.GreatThan:
+                condition_results.append(v > value)
+            elif compare_type == CompareType.GreatThanOrEqual:
+                condition_results.append(v >= value)
+            elif compare_type == CompareType.Equal:
+                condition_results.append(v == value)
+            elif compare_type == CompareType.LessThan:
+                condition_results.append(v < value)
+            elif compare_type == CompareType.LessThanOrEqual:
+                condition_results.append(v <= value)
+            elif compare_type == CompareType.NotEqual:
+                condition_results.append(v != value)
+    return all(condition_results) if filter_type == FilterType.All else any(condition_results)
+
+
+def expected_filter(filter_type, data, filter_compare_fields):
+    return [x for x in data if condition(x, filter_type, filter_compare_fields)]
+
+
+def normalize(records):
+    # NaN 不等于自身, 比较前替换为占位字符串
+    return [{k: "NaN" if isinstance(v, float) and math.isnan(v) else v for k, v in r.items()} for r in records]
+
+
+def number_field(name, compare_type, value):
+    return {"name": name, "value": value, "data_type": "NUMBER", "compare_type": compare_type}
+
+
+def assert_same_as_rows(filter_type, data, filter_compare_fields):
+    expected = expected_filter(filter_type, data, filter_compare_fields)
+    assert normalize(data_filter(filter_type, data, filter_compare_fields)) == normalize(expected)
+    dataset = ColumnarDataset.from_records(data)
+    columnar = data_filter(filter_type, dataset, filter_compare_fields)
+    assert isinstance(columnar, ColumnarDataset)
+    # 列式数据集中缺失的键为 None
+    expected = [{name: x.get(name) for name in dataset.names} for x in expected]
+    assert normalize(columnar.to_records()) == normalize(expected)
+
+
+COMPARE_TYPES = list(CompareType)
+DATA = [
+    {"a": 1, "b": "x"},
+    {"a": 2.5, "b": "y"},
+    {"a": None, "b": None},
+    {"a": float("nan"), "b": "x"},
+    {"a": 3, "b": "z"},
+    {"a": -1, "b": ""},
+    {"b": "no a"},
+]
+
+
+@pytest.mark.parametrize("filter_type", [FilterType.All, FilterType.Any])
+@pytest.mark.parametrize("compare_type", COMPARE_TYPES)
+def test_each_compare_type_matches_rows(filter_type, compare_type):
+    assert_same_as_rows(filter_type, DATA, [number_field("a", compare_type, "2")])
+    assert_same_as_rows(
+        filter_type,
+        DATA,
+        [{"name": "b", "value": "y", "data_type": "VARCHAR2", "compare_type": compare_type}],
+    )
+
+
+def test_none_and_nan():
+    data = [{"a": None}, {"a": float("nan")}, {"a": 1.0}]
+    # None 不满足任何比较, NaN 按浮点数比较
+    assert data_filter(FilterType.All, data, [number_field("a", CompareType.IsNull, None)]) == [{"a": None}]
+    assert normalize(data_filter(FilterType.All, data, [number_field("a", CompareType.IsNotNull, None)])) == [
+        {"a": "NaN"},
+        {"a": 1.0},
+    ]
+    assert data_filter(FilterType.All, data, [number_field("a", CompareType.GreatThan, "0")]) == [{"a": 1.0}]
+    assert normalize(data_filter(FilterType.All, data, [number_field("a", CompareType.NotEqual, "1")])) == [
+        {"a": "NaN"}
+    ]
+    # 不含 None 的数值列为浮点数组, NaN 不作为空值
+    dataset = ColumnarDataset.from_records([{"a": float("nan")}, {"a": 1.0}])
+    assert dataset.column("a").dtype == np.float64
+    result = data_filter(FilterType.All, dataset, [number_field("a", CompareType.IsNull, None)])
+    assert len(result) == 0
+
+
+def test_mixed_types():
+    data = [{"a": 1}, {"a": 1.0}, {"a": "1"}, {"a": True}, {"a": None}]
+    for compare_type in (CompareType.Equal, CompareType.NotEqual):
+        assert_same_as_rows(FilterType.All, data, [number_field("a", compare_type, "1")])
+        assert_same_as_rows(
+            FilterType.All, data, [{"name": "a", "value": "1", "data_type": "VARCHAR2", "compare_type": compare_type}]
+        )
+    # 文本与数值比较大小时与逐行比较一样抛出异常
+    with pytest.raises(TypeError):
+        expected_filter(FilterType.All, data, [number_field("a", CompareType.GreatThan, "0")])
+    with pytest.raises(TypeError):
+        data_filter(FilterType.All, data, [number_field("a", CompareType.GreatThan, "0")])
+
+
+def test_numeric_column_compared_with_text():
+    dataset = ColumnarDataset.from_records([{"a": 1}, {"a": 2}])
+    condition_field = {"name": "a", "value": "1", "data_type": "VARCHAR2", "compare_type": CompareType.Equal}
+    # 整数列与文本相等比较按 Python 语义均不相等
+    assert len(data_filter(FilterType.All, dataset, [condition_field])) == 0
+    condition_field["compare_type"] = CompareType.NotEqual
+    assert len(data_filter(FilterType.All, dataset, [condition_field])) == 2
+
+
+def test_date_compare():
+    data = [{"d": datetime(2024, 1, 1)}, {"d": datetime(2024, 6, 1)}, {"d": None}]
+    field = {"name": "d", "value": "2024-03-01 00:00:00", "data_type": "DATE", "compare_type": CompareType.GreatThan}
+    assert_same_as_rows(FilterType.All, data, [field])
+    assert data_filter(FilterType.All, data, [field]) == [{"d": datetime(2024, 6, 1)}]
+
+
+def test_lower_case_field_name():
+    data = [{"a": 1}, {"a": 3}]
+    assert data_filter(FilterType.All, data, [number_field("A", CompareType.GreatThan, "2")]) == [{"a": 3}]
+    dataset = data_filter(
+        FilterType.All, ColumnarDataset.from_records(data), [number_field("A", CompareType.LessThan, "2")]
+    )
+    assert dataset.to_records() == [{"a": 1}]
+
+
+def test_missing_column():
+    data = [{"a": 1}, {"a": 2}]
+    for compare_type in COMPARE_TYPES:
+        assert_same_as_rows(FilterType.All, data, [number_field("missing", compare_type, "1")])
+        assert_same_as_rows(FilterType.Any, data, [number_field("missing", compare_type, "1")])
+
+
+def test_invalid_value_only_raises_when_compared():
+    condition_field = number_field("a", CompareType.GreatThan, "abc")
+    compiled = CompiledCondition(condition_field)
+    assert isinstance(compiled.error, DataProcessError)
+    # 全部为空值时不需要比较, 与逐行比较一致不抛出异常
+    assert data_filter(FilterType.All, [{"a": None}], [condition_field]) == []
+    with pytest.raises(DataProcessError):
+        data_filter(FilterType.All, [{"a": None}, {"a": 1}], [condition_field])
+
+
+def test_empty_number_value_is_zero():
+    data = [{"a": -1}, {"a": 0}, {"a": 1}]
+    assert data_filter(FilterType.All, data, [number_field("a", CompareType.GreatThan, "")]) == [{"a": 1}]
+
+
+def test_unsupported_compare_type():
+    data = [{"a": 1}, {"a": None}, {"a": 3}]
+    unsupported = number_field("a", "between", "1")
+    greater = number_field("a", CompareType.GreatThan, "2")
+    for filter_type in (FilterType.All, FilterType.Any):
+        assert_same_as_rows(filter_type, data, [unsupported])
+        assert_same_as_rows(filter_type, data, [unsupported, greater])
+
+
+def test_compiled_filter_mask():
+    data = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": None}]
+    fields = [number_field("a", CompareType.GreatThanOrEqual, "2"), number_field("b", CompareType.IsNotNull, None)]
+    assert CompiledFilter(FilterType.All, fields).mask(data).tolist() == [False, True, False]
+    assert CompiledFilter(FilterType.Any, fields).mask(data).tolist() == [True, True, True]
+    assert CompiledFilter(FilterType.All, []).mask(data).tolist() == [True, True, True]
+    assert CompiledFilter(FilterType.Any, []).mask(data).tolist() == [False, False, False]
+
+
+def test_empty_data_and_conditions():
+    field = number_field("a", CompareType.Equal, "1")
+    assert data_filter(FilterType.All, [], [field]) == []
+    dataset = ColumnarDataset()
+    assert data_filter(FilterType.All, dataset, [field]) is dataset
+    data = [{"a": 1}]
+    assert data_filter(FilterType.All, data, []) is data
+
+
+@pytest.mark.parametrize("filter_type", [FilterType.All, FilterType.Any])
+@pytest.mark.parametrize("seed", range(20))
+def test_random_conditions_match_rows(filter_type, seed):
+    rng = random.Random(seed)
+    values = [None, float("nan"), -1, 0, 1, 2, 1.5, 2.0, 3]
+    texts = [None, "", "a", "b", "c"]
+    data = [{"n": rng.choice(values), "s": rng.choice(texts)} for _ in range(rng.randrange(1, 40))]
+    fields = []
+    for _ in range(rng.randrange(1, 4)):
+        compare_type = rng.choice(COMPARE_TYPES)
+        if rng.random() < 0.5:
+            fields.append(number_field("n", compare_type, str(rng.choice([-1, 0, 1, 1.5, 2]))))
+        else:
+            fields.append(
+                {
+                    "name": "s",
+                    "value": rng.choice(["", "a", "b"]),
+                    "data_type": "VARCHAR2",
+                    "compare_type": compare_type,
+                }
+            )
+    assert_same_as_rows(filter_type, data, fields)
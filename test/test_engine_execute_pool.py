@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.engine_execute_pool import ExecutePool
+from enum_type.execute_lane import ExecuteLane
+from error.data_process_error import DataProcessError
+from error.execute_error import ExecuteError
+
+
+class FakePool:
+    def apply(self, func, args=()):
+        # 在调用线程中执行, 与 multiprocessing.Pool.apply 一样阻塞至执行完毕
+        return func(*args)
+
+
+class Job:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, name, order):
+        order.append(name)
+        self.started.set()
+        self.release.wait(5)
+        return name
+
+
+@pytest.fixture
+def pool():
+    ExecutePool.set_pool(FakePool(), 2)
+    yield
+    ExecutePool.set_pool(None, 0)
+
+
+def submit(job, name, lane, order, results):
+    def run():
+        try:
+            results[name] = ExecutePool.apply(job, (name, order), lane)
+        except ExecuteError as e:
+            results[name] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def wait_until(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def lane_metrics(lane):
+    with patch("core.engine_execute_pool.worker_memory", return_value=[]):
+        return ExecutePool.metrics()["lanes"][lane.name]
+
+
+def test_api_reserved_process(pool):
+    order, results = [], {}
+    interactive_1, interactive_2, api = Job(), Job(), Job()
+    threads = [submit(interactive_1, "i1", ExecuteLane.Interactive, order, results)]
+    interactive_1.started.wait(5)
+    threads.append(submit(interactive_2, "i2", ExecuteLane.Interactive, order, results))
+    wait_until(lambda: lane_metrics(ExecuteLane.Interactive)["waiting"] == 1)
+    # 交互执行不可占用保留的进程, 发布接口调用直接执行
+    threads.append(submit(api, "a", ExecuteLane.Api, order, results))
+    assert api.started.wait(5)
+    assert order == ["i1", "a"]
+    assert lane_metrics(ExecuteLane.Interactive)["running"] == 1
+    assert lane_metrics(ExecuteLane.Api)["running"] == 1
+
+    api.release.set()
+    interactive_1.release.set()
+    assert interactive_2.started.wait(5)
+    interactive_2.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == {"i1": "i1", "i2": "i2", "a": "a"}
+    assert lane_metrics(ExecuteLane.Interactive)["running"] == 0
+    assert lane_metrics(ExecuteLane.Interactive)["run_time"]["count"] == 2
+
+
+def test_api_lane_runs_before_earlier_interactive(pool):
+    ExecutePool.set_pool(FakePool(), 1)
+    order, results = [], {}
+    first, interactive, api = Job(), Job(), Job()
+    threads = [submit(first, "first", ExecuteLane.Interactive, order, results)]
+    first.started.wait(5)
+    threads.append(submit(interactive, "i", ExecuteLane.Interactive, order, results))
+    wait_until(lambda: lane_metrics(ExecuteLane.Interactive)["waiting"] == 1)
+    threads.append(submit(api, "a", ExecuteLane.Api, order, results))
+    wait_until(lambda: lane_metrics(ExecuteLane.Api)["waiting"] == 1)
+
+    first.release.set()
+    assert api.started.wait(5)
+    assert not interactive.started.is_set()
+    api.release.set()
+    assert interactive.started.wait(5)
+    interactive.release.set()
+    for thread in threads:
+        thread.join(5)
+    # 后到达的发布接口调用优先于排队中的交互执行
+    assert order == ["first", "a", "i"]
+
+
+def test_queue_limit_rejects(pool):
+    ExecutePool.set_pool(FakePool(), 1)
+    order, results = [], {}
+    first, queued, rejected = Job(), Job(), Job()
+    with patch("core.engine_execute_pool.EXECUTE_POOL_QUEUE_LIMIT", 1):
+        threads = [submit(first, "first", ExecuteLane.Interactive, order, results)]
+        first.started.wait(5)
+        threads.append(submit(queued, "queued", ExecuteLane.Interactive, order, results))
+        wait_until(lambda: lane_metrics(ExecuteLane.Interactive)["waiting"] == 1)
+        submit(rejected, "rejected", ExecuteLane.Interactive, order, results).join(5)
+        assert isinstance(results["rejected"], ExecuteError)
+        assert lane_metrics(ExecuteLane.Interactive)["rejected"] == 1
+        # 拒绝后排队列表不保留被拒绝者
+        assert lane_metrics(ExecuteLane.Interactive)["waiting"] == 1
+
+        first.release.set()
+        queued.release.set()
+        for thread in threads:
+            thread.join(5)
+    assert results["queued"] == "queued"
+    assert order == ["first", "queued"]
+
+
+def test_queue_timeout(pool):
+    ExecutePool.set_pool(FakePool(), 1)
+    order, results = [], {}
+    first, waiting = Job(), Job()
+    with patch("core.engine_execute_pool.EXECUTE_POOL_QUEUE_TIMEOUT", 0.05):
+        thread = submit(first, "first", ExecuteLane.Interactive, order, results)
+        first.started.wait(5)
+        submit(waiting, "waiting", ExecuteLane.Api, order, results).join(5)
+    assert isinstance(results["waiting"], ExecuteError)
+    assert lane_metrics(ExecuteLane.Api)["timeout"] == 1
+    assert lane_metrics(ExecuteLane.Api)["waiting"] == 0
+    first.release.set()
+    thread.join(5)
+    assert order == ["first"]
+
+
+def test_apply_without_pool():
+    ExecutePool.set_pool(None, 0)
+    with pytest.raises(DataProcessError):
+        ExecutePool.apply(print)
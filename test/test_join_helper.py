@@ -0,0 +1,224 @@
+import math
+import random
+
+import pytest
+
+from entity.dataset.columnar_dataset import ColumnarDataset
+from helper import join_helper
+from helper.columnar_helper import to_records
+
+
+def nested_loop_join(data_0, data_1, field_0, field_1, fields, keep_left, keep_right):
+    # 哈希连接前的嵌套循环实现, 作为对照
+    names_0 = [f["name"] for f in field_0] if isinstance(field_0, list) else [field_0["name"]]
+    names_1 = [f["name"] for f in field_1] if isinstance(field_1, list) else [field_1["name"]]
+
+    def matches(d0, d1):
+        return all(n0 in d0 and n1 in d1 and d0[n0] == d1[n1] for n0, n1 in zip(names_0, names_1))
+
+    arr = []
+    for d0 in data_0:
+        joined = False
+        for d1 in data_1:
+            if matches(d0, d1):
+                joined = True
+                x = {}
+                for field_name in fields:
+                    if field_name in d0:
+                        x[field_name] = d0[field_name]
+                    elif field_name in d1:
+                        x[field_name] = d1[field_name]
+                if x:
+                    arr.append(x)
+        if keep_left and not joined and all(n0 in d0 for n0 in names_0):
+            arr.append({field_name: d0[field_name] if field_name in d0 else None for field_name in fields})
+    if keep_right:
+        for d1 in data_1:
+            if not any(matches(d0, d1) for d0 in data_0):
+                arr.append({field_name: d1[field_name] if field_name in d1 else None for field_name in fields})
+    return arr
+
+
+def expected_join(join_type, data_0, data_1, field_0, field_1, fields):
+    if join_type == "inner":
+        if not data_0 or not data_1:
+            return []
+        return nested_loop_join(data_0, data_1, field_0, field_1, fields, False, False)
+    if join_type == "left":
+        if not data_0:
+            return []
+        return nested_loop_join(data_0, data_1, field_0, field_1, fields, True, False)
+    if join_type == "right":
+        return expected_join("left", data_1, data_0, field_1, field_0, fields)
+    return nested_loop_join(data_0, data_1, field_0, field_1, fields, True, True)
+
+
+def actual_join(join_type, data_0, data_1, field_0, field_1, fields):
+    # 连接类型中没有右连接, 右连接即交换端口的左连接
+    if join_type == "inner":
+        return join_helper.inner_join(data_0, data_1, field_0, field_1, fields)
+    if join_type == "left":
+        return join_helper.left_join(data_0, data_1, field_0, field_1, fields)
+    if join_type == "right":
+        return join_helper.left_join(data_1, data_0, field_1, field_0, fields)
+    return join_helper.full_join(data_0, data_1, field_0, field_1, fields)
+
+
+def normalize(records):
+    # NaN 不等于自身, 比较前替换为占位字符串
+    return [
+        {k: "NaN" if isinstance(v, float) and math.isnan(v) else v for k, v in r.items()} for r in to_records(records)
+    ]
+
+
+JOIN_TYPES = ["inner", "left", "right", "full"]
+FIELD_0 = {"name": "k0"}
+FIELD_1 = {"name": "k1"}
+FIELDS = ["k0", "k1", "x", "y", "shared"]
+
+
+def random_data(rng, n, key_name, value_name, key_values):
+    return [
+        {key_name: rng.choice(key_values), value_name: rng.random(), "shared": f"{value_name}{i}"} for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("join_type", JOIN_TYPES)
+def test_join_duplicate_and_none_keys(join_type):
+    data_0 = [
+        {"k0": 1, "x": "a", "shared": "l0"},
+        {"k0": 2, "x": "b", "shared": "l1"},
+        {"k0": 1, "x": "c", "shared": "l2"},
+        {"k0": None, "x": "d", "shared": "l3"},
+        {"k0": 9, "x": "e", "shared": "l4"},
+    ]
+    data_1 = [
+        {"k1": 1, "y": 10, "shared": "r0"},
+        {"k1": 1, "y": 11, "shared": "r1"},
+        {"k1": None, "y": 12, "shared": "r2"},
+        {"k1": 7, "y": 13, "shared": "r3"},
+    ]
+    expected = expected_join(join_type, data_0, data_1, FIELD_0, FIELD_1, FIELDS)
+    assert actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, FIELDS) == expected
+    columnar = actual_join(
+        join_type,
+        ColumnarDataset.from_records(data_0),
+        ColumnarDataset.from_records(data_1),
+        FIELD_0,
+        FIELD_1,
+        FIELDS,
+    )
+    assert normalize(columnar) == expected
+
+
+def test_inner_join_result():
+    data_0 = [{"k0": 1, "x": "a"}, {"k0": None, "x": "b"}, {"k0": 1, "x": "c"}]
+    data_1 = [{"k1": 1, "y": 10}, {"k1": None, "y": 11}, {"k1": 1, "y": 12}]
+    assert join_helper.inner_join(data_0, data_1, FIELD_0, FIELD_1, ["x", "y"]) == [
+        {"x": "a", "y": 10},
+        {"x": "a", "y": 12},
+        {"x": "b", "y": 11},
+        {"x": "c", "y": 10},
+        {"x": "c", "y": 12},
+    ]
+
+
+def test_join_missing_key_and_nan_key():
+    data_0 = [{"x": "no key"}, {"k0": float("nan"), "x": "nan"}, {"k0": 1, "x": "one"}]
+    data_1 = [{"y": "no key"}, {"k1": float("nan"), "y": "nan"}, {"k1": 1, "y": "one"}]
+    for join_type in JOIN_TYPES:
+        expected = expected_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["x", "y"])
+        actual = actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["x", "y"])
+        assert normalize(actual) == normalize(expected), join_type
+
+
+@pytest.mark.parametrize("join_type", JOIN_TYPES)
+@pytest.mark.parametrize("seed", range(20))
+def test_join_matches_nested_loop(join_type, seed):
+    rng = random.Random(seed)
+    key_values = [None, 0, 1, 2, 2.0, 3, "3", float("nan")]
+    data_0 = random_data(rng, rng.randrange(0, 30), "k0", "x", key_values)
+    data_1 = random_data(rng, rng.randrange(0, 30), "k1", "y", key_values)
+    expected = expected_join(join_type, data_0, data_1, FIELD_0, FIELD_1, FIELDS)
+    records = actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, FIELDS)
+    assert normalize(records) == normalize(expected)
+
+
+@pytest.mark.parametrize("join_type", JOIN_TYPES)
+@pytest.mark.parametrize("seed", range(20))
+def test_columnar_join_matches_records(join_type, seed):
+    rng = random.Random(seed)
+    key_values = [None, 0, 1, 2, 3, 4]
+    n_0 = rng.randrange(1, 30)
+    n_1 = rng.randrange(1, 30)
+    data_0 = random_data(rng, n_0, "k0", "x", key_values)
+    data_1 = random_data(rng, n_1, "k1", "y", key_values)
+    records = actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, FIELDS)
+    columnar = actual_join(
+        join_type,
+        ColumnarDataset.from_records(data_0),
+        ColumnarDataset.from_records(data_1),
+        FIELD_0,
+        FIELD_1,
+        FIELDS,
+    )
+    assert isinstance(columnar, ColumnarDataset) or columnar == []
+    assert normalize(columnar) == normalize(records)
+
+
+@pytest.mark.parametrize("join_type", JOIN_TYPES)
+def test_join_sorted_numeric_keys(join_type):
+    # 两侧 key 均已升序时使用归并连接
+    data_0 = [{"k0": k, "x": i} for i, k in enumerate([0, 1, 1, 2, 4, 6])]
+    data_1 = [{"k1": k, "y": i} for i, k in enumerate([1, 1, 2, 3, 6, 6, 7])]
+    expected = expected_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["k0", "k1", "x", "y"])
+    assert actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["k0", "k1", "x", "y"]) == expected
+    columnar = actual_join(
+        join_type,
+        ColumnarDataset.from_records(data_0),
+        ColumnarDataset.from_records(data_1),
+        FIELD_0,
+        FIELD_1,
+        ["k0", "k1", "x", "y"],
+    )
+    assert normalize(columnar) == expected
+
+
+def test_join_multiple_keys():
+    field_0 = [{"name": "a0"}, {"name": "b0"}]
+    field_1 = [{"name": "a1"}, {"name": "b1"}]
+    data_0 = [{"a0": 1, "b0": "x", "v": 0}, {"a0": 1, "b0": "y", "v": 1}, {"a0": None, "b0": "x", "v": 2}]
+    data_1 = [{"a1": 1, "b1": "y", "w": 0}, {"a1": None, "b1": "x", "w": 1}, {"a1": 2, "b1": "x", "w": 2}]
+    fields = ["v", "w"]
+    for join_type in JOIN_TYPES:
+        expected = expected_join(join_type, data_0, data_1, field_0, field_1, fields)
+        assert actual_join(join_type, data_0, data_1, field_0, field_1, fields) == expected, join_type
+
+
+def test_join_unhashable_keys():
+    # 不可哈希的 key 退回嵌套循环
+    data_0 = [{"k0": [1], "x": 0}, {"k0": [2], "x": 1}]
+    data_1 = [{"k1": [2], "y": 0}, {"k1": [3], "y": 1}]
+    for join_type in JOIN_TYPES:
+        expected = expected_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["x", "y"])
+        assert actual_join(join_type, data_0, data_1, FIELD_0, FIELD_1, ["x", "y"]) == expected, join_type
+
+
+def test_columnar_full_join_right_only_rows_take_port_1_values():
+    data_0 = ColumnarDataset.from_records([{"k0": 1, "shared": "l0"}])
+    data_1 = ColumnarDataset.from_records([{"k1": 1, "shared": "r0"}, {"k1": 2, "shared": "r1"}])
+    result = join_helper.full_join(data_0, data_1, FIELD_0, FIELD_1, ["k0", "k1", "shared"])
+    assert result.to_records() == [
+        {"k0": 1, "k1": 1, "shared": "l0"},
+        {"k0": None, "k1": 2, "shared": "r1"},
+    ]
+
+
+def test_columnar_left_join_with_empty_port_1_keeps_fields():
+    data_0 = ColumnarDataset.from_records([{"k0": 1, "x": 1.5}, {"k0": 2, "x": 2.5}])
+    data_1 = ColumnarDataset()
+    result = join_helper.left_join(data_0, data_1, FIELD_0, FIELD_1, ["k0", "x", "y"])
+    expected = join_helper.left_join(data_0.to_records(), [], FIELD_0, FIELD_1, ["k0", "x", "y"])
+    assert expected == [{"k0": 1, "x": 1.5, "y": None}, {"k0": 2, "x": 2.5, "y": None}]
+    assert result.names == ["k0", "x", "y"]
+    assert result.to_records() == expected
@@ -1,10 +1,9 @@
-import multiprocessing
-
 import pytest
 from fastapi.testclient import TestClient
 
 from app import app
 from config import setting
+from core.cancel_token import CancelToken
 from core.engine_execute_pool import ExecutePool
 
 client = TestClient(app)
@@ -13,9 +12,8 @@ client = TestClient(app)
 @pytest.fixture(scope="module", autouse=True)
 def setup_teardown():
     # load_dotenv('.env.test')
-    pool = multiprocessing.Pool(processes=4)
-    ExecutePool.set_pool(pool)
-    ExecutePool.set_manager_dict(multiprocessing.Manager().dict())
+    CancelToken.create(setting.CANCEL_TOKEN_SLOTS)
+    pool = ExecutePool.create()
     yield
     pool.terminate()
 
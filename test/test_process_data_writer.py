@@ -0,0 +1,160 @@
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from core.process_data_writer import ProcessDataWriter
+from entity.dataset.columnar_dataset import ColumnarDataset
+from enum_type.result_code import ResultCode
+
+SQL = "insert into ml_process values(:1, :2)"
+
+
+@pytest.fixture
+def oss():
+    # mock 对象存储操作
+    with patch("helper.oss_helper.oss_helper.oss_helper1.create_csv_file") as create_csv_file:
+        with patch("helper.oss_helper.oss_helper.oss_helper1.generate_csv_key") as generate_csv_key:
+            generate_csv_key.side_effect = [f"key{i}" for i in range(100)]
+            yield create_csv_file
+
+
+@pytest.fixture
+def db():
+    # mock 数据库操作
+    with patch("helper.sql_helper.init_sql_helper.db_helper1.execute_arr") as execute_arr:
+        with patch("helper.sql_helper.init_sql_helper.db_helper1.execute") as execute:
+            execute_arr.return_value = ResultCode.Success.value
+            execute.return_value = ResultCode.Success.value
+            yield execute_arr, execute
+
+
+def test_not_active_writes_synchronously(oss, db):
+    execute_arr, execute = db
+    oss.return_value = "sync_key"
+    assert ProcessDataWriter.create_csv_file([{"a": 1}], None) == "sync_key"
+    assert ProcessDataWriter.insert(SQL, [1, 2]) == ResultCode.Success.value
+    execute.assert_called_once_with(SQL, [1, 2])
+    execute_arr.assert_not_called()
+
+
+def test_end_waits_for_uploads_before_writing_records(oss, db):
+    execute_arr, _ = db
+    release = threading.Event()
+    uploaded = []
+
+    def upload(data, fields, key):
+        release.wait(5)
+        uploaded.append(key)
+        return key
+
+    oss.side_effect = upload
+    ProcessDataWriter.begin()
+    keys = [ProcessDataWriter.create_csv_file([{"a": i}], None) for i in range(3)]
+    assert keys == ["key0", "key1", "key2"]
+    for i in range(5):
+        ProcessDataWriter.insert(SQL, [i, keys[i % 3]])
+    execute_arr.assert_not_called()
+
+    result = []
+    thread = threading.Thread(target=lambda: result.append(ProcessDataWriter.end()))
+    thread.start()
+    thread.join(0.1)
+    # 上传未完成时不写入执行记录
+    assert thread.is_alive()
+    execute_arr.assert_not_called()
+
+    release.set()
+    thread.join(5)
+    assert result == [ResultCode.Success.value]
+    assert sorted(uploaded) == keys
+    execute_arr.assert_called_once()
+    sql_arr, params_dict = execute_arr.call_args.args
+    assert sql_arr == [SQL] * 5
+    assert params_dict == {i: [i, keys[i % 3]] for i in range(5)}
+
+
+def test_end_writes_records_in_batches(oss, db):
+    execute_arr, _ = db
+    with patch("core.process_data_writer.PROCESS_DATA_BATCH_SIZE", 2):
+        ProcessDataWriter.begin()
+        for i in range(5):
+            ProcessDataWriter.insert(SQL, [i])
+        assert ProcessDataWriter.end() == ResultCode.Success.value
+    assert [c.args[1] for c in execute_arr.call_args_list] == [{0: [0], 1: [1]}, {0: [2], 1: [3]}, {0: [4]}]
+
+
+def test_end_upload_error_skips_records(oss, db):
+    execute_arr, execute = db
+    oss.side_effect = [RuntimeError("upload failed"), "key1"]
+    ProcessDataWriter.begin()
+    ProcessDataWriter.create_csv_file([{"a": 1}], None)
+    ProcessDataWriter.create_csv_file([{"a": 2}], None)
+    ProcessDataWriter.insert(SQL, [1])
+    assert ProcessDataWriter.end() == ResultCode.Error.value
+    # 上传失败时不写入执行记录, 避免洞察读取不存在的文件
+    execute_arr.assert_not_called()
+    # 出错后同样退出后写模式
+    ProcessDataWriter.insert(SQL, [2])
+    execute.assert_called_once_with(SQL, [2])
+
+
+def test_end_record_error(oss, db):
+    execute_arr, _ = db
+    execute_arr.side_effect = [ResultCode.Error.value, ResultCode.Success.value]
+    with patch("core.process_data_writer.PROCESS_DATA_BATCH_SIZE", 1):
+        ProcessDataWriter.begin()
+        ProcessDataWriter.insert(SQL, [1])
+        ProcessDataWriter.insert(SQL, [2])
+        assert ProcessDataWriter.end() == ResultCode.Error.value
+    # 一批写入失败时其余批次仍写入
+    assert execute_arr.call_count == 2
+
+
+def test_skip_snapshot(oss, db):
+    execute_arr, execute = db
+    ProcessDataWriter.begin(skip_snapshot=True)
+    assert ProcessDataWriter.create_csv_file([{"a": 1}], None) is None
+    assert ProcessDataWriter.insert(SQL, [1]) == ResultCode.Success.value
+    assert ProcessDataWriter.end() == ResultCode.Success.value
+    oss.assert_not_called()
+    execute_arr.assert_not_called()
+    execute.assert_not_called()
+
+
+def test_upload_does_not_see_later_mutations(oss, db):
+    release = threading.Event()
+    received = []
+
+    def upload(data, fields, key):
+        release.wait(5)
+        received.append((data, fields))
+        return key
+
+    oss.side_effect = upload
+    records = [{"a": 1}, {"a": 2}]
+    fields = [{"name": "a", "nick_name": "a", "data_type": "NUMBER"}]
+    df = pd.DataFrame({"a": [1, 2]})
+    source = [{"a": 1}, {"a": 2}]
+    dataset = ColumnarDataset.from_records(source)
+    ProcessDataWriter.begin()
+    ProcessDataWriter.create_csv_file(records, fields)
+    ProcessDataWriter.create_csv_file(df, None)
+    ProcessDataWriter.create_csv_file(dataset, None)
+    # 下游算子原地修改输出数据
+    records[0]["a"] = 100
+    records.append({"a": 3})
+    fields[0]["data_type"] = "VARCHAR2"
+    df.loc[0, "a"] = 100
+    source[0]["a"] = 100
+    release.set()
+    assert ProcessDataWriter.end() == ResultCode.Success.value
+
+    received_records, received_fields = next(x for x in received if isinstance(x[0], list))
+    assert received_records == [{"a": 1}, {"a": 2}]
+    assert received_fields == [{"name": "a", "nick_name": "a", "data_type": "NUMBER"}]
+    received_df = next(x[0] for x in received if isinstance(x[0], pd.DataFrame))
+    assert received_df["a"].tolist() == [1, 2]
+    received_dataset = next(x[0] for x in received if isinstance(x[0], ColumnarDataset))
+    assert received_dataset.column("a").tolist() == [1, 2]
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pytest
+
+from core.publish_result_cache import PublishResultCache, cache_key
+from enum_type.result_cache_policy import ResultCachePolicy
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    PublishResultCache.invalidate()
+    yield
+    PublishResultCache.invalidate()
+
+
+def put(publish_id, version_id, data, body=b"{}", process_id="p"):
+    PublishResultCache.put_publish(publish_id, version_id, ResultCachePolicy.Cache)
+    key = cache_key(publish_id, version_id, data)
+    PublishResultCache.put(key, body, process_id)
+    return key
+
+
+def test_cache_key_ignores_field_order():
+    assert cache_key("p", "v", {"a": 1, "b": [1, 2]}) == cache_key("p", "v", {"b": [1, 2], "a": 1})
+    assert cache_key("p", "v", {"a": 1}) != cache_key("p", "v", {"a": 2})
+    assert cache_key("p", "v", None)[:2] == ("p", "v")
+
+
+def test_put_and_get():
+    key = put("get", "v1", {"a": 1}, b'{"data": 1}', "process")
+    assert PublishResultCache.get(key) == (b'{"data": 1}', "process")
+    assert PublishResultCache.get(cache_key("get", "v1", {"a": 2})) is None
+    assert PublishResultCache.counters("get") == {"cache_hit_count": 1, "cache_miss_count": 1}
+
+
+def test_publish_cached_for_every_policy():
+    # 未开启结果缓存的发布同样缓存版本标识及缓存策略, 避免每次调用查询
+    assert PublishResultCache.put_publish("skip", "v1", ResultCachePolicy.Skip) is False
+    assert PublishResultCache.get_publish("skip") == ("v1", ResultCachePolicy.Skip)
+    assert PublishResultCache.put_publish("cache", "v1", ResultCachePolicy.Cache) is True
+    assert PublishResultCache.get_publish("cache") == ("v1", ResultCachePolicy.Cache)
+    # 发布未开启缓存时不缓存结果
+    PublishResultCache.put(cache_key("skip", "v1", {}), b"{}", "p")
+    assert PublishResultCache.get(cache_key("skip", "v1", {})) is None
+
+
+def test_ttl_expires():
+    with patch("core.publish_result_cache.PUBLISH_RESULT_CACHE_SECONDS", -1):
+        key = put("ttl", "v1", {"a": 1})
+    assert PublishResultCache.get(key) is None
+    assert PublishResultCache.get_publish("ttl") is None
+
+
+def test_lru_eviction_by_size():
+    with patch("core.publish_result_cache.PUBLISH_RESULT_CACHE_SIZE", 2):
+        first = put("lru", "v1", {"a": 1})
+        second = put("lru", "v1", {"a": 2})
+        # 读取后 first 为最近使用, 写入第三个结果时淘汰 second
+        assert PublishResultCache.get(first) is not None
+        third = put("lru", "v1", {"a": 3})
+    assert PublishResultCache.get(second) is None
+    assert PublishResultCache.get(first) is not None
+    assert PublishResultCache.get(third) is not None
+
+
+def test_byte_bound_eviction():
+    with patch("core.publish_result_cache.PUBLISH_RESULT_CACHE_MAX_BYTES", 10):
+        first = put("bytes", "v1", {"a": 1}, b"12345")
+        second = put("bytes", "v1", {"a": 2}, b"12345")
+        assert PublishResultCache.get(first) is not None
+        third = put("bytes", "v1", {"a": 3}, b"123")
+        # 超过字节数上限的结果不缓存
+        too_large = put("bytes", "v1", {"a": 4}, b"12345678901")
+    assert PublishResultCache.get(second) is None
+    assert PublishResultCache.get(first) is not None
+    assert PublishResultCache.get(third) is not None
+    assert PublishResultCache.get(too_large) is None
+
+
+def test_replacing_entry_updates_bytes():
+    with patch("core.publish_result_cache.PUBLISH_RESULT_CACHE_MAX_BYTES", 10):
+        key = put("replace", "v1", {"a": 1}, b"123456")
+        put("replace", "v1", {"a": 1}, b"123456", "p2")
+        other = put("replace", "v1", {"a": 2}, b"1234")
+    assert PublishResultCache.get(key) == (b"123456", "p2")
+    assert PublishResultCache.get(other) is not None
+
+
+def test_invalidate_publish():
+    key = put("invalidate", "v1", {"a": 1})
+    other = put("other", "v1", {"a": 1})
+    PublishResultCache.invalidate("invalidate")
+    assert PublishResultCache.get(key) is None
+    assert PublishResultCache.get_publish("invalidate") is None
+    assert PublishResultCache.get(other) is not None
+    # 失效后写入的结果不缓存, 直至重新缓存发布版本
+    PublishResultCache.put(key, b"{}", "p")
+    assert PublishResultCache.get(key) is None
+
+
+def test_invalidate_version():
+    key = put("publish_a", "v1", {"a": 1})
+    other = put("publish_b", "v2", {"a": 1})
+    PublishResultCache.put_publish("publish_skip", "v1", ResultCachePolicy.Skip)
+    PublishResultCache.invalidate_version("v1")
+    assert PublishResultCache.get(key) is None
+    assert PublishResultCache.get_publish("publish_skip") is None
+    assert PublishResultCache.get_publish("publish_a") is None
+    assert PublishResultCache.get(other) is not None
+    assert PublishResultCache.get_publish("publish_b") == ("v2", ResultCachePolicy.Cache)
+
+
+def test_disabled():
+    with patch("core.publish_result_cache.PUBLISH_RESULT_CACHE_SIZE", 0):
+        assert not PublishResultCache.enabled()
+        assert PublishResultCache.put_publish("disabled", "v1", ResultCachePolicy.Cache) is False
+        assert PublishResultCache.get_publish("disabled") is None
+        key = cache_key("disabled", "v1", {})
+        PublishResultCache.put(key, b"{}", "p")
+    assert PublishResultCache.get(key) is None
@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from helper.sql_helper.schema_metadata_cache import SchemaMetadataCache
+
+FIELDS = [{"name": "a", "data_type": "NUMBER"}, {"name": "b", "data_type": "VARCHAR2"}]
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    SchemaMetadataCache.invalidate()
+    yield
+    SchemaMetadataCache.invalidate()
+
+
+def loader_of(fields=None):
+    return MagicMock(side_effect=lambda table_name: list(FIELDS if fields is None else fields))
+
+
+def test_get_fields_cached():
+    loader = loader_of()
+    assert SchemaMetadataCache.get_fields("db", "T1", loader) == FIELDS
+    cached = SchemaMetadataCache.get_fields("db", "T1", loader)
+    assert cached == FIELDS
+    loader.assert_called_once_with("T1")
+    # 返回副本, 调用方修改不影响缓存
+    cached.append({"name": "c"})
+    assert SchemaMetadataCache.get_fields("db", "T1", loader) == FIELDS
+    # 不同所属库分别缓存
+    SchemaMetadataCache.get_fields("other", "T1", loader)
+    assert loader.call_count == 2
+
+
+def test_missing_table_not_cached():
+    loader = loader_of([])
+    assert SchemaMetadataCache.get_fields("db", "T1", loader) == []
+    assert SchemaMetadataCache.get_fields("db", "T1", loader) == []
+    assert loader.call_count == 2
+
+
+def test_ttl_expires():
+    loader = loader_of()
+    with patch("helper.sql_helper.schema_metadata_cache.SCHEMA_METADATA_CACHE_SECONDS", -1):
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+    # 缓存时已过期
+    SchemaMetadataCache.get_fields("db", "T1", loader)
+    SchemaMetadataCache.get_fields("db", "T1", loader)
+    assert loader.call_count == 2
+
+
+def test_lru_eviction():
+    loader = loader_of()
+    with patch("helper.sql_helper.schema_metadata_cache.SCHEMA_METADATA_CACHE_SIZE", 2):
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+        SchemaMetadataCache.get_fields("db", "T2", loader)
+        # 读取后 T1 为最近使用, 缓存 T3 时淘汰 T2
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+        SchemaMetadataCache.get_fields("db", "T3", loader)
+        assert [c.args[0] for c in loader.call_args_list] == ["T1", "T2", "T3"]
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+        SchemaMetadataCache.get_fields("db", "T3", loader)
+        assert loader.call_count == 3
+        SchemaMetadataCache.get_fields("db", "T2", loader)
+    assert loader.call_count == 4
+
+
+def test_invalidate_table_case_insensitive():
+    loader = loader_of()
+    SchemaMetadataCache.get_fields("db", "T1", loader)
+    SchemaMetadataCache.get_fields("db", "T2", loader)
+    SchemaMetadataCache.get_fields("other", "T1", loader)
+    SchemaMetadataCache.invalidate("db", "t1")
+    SchemaMetadataCache.get_fields("db", "T1", loader)
+    SchemaMetadataCache.get_fields("db", "T2", loader)
+    SchemaMetadataCache.get_fields("other", "T1", loader)
+    assert [c.args[0] for c in loader.call_args_list] == ["T1", "T2", "T1", "T1"]
+
+
+def test_invalidate_owner_and_all():
+    loader = loader_of()
+    for owner in ("db", "other"):
+        for table_name in ("T1", "T2"):
+            SchemaMetadataCache.get_fields(owner, table_name, loader)
+    SchemaMetadataCache.invalidate("db")
+    for table_name in ("T1", "T2"):
+        SchemaMetadataCache.get_fields("db", table_name, loader)
+        SchemaMetadataCache.get_fields("other", table_name, loader)
+    assert loader.call_count == 6
+    SchemaMetadataCache.invalidate()
+    SchemaMetadataCache.get_fields("other", "T1", loader)
+    assert loader.call_count == 7
+
+
+def test_disabled():
+    loader = loader_of()
+    with patch("helper.sql_helper.schema_metadata_cache.SCHEMA_METADATA_CACHE_SIZE", 0):
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+    assert loader.call_count == 2
+
+
+def test_reserved_words_loaded_once():
+    loader = MagicMock(return_value=["SELECT", "FROM"])
+    assert SchemaMetadataCache.get_reserved_words("db", loader) == frozenset({"SELECT", "FROM"})
+    assert SchemaMetadataCache.get_reserved_words("db", loader) == frozenset({"SELECT", "FROM"})
+    loader.assert_called_once()
+    SchemaMetadataCache.get_reserved_words("other", loader)
+    assert loader.call_count == 2
+
+
+def test_reset_after_fork():
+    loader = loader_of()
+    SchemaMetadataCache.get_fields("db", "T1", loader)
+    # 子进程不沿用父进程的缓存
+    with patch("helper.sql_helper.schema_metadata_cache.os.getpid", return_value=-1):
+        SchemaMetadataCache.get_fields("db", "T1", loader)
+    assert loader.call_count == 2
@@ -0,0 +1,193 @@
+import io
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from helper.oss_helper.snapshot_format import (
+    FIELDS_METADATA_KEY,
+    frame_to_records,
+    open_range_file,
+    overlapping_groups,
+    snapshot_format_of,
+    snapshot_formats,
+    snapshot_frame,
+    to_arrow_table,
+)
+
+FIELDS = [
+    {"name": "i", "nick_name": "i", "data_type": "NUMBER"},
+    {"name": "f", "nick_name": "f", "data_type": "NUMBER"},
+    {"name": "s", "nick_name": "s", "data_type": "VARCHAR2"},
+]
+
+
+class FakeObjectStorage:
+    def __init__(self):
+        """
+        以内存保存快照文件的对象存储, 记录范围读取的字节数
+        """
+        self.files = {}
+        self.bytes_read = 0
+
+    def put(self, key, body):
+        self.files[key] = body.encode("utf-8") if isinstance(body, str) else body
+
+    def read_snapshot_range(self, key, start, end):
+        self.bytes_read += end - start
+        return self.files[key][start:end]
+
+    @contextmanager
+    def open_snapshot(self, key):
+        if key not in self.files:
+            yield None
+            return
+        with open_range_file(len(self.files[key]), lambda start, end: self.read_snapshot_range(key, start, end)) as f:
+            yield f
+
+    def read_csv_frame(self, key, **kwargs):
+        if key not in self.files:
+            return None
+        self.bytes_read += len(self.files[key])
+        return pd.read_csv(io.BytesIO(self.files[key]), **kwargs)
+
+
+def sample_frame(n):
+    rng = np.random.default_rng(0)
+    f = rng.random(n)
+    f[::7] = np.nan
+    return pd.DataFrame(
+        {
+            "i": np.arange(n, dtype=np.int64),
+            "f": f,
+            "s": [None if i % 5 == 0 else f"s{i}" for i in range(n)],
+        }
+    )
+
+
+def write(storage, extension, df, fields=FIELDS):
+    key = f"snapshot/test.{extension}"
+    storage.put(key, snapshot_formats[extension].dumps(df, fields))
+    return key
+
+
+def assert_frame(actual, expected, extension):
+    expected = expected.reset_index(drop=True)
+    if extension == "csv":
+        # CSV 不保存列类型, 空文本读取为 NaN
+        expected = expected.astype({"s": object}).where(expected.notna(), np.nan) if "s" in expected else expected
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    else:
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "arrow"])
+def test_round_trip(extension):
+    storage = FakeObjectStorage()
+    df = sample_frame(50)
+    key = write(storage, extension, df)
+    assert snapshot_format_of(key) is snapshot_formats[extension]
+    assert_frame(snapshot_format_of(key).read_frame(storage, key), df, extension)
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "arrow"])
+@pytest.mark.parametrize("offset, limit", [(0, 10), (23, 15), (40, None), (45, 100), (0, 0)])
+def test_ranged_read(extension, offset, limit):
+    storage = FakeObjectStorage()
+    df = sample_frame(95)
+    with patch("helper.oss_helper.snapshot_format.SNAPSHOT_ROW_GROUP_ROWS", 10):
+        key = write(storage, extension, df)
+    frame = snapshot_formats[extension].read_frame(storage, key, ["i", "s"], offset, limit)
+    end = None if limit is None else offset + limit
+    assert_frame(frame, df[["i", "s"]].iloc[offset:end], extension)
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_ranged_read_past_end(extension):
+    storage = FakeObjectStorage()
+    df = sample_frame(20)
+    with patch("helper.oss_helper.snapshot_format.SNAPSHOT_ROW_GROUP_ROWS", 10):
+        key = write(storage, extension, df)
+    frame = snapshot_formats[extension].read_frame(storage, key, ["i"], 30, 10)
+    assert list(frame.columns) == ["i"]
+    assert len(frame) == 0
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_ranged_read_downloads_only_needed_groups(extension):
+    storage = FakeObjectStorage()
+    df = sample_frame(100000)
+    with patch("helper.oss_helper.snapshot_format.SNAPSHOT_ROW_GROUP_ROWS", 5000):
+        key = write(storage, extension, df)
+    size = len(storage.files[key])
+    with patch("helper.oss_helper.snapshot_format.SNAPSHOT_READ_BUFFER_BYTES", 0):
+        frame = snapshot_formats[extension].read_frame(storage, key, ["f"], 54321, 10)
+    assert frame["f"].tolist() == pytest.approx(df["f"].iloc[54321:54331].tolist(), nan_ok=True)
+    # 只下载文件尾及所需行组
+    assert storage.bytes_read < size / 4
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "arrow"])
+def test_missing_file(extension):
+    assert snapshot_formats[extension].read_frame(FakeObjectStorage(), f"missing.{extension}") is None
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_nulls_read_back_same_as_csv(extension):
+    fields = [
+        {"name": "s", "nick_name": "s", "data_type": "VARCHAR2"},
+        {"name": "n", "nick_name": "n", "data_type": "NUMBER"},
+        {"name": "d", "nick_name": "d", "data_type": "DATE"},
+    ]
+    data = [
+        {"s": None, "n": 1, "d": datetime(2024, 1, 1)},
+        {"s": "y", "n": None, "d": None},
+        {"s": float("nan"), "n": 2.5, "d": "2024-02-01 08:00:00"},
+        {"s": "z", "n": 3, "d": datetime(2024, 3, 1)},
+    ]
+
+    def read_records(ext):
+        storage = FakeObjectStorage()
+        key = f"snapshot/test.{ext}"
+        storage.put(key, snapshot_formats[ext].dumps(snapshot_frame(data, fields), fields))
+        df = snapshot_formats[ext].read_frame(storage, key)
+        return frame_to_records(df, None if snapshot_formats[ext].typed else fields)
+
+    records = read_records(extension)
+    # 文本列的空值不保存为字符串 "None"
+    assert [r["s"] for r in records] == [None, "y", None, "z"]
+    assert records == read_records("csv")
+
+
+def test_fields_embedded_in_metadata():
+    storage = FakeObjectStorage()
+    key = write(storage, "parquet", sample_frame(5))
+    metadata = pq.ParquetFile(io.BytesIO(storage.files[key])).schema_arrow.metadata
+    assert json.loads(metadata[FIELDS_METADATA_KEY].decode("utf-8")) == FIELDS
+
+
+def test_mixed_type_column_stored_as_text():
+    df = pd.DataFrame({"m": [1, "a", None, 2.5]})
+    table = to_arrow_table(df)
+    assert table.column("m").to_pylist() == ["1", "a", None, "2.5"]
+
+
+def test_snapshot_format_of_unknown_extension():
+    # 无法识别的扩展名按 CSV 读取, 兼容已有快照
+    assert snapshot_format_of("a/b.csv") is snapshot_formats["csv"]
+    assert snapshot_format_of("a/b.PARQUET") is snapshot_formats["parquet"]
+    assert snapshot_format_of("a/b") is snapshot_formats["csv"]
+    assert snapshot_format_of(None) is snapshot_formats["csv"]
+
+
+def test_overlapping_groups():
+    assert overlapping_groups([10, 10, 10], 0, None) == ([0, 1, 2], 0)
+    assert overlapping_groups([10, 10, 10], 15, 10) == ([1, 2], 5)
+    assert overlapping_groups([10, 10, 10], 10, 10) == ([1], 0)
+    assert overlapping_groups([10, 10, 10], 30, 5) == ([], 0)
+    assert overlapping_groups([10, 10, 10], 10, 0) == ([], 0)
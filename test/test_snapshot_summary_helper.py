@@ -0,0 +1,46 @@
+import io
+from datetime import datetime
+
+import pandas as pd
+
+from helper.oss_helper.snapshot_format import snapshot_formats, snapshot_frame
+from helper.snapshot_summary_helper import summarize_dataframe, summarize_series
+
+FIELDS = [
+    {"name": "s", "nick_name": "s", "data_type": "VARCHAR2"},
+    {"name": "n", "nick_name": "n", "data_type": "NUMBER"},
+    {"name": "d", "nick_name": "d", "data_type": "DATE"},
+]
+DATA = [
+    {"s": None, "n": 1, "d": datetime(2024, 1, 1)},
+    {"s": "y", "n": None, "d": None},
+    {"s": None, "n": 3, "d": datetime(2024, 3, 1)},
+]
+
+
+def test_text_nulls_counted_on_write():
+    summary = summarize_dataframe(snapshot_frame(DATA, FIELDS), FIELDS)
+    # 文本列的空值不按字符串 "None" 统计
+    assert summary["columns"]["s"] == {
+        "count": 1,
+        "nulls": 2,
+        "kind": "string",
+        "distinct": 1,
+        "top_values": {"values": ["y"], "counts": [1]},
+    }
+    assert summary["columns"]["n"]["nulls"] == 1
+    assert summary["columns"]["d"]["nulls"] == 1
+
+
+def test_write_summary_same_as_csv_summary():
+    # 历史 CSV 快照读取全部数据补算的汇总统计与写入时计算的一致
+    df = snapshot_frame(DATA, FIELDS)
+    csv_df = pd.read_csv(io.StringIO(snapshot_formats["csv"].dumps(df, FIELDS)))
+    assert summarize_dataframe(df, FIELDS) == summarize_dataframe(csv_df, FIELDS)
+
+
+def test_summarize_number_and_date():
+    number = summarize_series(pd.Series([1.0, None, 3.0]), "NUMBER")
+    assert (number["count"], number["min"], number["max"], number["mean"]) == (2, 1.0, 3.0, 2.0)
+    date = summarize_series(pd.Series(["2024-03-01", None, "2024-01-01"]), "DATE")
+    assert (date["nulls"], date["min"], date["max"]) == (1, "2024-01-01T00:00:00", "2024-03-01T00:00:00")
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+
+from enum_type.result_code import ResultCode
+from helper.token_helper import SecretVersionTable, get_secret_version, increase_secret_version
+
+UPDATE_SQL = "update ml_secret_version set secret_version = secret_version + 1"
+
+
+@pytest.fixture
+def db():
+    # 每个用例重新检查密钥版本号表, mock 数据库操作
+    SecretVersionTable.invalidate()
+    with patch("helper.sql_helper.init_sql_helper.db_helper1.fetchone") as fetchone:
+        with patch("helper.sql_helper.init_sql_helper.db_helper1.execute") as execute:
+            execute.return_value = ResultCode.Success.value
+            yield fetchone, execute
+    SecretVersionTable.invalidate()
+
+
+def test_secret_version_existing_row(db):
+    fetchone, execute = db
+    fetchone.side_effect = [{"row_count": 1}, {"secret_version": 3}, {"secret_version": 4}]
+    assert get_secret_version() == 3
+    assert get_secret_version() == 4
+    increase_secret_version()
+    # 表及记录可用后不再检查
+    assert fetchone.call_count == 3
+    execute.assert_called_once_with(UPDATE_SQL)
+
+
+@pytest.mark.parametrize(
+    "check_result",
+    [RuntimeError("ORA-00942: table or view does not exist"), RuntimeError("connection pool exhausted")],
+)
+def test_secret_version_unavailable_rechecked_after_retry(db, check_result):
+    fetchone, execute = db
+    fetchone.side_effect = [check_result, {"row_count": 1}, {"secret_version": 2}]
+    with patch("helper.token_helper.time.monotonic", return_value=100):
+        for _ in range(3):
+            assert get_secret_version() is None
+            increase_secret_version()
+    # 间隔期内不再检查, 不创建表
+    assert fetchone.call_count == 1
+    execute.assert_not_called()
+    with patch("helper.token_helper.time.monotonic", return_value=100 + 60):
+        assert get_secret_version() == 2
+    assert fetchone.call_count == 3
+
+
+def test_secret_version_missing_row_not_inserted(db):
+    fetchone, execute = db
+    fetchone.side_effect = [{"row_count": 0}]
+    with patch("helper.token_helper.logger") as logger:
+        assert get_secret_version() is None
+        increase_secret_version()
+    # 记录由数据库脚本插入, 请求中只提示
+    assert logger.warning.call_count == 1
+    execute.assert_not_called()
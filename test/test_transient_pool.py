@@ -0,0 +1,174 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from error.general_error import GeneralError
+from helper.sql_helper.transient_pool import TransientConnectionPool, TransientPoolRegistry
+
+
+class FakeHelper:
+    def __init__(self, connection_string, user, password):
+        self.connection_string = connection_string
+        self.user = user
+        self.password = password
+        self.conn = MagicMock()
+        self.opened = False
+        self.closed = False
+        self.alive = True
+        self.ping_count = 0
+
+    def open(self):
+        self.opened = True
+
+    def close(self):
+        self.closed = True
+
+    def ping(self):
+        self.ping_count += 1
+        if not self.alive:
+            raise ConnectionError("connection lost")
+
+
+def new_pool(max_size=2):
+    return TransientConnectionPool(FakeHelper, "jdbc:test", "user", "password", max_size)
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    TransientPoolRegistry.invalidate()
+    yield
+    TransientPoolRegistry.invalidate()
+
+
+def test_acquire_release_reuses_connection():
+    pool = new_pool()
+    helper = pool.acquire()
+    assert helper.opened
+    assert helper.connection_string == "jdbc:test"
+    pool.release(helper)
+    # 归还时结束未提交的事务
+    helper.conn.rollback.assert_called_once()
+    assert pool.acquire() is helper
+    assert not helper.closed
+
+
+def test_connection_context_discards_on_error():
+    pool = new_pool()
+    with pytest.raises(ValueError):
+        with pool.connection() as helper:
+            raise ValueError("query failed")
+    # 使用中出错的连接直接关闭, 不放回池中
+    assert helper.closed
+    assert not pool.idle
+    with pool.connection() as other:
+        assert other is not helper
+    assert len(pool.idle) == 1
+
+
+def test_release_discards_when_rollback_fails():
+    pool = new_pool(max_size=1)
+    helper = pool.acquire()
+    helper.conn.rollback.side_effect = RuntimeError("connection lost")
+    pool.release(helper)
+    assert helper.closed
+    assert not pool.idle
+    # 连接数许可已归还
+    assert pool.acquire() is not helper
+
+
+def test_acquire_waits_for_max_size():
+    pool = new_pool(max_size=1)
+    helper = pool.acquire()
+    with patch("helper.sql_helper.transient_pool.TRANSIENT_POOL_WAIT_SECONDS", 0.01):
+        with pytest.raises(GeneralError):
+            pool.acquire()
+    pool.discard(helper)
+    assert helper.closed
+    assert pool.acquire() is not helper
+
+
+def test_acquire_pings_long_idle_connection():
+    pool = new_pool()
+    helper = pool.acquire()
+    pool.release(helper)
+    with patch("helper.sql_helper.transient_pool.TRANSIENT_POOL_PING_SECONDS", -1):
+        assert pool.acquire() is helper
+        assert helper.ping_count == 1
+        pool.release(helper)
+        # 已断开的连接关闭后重新建立
+        helper.alive = False
+        other = pool.acquire()
+    assert other is not helper
+    assert helper.closed
+    assert other.opened
+
+
+def test_recently_released_connection_not_pinged():
+    pool = new_pool()
+    helper = pool.acquire()
+    pool.release(helper)
+    assert pool.acquire() is helper
+    assert helper.ping_count == 0
+
+
+def test_evict_idle():
+    pool = new_pool()
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.evict_idle() == 2
+    with patch("helper.sql_helper.transient_pool.TRANSIENT_POOL_IDLE_SECONDS", -1):
+        assert pool.evict_idle() == 0
+    assert first.closed and second.closed
+
+
+def test_close_closes_idle_and_returned_connections():
+    pool = new_pool()
+    idle, borrowed = pool.acquire(), pool.acquire()
+    pool.release(idle)
+    pool.close()
+    assert idle.closed
+    assert not borrowed.closed
+    # 关闭后归还的连接直接关闭
+    pool.release(borrowed)
+    assert borrowed.closed
+    assert not pool.idle
+
+
+def test_registry_reuses_pool():
+    pool = TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password")
+    assert TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password") is pool
+    assert TransientPoolRegistry.get("other", FakeHelper, "jdbc:test", "user", "password") is not pool
+
+
+def test_registry_rebuilds_on_signature_change():
+    pool = TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password")
+    helper = pool.acquire()
+    pool.release(helper)
+    rebuilt = TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "new password")
+    # 连接信息变化时关闭原连接池
+    assert rebuilt is not pool
+    assert pool.closed
+    assert helper.closed
+    assert rebuilt.password == "new password"
+    assert rebuilt.acquire().password == "new password"
+
+
+def test_registry_closes_unused_pools():
+    unused = TransientPoolRegistry.get("unused", FakeHelper, "jdbc:test", "user", "password")
+    with patch("helper.sql_helper.transient_pool.TRANSIENT_POOL_IDLE_SECONDS", -1):
+        pool = TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password")
+    assert unused.closed
+    assert not pool.closed
+    assert TransientPoolRegistry.get("unused", FakeHelper, "jdbc:test", "user", "password") is not unused
+
+
+def test_registry_invalidate():
+    pool = TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password")
+    other = TransientPoolRegistry.get("other", FakeHelper, "jdbc:test", "user", "password")
+    TransientPoolRegistry.invalidate("ds")
+    assert pool.closed
+    assert not other.closed
+    assert TransientPoolRegistry.get("ds", FakeHelper, "jdbc:test", "user", "password") is not pool
+    TransientPoolRegistry.invalidate()
+    assert other.closed